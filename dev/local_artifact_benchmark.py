@@ -0,0 +1,101 @@
+"""
+Benchmark of logging and loading a large model directory with the local artifact repository, for
+each value of ``MLFLOW_LOCAL_ARTIFACT_LINK_MODE``.
+
+This script creates a model directory of a few large files and many small ones, then for each of
+the given link modes logs it to an artifact root with ``log_artifacts``, downloads it back with
+``download_artifacts``, and reports the time and throughput of both, along with the way the files
+were actually copied. Put ``--root`` on the filesystem to measure, e.g. a shared filesystem: files
+are only hard-linked within a filesystem, and only cloned by filesystems with copy-on-write.
+
+Usage:
+
+    python dev/local_artifact_benchmark.py --root /mnt/shared/tmp --size-mb 4096 --files 500
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from mlflow.store.artifact import local_artifact_repo
+from mlflow.store.artifact.local_artifact_repo import LINK_MODE_ENV_VAR, LocalArtifactRepository
+from mlflow.utils.file_utils import COPY_FILE_LINK_MODES, copy_file, path_to_local_file_uri
+
+
+def _create_model(model_dir, size_mb, num_files, num_large_files):
+    small_files_dir = os.path.join(model_dir, "variables")
+    os.makedirs(small_files_dir)
+    for i in range(num_files):
+        with open(os.path.join(small_files_dir, "file%d.bin" % i), "wb") as f:
+            f.write(os.urandom(16 * 1024))
+    chunk = os.urandom(1024 * 1024)
+    for i in range(num_large_files):
+        with open(os.path.join(model_dir, "weights%d.bin" % i), "wb") as f:
+            for _ in range(size_mb // num_large_files):
+                f.write(chunk)
+    return sum(
+        os.path.getsize(os.path.join(root, f))
+        for root, _, filenames in os.walk(model_dir)
+        for f in filenames
+    )
+
+
+def _benchmark(root_dir, model_dir, link_mode):
+    os.environ[LINK_MODE_ENV_VAR] = link_mode
+    artifact_dir = tempfile.mkdtemp(dir=root_dir)
+    dst_dir = tempfile.mkdtemp(dir=root_dir)
+    repo = LocalArtifactRepository(path_to_local_file_uri(artifact_dir))
+    used_modes = set()
+
+    def tracking_copy_file(src, dst, mode="copy"):
+        used_modes.add(copy_file(src, dst, mode))
+
+    local_artifact_repo.copy_file = tracking_copy_file
+    try:
+        start = time.time()
+        repo.log_artifacts(model_dir, "model")
+        log = time.time() - start
+        start = time.time()
+        repo.download_artifacts("model", dst_dir)
+        load = time.time() - start
+    finally:
+        local_artifact_repo.copy_file = copy_file
+        shutil.rmtree(artifact_dir)
+        shutil.rmtree(dst_dir)
+    return log, load, sorted(used_modes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--root", default=None, help="Directory of the benchmark files")
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--large-files", type=int, default=4)
+    parser.add_argument("--link-modes", nargs="+", default=COPY_FILE_LINK_MODES)
+    args = parser.parse_args()
+
+    root_dir = tempfile.mkdtemp(dir=args.root)
+    try:
+        model_dir = os.path.join(root_dir, "model")
+        size = _create_model(model_dir, args.size_mb, args.files, args.large_files)
+        print("Model directory of %.1fMB in %s" % (size / 1024 / 1024, root_dir))
+        for link_mode in args.link_modes:
+            log, load, used_modes = _benchmark(root_dir, model_dir, link_mode)
+            print(
+                "  %-8s log=%6.2fs (%8.1fMB/s)  load=%6.2fs (%8.1fMB/s)  used: %s"
+                % (
+                    link_mode,
+                    log,
+                    size / log / 1024 / 1024,
+                    load,
+                    size / load / 1024 / 1024,
+                    ", ".join(used_modes),
+                )
+            )
+    finally:
+        shutil.rmtree(root_dir)
+
+
+if __name__ == "__main__":
+    main()
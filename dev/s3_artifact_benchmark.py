@@ -0,0 +1,129 @@
+"""
+Benchmark of the S3 artifact repository against a local S3-compatible server (moto's standalone
+server, installed with ``pip install "moto[server]"``).
+
+This script first measures the latency of getting an S3 client with and without the client cache
+of the repository, then logs and downloads a directory of small files and a large file with each
+of the given ``MLFLOW_S3_MAX_CONCURRENCY`` values, and reports their throughput.
+
+Usage:
+
+    python dev/s3_artifact_benchmark.py --files 200 --large-file-size-mb 256 --max-concurrency 1 4 8
+"""
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+from mlflow.store.artifact import s3_artifact_repo
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+
+BUCKET = "mlflow-benchmark"
+
+
+def _get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server():
+    port = _get_free_port()
+    process = subprocess.Popen([sys.executable, "-m", "moto.server", "-p", str(port)])
+    url = "http://localhost:%d" % port
+    for _ in range(100):
+        try:
+            requests.get(url)
+            return url, process
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise Exception("S3 server failed to start at %s" % url)
+
+
+def _benchmark_clients(repo, num_clients):
+    start = time.time()
+    for _ in range(num_clients):
+        s3_artifact_repo._clients.clear()
+        repo._get_s3_client()
+    uncached = (time.time() - start) / num_clients
+    start = time.time()
+    for _ in range(num_clients):
+        repo._get_s3_client()
+    cached = (time.time() - start) / num_clients
+    return uncached, cached
+
+
+def _create_artifacts(root_dir, num_files, large_file_size_mb):
+    small_dir = os.path.join(root_dir, "small")
+    os.makedirs(small_dir)
+    for i in range(num_files):
+        with open(os.path.join(small_dir, "file%d.bin" % i), "wb") as f:
+            f.write(os.urandom(16 * 1024))
+    large_dir = os.path.join(root_dir, "large")
+    os.makedirs(large_dir)
+    with open(os.path.join(large_dir, "model.bin"), "wb") as f:
+        for _ in range(large_file_size_mb):
+            f.write(os.urandom(1024 * 1024))
+    return [(small_dir, num_files * 16 * 1024), (large_dir, large_file_size_mb * 1024 * 1024)]
+
+
+def _benchmark_transfers(repo, artifacts, root_dir):
+    results = []
+    for local_dir, size in artifacts:
+        name = os.path.basename(local_dir)
+        start = time.time()
+        repo.log_artifacts(local_dir, name)
+        upload = time.time() - start
+        dst_dir = tempfile.mkdtemp(dir=root_dir)
+        start = time.time()
+        repo.download_artifacts(name, dst_dir)
+        download = time.time() - start
+        results.append((name, size / upload, size / download))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--large-file-size-mb", type=int, default=256)
+    parser.add_argument("--max-concurrency", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    url, process = _start_server()
+    root_dir = tempfile.mkdtemp()
+    os.environ["MLFLOW_S3_ENDPOINT_URL"] = url
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    try:
+        repo = S3ArtifactRepository("s3://%s/artifacts" % BUCKET)
+        repo._get_s3_client().create_bucket(Bucket=BUCKET)
+        uncached, cached = _benchmark_clients(repo, args.clients)
+        print("Client creation: %.2fms uncached, %.4fms cached" % (uncached * 1000, cached * 1000))
+
+        artifacts = _create_artifacts(root_dir, args.files, args.large_file_size_mb)
+        for max_concurrency in args.max_concurrency:
+            os.environ["MLFLOW_S3_MAX_CONCURRENCY"] = str(max_concurrency)
+            repo = S3ArtifactRepository("s3://%s/concurrency-%d" % (BUCKET, max_concurrency))
+            print("MLFLOW_S3_MAX_CONCURRENCY=%d" % max_concurrency)
+            for name, upload, download in _benchmark_transfers(repo, artifacts, root_dir):
+                print(
+                    "  %-6s upload=%7.1fMB/s  download=%7.1fMB/s"
+                    % (name, upload / 1024 / 1024, download / 1024 / 1024)
+                )
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(root_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Load test comparing the latency of the tracking server served with gunicorn (the default) and with
+uvicorn (``mlflow server --asgi``).
+
+For each server mode, this script starts a tracking server backed by a fresh SQLite database,
+creates an experiment with runs and an artifact, then issues a mix of concurrent SearchRuns,
+GetRun and artifact download requests, and reports the p50 and p99 latencies of each request
+type.
+
+Usage:
+
+    python dev/server_benchmark.py --concurrency 64 --requests 2000 --artifact-size-mb 16
+"""
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from mlflow.entities import Metric, Param
+from mlflow.tracking import MlflowClient
+
+
+def _get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(root_dir, workers, asgi):
+    port = _get_free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "mlflow.cli",
+        "server",
+        "--backend-store-uri",
+        "sqlite:///" + os.path.join(root_dir, "mlflow.db"),
+        "--default-artifact-root",
+        os.path.join(root_dir, "artifacts"),
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+    ]
+    if asgi:
+        command.append("--asgi")
+    process = subprocess.Popen(command)
+    url = "http://localhost:%d" % port
+    for _ in range(100):
+        try:
+            if requests.get(url + "/health").ok:
+                return url, process
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise Exception("Tracking server failed to start at %s" % url)
+
+
+def _populate(url, num_runs, artifact_size_mb, root_dir):
+    client = MlflowClient(url)
+    experiment_id = client.create_experiment("benchmark")
+    run_ids = []
+    for i in range(num_runs):
+        run_id = client.create_run(experiment_id).info.run_id
+        client.log_batch(
+            run_id,
+            metrics=[Metric("m%d" % j, i * j, 0, 0) for j in range(10)],
+            params=[Param("p%d" % j, str(i + j)) for j in range(10)],
+        )
+        run_ids.append(run_id)
+    artifact_path = os.path.join(root_dir, "artifact.bin")
+    with open(artifact_path, "wb") as f:
+        f.write(os.urandom(artifact_size_mb * 1024 * 1024))
+    client.log_artifact(run_ids[0], artifact_path)
+    return experiment_id, run_ids
+
+
+def _percentile(latencies, percentile):
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(len(latencies) * percentile / 100))]
+
+
+def _benchmark(url, experiment_id, run_ids, num_requests, concurrency):
+    def search_runs(i):
+        return requests.post(
+            url + "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": [experiment_id], "filter": "metrics.m1 > %d" % (i % 10)},
+        )
+
+    def get_run(i):
+        return requests.get(url + "/api/2.0/mlflow/runs/get", params={"run_id": run_ids[i % 10]})
+
+    def get_artifact(_):
+        return requests.get(
+            url + "/get-artifact", params={"run_id": run_ids[0], "path": "artifact.bin"}
+        )
+
+    request_types = [
+        ("SearchRuns", search_runs),
+        ("GetRun", get_run),
+        ("GetArtifact", get_artifact),
+    ]
+
+    def timed_request(i):
+        name, send = request_types[i % len(request_types)]
+        start = time.time()
+        response = send(i)
+        response.raise_for_status()
+        return name, time.time() - start
+
+    latencies = {name: [] for name, _ in request_types}
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for name, latency in executor.map(timed_request, range(num_requests)):
+            latencies[name].append(latency)
+    return latencies, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--artifact-size-mb", type=int, default=16)
+    args = parser.parse_args()
+
+    for asgi in [False, True]:
+        root_dir = tempfile.mkdtemp()
+        url, process = _start_server(root_dir, args.workers, asgi)
+        try:
+            experiment_id, run_ids = _populate(url, args.runs, args.artifact_size_mb, root_dir)
+            latencies, duration = _benchmark(
+                url, experiment_id, run_ids, args.requests, args.concurrency
+            )
+        finally:
+            process.terminate()
+            process.wait()
+            shutil.rmtree(root_dir)
+        print(
+            "%s: %d requests in %.1fs (%.1f requests/s)"
+            % ("uvicorn" if asgi else "gunicorn", args.requests, duration, args.requests / duration)
+        )
+        for name, values in latencies.items():
+            print(
+                "  %-12s p50=%7.1fms  p99=%7.1fms"
+                % (name, _percentile(values, 50) * 1000, _percentile(values, 99) * 1000)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,11 @@ import mlflow.store.artifact.cli
 import mlflow.store.db.utils
 from mlflow import tracking
 from mlflow.server import _run_server
+from mlflow.server.admission_control import (
+    get_limiter_state,
+    parse_client_rate_limit,
+    parse_concurrency_limits,
+)
 from mlflow.server.handlers import initialize_backend_stores
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
@@ -215,8 +220,18 @@ def _user_args_to_dict(arguments, argument_type="P"):
     return user_dict
 
 
-def _validate_server_args(gunicorn_opts=None, workers=None, waitress_opts=None):
-    if sys.platform == "win32":
+def _validate_server_args(
+    gunicorn_opts=None, workers=None, waitress_opts=None, asgi=False, uvicorn_opts=None
+):
+    if asgi:
+        if gunicorn_opts is not None or waitress_opts is not None:
+            raise NotImplementedError(
+                "uvicorn replaces gunicorn and waitress when --asgi is specified, "
+                "cannot specify --gunicorn-opts or --waitress-opts"
+            )
+    elif uvicorn_opts is not None:
+        raise NotImplementedError("--uvicorn-opts can only be specified together with --asgi")
+    elif sys.platform == "win32":
         if gunicorn_opts is not None or workers is not None:
             raise NotImplementedError(
                 "waitress replaces gunicorn on Windows, "
@@ -312,6 +327,19 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
     "(e.g. 'file:///absolute/path/to/directory'). By default, data will be logged "
     "to the ./mlruns directory.",
 )
+@click.option(
+    "--backend-store-read-replica-uri",
+    "backend_store_read_replica_uris",
+    metavar="URI",
+    multiple=True,
+    help="SQLAlchemy-compatible connection string of a read replica of the database backend "
+    "store. Can be specified multiple times; read-only queries (e.g. searching runs or fetching "
+    "runs and metric histories) are balanced across the replicas while writes go to "
+    "--backend-store-uri. Lookups of single entities read from --backend-store-uri when the "
+    "replica misses them or when this process wrote them in the last "
+    "MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW seconds. Only supported with database "
+    "backend stores.",
+)
 @click.option(
     "--default-artifact-root",
     metavar="URI",
@@ -345,8 +373,103 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
     "doesn't exist, it will be created. "
     "Activate prometheus exporter to expose metrics on /metrics endpoint.",
 )
+@click.option(
+    "--response-cache",
+    metavar="URI",
+    default=None,
+    help="Cache the responses of read-heavy endpoints (GetExperiment, ListExperiments, "
+    "SearchRuns, GetRun and GetLatestVersions). Either 'memory' for a per-worker in-memory cache "
+    "or 'sqlite:///path/to/cache.db' for a cache shared by all workers. Cached responses are "
+    "invalidated by writes made through this server. By default, responses are not cached.",
+)
+@click.option(
+    "--response-cache-ttl",
+    default=None,
+    help="Time-to-live in seconds of cached responses, either for all endpoints (e.g. '30') or "
+    "per endpoint (e.g. '30,GetRun=5,SearchRuns=10'). Default: 60.",
+)
+@click.option(
+    "--asgi",
+    is_flag=True,
+    default=False,
+    help="Serve the tracking server with uvicorn, through a threaded ASGI adapter of its "
+    "handlers, instead of gunicorn or waitress. Handlers run synchronously in a bounded thread "
+    "pool of each worker, while the event loop receives requests and writes responses, so that "
+    "artifact downloads to slow clients only hold a thread while reading from the artifact "
+    "store. Requires uvicorn.",
+)
+@click.option(
+    "--asgi-max-threads",
+    type=click.INT,
+    default=None,
+    help="Number of threads running handlers in each uvicorn worker, i.e. maximum number of "
+    "requests handled concurrently by each worker, when --asgi is specified. Default: 32, plus "
+    "one thread per metric stream served by a worker (8), raised to the number of requests "
+    "admitted by --max-concurrent-requests.",
+)
+@click.option(
+    "--uvicorn-opts",
+    default=None,
+    help="Additional command line options forwarded to uvicorn, when --asgi is specified.",
+)
+@click.option(
+    "--client-rate-limit",
+    metavar="RATE[,BURST]",
+    default=None,
+    help="Limit the rate of API and artifact requests of each client (identified by its IP "
+    "address, or by its user name or access token with --trust-proxy-auth) to RATE requests per "
+    "second, with bursts of up to BURST requests (default: RATE), e.g. '20,100'. Requests over "
+    "the limit are rejected with HTTP 429 and a Retry-After header. By default, requests are not "
+    "rate limited.",
+)
+@click.option(
+    "--max-concurrent-requests",
+    default=None,
+    help="Maximum numbers of requests served concurrently by the server per endpoint class, "
+    "among 'writes', 'searches', 'artifacts' and 'streams' (metric streams), e.g. "
+    "'writes=32,searches=8,artifacts=4,streams=16'. "
+    "Requests over the limit are rejected with HTTP 429 and a Retry-After header.",
+)
+@click.option(
+    "--admission-control-state",
+    metavar="URI",
+    default=None,
+    help="Where the state of the rate and concurrency limits is kept: 'memory' for a state held "
+    "by each worker, which enforces the limits divided by the number of workers, or "
+    "'sqlite:///path/to/state.db' for a state shared by all workers, which enforces the exact "
+    "limits but takes a lock on the file for every request. Default: 'memory'.",
+)
+@click.option(
+    "--trust-proxy-auth",
+    is_flag=True,
+    default=False,
+    help="Identify the clients of --client-rate-limit by the user name or access token of their "
+    "Authorization header instead of their IP address. Only set it when the server is behind a "
+    "proxy that authenticates all requests, since the server does not verify this header itself.",
+)
+@click.option(
+    "--artifacts-destination",
+    metavar="URI",
+    default=None,
+    help="URI of the artifact storage (e.g. 's3://my-bucket/mlartifacts') served by the proxied "
+    "artifact access endpoints, through which clients upload and download artifacts without "
+    "credentials for the storage. Large files are uploaded in resumable multipart uploads "
+    "streamed to the storage. To proxy the artifacts of new experiments, set "
+    "--default-artifact-root to 'http://<host>:<port>/api/2.0/mlflow-artifacts/artifacts'. "
+    "By default, proxied artifact access is disabled.",
+)
+@click.option(
+    "--preload",
+    is_flag=True,
+    default=False,
+    help="Initialize the backend stores and warm their database connection pools before serving "
+    "requests, instead of on the first requests of each worker. With gunicorn, the stores are "
+    "initialized once before forking the workers (gunicorn --preload), and each worker warms its "
+    "own connection pools once forked. The /ready endpoint only passes in warm workers.",
+)
 def server(
     backend_store_uri,
+    backend_store_read_replica_uris,
     default_artifact_root,
     host,
     port,
@@ -355,6 +478,17 @@ def server(
     gunicorn_opts,
     waitress_opts,
     expose_prometheus,
+    response_cache,
+    response_cache_ttl,
+    asgi,
+    asgi_max_threads,
+    uvicorn_opts,
+    client_rate_limit,
+    max_concurrent_requests,
+    admission_control_state,
+    trust_proxy_auth,
+    artifacts_destination,
+    preload,
 ):
     """
     Run the MLflow tracking server.
@@ -365,12 +499,27 @@ def server(
     (or a specific interface address).
     """
 
-    _validate_server_args(gunicorn_opts=gunicorn_opts, workers=workers, waitress_opts=waitress_opts)
+    _validate_server_args(
+        gunicorn_opts=gunicorn_opts,
+        workers=workers,
+        waitress_opts=waitress_opts,
+        asgi=asgi,
+        uvicorn_opts=uvicorn_opts,
+    )
 
     # Ensure that both backend_store_uri and default_artifact_uri are set correctly.
     if not backend_store_uri:
         backend_store_uri = DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 
+    if backend_store_read_replica_uris:
+        if is_local_uri(backend_store_uri):
+            eprint("Option 'backend-store-read-replica-uri' requires a database backend store.")
+            sys.exit(1)
+        # Picked up by the database backend stores of this process and of the server workers
+        os.environ[mlflow.store.db.utils.MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS] = ",".join(
+            backend_store_read_replica_uris
+        )
+
     if not default_artifact_root:
         if is_local_uri(backend_store_uri):
             default_artifact_root = backend_store_uri
@@ -381,6 +530,17 @@ def server(
             )
             sys.exit(1)
 
+    try:
+        if client_rate_limit:
+            parse_client_rate_limit(client_rate_limit)
+        if max_concurrent_requests:
+            parse_concurrency_limits(max_concurrent_requests)
+        if admission_control_state:
+            get_limiter_state(admission_control_state)
+    except MlflowException as e:
+        eprint(e.message)
+        sys.exit(1)
+
     try:
         initialize_backend_stores(backend_store_uri, default_artifact_root)
     except Exception as e:  # pylint: disable=broad-except
@@ -399,6 +559,17 @@ def server(
             gunicorn_opts,
             waitress_opts,
             expose_prometheus,
+            response_cache,
+            response_cache_ttl,
+            asgi,
+            asgi_max_threads,
+            uvicorn_opts,
+            client_rate_limit,
+            max_concurrent_requests,
+            admission_control_state,
+            trust_proxy_auth,
+            artifacts_destination,
+            preload,
         )
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
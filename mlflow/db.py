@@ -28,3 +28,34 @@ def upgrade(url):
     if mlflow.store.db.utils._is_initialized_before_mlflow_1(engine):
         mlflow.store.db.utils._upgrade_db_initialized_before_mlflow_1(engine)
     mlflow.store.db.utils._upgrade_db(engine)
+
+
+@commands.command("create-search-index")
+@click.argument("url")
+def create_search_index(url):
+    """
+    Create or rebuild the search index of an MLflow tracking database, which speeds up the
+    ``LIKE`` and ``ILIKE`` search filters on run names, params and tags. Supported by SQLite
+    databases, with SQLite 3.34.0 or later, and by PostgreSQL databases, on which the ``pg_trgm``
+    extension is created if needed.
+
+    Run this command again after upgrading the schema of the database, as migrations may
+    recreate the indexed tables. Tracking servers detect the index when they start.
+    """
+    import mlflow.store.tracking.search_index
+
+    engine = mlflow.store.db.utils.create_sqlalchemy_engine_with_retry(url)
+    mlflow.store.tracking.search_index.create_search_index(engine)
+
+
+@commands.command("drop-search-index")
+@click.argument("url")
+def drop_search_index(url):
+    """
+    Drop the search index of an MLflow tracking database, created by
+    ``mlflow db create-search-index``.
+    """
+    import mlflow.store.tracking.search_index
+
+    engine = mlflow.store.db.utils.create_sqlalchemy_engine_with_retry(url)
+    mlflow.store.tracking.search_index.drop_search_index(engine)
@@ -4,6 +4,7 @@ from mlflow.protos.databricks_pb2 import (
     INTERNAL_ERROR,
     TEMPORARILY_UNAVAILABLE,
     ENDPOINT_NOT_FOUND,
+    FEATURE_DISABLED,
     PERMISSION_DENIED,
     REQUEST_LIMIT_EXCEEDED,
     BAD_REQUEST,
@@ -25,6 +26,7 @@ ERROR_CODE_TO_HTTP_STATUS = {
     ErrorCode.Name(BAD_REQUEST): 400,
     ErrorCode.Name(RESOURCE_ALREADY_EXISTS): 400,
     ErrorCode.Name(INVALID_PARAMETER_VALUE): 400,
+    ErrorCode.Name(FEATURE_DISABLED): 501,
 }
 
 
@@ -33210,6 +33210,35 @@ public final class Service {
      */
     com.google.protobuf.ByteString
         getRunUuidBytes();
+
+    /**
+     * <pre>
+     * Version of the run returned by an earlier request. If the run has not changed since, the
+     * response contains no run, so that clients polling active runs only download their changes.
+     * </pre>
+     *
+     * <code>optional string since_version = 3;</code>
+     */
+    boolean hasSinceVersion();
+    /**
+     * <pre>
+     * Version of the run returned by an earlier request. If the run has not changed since, the
+     * response contains no run, so that clients polling active runs only download their changes.
+     * </pre>
+     *
+     * <code>optional string since_version = 3;</code>
+     */
+    java.lang.String getSinceVersion();
+    /**
+     * <pre>
+     * Version of the run returned by an earlier request. If the run has not changed since, the
+     * response contains no run, so that clients polling active runs only download their changes.
+     * </pre>
+     *
+     * <code>optional string since_version = 3;</code>
+     */
+    com.google.protobuf.ByteString
+        getSinceVersionBytes();
   }
   /**
    * Protobuf type {@code mlflow.GetRun}
@@ -33226,6 +33255,7 @@ public final class Service {
     private GetRun() {
       runId_ = "";
       runUuid_ = "";
+      sinceVersion_ = "";
     }
 
     @java.lang.Override
@@ -33264,6 +33294,12 @@ public final class Service {
               runId_ = bs;
               break;
             }
+            case 26: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000004;
+              sinceVersion_ = bs;
+              break;
+            }
             default: {
               if (!parseUnknownField(
                   input, unknownFields, extensionRegistry, tag)) {
@@ -33302,7 +33338,8 @@ public final class Service {
 
       /**
        * <pre>
-       * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+       * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+       * run has not changed since ``since_version``.
        * </pre>
        *
        * <code>optional .mlflow.Run run = 1;</code>
@@ -33310,7 +33347,8 @@ public final class Service {
       boolean hasRun();
       /**
        * <pre>
-       * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+       * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+       * run has not changed since ``since_version``.
        * </pre>
        *
        * <code>optional .mlflow.Run run = 1;</code>
@@ -33318,12 +33356,39 @@ public final class Service {
       org.mlflow.api.proto.Service.Run getRun();
       /**
        * <pre>
-       * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+       * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+       * run has not changed since ``since_version``.
        * </pre>
        *
        * <code>optional .mlflow.Run run = 1;</code>
        */
       org.mlflow.api.proto.Service.RunOrBuilder getRunOrBuilder();
+
+      /**
+       * <pre>
+       * Opaque version of the run, changing whenever its metadata or data change.
+       * </pre>
+       *
+       * <code>optional string version = 2;</code>
+       */
+      boolean hasVersion();
+      /**
+       * <pre>
+       * Opaque version of the run, changing whenever its metadata or data change.
+       * </pre>
+       *
+       * <code>optional string version = 2;</code>
+       */
+      java.lang.String getVersion();
+      /**
+       * <pre>
+       * Opaque version of the run, changing whenever its metadata or data change.
+       * </pre>
+       *
+       * <code>optional string version = 2;</code>
+       */
+      com.google.protobuf.ByteString
+          getVersionBytes();
     }
     /**
      * Protobuf type {@code mlflow.GetRun.Response}
@@ -33338,6 +33403,7 @@ public final class Service {
         super(builder);
       }
       private Response() {
+        version_ = "";
       }
 
       @java.lang.Override
@@ -33377,6 +33443,12 @@ public final class Service {
                 bitField0_ |= 0x00000001;
                 break;
               }
+              case 18: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000002;
+                version_ = bs;
+                break;
+              }
               default: {
                 if (!parseUnknownField(
                     input, unknownFields, extensionRegistry, tag)) {
@@ -33414,7 +33486,8 @@ public final class Service {
       private org.mlflow.api.proto.Service.Run run_;
       /**
        * <pre>
-       * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+       * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+       * run has not changed since ``since_version``.
        * </pre>
        *
        * <code>optional .mlflow.Run run = 1;</code>
@@ -33424,7 +33497,8 @@ public final class Service {
       }
       /**
        * <pre>
-       * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+       * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+       * run has not changed since ``since_version``.
        * </pre>
        *
        * <code>optional .mlflow.Run run = 1;</code>
@@ -33434,7 +33508,8 @@ public final class Service {
       }
       /**
        * <pre>
-       * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+       * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+       * run has not changed since ``since_version``.
        * </pre>
        *
        * <code>optional .mlflow.Run run = 1;</code>
@@ -33443,6 +33518,60 @@ public final class Service {
         return run_ == null ? org.mlflow.api.proto.Service.Run.getDefaultInstance() : run_;
       }
 
+      public static final int VERSION_FIELD_NUMBER = 2;
+      private volatile java.lang.Object version_;
+      /**
+       * <pre>
+       * Opaque version of the run, changing whenever its metadata or data change.
+       * </pre>
+       *
+       * <code>optional string version = 2;</code>
+       */
+      public boolean hasVersion() {
+        return ((bitField0_ & 0x00000002) == 0x00000002);
+      }
+      /**
+       * <pre>
+       * Opaque version of the run, changing whenever its metadata or data change.
+       * </pre>
+       *
+       * <code>optional string version = 2;</code>
+       */
+      public java.lang.String getVersion() {
+        java.lang.Object ref = version_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            version_ = s;
+          }
+          return s;
+        }
+      }
+      /**
+       * <pre>
+       * Opaque version of the run, changing whenever its metadata or data change.
+       * </pre>
+       *
+       * <code>optional string version = 2;</code>
+       */
+      public com.google.protobuf.ByteString
+          getVersionBytes() {
+        java.lang.Object ref = version_;
+        if (ref instanceof java.lang.String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          version_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+
       private byte memoizedIsInitialized = -1;
       @java.lang.Override
       public final boolean isInitialized() {
@@ -33460,6 +33589,9 @@ public final class Service {
         if (((bitField0_ & 0x00000001) == 0x00000001)) {
           output.writeMessage(1, getRun());
         }
+        if (((bitField0_ & 0x00000002) == 0x00000002)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 2, version_);
+        }
         unknownFields.writeTo(output);
       }
 
@@ -33473,6 +33605,9 @@ public final class Service {
           size += com.google.protobuf.CodedOutputStream
             .computeMessageSize(1, getRun());
         }
+        if (((bitField0_ & 0x00000002) == 0x00000002)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, version_);
+        }
         size += unknownFields.getSerializedSize();
         memoizedSize = size;
         return size;
@@ -33494,6 +33629,11 @@ public final class Service {
           result = result && getRun()
               .equals(other.getRun());
         }
+        result = result && (hasVersion() == other.hasVersion());
+        if (hasVersion()) {
+          result = result && getVersion()
+              .equals(other.getVersion());
+        }
         result = result && unknownFields.equals(other.unknownFields);
         return result;
       }
@@ -33509,6 +33649,10 @@ public final class Service {
           hash = (37 * hash) + RUN_FIELD_NUMBER;
           hash = (53 * hash) + getRun().hashCode();
         }
+        if (hasVersion()) {
+          hash = (37 * hash) + VERSION_FIELD_NUMBER;
+          hash = (53 * hash) + getVersion().hashCode();
+        }
         hash = (29 * hash) + unknownFields.hashCode();
         memoizedHashCode = hash;
         return hash;
@@ -33649,6 +33793,8 @@ public final class Service {
             runBuilder_.clear();
           }
           bitField0_ = (bitField0_ & ~0x00000001);
+          version_ = "";
+          bitField0_ = (bitField0_ & ~0x00000002);
           return this;
         }
 
@@ -33685,6 +33831,10 @@ public final class Service {
           } else {
             result.run_ = runBuilder_.build();
           }
+          if (((from_bitField0_ & 0x00000002) == 0x00000002)) {
+            to_bitField0_ |= 0x00000002;
+          }
+          result.version_ = version_;
           result.bitField0_ = to_bitField0_;
           onBuilt();
           return result;
@@ -33737,6 +33887,11 @@ public final class Service {
           if (other.hasRun()) {
             mergeRun(other.getRun());
           }
+          if (other.hasVersion()) {
+            bitField0_ |= 0x00000002;
+            version_ = other.version_;
+            onChanged();
+          }
           this.mergeUnknownFields(other.unknownFields);
           onChanged();
           return this;
@@ -33772,7 +33927,8 @@ public final class Service {
             org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runBuilder_;
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33782,7 +33938,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33796,7 +33953,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33816,7 +33974,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33834,7 +33993,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33858,7 +34018,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33875,7 +34036,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33887,7 +34049,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33902,7 +34065,8 @@ public final class Service {
         }
         /**
          * <pre>
-         * Run metadata (name, start time, etc) and data (metrics, params, and tags).
+         * Run metadata (name, start time, etc) and data (metrics, params, and tags). Not set if the
+         * run has not changed since ``since_version``.
          * </pre>
          *
          * <code>optional .mlflow.Run run = 1;</code>
@@ -33920,6 +34084,106 @@ public final class Service {
           }
           return runBuilder_;
         }
+
+        private java.lang.Object version_ = "";
+        /**
+         * <pre>
+         * Opaque version of the run, changing whenever its metadata or data change.
+         * </pre>
+         *
+         * <code>optional string version = 2;</code>
+         */
+        public boolean hasVersion() {
+          return ((bitField0_ & 0x00000002) == 0x00000002);
+        }
+        /**
+         * <pre>
+         * Opaque version of the run, changing whenever its metadata or data change.
+         * </pre>
+         *
+         * <code>optional string version = 2;</code>
+         */
+        public java.lang.String getVersion() {
+          java.lang.Object ref = version_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              version_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Opaque version of the run, changing whenever its metadata or data change.
+         * </pre>
+         *
+         * <code>optional string version = 2;</code>
+         */
+        public com.google.protobuf.ByteString
+            getVersionBytes() {
+          java.lang.Object ref = version_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            version_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <pre>
+         * Opaque version of the run, changing whenever its metadata or data change.
+         * </pre>
+         *
+         * <code>optional string version = 2;</code>
+         */
+        public Builder setVersion(
+            java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+          version_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Opaque version of the run, changing whenever its metadata or data change.
+         * </pre>
+         *
+         * <code>optional string version = 2;</code>
+         */
+        public Builder clearVersion() {
+          bitField0_ = (bitField0_ & ~0x00000002);
+          version_ = getDefaultInstance().getVersion();
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Opaque version of the run, changing whenever its metadata or data change.
+         * </pre>
+         *
+         * <code>optional string version = 2;</code>
+         */
+        public Builder setVersionBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+          version_ = value;
+          onChanged();
+          return this;
+        }
         @java.lang.Override
         public final Builder setUnknownFields(
             final com.google.protobuf.UnknownFieldSet unknownFields) {
@@ -34085,6 +34349,63 @@ public final class Service {
       }
     }
 
+    public static final int SINCE_VERSION_FIELD_NUMBER = 3;
+    private volatile java.lang.Object sinceVersion_;
+    /**
+     * <pre>
+     * Version of the run returned by an earlier request. If the run has not changed since, the
+     * response contains no run, so that clients polling active runs only download their changes.
+     * </pre>
+     *
+     * <code>optional string since_version = 3;</code>
+     */
+    public boolean hasSinceVersion() {
+      return ((bitField0_ & 0x00000004) == 0x00000004);
+    }
+    /**
+     * <pre>
+     * Version of the run returned by an earlier request. If the run has not changed since, the
+     * response contains no run, so that clients polling active runs only download their changes.
+     * </pre>
+     *
+     * <code>optional string since_version = 3;</code>
+     */
+    public java.lang.String getSinceVersion() {
+      java.lang.Object ref = sinceVersion_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          sinceVersion_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * Version of the run returned by an earlier request. If the run has not changed since, the
+     * response contains no run, so that clients polling active runs only download their changes.
+     * </pre>
+     *
+     * <code>optional string since_version = 3;</code>
+     */
+    public com.google.protobuf.ByteString
+        getSinceVersionBytes() {
+      java.lang.Object ref = sinceVersion_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        sinceVersion_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
     private byte memoizedIsInitialized = -1;
     @java.lang.Override
     public final boolean isInitialized() {
@@ -34105,6 +34426,9 @@ public final class Service {
       if (((bitField0_ & 0x00000001) == 0x00000001)) {
         com.google.protobuf.GeneratedMessageV3.writeString(output, 2, runId_);
       }
+      if (((bitField0_ & 0x00000004) == 0x00000004)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 3, sinceVersion_);
+      }
       unknownFields.writeTo(output);
     }
 
@@ -34120,6 +34444,9 @@ public final class Service {
       if (((bitField0_ & 0x00000001) == 0x00000001)) {
         size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, runId_);
       }
+      if (((bitField0_ & 0x00000004) == 0x00000004)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, sinceVersion_);
+      }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
       return size;
@@ -34146,6 +34473,11 @@ public final class Service {
         result = result && getRunUuid()
             .equals(other.getRunUuid());
       }
+      result = result && (hasSinceVersion() == other.hasSinceVersion());
+      if (hasSinceVersion()) {
+        result = result && getSinceVersion()
+            .equals(other.getSinceVersion());
+      }
       result = result && unknownFields.equals(other.unknownFields);
       return result;
     }
@@ -34165,6 +34497,10 @@ public final class Service {
         hash = (37 * hash) + RUN_UUID_FIELD_NUMBER;
         hash = (53 * hash) + getRunUuid().hashCode();
       }
+      if (hasSinceVersion()) {
+        hash = (37 * hash) + SINCE_VERSION_FIELD_NUMBER;
+        hash = (53 * hash) + getSinceVersion().hashCode();
+      }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
@@ -34302,6 +34638,8 @@ public final class Service {
         bitField0_ = (bitField0_ & ~0x00000001);
         runUuid_ = "";
         bitField0_ = (bitField0_ & ~0x00000002);
+        sinceVersion_ = "";
+        bitField0_ = (bitField0_ & ~0x00000004);
         return this;
       }
 
@@ -34338,6 +34676,10 @@ public final class Service {
           to_bitField0_ |= 0x00000002;
         }
         result.runUuid_ = runUuid_;
+        if (((from_bitField0_ & 0x00000004) == 0x00000004)) {
+          to_bitField0_ |= 0x00000004;
+        }
+        result.sinceVersion_ = sinceVersion_;
         result.bitField0_ = to_bitField0_;
         onBuilt();
         return result;
@@ -34397,6 +34739,11 @@ public final class Service {
           runUuid_ = other.runUuid_;
           onChanged();
         }
+        if (other.hasSinceVersion()) {
+          bitField0_ |= 0x00000004;
+          sinceVersion_ = other.sinceVersion_;
+          onChanged();
+        }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
         return this;
@@ -34632,36 +34979,142 @@ public final class Service {
         onChanged();
         return this;
       }
-      @java.lang.Override
-      public final Builder setUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.setUnknownFields(unknownFields);
-      }
 
-      @java.lang.Override
-      public final Builder mergeUnknownFields(
-          final com.google.protobuf.UnknownFieldSet unknownFields) {
-        return super.mergeUnknownFields(unknownFields);
+      private java.lang.Object sinceVersion_ = "";
+      /**
+       * <pre>
+       * Version of the run returned by an earlier request. If the run has not changed since, the
+       * response contains no run, so that clients polling active runs only download their changes.
+       * </pre>
+       *
+       * <code>optional string since_version = 3;</code>
+       */
+      public boolean hasSinceVersion() {
+        return ((bitField0_ & 0x00000004) == 0x00000004);
       }
-
-
-      // @@protoc_insertion_point(builder_scope:mlflow.GetRun)
-    }
-
-    // @@protoc_insertion_point(class_scope:mlflow.GetRun)
-    private static final org.mlflow.api.proto.Service.GetRun DEFAULT_INSTANCE;
-    static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetRun();
-    }
-
-    public static org.mlflow.api.proto.Service.GetRun getDefaultInstance() {
-      return DEFAULT_INSTANCE;
-    }
-
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetRun>
-        PARSER = new com.google.protobuf.AbstractParser<GetRun>() {
-      @java.lang.Override
-      public GetRun parsePartialFrom(
+      /**
+       * <pre>
+       * Version of the run returned by an earlier request. If the run has not changed since, the
+       * response contains no run, so that clients polling active runs only download their changes.
+       * </pre>
+       *
+       * <code>optional string since_version = 3;</code>
+       */
+      public java.lang.String getSinceVersion() {
+        java.lang.Object ref = sinceVersion_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            sinceVersion_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Version of the run returned by an earlier request. If the run has not changed since, the
+       * response contains no run, so that clients polling active runs only download their changes.
+       * </pre>
+       *
+       * <code>optional string since_version = 3;</code>
+       */
+      public com.google.protobuf.ByteString
+          getSinceVersionBytes() {
+        java.lang.Object ref = sinceVersion_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          sinceVersion_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * Version of the run returned by an earlier request. If the run has not changed since, the
+       * response contains no run, so that clients polling active runs only download their changes.
+       * </pre>
+       *
+       * <code>optional string since_version = 3;</code>
+       */
+      public Builder setSinceVersion(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+        sinceVersion_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Version of the run returned by an earlier request. If the run has not changed since, the
+       * response contains no run, so that clients polling active runs only download their changes.
+       * </pre>
+       *
+       * <code>optional string since_version = 3;</code>
+       */
+      public Builder clearSinceVersion() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        sinceVersion_ = getDefaultInstance().getSinceVersion();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Version of the run returned by an earlier request. If the run has not changed since, the
+       * response contains no run, so that clients polling active runs only download their changes.
+       * </pre>
+       *
+       * <code>optional string since_version = 3;</code>
+       */
+      public Builder setSinceVersionBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000004;
+        sinceVersion_ = value;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.GetRun)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.GetRun)
+    private static final org.mlflow.api.proto.Service.GetRun DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.GetRun();
+    }
+
+    public static org.mlflow.api.proto.Service.GetRun getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<GetRun>
+        PARSER = new com.google.protobuf.AbstractParser<GetRun>() {
+      @java.lang.Override
+      public GetRun parsePartialFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
@@ -37564,6 +38017,25 @@ public final class Service {
      */
     com.google.protobuf.ByteString
         getPageTokenBytes();
+
+    /**
+     * <pre>
+     * If true, list the files at any depth under the path instead of its direct children, along
+     * with the directories that contain no file. Object stores are listed with a single request.
+     * </pre>
+     *
+     * <code>optional bool recursive = 5;</code>
+     */
+    boolean hasRecursive();
+    /**
+     * <pre>
+     * If true, list the files at any depth under the path instead of its direct children, along
+     * with the directories that contain no file. Object stores are listed with a single request.
+     * </pre>
+     *
+     * <code>optional bool recursive = 5;</code>
+     */
+    boolean getRecursive();
   }
   /**
    * Protobuf type {@code mlflow.ListArtifacts}
@@ -37582,6 +38054,7 @@ public final class Service {
       runUuid_ = "";
       path_ = "";
       pageToken_ = "";
+      recursive_ = false;
     }
 
     @java.lang.Override
@@ -37632,6 +38105,11 @@ public final class Service {
               pageToken_ = bs;
               break;
             }
+            case 40: {
+              bitField0_ |= 0x00000010;
+              recursive_ = input.readBool();
+              break;
+            }
             default: {
               if (!parseUnknownField(
                   input, unknownFields, extensionRegistry, tag)) {
@@ -39207,6 +39685,31 @@ public final class Service {
       }
     }
 
+    public static final int RECURSIVE_FIELD_NUMBER = 5;
+    private boolean recursive_;
+    /**
+     * <pre>
+     * If true, list the files at any depth under the path instead of its direct children, along
+     * with the directories that contain no file. Object stores are listed with a single request.
+     * </pre>
+     *
+     * <code>optional bool recursive = 5;</code>
+     */
+    public boolean hasRecursive() {
+      return ((bitField0_ & 0x00000010) == 0x00000010);
+    }
+    /**
+     * <pre>
+     * If true, list the files at any depth under the path instead of its direct children, along
+     * with the directories that contain no file. Object stores are listed with a single request.
+     * </pre>
+     *
+     * <code>optional bool recursive = 5;</code>
+     */
+    public boolean getRecursive() {
+      return recursive_;
+    }
+
     private byte memoizedIsInitialized = -1;
     @java.lang.Override
     public final boolean isInitialized() {
@@ -39233,6 +39736,9 @@ public final class Service {
       if (((bitField0_ & 0x00000008) == 0x00000008)) {
         com.google.protobuf.GeneratedMessageV3.writeString(output, 4, pageToken_);
       }
+      if (((bitField0_ & 0x00000010) == 0x00000010)) {
+        output.writeBool(5, recursive_);
+      }
       unknownFields.writeTo(output);
     }
 
@@ -39254,6 +39760,10 @@ public final class Service {
       if (((bitField0_ & 0x00000008) == 0x00000008)) {
         size += com.google.protobuf.GeneratedMessageV3.computeStringSize(4, pageToken_);
       }
+      if (((bitField0_ & 0x00000010) == 0x00000010)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeBoolSize(5, recursive_);
+      }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
       return size;
@@ -39290,6 +39800,11 @@ public final class Service {
         result = result && getPageToken()
             .equals(other.getPageToken());
       }
+      result = result && (hasRecursive() == other.hasRecursive());
+      if (hasRecursive()) {
+        result = result && (getRecursive()
+            == other.getRecursive());
+      }
       result = result && unknownFields.equals(other.unknownFields);
       return result;
     }
@@ -39317,6 +39832,11 @@ public final class Service {
         hash = (37 * hash) + PAGE_TOKEN_FIELD_NUMBER;
         hash = (53 * hash) + getPageToken().hashCode();
       }
+      if (hasRecursive()) {
+        hash = (37 * hash) + RECURSIVE_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashBoolean(
+            getRecursive());
+      }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
@@ -39458,6 +39978,8 @@ public final class Service {
         bitField0_ = (bitField0_ & ~0x00000004);
         pageToken_ = "";
         bitField0_ = (bitField0_ & ~0x00000008);
+        recursive_ = false;
+        bitField0_ = (bitField0_ & ~0x00000010);
         return this;
       }
 
@@ -39502,6 +40024,10 @@ public final class Service {
           to_bitField0_ |= 0x00000008;
         }
         result.pageToken_ = pageToken_;
+        if (((from_bitField0_ & 0x00000010) == 0x00000010)) {
+          to_bitField0_ |= 0x00000010;
+        }
+        result.recursive_ = recursive_;
         result.bitField0_ = to_bitField0_;
         onBuilt();
         return result;
@@ -39571,6 +40097,9 @@ public final class Service {
           pageToken_ = other.pageToken_;
           onChanged();
         }
+        if (other.hasRecursive()) {
+          setRecursive(other.getRecursive());
+        }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
         return this;
@@ -40006,6 +40535,58 @@ public final class Service {
         onChanged();
         return this;
       }
+
+      private boolean recursive_ ;
+      /**
+       * <pre>
+       * If true, list the files at any depth under the path instead of its direct children, along
+       * with the directories that contain no file. Object stores are listed with a single request.
+       * </pre>
+       *
+       * <code>optional bool recursive = 5;</code>
+       */
+      public boolean hasRecursive() {
+        return ((bitField0_ & 0x00000010) == 0x00000010);
+      }
+      /**
+       * <pre>
+       * If true, list the files at any depth under the path instead of its direct children, along
+       * with the directories that contain no file. Object stores are listed with a single request.
+       * </pre>
+       *
+       * <code>optional bool recursive = 5;</code>
+       */
+      public boolean getRecursive() {
+        return recursive_;
+      }
+      /**
+       * <pre>
+       * If true, list the files at any depth under the path instead of its direct children, along
+       * with the directories that contain no file. Object stores are listed with a single request.
+       * </pre>
+       *
+       * <code>optional bool recursive = 5;</code>
+       */
+      public Builder setRecursive(boolean value) {
+        bitField0_ |= 0x00000010;
+        recursive_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * If true, list the files at any depth under the path instead of its direct children, along
+       * with the directories that contain no file. Object stores are listed with a single request.
+       * </pre>
+       *
+       * <code>optional bool recursive = 5;</code>
+       */
+      public Builder clearRecursive() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        recursive_ = false;
+        onChanged();
+        return this;
+      }
       @java.lang.Override
       public final Builder setUnknownFields(
           final com.google.protobuf.UnknownFieldSet unknownFields) {
@@ -41022,6 +41603,46 @@ public final class Service {
      */
     com.google.protobuf.ByteString
         getMetricKeyBytes();
+
+    /**
+     * <pre>
+     * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+     * an earlier request. If specified together with ``since_timestamp``, only the values whose
+     * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+     * </pre>
+     *
+     * <code>optional int64 since_step = 4;</code>
+     */
+    boolean hasSinceStep();
+    /**
+     * <pre>
+     * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+     * an earlier request. If specified together with ``since_timestamp``, only the values whose
+     * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+     * </pre>
+     *
+     * <code>optional int64 since_step = 4;</code>
+     */
+    long getSinceStep();
+
+    /**
+     * <pre>
+     * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+     * epoch.
+     * </pre>
+     *
+     * <code>optional int64 since_timestamp = 5;</code>
+     */
+    boolean hasSinceTimestamp();
+    /**
+     * <pre>
+     * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+     * epoch.
+     * </pre>
+     *
+     * <code>optional int64 since_timestamp = 5;</code>
+     */
+    long getSinceTimestamp();
   }
   /**
    * Protobuf type {@code mlflow.GetMetricHistory}
@@ -41039,6 +41660,8 @@ public final class Service {
       runId_ = "";
       runUuid_ = "";
       metricKey_ = "";
+      sinceStep_ = 0L;
+      sinceTimestamp_ = 0L;
     }
 
     @java.lang.Override
@@ -41083,6 +41706,16 @@ public final class Service {
               runId_ = bs;
               break;
             }
+            case 32: {
+              bitField0_ |= 0x00000008;
+              sinceStep_ = input.readInt64();
+              break;
+            }
+            case 40: {
+              bitField0_ |= 0x00000010;
+              sinceTimestamp_ = input.readInt64();
+              break;
+            }
             default: {
               if (!parseUnknownField(
                   input, unknownFields, extensionRegistry, tag)) {
@@ -41121,7 +41754,7 @@ public final class Service {
 
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41130,7 +41763,7 @@ public final class Service {
           getMetricsList();
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41138,7 +41771,7 @@ public final class Service {
       org.mlflow.api.proto.Service.Metric getMetrics(int index);
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41146,7 +41779,7 @@ public final class Service {
       int getMetricsCount();
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41155,7 +41788,7 @@ public final class Service {
           getMetricsOrBuilderList();
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41251,7 +41884,7 @@ public final class Service {
       private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_;
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41261,7 +41894,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41272,7 +41905,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41282,7 +41915,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41292,7 +41925,7 @@ public final class Service {
       }
       /**
        * <pre>
-       * All logged values for this metric.
+       * All logged values for this metric, or the values after the cursor if specified.
        * </pre>
        *
        * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41659,7 +42292,7 @@ public final class Service {
 
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41673,7 +42306,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41687,7 +42320,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41701,7 +42334,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41722,7 +42355,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41740,7 +42373,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41760,7 +42393,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41781,7 +42414,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41799,7 +42432,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41817,7 +42450,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41836,7 +42469,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41853,7 +42486,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41870,7 +42503,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41881,7 +42514,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41895,7 +42528,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41910,7 +42543,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41921,7 +42554,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -41933,7 +42566,7 @@ public final class Service {
         }
         /**
          * <pre>
-         * All logged values for this metric.
+         * All logged values for this metric, or the values after the cursor if specified.
          * </pre>
          *
          * <code>repeated .mlflow.Metric metrics = 1;</code>
@@ -42175,6 +42808,58 @@ public final class Service {
       }
     }
 
+    public static final int SINCE_STEP_FIELD_NUMBER = 4;
+    private long sinceStep_;
+    /**
+     * <pre>
+     * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+     * an earlier request. If specified together with ``since_timestamp``, only the values whose
+     * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+     * </pre>
+     *
+     * <code>optional int64 since_step = 4;</code>
+     */
+    public boolean hasSinceStep() {
+      return ((bitField0_ & 0x00000008) == 0x00000008);
+    }
+    /**
+     * <pre>
+     * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+     * an earlier request. If specified together with ``since_timestamp``, only the values whose
+     * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+     * </pre>
+     *
+     * <code>optional int64 since_step = 4;</code>
+     */
+    public long getSinceStep() {
+      return sinceStep_;
+    }
+
+    public static final int SINCE_TIMESTAMP_FIELD_NUMBER = 5;
+    private long sinceTimestamp_;
+    /**
+     * <pre>
+     * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+     * epoch.
+     * </pre>
+     *
+     * <code>optional int64 since_timestamp = 5;</code>
+     */
+    public boolean hasSinceTimestamp() {
+      return ((bitField0_ & 0x00000010) == 0x00000010);
+    }
+    /**
+     * <pre>
+     * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+     * epoch.
+     * </pre>
+     *
+     * <code>optional int64 since_timestamp = 5;</code>
+     */
+    public long getSinceTimestamp() {
+      return sinceTimestamp_;
+    }
+
     private byte memoizedIsInitialized = -1;
     @java.lang.Override
     public final boolean isInitialized() {
@@ -42198,6 +42883,12 @@ public final class Service {
       if (((bitField0_ & 0x00000001) == 0x00000001)) {
         com.google.protobuf.GeneratedMessageV3.writeString(output, 3, runId_);
       }
+      if (((bitField0_ & 0x00000008) == 0x00000008)) {
+        output.writeInt64(4, sinceStep_);
+      }
+      if (((bitField0_ & 0x00000010) == 0x00000010)) {
+        output.writeInt64(5, sinceTimestamp_);
+      }
       unknownFields.writeTo(output);
     }
 
@@ -42216,6 +42907,14 @@ public final class Service {
       if (((bitField0_ & 0x00000001) == 0x00000001)) {
         size += com.google.protobuf.GeneratedMessageV3.computeStringSize(3, runId_);
       }
+      if (((bitField0_ & 0x00000008) == 0x00000008)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(4, sinceStep_);
+      }
+      if (((bitField0_ & 0x00000010) == 0x00000010)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(5, sinceTimestamp_);
+      }
       size += unknownFields.getSerializedSize();
       memoizedSize = size;
       return size;
@@ -42247,6 +42946,16 @@ public final class Service {
         result = result && getMetricKey()
             .equals(other.getMetricKey());
       }
+      result = result && (hasSinceStep() == other.hasSinceStep());
+      if (hasSinceStep()) {
+        result = result && (getSinceStep()
+            == other.getSinceStep());
+      }
+      result = result && (hasSinceTimestamp() == other.hasSinceTimestamp());
+      if (hasSinceTimestamp()) {
+        result = result && (getSinceTimestamp()
+            == other.getSinceTimestamp());
+      }
       result = result && unknownFields.equals(other.unknownFields);
       return result;
     }
@@ -42270,6 +42979,16 @@ public final class Service {
         hash = (37 * hash) + METRIC_KEY_FIELD_NUMBER;
         hash = (53 * hash) + getMetricKey().hashCode();
       }
+      if (hasSinceStep()) {
+        hash = (37 * hash) + SINCE_STEP_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getSinceStep());
+      }
+      if (hasSinceTimestamp()) {
+        hash = (37 * hash) + SINCE_TIMESTAMP_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getSinceTimestamp());
+      }
       hash = (29 * hash) + unknownFields.hashCode();
       memoizedHashCode = hash;
       return hash;
@@ -42409,6 +43128,10 @@ public final class Service {
         bitField0_ = (bitField0_ & ~0x00000002);
         metricKey_ = "";
         bitField0_ = (bitField0_ & ~0x00000004);
+        sinceStep_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000008);
+        sinceTimestamp_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000010);
         return this;
       }
 
@@ -42449,6 +43172,14 @@ public final class Service {
           to_bitField0_ |= 0x00000004;
         }
         result.metricKey_ = metricKey_;
+        if (((from_bitField0_ & 0x00000008) == 0x00000008)) {
+          to_bitField0_ |= 0x00000008;
+        }
+        result.sinceStep_ = sinceStep_;
+        if (((from_bitField0_ & 0x00000010) == 0x00000010)) {
+          to_bitField0_ |= 0x00000010;
+        }
+        result.sinceTimestamp_ = sinceTimestamp_;
         result.bitField0_ = to_bitField0_;
         onBuilt();
         return result;
@@ -42513,6 +43244,12 @@ public final class Service {
           metricKey_ = other.metricKey_;
           onChanged();
         }
+        if (other.hasSinceStep()) {
+          setSinceStep(other.getSinceStep());
+        }
+        if (other.hasSinceTimestamp()) {
+          setSinceTimestamp(other.getSinceTimestamp());
+        }
         this.mergeUnknownFields(other.unknownFields);
         onChanged();
         return this;
@@ -42848,8 +43585,116 @@ public final class Service {
         onChanged();
         return this;
       }
-      @java.lang.Override
-      public final Builder setUnknownFields(
+
+      private long sinceStep_ ;
+      /**
+       * <pre>
+       * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+       * an earlier request. If specified together with ``since_timestamp``, only the values whose
+       * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+       * </pre>
+       *
+       * <code>optional int64 since_step = 4;</code>
+       */
+      public boolean hasSinceStep() {
+        return ((bitField0_ & 0x00000008) == 0x00000008);
+      }
+      /**
+       * <pre>
+       * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+       * an earlier request. If specified together with ``since_timestamp``, only the values whose
+       * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+       * </pre>
+       *
+       * <code>optional int64 since_step = 4;</code>
+       */
+      public long getSinceStep() {
+        return sinceStep_;
+      }
+      /**
+       * <pre>
+       * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+       * an earlier request. If specified together with ``since_timestamp``, only the values whose
+       * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+       * </pre>
+       *
+       * <code>optional int64 since_step = 4;</code>
+       */
+      public Builder setSinceStep(long value) {
+        bitField0_ |= 0x00000008;
+        sinceStep_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Step of the ``(since_step, since_timestamp)`` cursor, typically of the last value fetched by
+       * an earlier request. If specified together with ``since_timestamp``, only the values whose
+       * ``(step, timestamp)`` is greater than the cursor are returned, sorted by step and timestamp.
+       * </pre>
+       *
+       * <code>optional int64 since_step = 4;</code>
+       */
+      public Builder clearSinceStep() {
+        bitField0_ = (bitField0_ & ~0x00000008);
+        sinceStep_ = 0L;
+        onChanged();
+        return this;
+      }
+
+      private long sinceTimestamp_ ;
+      /**
+       * <pre>
+       * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+       * epoch.
+       * </pre>
+       *
+       * <code>optional int64 since_timestamp = 5;</code>
+       */
+      public boolean hasSinceTimestamp() {
+        return ((bitField0_ & 0x00000010) == 0x00000010);
+      }
+      /**
+       * <pre>
+       * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+       * epoch.
+       * </pre>
+       *
+       * <code>optional int64 since_timestamp = 5;</code>
+       */
+      public long getSinceTimestamp() {
+        return sinceTimestamp_;
+      }
+      /**
+       * <pre>
+       * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+       * epoch.
+       * </pre>
+       *
+       * <code>optional int64 since_timestamp = 5;</code>
+       */
+      public Builder setSinceTimestamp(long value) {
+        bitField0_ |= 0x00000010;
+        sinceTimestamp_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Timestamp of the ``(since_step, since_timestamp)`` cursor, in milliseconds since the UNIX
+       * epoch.
+       * </pre>
+       *
+       * <code>optional int64 since_timestamp = 5;</code>
+       */
+      public Builder clearSinceTimestamp() {
+        bitField0_ = (bitField0_ & ~0x00000010);
+        sinceTimestamp_ = 0L;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
           final com.google.protobuf.UnknownFieldSet unknownFields) {
         return super.setUnknownFields(unknownFields);
       }
@@ -45198,219 +46043,5483 @@ public final class Service {
           tags_.add(value);
           onChanged();
         } else {
-          tagsBuilder_.addMessage(value);
+          tagsBuilder_.addMessage(value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(
+          int index, org.mlflow.api.proto.Service.RunTag value) {
+        if (tagsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureTagsIsMutable();
+          tags_.add(index, value);
+          onChanged();
+        } else {
+          tagsBuilder_.addMessage(index, value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(
+          org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.add(builderForValue.build());
+          onChanged();
+        } else {
+          tagsBuilder_.addMessage(builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addTags(
+          int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.add(index, builderForValue.build());
+          onChanged();
+        } else {
+          tagsBuilder_.addMessage(index, builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder addAllTags(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunTag> values) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, tags_);
+          onChanged();
+        } else {
+          tagsBuilder_.addAllMessages(values);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder clearTags() {
+        if (tagsBuilder_ == null) {
+          tags_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000008);
+          onChanged();
+        } else {
+          tagsBuilder_.clear();
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public Builder removeTags(int index) {
+        if (tagsBuilder_ == null) {
+          ensureTagsIsMutable();
+          tags_.remove(index);
+          onChanged();
+        } else {
+          tagsBuilder_.remove(index);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag.Builder getTagsBuilder(
+          int index) {
+        return getTagsFieldBuilder().getBuilder(index);
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+          int index) {
+        if (tagsBuilder_ == null) {
+          return tags_.get(index);  } else {
+          return tagsBuilder_.getMessageOrBuilder(index);
+        }
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+           getTagsOrBuilderList() {
+        if (tagsBuilder_ != null) {
+          return tagsBuilder_.getMessageOrBuilderList();
+        } else {
+          return java.util.Collections.unmodifiableList(tags_);
+        }
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder() {
+        return getTagsFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder(
+          int index) {
+        return getTagsFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Tags to log. A single request can contain up to 100 tags, and up to 1000
+       * metrics, params, and tags in total.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunTag.Builder> 
+           getTagsBuilderList() {
+        return getTagsFieldBuilder().getBuilderList();
+      }
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> 
+          getTagsFieldBuilder() {
+        if (tagsBuilder_ == null) {
+          tagsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder>(
+                  tags_,
+                  ((bitField0_ & 0x00000008) == 0x00000008),
+                  getParentForChildren(),
+                  isClean());
+          tags_ = null;
+        }
+        return tagsBuilder_;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.LogBatch)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.LogBatch)
+    private static final org.mlflow.api.proto.Service.LogBatch DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatch();
+    }
+
+    public static org.mlflow.api.proto.Service.LogBatch getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<LogBatch>
+        PARSER = new com.google.protobuf.AbstractParser<LogBatch>() {
+      @java.lang.Override
+      public LogBatch parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new LogBatch(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<LogBatch> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<LogBatch> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.LogBatch getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface CreateRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.CreateRuns)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * ID of the experiment under which to create the runs.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    boolean hasExperimentId();
+    /**
+     * <pre>
+     * ID of the experiment under which to create the runs.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    java.lang.String getExperimentId();
+    /**
+     * <pre>
+     * ID of the experiment under which to create the runs.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    com.google.protobuf.ByteString
+        getExperimentIdBytes();
+
+    /**
+     * <pre>
+     * ID of the user executing the runs.
+     * This field is deprecated as of MLflow 1.0, and will be removed in a future
+     * MLflow release. Use 'mlflow.user' tag instead.
+     * </pre>
+     *
+     * <code>optional string user_id = 2;</code>
+     */
+    boolean hasUserId();
+    /**
+     * <pre>
+     * ID of the user executing the runs.
+     * This field is deprecated as of MLflow 1.0, and will be removed in a future
+     * MLflow release. Use 'mlflow.user' tag instead.
+     * </pre>
+     *
+     * <code>optional string user_id = 2;</code>
+     */
+    java.lang.String getUserId();
+    /**
+     * <pre>
+     * ID of the user executing the runs.
+     * This field is deprecated as of MLflow 1.0, and will be removed in a future
+     * MLflow release. Use 'mlflow.user' tag instead.
+     * </pre>
+     *
+     * <code>optional string user_id = 2;</code>
+     */
+    com.google.protobuf.ByteString
+        getUserIdBytes();
+
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs started.
+     * </pre>
+     *
+     * <code>optional int64 start_time = 3;</code>
+     */
+    boolean hasStartTime();
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs started.
+     * </pre>
+     *
+     * <code>optional int64 start_time = 3;</code>
+     */
+    long getStartTime();
+
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    java.util.List<org.mlflow.api.proto.Service.RunData> 
+        getRunsDataList();
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    org.mlflow.api.proto.Service.RunData getRunsData(int index);
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    int getRunsDataCount();
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    java.util.List<? extends org.mlflow.api.proto.Service.RunDataOrBuilder> 
+        getRunsDataOrBuilderList();
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    org.mlflow.api.proto.Service.RunDataOrBuilder getRunsDataOrBuilder(
+        int index);
+  }
+  /**
+   * Protobuf type {@code mlflow.CreateRuns}
+   */
+  public  static final class CreateRuns extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.CreateRuns)
+      CreateRunsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use CreateRuns.newBuilder() to construct.
+    private CreateRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private CreateRuns() {
+      experimentId_ = "";
+      userId_ = "";
+      startTime_ = 0L;
+      runsData_ = java.util.Collections.emptyList();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private CreateRuns(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              experimentId_ = bs;
+              break;
+            }
+            case 18: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000002;
+              userId_ = bs;
+              break;
+            }
+            case 24: {
+              bitField0_ |= 0x00000004;
+              startTime_ = input.readInt64();
+              break;
+            }
+            case 34: {
+              if (!((mutable_bitField0_ & 0x00000008) == 0x00000008)) {
+                runsData_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunData>();
+                mutable_bitField0_ |= 0x00000008;
+              }
+              runsData_.add(
+                  input.readMessage(org.mlflow.api.proto.Service.RunData.PARSER, extensionRegistry));
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000008) == 0x00000008)) {
+          runsData_ = java.util.Collections.unmodifiableList(runsData_);
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.CreateRuns.class, org.mlflow.api.proto.Service.CreateRuns.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.CreateRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Run> 
+          getRunsList();
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.Run getRuns(int index);
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      int getRunsCount();
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList();
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index);
+    }
+    /**
+     * Protobuf type {@code mlflow.CreateRuns.Response}
+     */
+    public  static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.CreateRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        runs_ = java.util.Collections.emptyList();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+                  runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                runs_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+            runs_ = java.util.Collections.unmodifiableList(runs_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.CreateRuns.Response.class, org.mlflow.api.proto.Service.CreateRuns.Response.Builder.class);
+      }
+
+      public static final int RUNS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+        return runs_;
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList() {
+        return runs_;
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public int getRunsCount() {
+        return runs_.size();
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.Run getRuns(int index) {
+        return runs_.get(index);
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the same order as ``runs_data``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index) {
+        return runs_.get(index);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < runs_.size(); i++) {
+          output.writeMessage(1, runs_.get(i));
+        }
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < runs_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, runs_.get(i));
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.CreateRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.CreateRuns.Response other = (org.mlflow.api.proto.Service.CreateRuns.Response) obj;
+
+        boolean result = true;
+        result = result && getRunsList()
+            .equals(other.getRunsList());
+        result = result && unknownFields.equals(other.unknownFields);
+        return result;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getRunsCount() > 0) {
+          hash = (37 * hash) + RUNS_FIELD_NUMBER;
+          hash = (53 * hash) + getRunsList().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.CreateRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * Protobuf type {@code mlflow.CreateRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.CreateRuns.Response)
+          org.mlflow.api.proto.Service.CreateRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.CreateRuns.Response.class, org.mlflow.api.proto.Service.CreateRuns.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.CreateRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getRunsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.CreateRuns.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.Response build() {
+          org.mlflow.api.proto.Service.CreateRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.CreateRuns.Response result = new org.mlflow.api.proto.Service.CreateRuns.Response(this);
+          int from_bitField0_ = bitField0_;
+          if (runsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) == 0x00000001)) {
+              runs_ = java.util.Collections.unmodifiableList(runs_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.runs_ = runs_;
+          } else {
+            result.runs_ = runsBuilder_.build();
+          }
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return (Builder) super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return (Builder) super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return (Builder) super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return (Builder) super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.CreateRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.CreateRuns.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.CreateRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.CreateRuns.Response.getDefaultInstance()) return this;
+          if (runsBuilder_ == null) {
+            if (!other.runs_.isEmpty()) {
+              if (runs_.isEmpty()) {
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureRunsIsMutable();
+                runs_.addAll(other.runs_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.runs_.isEmpty()) {
+              if (runsBuilder_.isEmpty()) {
+                runsBuilder_.dispose();
+                runsBuilder_ = null;
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                runsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getRunsFieldBuilder() : null;
+              } else {
+                runsBuilder_.addAllMessages(other.runs_);
+              }
+            }
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.CreateRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.CreateRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
+
+        private java.util.List<org.mlflow.api.proto.Service.Run> runs_ =
+          java.util.Collections.emptyList();
+        private void ensureRunsIsMutable() {
+          if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+            runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>(runs_);
+            bitField0_ |= 0x00000001;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runsBuilder_;
+
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+          if (runsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(runs_);
+          } else {
+            return runsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public int getRunsCount() {
+          if (runsBuilder_ == null) {
+            return runs_.size();
+          } else {
+            return runsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run getRuns(int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);
+          } else {
+            return runsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.set(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addAllRuns(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Run> values) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, runs_);
+            onChanged();
+          } else {
+            runsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder clearRuns() {
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder removeRuns(int index) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.remove(index);
+            onChanged();
+          } else {
+            runsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder getRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+            int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);  } else {
+            return runsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+             getRunsOrBuilderList() {
+          if (runsBuilder_ != null) {
+            return runsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(runs_);
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder() {
+          return getRunsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the same order as ``runs_data``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run.Builder> 
+             getRunsBuilderList() {
+          return getRunsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> 
+            getRunsFieldBuilder() {
+          if (runsBuilder_ == null) {
+            runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder>(
+                    runs_,
+                    ((bitField0_ & 0x00000001) == 0x00000001),
+                    getParentForChildren(),
+                    isClean());
+            runs_ = null;
+          }
+          return runsBuilder_;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.CreateRuns.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.CreateRuns.Response)
+      private static final org.mlflow.api.proto.Service.CreateRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.CreateRuns.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.CreateRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    private int bitField0_;
+    public static final int EXPERIMENT_ID_FIELD_NUMBER = 1;
+    private volatile java.lang.Object experimentId_;
+    /**
+     * <pre>
+     * ID of the experiment under which to create the runs.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    public boolean hasExperimentId() {
+      return ((bitField0_ & 0x00000001) == 0x00000001);
+    }
+    /**
+     * <pre>
+     * ID of the experiment under which to create the runs.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    public java.lang.String getExperimentId() {
+      java.lang.Object ref = experimentId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          experimentId_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * ID of the experiment under which to create the runs.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    public com.google.protobuf.ByteString
+        getExperimentIdBytes() {
+      java.lang.Object ref = experimentId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        experimentId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int USER_ID_FIELD_NUMBER = 2;
+    private volatile java.lang.Object userId_;
+    /**
+     * <pre>
+     * ID of the user executing the runs.
+     * This field is deprecated as of MLflow 1.0, and will be removed in a future
+     * MLflow release. Use 'mlflow.user' tag instead.
+     * </pre>
+     *
+     * <code>optional string user_id = 2;</code>
+     */
+    public boolean hasUserId() {
+      return ((bitField0_ & 0x00000002) == 0x00000002);
+    }
+    /**
+     * <pre>
+     * ID of the user executing the runs.
+     * This field is deprecated as of MLflow 1.0, and will be removed in a future
+     * MLflow release. Use 'mlflow.user' tag instead.
+     * </pre>
+     *
+     * <code>optional string user_id = 2;</code>
+     */
+    public java.lang.String getUserId() {
+      java.lang.Object ref = userId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          userId_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * ID of the user executing the runs.
+     * This field is deprecated as of MLflow 1.0, and will be removed in a future
+     * MLflow release. Use 'mlflow.user' tag instead.
+     * </pre>
+     *
+     * <code>optional string user_id = 2;</code>
+     */
+    public com.google.protobuf.ByteString
+        getUserIdBytes() {
+      java.lang.Object ref = userId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        userId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int START_TIME_FIELD_NUMBER = 3;
+    private long startTime_;
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs started.
+     * </pre>
+     *
+     * <code>optional int64 start_time = 3;</code>
+     */
+    public boolean hasStartTime() {
+      return ((bitField0_ & 0x00000004) == 0x00000004);
+    }
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs started.
+     * </pre>
+     *
+     * <code>optional int64 start_time = 3;</code>
+     */
+    public long getStartTime() {
+      return startTime_;
+    }
+
+    public static final int RUNS_DATA_FIELD_NUMBER = 4;
+    private java.util.List<org.mlflow.api.proto.Service.RunData> runsData_;
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    public java.util.List<org.mlflow.api.proto.Service.RunData> getRunsDataList() {
+      return runsData_;
+    }
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    public java.util.List<? extends org.mlflow.api.proto.Service.RunDataOrBuilder> 
+        getRunsDataOrBuilderList() {
+      return runsData_;
+    }
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    public int getRunsDataCount() {
+      return runsData_.size();
+    }
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    public org.mlflow.api.proto.Service.RunData getRunsData(int index) {
+      return runsData_.get(index);
+    }
+    /**
+     * <pre>
+     * Initial metrics, params, and tags of the runs to create, one entry per run.
+     * </pre>
+     *
+     * <code>repeated .mlflow.RunData runs_data = 4;</code>
+     */
+    public org.mlflow.api.proto.Service.RunDataOrBuilder getRunsDataOrBuilder(
+        int index) {
+      return runsData_.get(index);
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      if (((bitField0_ & 0x00000001) == 0x00000001)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, experimentId_);
+      }
+      if (((bitField0_ & 0x00000002) == 0x00000002)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 2, userId_);
+      }
+      if (((bitField0_ & 0x00000004) == 0x00000004)) {
+        output.writeInt64(3, startTime_);
+      }
+      for (int i = 0; i < runsData_.size(); i++) {
+        output.writeMessage(4, runsData_.get(i));
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      if (((bitField0_ & 0x00000001) == 0x00000001)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, experimentId_);
+      }
+      if (((bitField0_ & 0x00000002) == 0x00000002)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(2, userId_);
+      }
+      if (((bitField0_ & 0x00000004) == 0x00000004)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(3, startTime_);
+      }
+      for (int i = 0; i < runsData_.size(); i++) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(4, runsData_.get(i));
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.CreateRuns)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.CreateRuns other = (org.mlflow.api.proto.Service.CreateRuns) obj;
+
+      boolean result = true;
+      result = result && (hasExperimentId() == other.hasExperimentId());
+      if (hasExperimentId()) {
+        result = result && getExperimentId()
+            .equals(other.getExperimentId());
+      }
+      result = result && (hasUserId() == other.hasUserId());
+      if (hasUserId()) {
+        result = result && getUserId()
+            .equals(other.getUserId());
+      }
+      result = result && (hasStartTime() == other.hasStartTime());
+      if (hasStartTime()) {
+        result = result && (getStartTime()
+            == other.getStartTime());
+      }
+      result = result && getRunsDataList()
+          .equals(other.getRunsDataList());
+      result = result && unknownFields.equals(other.unknownFields);
+      return result;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (hasExperimentId()) {
+        hash = (37 * hash) + EXPERIMENT_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getExperimentId().hashCode();
+      }
+      if (hasUserId()) {
+        hash = (37 * hash) + USER_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getUserId().hashCode();
+      }
+      if (hasStartTime()) {
+        hash = (37 * hash) + START_TIME_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getStartTime());
+      }
+      if (getRunsDataCount() > 0) {
+        hash = (37 * hash) + RUNS_DATA_FIELD_NUMBER;
+        hash = (53 * hash) + getRunsDataList().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.CreateRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.CreateRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.CreateRuns)
+        org.mlflow.api.proto.Service.CreateRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.CreateRuns.class, org.mlflow.api.proto.Service.CreateRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.CreateRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+          getRunsDataFieldBuilder();
+        }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        experimentId_ = "";
+        bitField0_ = (bitField0_ & ~0x00000001);
+        userId_ = "";
+        bitField0_ = (bitField0_ & ~0x00000002);
+        startTime_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000004);
+        if (runsDataBuilder_ == null) {
+          runsData_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000008);
+        } else {
+          runsDataBuilder_.clear();
+        }
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.CreateRuns.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns build() {
+        org.mlflow.api.proto.Service.CreateRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns buildPartial() {
+        org.mlflow.api.proto.Service.CreateRuns result = new org.mlflow.api.proto.Service.CreateRuns(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((from_bitField0_ & 0x00000001) == 0x00000001)) {
+          to_bitField0_ |= 0x00000001;
+        }
+        result.experimentId_ = experimentId_;
+        if (((from_bitField0_ & 0x00000002) == 0x00000002)) {
+          to_bitField0_ |= 0x00000002;
+        }
+        result.userId_ = userId_;
+        if (((from_bitField0_ & 0x00000004) == 0x00000004)) {
+          to_bitField0_ |= 0x00000004;
+        }
+        result.startTime_ = startTime_;
+        if (runsDataBuilder_ == null) {
+          if (((bitField0_ & 0x00000008) == 0x00000008)) {
+            runsData_ = java.util.Collections.unmodifiableList(runsData_);
+            bitField0_ = (bitField0_ & ~0x00000008);
+          }
+          result.runsData_ = runsData_;
+        } else {
+          result.runsData_ = runsDataBuilder_.build();
+        }
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return (Builder) super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return (Builder) super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return (Builder) super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return (Builder) super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.CreateRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.CreateRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
+        }
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.CreateRuns other) {
+        if (other == org.mlflow.api.proto.Service.CreateRuns.getDefaultInstance()) return this;
+        if (other.hasExperimentId()) {
+          bitField0_ |= 0x00000001;
+          experimentId_ = other.experimentId_;
+          onChanged();
+        }
+        if (other.hasUserId()) {
+          bitField0_ |= 0x00000002;
+          userId_ = other.userId_;
+          onChanged();
+        }
+        if (other.hasStartTime()) {
+          setStartTime(other.getStartTime());
+        }
+        if (runsDataBuilder_ == null) {
+          if (!other.runsData_.isEmpty()) {
+            if (runsData_.isEmpty()) {
+              runsData_ = other.runsData_;
+              bitField0_ = (bitField0_ & ~0x00000008);
+            } else {
+              ensureRunsDataIsMutable();
+              runsData_.addAll(other.runsData_);
+            }
+            onChanged();
+          }
+        } else {
+          if (!other.runsData_.isEmpty()) {
+            if (runsDataBuilder_.isEmpty()) {
+              runsDataBuilder_.dispose();
+              runsDataBuilder_ = null;
+              runsData_ = other.runsData_;
+              bitField0_ = (bitField0_ & ~0x00000008);
+              runsDataBuilder_ = 
+                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                   getRunsDataFieldBuilder() : null;
+            } else {
+              runsDataBuilder_.addAllMessages(other.runsData_);
+            }
+          }
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.CreateRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.CreateRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
+      }
+      private int bitField0_;
+
+      private java.lang.Object experimentId_ = "";
+      /**
+       * <pre>
+       * ID of the experiment under which to create the runs.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public boolean hasExperimentId() {
+        return ((bitField0_ & 0x00000001) == 0x00000001);
+      }
+      /**
+       * <pre>
+       * ID of the experiment under which to create the runs.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public java.lang.String getExperimentId() {
+        java.lang.Object ref = experimentId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            experimentId_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the experiment under which to create the runs.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public com.google.protobuf.ByteString
+          getExperimentIdBytes() {
+        java.lang.Object ref = experimentId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          experimentId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the experiment under which to create the runs.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public Builder setExperimentId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        experimentId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the experiment under which to create the runs.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public Builder clearExperimentId() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        experimentId_ = getDefaultInstance().getExperimentId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the experiment under which to create the runs.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public Builder setExperimentIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        experimentId_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.lang.Object userId_ = "";
+      /**
+       * <pre>
+       * ID of the user executing the runs.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 2;</code>
+       */
+      public boolean hasUserId() {
+        return ((bitField0_ & 0x00000002) == 0x00000002);
+      }
+      /**
+       * <pre>
+       * ID of the user executing the runs.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 2;</code>
+       */
+      public java.lang.String getUserId() {
+        java.lang.Object ref = userId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            userId_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the user executing the runs.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 2;</code>
+       */
+      public com.google.protobuf.ByteString
+          getUserIdBytes() {
+        java.lang.Object ref = userId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          userId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the user executing the runs.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 2;</code>
+       */
+      public Builder setUserId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        userId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the user executing the runs.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 2;</code>
+       */
+      public Builder clearUserId() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        userId_ = getDefaultInstance().getUserId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the user executing the runs.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 2;</code>
+       */
+      public Builder setUserIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000002;
+        userId_ = value;
+        onChanged();
+        return this;
+      }
+
+      private long startTime_ ;
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 3;</code>
+       */
+      public boolean hasStartTime() {
+        return ((bitField0_ & 0x00000004) == 0x00000004);
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 3;</code>
+       */
+      public long getStartTime() {
+        return startTime_;
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 3;</code>
+       */
+      public Builder setStartTime(long value) {
+        bitField0_ |= 0x00000004;
+        startTime_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 3;</code>
+       */
+      public Builder clearStartTime() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        startTime_ = 0L;
+        onChanged();
+        return this;
+      }
+
+      private java.util.List<org.mlflow.api.proto.Service.RunData> runsData_ =
+        java.util.Collections.emptyList();
+      private void ensureRunsDataIsMutable() {
+        if (!((bitField0_ & 0x00000008) == 0x00000008)) {
+          runsData_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunData>(runsData_);
+          bitField0_ |= 0x00000008;
+         }
+      }
+
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.RunData, org.mlflow.api.proto.Service.RunData.Builder, org.mlflow.api.proto.Service.RunDataOrBuilder> runsDataBuilder_;
+
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunData> getRunsDataList() {
+        if (runsDataBuilder_ == null) {
+          return java.util.Collections.unmodifiableList(runsData_);
+        } else {
+          return runsDataBuilder_.getMessageList();
+        }
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public int getRunsDataCount() {
+        if (runsDataBuilder_ == null) {
+          return runsData_.size();
+        } else {
+          return runsDataBuilder_.getCount();
+        }
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunData getRunsData(int index) {
+        if (runsDataBuilder_ == null) {
+          return runsData_.get(index);
+        } else {
+          return runsDataBuilder_.getMessage(index);
+        }
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder setRunsData(
+          int index, org.mlflow.api.proto.Service.RunData value) {
+        if (runsDataBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureRunsDataIsMutable();
+          runsData_.set(index, value);
+          onChanged();
+        } else {
+          runsDataBuilder_.setMessage(index, value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder setRunsData(
+          int index, org.mlflow.api.proto.Service.RunData.Builder builderForValue) {
+        if (runsDataBuilder_ == null) {
+          ensureRunsDataIsMutable();
+          runsData_.set(index, builderForValue.build());
+          onChanged();
+        } else {
+          runsDataBuilder_.setMessage(index, builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder addRunsData(org.mlflow.api.proto.Service.RunData value) {
+        if (runsDataBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureRunsDataIsMutable();
+          runsData_.add(value);
+          onChanged();
+        } else {
+          runsDataBuilder_.addMessage(value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder addRunsData(
+          int index, org.mlflow.api.proto.Service.RunData value) {
+        if (runsDataBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureRunsDataIsMutable();
+          runsData_.add(index, value);
+          onChanged();
+        } else {
+          runsDataBuilder_.addMessage(index, value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder addRunsData(
+          org.mlflow.api.proto.Service.RunData.Builder builderForValue) {
+        if (runsDataBuilder_ == null) {
+          ensureRunsDataIsMutable();
+          runsData_.add(builderForValue.build());
+          onChanged();
+        } else {
+          runsDataBuilder_.addMessage(builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder addRunsData(
+          int index, org.mlflow.api.proto.Service.RunData.Builder builderForValue) {
+        if (runsDataBuilder_ == null) {
+          ensureRunsDataIsMutable();
+          runsData_.add(index, builderForValue.build());
+          onChanged();
+        } else {
+          runsDataBuilder_.addMessage(index, builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder addAllRunsData(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunData> values) {
+        if (runsDataBuilder_ == null) {
+          ensureRunsDataIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, runsData_);
+          onChanged();
+        } else {
+          runsDataBuilder_.addAllMessages(values);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder clearRunsData() {
+        if (runsDataBuilder_ == null) {
+          runsData_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000008);
+          onChanged();
+        } else {
+          runsDataBuilder_.clear();
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public Builder removeRunsData(int index) {
+        if (runsDataBuilder_ == null) {
+          ensureRunsDataIsMutable();
+          runsData_.remove(index);
+          onChanged();
+        } else {
+          runsDataBuilder_.remove(index);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunData.Builder getRunsDataBuilder(
+          int index) {
+        return getRunsDataFieldBuilder().getBuilder(index);
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunDataOrBuilder getRunsDataOrBuilder(
+          int index) {
+        if (runsDataBuilder_ == null) {
+          return runsData_.get(index);  } else {
+          return runsDataBuilder_.getMessageOrBuilder(index);
+        }
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunDataOrBuilder> 
+           getRunsDataOrBuilderList() {
+        if (runsDataBuilder_ != null) {
+          return runsDataBuilder_.getMessageOrBuilderList();
+        } else {
+          return java.util.Collections.unmodifiableList(runsData_);
+        }
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunData.Builder addRunsDataBuilder() {
+        return getRunsDataFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.RunData.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunData.Builder addRunsDataBuilder(
+          int index) {
+        return getRunsDataFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.RunData.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Initial metrics, params, and tags of the runs to create, one entry per run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunData runs_data = 4;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunData.Builder> 
+           getRunsDataBuilderList() {
+        return getRunsDataFieldBuilder().getBuilderList();
+      }
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.RunData, org.mlflow.api.proto.Service.RunData.Builder, org.mlflow.api.proto.Service.RunDataOrBuilder> 
+          getRunsDataFieldBuilder() {
+        if (runsDataBuilder_ == null) {
+          runsDataBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.RunData, org.mlflow.api.proto.Service.RunData.Builder, org.mlflow.api.proto.Service.RunDataOrBuilder>(
+                  runsData_,
+                  ((bitField0_ & 0x00000008) == 0x00000008),
+                  getParentForChildren(),
+                  isClean());
+          runsData_ = null;
+        }
+        return runsDataBuilder_;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.CreateRuns)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.CreateRuns)
+    private static final org.mlflow.api.proto.Service.CreateRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.CreateRuns();
+    }
+
+    public static org.mlflow.api.proto.Service.CreateRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<CreateRuns>
+        PARSER = new com.google.protobuf.AbstractParser<CreateRuns>() {
+      @java.lang.Override
+      public CreateRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new CreateRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<CreateRuns> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<CreateRuns> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.CreateRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface TerminateRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.TerminateRuns)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    java.util.List<java.lang.String>
+        getRunIdsList();
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    int getRunIdsCount();
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    java.lang.String getRunIds(int index);
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    com.google.protobuf.ByteString
+        getRunIdsBytes(int index);
+
+    /**
+     * <pre>
+     * Updated status of the runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.RunStatus status = 2;</code>
+     */
+    boolean hasStatus();
+    /**
+     * <pre>
+     * Updated status of the runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.RunStatus status = 2;</code>
+     */
+    org.mlflow.api.proto.Service.RunStatus getStatus();
+
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs ended.
+     * </pre>
+     *
+     * <code>optional int64 end_time = 3;</code>
+     */
+    boolean hasEndTime();
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs ended.
+     * </pre>
+     *
+     * <code>optional int64 end_time = 3;</code>
+     */
+    long getEndTime();
+  }
+  /**
+   * Protobuf type {@code mlflow.TerminateRuns}
+   */
+  public  static final class TerminateRuns extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.TerminateRuns)
+      TerminateRunsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use TerminateRuns.newBuilder() to construct.
+    private TerminateRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private TerminateRuns() {
+      runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      status_ = 1;
+      endTime_ = 0L;
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private TerminateRuns(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              if (!((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+                runIds_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000001;
+              }
+              runIds_.add(bs);
+              break;
+            }
+            case 16: {
+              int rawValue = input.readEnum();
+                @SuppressWarnings("deprecation")
+              org.mlflow.api.proto.Service.RunStatus value = org.mlflow.api.proto.Service.RunStatus.valueOf(rawValue);
+              if (value == null) {
+                unknownFields.mergeVarintField(2, rawValue);
+              } else {
+                bitField0_ |= 0x00000001;
+                status_ = rawValue;
+              }
+              break;
+            }
+            case 24: {
+              bitField0_ |= 0x00000002;
+              endTime_ = input.readInt64();
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = runIds_.getUnmodifiableView();
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.TerminateRuns.class, org.mlflow.api.proto.Service.TerminateRuns.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.TerminateRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.RunInfo> 
+          getRunInfosList();
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunInfo getRunInfos(int index);
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      int getRunInfosCount();
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunInfoOrBuilder> 
+          getRunInfosOrBuilderList();
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunInfoOrBuilder getRunInfosOrBuilder(
+          int index);
+    }
+    /**
+     * Protobuf type {@code mlflow.TerminateRuns.Response}
+     */
+    public  static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.TerminateRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        runInfos_ = java.util.Collections.emptyList();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+                  runInfos_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunInfo>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                runInfos_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.RunInfo.PARSER, extensionRegistry));
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+            runInfos_ = java.util.Collections.unmodifiableList(runInfos_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.TerminateRuns.Response.class, org.mlflow.api.proto.Service.TerminateRuns.Response.Builder.class);
+      }
+
+      public static final int RUN_INFOS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.RunInfo> runInfos_;
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunInfo> getRunInfosList() {
+        return runInfos_;
+      }
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunInfoOrBuilder> 
+          getRunInfosOrBuilderList() {
+        return runInfos_;
+      }
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      public int getRunInfosCount() {
+        return runInfos_.size();
+      }
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.RunInfo getRunInfos(int index) {
+        return runInfos_.get(index);
+      }
+      /**
+       * <pre>
+       * Updated metadata of the runs, in the same order as ``run_ids``.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.RunInfoOrBuilder getRunInfosOrBuilder(
+          int index) {
+        return runInfos_.get(index);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < runInfos_.size(); i++) {
+          output.writeMessage(1, runInfos_.get(i));
+        }
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < runInfos_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, runInfos_.get(i));
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.TerminateRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.TerminateRuns.Response other = (org.mlflow.api.proto.Service.TerminateRuns.Response) obj;
+
+        boolean result = true;
+        result = result && getRunInfosList()
+            .equals(other.getRunInfosList());
+        result = result && unknownFields.equals(other.unknownFields);
+        return result;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getRunInfosCount() > 0) {
+          hash = (37 * hash) + RUN_INFOS_FIELD_NUMBER;
+          hash = (53 * hash) + getRunInfosList().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.TerminateRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * Protobuf type {@code mlflow.TerminateRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.TerminateRuns.Response)
+          org.mlflow.api.proto.Service.TerminateRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.TerminateRuns.Response.class, org.mlflow.api.proto.Service.TerminateRuns.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.TerminateRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getRunInfosFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (runInfosBuilder_ == null) {
+            runInfos_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            runInfosBuilder_.clear();
+          }
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.TerminateRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.TerminateRuns.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.TerminateRuns.Response build() {
+          org.mlflow.api.proto.Service.TerminateRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.TerminateRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.TerminateRuns.Response result = new org.mlflow.api.proto.Service.TerminateRuns.Response(this);
+          int from_bitField0_ = bitField0_;
+          if (runInfosBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) == 0x00000001)) {
+              runInfos_ = java.util.Collections.unmodifiableList(runInfos_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.runInfos_ = runInfos_;
+          } else {
+            result.runInfos_ = runInfosBuilder_.build();
+          }
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return (Builder) super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return (Builder) super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return (Builder) super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return (Builder) super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.TerminateRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.TerminateRuns.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.TerminateRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.TerminateRuns.Response.getDefaultInstance()) return this;
+          if (runInfosBuilder_ == null) {
+            if (!other.runInfos_.isEmpty()) {
+              if (runInfos_.isEmpty()) {
+                runInfos_ = other.runInfos_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureRunInfosIsMutable();
+                runInfos_.addAll(other.runInfos_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.runInfos_.isEmpty()) {
+              if (runInfosBuilder_.isEmpty()) {
+                runInfosBuilder_.dispose();
+                runInfosBuilder_ = null;
+                runInfos_ = other.runInfos_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                runInfosBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getRunInfosFieldBuilder() : null;
+              } else {
+                runInfosBuilder_.addAllMessages(other.runInfos_);
+              }
+            }
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.TerminateRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.TerminateRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
+
+        private java.util.List<org.mlflow.api.proto.Service.RunInfo> runInfos_ =
+          java.util.Collections.emptyList();
+        private void ensureRunInfosIsMutable() {
+          if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+            runInfos_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunInfo>(runInfos_);
+            bitField0_ |= 0x00000001;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.RunInfo, org.mlflow.api.proto.Service.RunInfo.Builder, org.mlflow.api.proto.Service.RunInfoOrBuilder> runInfosBuilder_;
+
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.RunInfo> getRunInfosList() {
+          if (runInfosBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(runInfos_);
+          } else {
+            return runInfosBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public int getRunInfosCount() {
+          if (runInfosBuilder_ == null) {
+            return runInfos_.size();
+          } else {
+            return runInfosBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunInfo getRunInfos(int index) {
+          if (runInfosBuilder_ == null) {
+            return runInfos_.get(index);
+          } else {
+            return runInfosBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder setRunInfos(
+            int index, org.mlflow.api.proto.Service.RunInfo value) {
+          if (runInfosBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunInfosIsMutable();
+            runInfos_.set(index, value);
+            onChanged();
+          } else {
+            runInfosBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder setRunInfos(
+            int index, org.mlflow.api.proto.Service.RunInfo.Builder builderForValue) {
+          if (runInfosBuilder_ == null) {
+            ensureRunInfosIsMutable();
+            runInfos_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            runInfosBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder addRunInfos(org.mlflow.api.proto.Service.RunInfo value) {
+          if (runInfosBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunInfosIsMutable();
+            runInfos_.add(value);
+            onChanged();
+          } else {
+            runInfosBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder addRunInfos(
+            int index, org.mlflow.api.proto.Service.RunInfo value) {
+          if (runInfosBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunInfosIsMutable();
+            runInfos_.add(index, value);
+            onChanged();
+          } else {
+            runInfosBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder addRunInfos(
+            org.mlflow.api.proto.Service.RunInfo.Builder builderForValue) {
+          if (runInfosBuilder_ == null) {
+            ensureRunInfosIsMutable();
+            runInfos_.add(builderForValue.build());
+            onChanged();
+          } else {
+            runInfosBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder addRunInfos(
+            int index, org.mlflow.api.proto.Service.RunInfo.Builder builderForValue) {
+          if (runInfosBuilder_ == null) {
+            ensureRunInfosIsMutable();
+            runInfos_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            runInfosBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder addAllRunInfos(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunInfo> values) {
+          if (runInfosBuilder_ == null) {
+            ensureRunInfosIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, runInfos_);
+            onChanged();
+          } else {
+            runInfosBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder clearRunInfos() {
+          if (runInfosBuilder_ == null) {
+            runInfos_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            runInfosBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public Builder removeRunInfos(int index) {
+          if (runInfosBuilder_ == null) {
+            ensureRunInfosIsMutable();
+            runInfos_.remove(index);
+            onChanged();
+          } else {
+            runInfosBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunInfo.Builder getRunInfosBuilder(
+            int index) {
+          return getRunInfosFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunInfoOrBuilder getRunInfosOrBuilder(
+            int index) {
+          if (runInfosBuilder_ == null) {
+            return runInfos_.get(index);  } else {
+            return runInfosBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunInfoOrBuilder> 
+             getRunInfosOrBuilderList() {
+          if (runInfosBuilder_ != null) {
+            return runInfosBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(runInfos_);
+          }
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunInfo.Builder addRunInfosBuilder() {
+          return getRunInfosFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.RunInfo.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunInfo.Builder addRunInfosBuilder(
+            int index) {
+          return getRunInfosFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.RunInfo.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Updated metadata of the runs, in the same order as ``run_ids``.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunInfo run_infos = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.RunInfo.Builder> 
+             getRunInfosBuilderList() {
+          return getRunInfosFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.RunInfo, org.mlflow.api.proto.Service.RunInfo.Builder, org.mlflow.api.proto.Service.RunInfoOrBuilder> 
+            getRunInfosFieldBuilder() {
+          if (runInfosBuilder_ == null) {
+            runInfosBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.RunInfo, org.mlflow.api.proto.Service.RunInfo.Builder, org.mlflow.api.proto.Service.RunInfoOrBuilder>(
+                    runInfos_,
+                    ((bitField0_ & 0x00000001) == 0x00000001),
+                    getParentForChildren(),
+                    isClean());
+            runInfos_ = null;
+          }
+          return runInfosBuilder_;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.TerminateRuns.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.TerminateRuns.Response)
+      private static final org.mlflow.api.proto.Service.TerminateRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.TerminateRuns.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.TerminateRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.TerminateRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    private int bitField0_;
+    public static final int RUN_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList runIds_;
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public com.google.protobuf.ProtocolStringList
+        getRunIdsList() {
+      return runIds_;
+    }
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public int getRunIdsCount() {
+      return runIds_.size();
+    }
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public java.lang.String getRunIds(int index) {
+      return runIds_.get(index);
+    }
+    /**
+     * <pre>
+     * IDs of the runs to update.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public com.google.protobuf.ByteString
+        getRunIdsBytes(int index) {
+      return runIds_.getByteString(index);
+    }
+
+    public static final int STATUS_FIELD_NUMBER = 2;
+    private int status_;
+    /**
+     * <pre>
+     * Updated status of the runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.RunStatus status = 2;</code>
+     */
+    public boolean hasStatus() {
+      return ((bitField0_ & 0x00000001) == 0x00000001);
+    }
+    /**
+     * <pre>
+     * Updated status of the runs.
+     * </pre>
+     *
+     * <code>optional .mlflow.RunStatus status = 2;</code>
+     */
+    public org.mlflow.api.proto.Service.RunStatus getStatus() {
+      @SuppressWarnings("deprecation")
+      org.mlflow.api.proto.Service.RunStatus result = org.mlflow.api.proto.Service.RunStatus.valueOf(status_);
+      return result == null ? org.mlflow.api.proto.Service.RunStatus.RUNNING : result;
+    }
+
+    public static final int END_TIME_FIELD_NUMBER = 3;
+    private long endTime_;
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs ended.
+     * </pre>
+     *
+     * <code>optional int64 end_time = 3;</code>
+     */
+    public boolean hasEndTime() {
+      return ((bitField0_ & 0x00000002) == 0x00000002);
+    }
+    /**
+     * <pre>
+     * Unix timestamp in milliseconds of when the runs ended.
+     * </pre>
+     *
+     * <code>optional int64 end_time = 3;</code>
+     */
+    public long getEndTime() {
+      return endTime_;
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < runIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runIds_.getRaw(i));
+      }
+      if (((bitField0_ & 0x00000001) == 0x00000001)) {
+        output.writeEnum(2, status_);
+      }
+      if (((bitField0_ & 0x00000002) == 0x00000002)) {
+        output.writeInt64(3, endTime_);
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < runIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(runIds_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getRunIdsList().size();
+      }
+      if (((bitField0_ & 0x00000001) == 0x00000001)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeEnumSize(2, status_);
+      }
+      if (((bitField0_ & 0x00000002) == 0x00000002)) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeInt64Size(3, endTime_);
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.TerminateRuns)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.TerminateRuns other = (org.mlflow.api.proto.Service.TerminateRuns) obj;
+
+      boolean result = true;
+      result = result && getRunIdsList()
+          .equals(other.getRunIdsList());
+      result = result && (hasStatus() == other.hasStatus());
+      if (hasStatus()) {
+        result = result && status_ == other.status_;
+      }
+      result = result && (hasEndTime() == other.hasEndTime());
+      if (hasEndTime()) {
+        result = result && (getEndTime()
+            == other.getEndTime());
+      }
+      result = result && unknownFields.equals(other.unknownFields);
+      return result;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getRunIdsCount() > 0) {
+        hash = (37 * hash) + RUN_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getRunIdsList().hashCode();
+      }
+      if (hasStatus()) {
+        hash = (37 * hash) + STATUS_FIELD_NUMBER;
+        hash = (53 * hash) + status_;
+      }
+      if (hasEndTime()) {
+        hash = (37 * hash) + END_TIME_FIELD_NUMBER;
+        hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+            getEndTime());
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.TerminateRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.TerminateRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.TerminateRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.TerminateRuns)
+        org.mlflow.api.proto.Service.TerminateRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.TerminateRuns.class, org.mlflow.api.proto.Service.TerminateRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.TerminateRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+        }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        status_ = 1;
+        bitField0_ = (bitField0_ & ~0x00000002);
+        endTime_ = 0L;
+        bitField0_ = (bitField0_ & ~0x00000004);
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_TerminateRuns_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.TerminateRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.TerminateRuns.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.TerminateRuns build() {
+        org.mlflow.api.proto.Service.TerminateRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.TerminateRuns buildPartial() {
+        org.mlflow.api.proto.Service.TerminateRuns result = new org.mlflow.api.proto.Service.TerminateRuns(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = runIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
+        }
+        result.runIds_ = runIds_;
+        if (((from_bitField0_ & 0x00000002) == 0x00000002)) {
+          to_bitField0_ |= 0x00000001;
+        }
+        result.status_ = status_;
+        if (((from_bitField0_ & 0x00000004) == 0x00000004)) {
+          to_bitField0_ |= 0x00000002;
+        }
+        result.endTime_ = endTime_;
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return (Builder) super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return (Builder) super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return (Builder) super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return (Builder) super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.TerminateRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.TerminateRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
+        }
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.TerminateRuns other) {
+        if (other == org.mlflow.api.proto.Service.TerminateRuns.getDefaultInstance()) return this;
+        if (!other.runIds_.isEmpty()) {
+          if (runIds_.isEmpty()) {
+            runIds_ = other.runIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureRunIdsIsMutable();
+            runIds_.addAll(other.runIds_);
+          }
+          onChanged();
+        }
+        if (other.hasStatus()) {
+          setStatus(other.getStatus());
+        }
+        if (other.hasEndTime()) {
+          setEndTime(other.getEndTime());
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.TerminateRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.TerminateRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
+      }
+      private int bitField0_;
+
+      private com.google.protobuf.LazyStringList runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureRunIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = new com.google.protobuf.LazyStringArrayList(runIds_);
+          bitField0_ |= 0x00000001;
+         }
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public com.google.protobuf.ProtocolStringList
+          getRunIdsList() {
+        return runIds_.getUnmodifiableView();
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public int getRunIdsCount() {
+        return runIds_.size();
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public java.lang.String getRunIds(int index) {
+        return runIds_.get(index);
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public com.google.protobuf.ByteString
+          getRunIdsBytes(int index) {
+        return runIds_.getByteString(index);
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public Builder setRunIds(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.set(index, value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public Builder addRunIds(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public Builder addAllRunIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureRunIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, runIds_);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public Builder clearRunIds() {
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * IDs of the runs to update.
+       * </pre>
+       *
+       * <code>repeated string run_ids = 1;</code>
+       */
+      public Builder addRunIdsBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
+      }
+
+      private int status_ = 1;
+      /**
+       * <pre>
+       * Updated status of the runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 2;</code>
+       */
+      public boolean hasStatus() {
+        return ((bitField0_ & 0x00000002) == 0x00000002);
+      }
+      /**
+       * <pre>
+       * Updated status of the runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.RunStatus getStatus() {
+        @SuppressWarnings("deprecation")
+        org.mlflow.api.proto.Service.RunStatus result = org.mlflow.api.proto.Service.RunStatus.valueOf(status_);
+        return result == null ? org.mlflow.api.proto.Service.RunStatus.RUNNING : result;
+      }
+      /**
+       * <pre>
+       * Updated status of the runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 2;</code>
+       */
+      public Builder setStatus(org.mlflow.api.proto.Service.RunStatus value) {
+        if (value == null) {
+          throw new NullPointerException();
+        }
+        bitField0_ |= 0x00000002;
+        status_ = value.getNumber();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Updated status of the runs.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 2;</code>
+       */
+      public Builder clearStatus() {
+        bitField0_ = (bitField0_ & ~0x00000002);
+        status_ = 1;
+        onChanged();
+        return this;
+      }
+
+      private long endTime_ ;
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs ended.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      public boolean hasEndTime() {
+        return ((bitField0_ & 0x00000004) == 0x00000004);
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs ended.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      public long getEndTime() {
+        return endTime_;
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs ended.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      public Builder setEndTime(long value) {
+        bitField0_ |= 0x00000004;
+        endTime_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the runs ended.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      public Builder clearEndTime() {
+        bitField0_ = (bitField0_ & ~0x00000004);
+        endTime_ = 0L;
+        onChanged();
+        return this;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.TerminateRuns)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.TerminateRuns)
+    private static final org.mlflow.api.proto.Service.TerminateRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.TerminateRuns();
+    }
+
+    public static org.mlflow.api.proto.Service.TerminateRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<TerminateRuns>
+        PARSER = new com.google.protobuf.AbstractParser<TerminateRuns>() {
+      @java.lang.Override
+      public TerminateRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new TerminateRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<TerminateRuns> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<TerminateRuns> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.TerminateRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
+  public interface DeleteRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.DeleteRuns)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    java.util.List<java.lang.String>
+        getRunIdsList();
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    int getRunIdsCount();
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    java.lang.String getRunIds(int index);
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    com.google.protobuf.ByteString
+        getRunIdsBytes(int index);
+  }
+  /**
+   * Protobuf type {@code mlflow.DeleteRuns}
+   */
+  public  static final class DeleteRuns extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.DeleteRuns)
+      DeleteRunsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use DeleteRuns.newBuilder() to construct.
+    private DeleteRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private DeleteRuns() {
+      runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private DeleteRuns(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              if (!((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+                runIds_ = new com.google.protobuf.LazyStringArrayList();
+                mutable_bitField0_ |= 0x00000001;
+              }
+              runIds_.add(bs);
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = runIds_.getUnmodifiableView();
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.DeleteRuns.class, org.mlflow.api.proto.Service.DeleteRuns.Builder.class);
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.DeleteRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
+    }
+    /**
+     * Protobuf type {@code mlflow.DeleteRuns.Response}
+     */
+    public  static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.DeleteRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.DeleteRuns.Response.class, org.mlflow.api.proto.Service.DeleteRuns.Response.Builder.class);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.DeleteRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.DeleteRuns.Response other = (org.mlflow.api.proto.Service.DeleteRuns.Response) obj;
+
+        boolean result = true;
+        result = result && unknownFields.equals(other.unknownFields);
+        return result;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.DeleteRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * Protobuf type {@code mlflow.DeleteRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.DeleteRuns.Response)
+          org.mlflow.api.proto.Service.DeleteRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.DeleteRuns.Response.class, org.mlflow.api.proto.Service.DeleteRuns.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.DeleteRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.DeleteRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.DeleteRuns.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.DeleteRuns.Response build() {
+          org.mlflow.api.proto.Service.DeleteRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.DeleteRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.DeleteRuns.Response result = new org.mlflow.api.proto.Service.DeleteRuns.Response(this);
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return (Builder) super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return (Builder) super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return (Builder) super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return (Builder) super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.DeleteRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.DeleteRuns.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.DeleteRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.DeleteRuns.Response.getDefaultInstance()) return this;
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.DeleteRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.DeleteRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.DeleteRuns.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.DeleteRuns.Response)
+      private static final org.mlflow.api.proto.Service.DeleteRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.DeleteRuns.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.DeleteRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.DeleteRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    public static final int RUN_IDS_FIELD_NUMBER = 1;
+    private com.google.protobuf.LazyStringList runIds_;
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public com.google.protobuf.ProtocolStringList
+        getRunIdsList() {
+      return runIds_;
+    }
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public int getRunIdsCount() {
+      return runIds_.size();
+    }
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public java.lang.String getRunIds(int index) {
+      return runIds_.get(index);
+    }
+    /**
+     * <pre>
+     * IDs of the runs to delete.
+     * </pre>
+     *
+     * <code>repeated string run_ids = 1;</code>
+     */
+    public com.google.protobuf.ByteString
+        getRunIdsBytes(int index) {
+      return runIds_.getByteString(index);
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      for (int i = 0; i < runIds_.size(); i++) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, runIds_.getRaw(i));
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      {
+        int dataSize = 0;
+        for (int i = 0; i < runIds_.size(); i++) {
+          dataSize += computeStringSizeNoTag(runIds_.getRaw(i));
+        }
+        size += dataSize;
+        size += 1 * getRunIdsList().size();
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.DeleteRuns)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.DeleteRuns other = (org.mlflow.api.proto.Service.DeleteRuns) obj;
+
+      boolean result = true;
+      result = result && getRunIdsList()
+          .equals(other.getRunIdsList());
+      result = result && unknownFields.equals(other.unknownFields);
+      return result;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (getRunIdsCount() > 0) {
+        hash = (37 * hash) + RUN_IDS_FIELD_NUMBER;
+        hash = (53 * hash) + getRunIdsList().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.DeleteRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.DeleteRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.DeleteRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.DeleteRuns)
+        org.mlflow.api.proto.Service.DeleteRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.DeleteRuns.class, org.mlflow.api.proto.Service.DeleteRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.DeleteRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+        }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_DeleteRuns_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.DeleteRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.DeleteRuns.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.DeleteRuns build() {
+        org.mlflow.api.proto.Service.DeleteRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.DeleteRuns buildPartial() {
+        org.mlflow.api.proto.Service.DeleteRuns result = new org.mlflow.api.proto.Service.DeleteRuns(this);
+        int from_bitField0_ = bitField0_;
+        if (((bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = runIds_.getUnmodifiableView();
+          bitField0_ = (bitField0_ & ~0x00000001);
+        }
+        result.runIds_ = runIds_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return (Builder) super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return (Builder) super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return (Builder) super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return (Builder) super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.DeleteRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.DeleteRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
         }
-        return this;
       }
-      /**
-       * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
-       */
-      public Builder addTags(
-          int index, org.mlflow.api.proto.Service.RunTag value) {
-        if (tagsBuilder_ == null) {
-          if (value == null) {
-            throw new NullPointerException();
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.DeleteRuns other) {
+        if (other == org.mlflow.api.proto.Service.DeleteRuns.getDefaultInstance()) return this;
+        if (!other.runIds_.isEmpty()) {
+          if (runIds_.isEmpty()) {
+            runIds_ = other.runIds_;
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            ensureRunIdsIsMutable();
+            runIds_.addAll(other.runIds_);
           }
-          ensureTagsIsMutable();
-          tags_.add(index, value);
           onChanged();
-        } else {
-          tagsBuilder_.addMessage(index, value);
         }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
         return this;
       }
-      /**
-       * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
-       */
-      public Builder addTags(
-          org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.add(builderForValue.build());
-          onChanged();
-        } else {
-          tagsBuilder_.addMessage(builderForValue.build());
-        }
-        return this;
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
       }
-      /**
-       * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
-       * </pre>
-       *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
-       */
-      public Builder addTags(
-          int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.add(index, builderForValue.build());
-          onChanged();
-        } else {
-          tagsBuilder_.addMessage(index, builderForValue.build());
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.DeleteRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.DeleteRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
         }
         return this;
       }
+      private int bitField0_;
+
+      private com.google.protobuf.LazyStringList runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+      private void ensureRunIdsIsMutable() {
+        if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+          runIds_ = new com.google.protobuf.LazyStringArrayList(runIds_);
+          bitField0_ |= 0x00000001;
+         }
+      }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public Builder addAllTags(
-          java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunTag> values) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          com.google.protobuf.AbstractMessageLite.Builder.addAll(
-              values, tags_);
-          onChanged();
-        } else {
-          tagsBuilder_.addAllMessages(values);
-        }
-        return this;
+      public com.google.protobuf.ProtocolStringList
+          getRunIdsList() {
+        return runIds_.getUnmodifiableView();
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public Builder clearTags() {
-        if (tagsBuilder_ == null) {
-          tags_ = java.util.Collections.emptyList();
-          bitField0_ = (bitField0_ & ~0x00000008);
-          onChanged();
-        } else {
-          tagsBuilder_.clear();
-        }
-        return this;
+      public int getRunIdsCount() {
+        return runIds_.size();
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public Builder removeTags(int index) {
-        if (tagsBuilder_ == null) {
-          ensureTagsIsMutable();
-          tags_.remove(index);
-          onChanged();
-        } else {
-          tagsBuilder_.remove(index);
-        }
-        return this;
+      public java.lang.String getRunIds(int index) {
+        return runIds_.get(index);
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag.Builder getTagsBuilder(
-          int index) {
-        return getTagsFieldBuilder().getBuilder(index);
+      public com.google.protobuf.ByteString
+          getRunIdsBytes(int index) {
+        return runIds_.getByteString(index);
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
-          int index) {
-        if (tagsBuilder_ == null) {
-          return tags_.get(index);  } else {
-          return tagsBuilder_.getMessageOrBuilder(index);
-        }
+      public Builder setRunIds(
+          int index, java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.set(index, value);
+        onChanged();
+        return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
-           getTagsOrBuilderList() {
-        if (tagsBuilder_ != null) {
-          return tagsBuilder_.getMessageOrBuilderList();
-        } else {
-          return java.util.Collections.unmodifiableList(tags_);
-        }
+      public Builder addRunIds(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder() {
-        return getTagsFieldBuilder().addBuilder(
-            org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+      public Builder addAllRunIds(
+          java.lang.Iterable<java.lang.String> values) {
+        ensureRunIdsIsMutable();
+        com.google.protobuf.AbstractMessageLite.Builder.addAll(
+            values, runIds_);
+        onChanged();
+        return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder(
-          int index) {
-        return getTagsFieldBuilder().addBuilder(
-            index, org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+      public Builder clearRunIds() {
+        runIds_ = com.google.protobuf.LazyStringArrayList.EMPTY;
+        bitField0_ = (bitField0_ & ~0x00000001);
+        onChanged();
+        return this;
       }
       /**
        * <pre>
-       * Tags to log. A single request can contain up to 100 tags, and up to 1000
-       * metrics, params, and tags in total.
+       * IDs of the runs to delete.
        * </pre>
        *
-       * <code>repeated .mlflow.RunTag tags = 4;</code>
+       * <code>repeated string run_ids = 1;</code>
        */
-      public java.util.List<org.mlflow.api.proto.Service.RunTag.Builder> 
-           getTagsBuilderList() {
-        return getTagsFieldBuilder().getBuilderList();
-      }
-      private com.google.protobuf.RepeatedFieldBuilderV3<
-          org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> 
-          getTagsFieldBuilder() {
-        if (tagsBuilder_ == null) {
-          tagsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
-              org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder>(
-                  tags_,
-                  ((bitField0_ & 0x00000008) == 0x00000008),
-                  getParentForChildren(),
-                  isClean());
-          tags_ = null;
-        }
-        return tagsBuilder_;
+      public Builder addRunIdsBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  ensureRunIdsIsMutable();
+        runIds_.add(value);
+        onChanged();
+        return this;
       }
       @java.lang.Override
       public final Builder setUnknownFields(
@@ -45425,41 +51534,41 @@ public final class Service {
       }
 
 
-      // @@protoc_insertion_point(builder_scope:mlflow.LogBatch)
+      // @@protoc_insertion_point(builder_scope:mlflow.DeleteRuns)
     }
 
-    // @@protoc_insertion_point(class_scope:mlflow.LogBatch)
-    private static final org.mlflow.api.proto.Service.LogBatch DEFAULT_INSTANCE;
+    // @@protoc_insertion_point(class_scope:mlflow.DeleteRuns)
+    private static final org.mlflow.api.proto.Service.DeleteRuns DEFAULT_INSTANCE;
     static {
-      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.LogBatch();
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.DeleteRuns();
     }
 
-    public static org.mlflow.api.proto.Service.LogBatch getDefaultInstance() {
+    public static org.mlflow.api.proto.Service.DeleteRuns getDefaultInstance() {
       return DEFAULT_INSTANCE;
     }
 
-    @java.lang.Deprecated public static final com.google.protobuf.Parser<LogBatch>
-        PARSER = new com.google.protobuf.AbstractParser<LogBatch>() {
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<DeleteRuns>
+        PARSER = new com.google.protobuf.AbstractParser<DeleteRuns>() {
       @java.lang.Override
-      public LogBatch parsePartialFrom(
+      public DeleteRuns parsePartialFrom(
           com.google.protobuf.CodedInputStream input,
           com.google.protobuf.ExtensionRegistryLite extensionRegistry)
           throws com.google.protobuf.InvalidProtocolBufferException {
-        return new LogBatch(input, extensionRegistry);
+        return new DeleteRuns(input, extensionRegistry);
       }
     };
 
-    public static com.google.protobuf.Parser<LogBatch> parser() {
+    public static com.google.protobuf.Parser<DeleteRuns> parser() {
       return PARSER;
     }
 
     @java.lang.Override
-    public com.google.protobuf.Parser<LogBatch> getParserForType() {
+    public com.google.protobuf.Parser<DeleteRuns> getParserForType() {
       return PARSER;
     }
 
     @java.lang.Override
-    public org.mlflow.api.proto.Service.LogBatch getDefaultInstanceForType() {
+    public org.mlflow.api.proto.Service.DeleteRuns getDefaultInstanceForType() {
       return DEFAULT_INSTANCE;
     }
 
@@ -48274,6 +54383,36 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_LogBatch_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_CreateRuns_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_CreateRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_CreateRuns_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_CreateRuns_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_TerminateRuns_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_TerminateRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_TerminateRuns_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_TerminateRuns_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_DeleteRuns_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_DeleteRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_DeleteRuns_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_DeleteRuns_Response_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_LogModel_descriptor;
   private static final 
@@ -48376,144 +54515,172 @@ public final class Service {
       "tabricks.rpc.RPC[$this.Response]\"m\n\tDele" +
       "teTag\022\024\n\006run_id\030\001 \001(\tB\004\370\206\031\001\022\021\n\003key\030\002 \001(\t" +
       "B\004\370\206\031\001\032\n\n\010Response:+\342?(\n&com.databricks." +
-      "rpc.RPC[$this.Response]\"}\n\006GetRun\022\016\n\006run" +
-      "_id\030\002 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\032$\n\010Response\022" +
-      "\030\n\003run\030\001 \001(\0132\013.mlflow.Run:+\342?(\n&com.data" +
-      "bricks.rpc.RPC[$this.Response]\"\230\002\n\nSearc" +
-      "hRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n\006filter\030" +
-      "\004 \001(\t\0224\n\rrun_view_type\030\003 \001(\0162\020.mlflow.Vi" +
-      "ewType:\013ACTIVE_ONLY\022\031\n\013max_results\030\005 \001(\005" +
-      ":\0041000\022\020\n\010order_by\030\006 \003(\t\022\022\n\npage_token\030\007" +
-      " \001(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013.mlflow." +
-      "Run\022\027\n\017next_page_token\030\002 \001(\t:+\342?(\n&com.d" +
-      "atabricks.rpc.RPC[$this.Response]\"\330\001\n\rLi" +
-      "stArtifacts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid\030" +
-      "\001 \001(\t\022\014\n\004path\030\002 \001(\t\022\022\n\npage_token\030\004 \001(\t\032" +
-      "V\n\010Response\022\020\n\010root_uri\030\001 \001(\t\022\037\n\005files\030\002" +
-      " \003(\0132\020.mlflow.FileInfo\022\027\n\017next_page_toke" +
-      "n\030\003 \001(\t:+\342?(\n&com.databricks.rpc.RPC[$th" +
-      "is.Response]\";\n\010FileInfo\022\014\n\004path\030\001 \001(\t\022\016" +
-      "\n\006is_dir\030\002 \001(\010\022\021\n\tfile_size\030\003 \001(\003\"\250\001\n\020Ge" +
-      "tMetricHistory\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uu" +
-      "id\030\001 \001(\t\022\030\n\nmetric_key\030\002 \001(\tB\004\370\206\031\001\032+\n\010Re" +
-      "sponse\022\037\n\007metrics\030\001 \003(\0132\016.mlflow.Metric:" +
-      "+\342?(\n&com.databricks.rpc.RPC[$this.Respo" +
-      "nse]\"\261\001\n\010LogBatch\022\016\n\006run_id\030\001 \001(\t\022\037\n\007met" +
-      "rics\030\002 \003(\0132\016.mlflow.Metric\022\035\n\006params\030\003 \003" +
-      "(\0132\r.mlflow.Param\022\034\n\004tags\030\004 \003(\0132\016.mlflow" +
-      ".RunTag\032\n\n\010Response:+\342?(\n&com.databricks" +
-      ".rpc.RPC[$this.Response]\"g\n\010LogModel\022\016\n\006" +
-      "run_id\030\001 \001(\t\022\022\n\nmodel_json\030\002 \001(\t\032\n\n\010Resp" +
+      "rpc.RPC[$this.Response]\"\245\001\n\006GetRun\022\016\n\006ru" +
+      "n_id\030\002 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\022\025\n\rsince_ve" +
+      "rsion\030\003 \001(\t\0325\n\010Response\022\030\n\003run\030\001 \001(\0132\013.m" +
+      "lflow.Run\022\017\n\007version\030\002 \001(\t:+\342?(\n&com.dat" +
+      "abricks.rpc.RPC[$this.Response]\"\230\002\n\nSear" +
+      "chRuns\022\026\n\016experiment_ids\030\001 \003(\t\022\016\n\006filter" +
+      "\030\004 \001(\t\0224\n\rrun_view_type\030\003 \001(\0162\020.mlflow.V" +
+      "iewType:\013ACTIVE_ONLY\022\031\n\013max_results\030\005 \001(" +
+      "\005:\0041000\022\020\n\010order_by\030\006 \003(\t\022\022\n\npage_token\030" +
+      "\007 \001(\t\032>\n\010Response\022\031\n\004runs\030\001 \003(\0132\013.mlflow" +
+      ".Run\022\027\n\017next_page_token\030\002 \001(\t:+\342?(\n&com." +
+      "databricks.rpc.RPC[$this.Response]\"\353\001\n\rL" +
+      "istArtifacts\022\016\n\006run_id\030\003 \001(\t\022\020\n\010run_uuid" +
+      "\030\001 \001(\t\022\014\n\004path\030\002 \001(\t\022\022\n\npage_token\030\004 \001(\t" +
+      "\022\021\n\trecursive\030\005 \001(\010\032V\n\010Response\022\020\n\010root_" +
+      "uri\030\001 \001(\t\022\037\n\005files\030\002 \003(\0132\020.mlflow.FileIn" +
+      "fo\022\027\n\017next_page_token\030\003 \001(\t:+\342?(\n&com.da" +
+      "tabricks.rpc.RPC[$this.Response]\";\n\010File" +
+      "Info\022\014\n\004path\030\001 \001(\t\022\016\n\006is_dir\030\002 \001(\010\022\021\n\tfi" +
+      "le_size\030\003 \001(\003\"\325\001\n\020GetMetricHistory\022\016\n\006ru" +
+      "n_id\030\003 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\022\030\n\nmetric_k" +
+      "ey\030\002 \001(\tB\004\370\206\031\001\022\022\n\nsince_step\030\004 \001(\003\022\027\n\017si" +
+      "nce_timestamp\030\005 \001(\003\032+\n\010Response\022\037\n\007metri" +
+      "cs\030\001 \003(\0132\016.mlflow.Metric:+\342?(\n&com.datab" +
+      "ricks.rpc.RPC[$this.Response]\"\261\001\n\010LogBat" +
+      "ch\022\016\n\006run_id\030\001 \001(\t\022\037\n\007metrics\030\002 \003(\0132\016.ml" +
+      "flow.Metric\022\035\n\006params\030\003 \003(\0132\r.mlflow.Par" +
+      "am\022\034\n\004tags\030\004 \003(\0132\016.mlflow.RunTag\032\n\n\010Resp" +
       "onse:+\342?(\n&com.databricks.rpc.RPC[$this." +
-      "Response]\"\225\001\n\023GetExperimentByName\022\035\n\017exp" +
-      "eriment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Response\022&\n\n" +
-      "experiment\030\001 \001(\0132\022.mlflow.Experiment:+\342?" +
-      "(\n&com.databricks.rpc.RPC[$this.Response" +
-      "]*6\n\010ViewType\022\017\n\013ACTIVE_ONLY\020\001\022\020\n\014DELETE" +
-      "D_ONLY\020\002\022\007\n\003ALL\020\003*I\n\nSourceType\022\014\n\010NOTEB" +
-      "OOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003\022\t\n\005LOCAL\020\004\022\014" +
-      "\n\007UNKNOWN\020\350\007*M\n\tRunStatus\022\013\n\007RUNNING\020\001\022\r" +
-      "\n\tSCHEDULED\020\002\022\014\n\010FINISHED\020\003\022\n\n\006FAILED\020\004\022" +
-      "\n\n\006KILLED\020\0052\341\036\n\rMlflowService\022\246\001\n\023getExp" +
-      "erimentByName\022\033.mlflow.GetExperimentByNa" +
-      "me\032$.mlflow.GetExperimentByName.Response" +
-      "\"L\362\206\031H\n,\n\003GET\022\037/mlflow/experiments/get-b" +
-      "y-name\032\004\010\002\020\000\020\001*\026Get Experiment By Name\022\306" +
-      "\001\n\020createExperiment\022\030.mlflow.CreateExper" +
-      "iment\032!.mlflow.CreateExperiment.Response" +
-      "\"u\362\206\031q\n(\n\004POST\022\032/mlflow/experiments/crea" +
-      "te\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlflow/experi" +
-      "ments/create\032\004\010\002\020\000\020\001*\021Create Experiment\022" +
-      "\274\001\n\017listExperiments\022\027.mlflow.ListExperim" +
-      "ents\032 .mlflow.ListExperiments.Response\"n" +
-      "\362\206\031j\n%\n\003GET\022\030/mlflow/experiments/list\032\004\010" +
-      "\002\020\000\n-\n\003GET\022 /preview/mlflow/experiments/" +
-      "list\032\004\010\002\020\000\020\001*\020List Experiments\022\262\001\n\rgetEx" +
-      "periment\022\025.mlflow.GetExperiment\032\036.mlflow" +
-      ".GetExperiment.Response\"j\362\206\031f\n$\n\003GET\022\027/m" +
-      "lflow/experiments/get\032\004\010\002\020\000\n,\n\003GET\022\037/pre" +
-      "view/mlflow/experiments/get\032\004\010\002\020\000\020\001*\016Get" +
-      " Experiment\022\306\001\n\020deleteExperiment\022\030.mlflo" +
-      "w.DeleteExperiment\032!.mlflow.DeleteExperi" +
-      "ment.Response\"u\362\206\031q\n(\n\004POST\022\032/mlflow/exp" +
-      "eriments/delete\032\004\010\002\020\000\n0\n\004POST\022\"/preview/" +
-      "mlflow/experiments/delete\032\004\010\002\020\000\020\001*\021Delet" +
-      "e Experiment\022\314\001\n\021restoreExperiment\022\031.mlf" +
-      "low.RestoreExperiment\032\".mlflow.RestoreEx" +
-      "periment.Response\"x\362\206\031t\n)\n\004POST\022\033/mlflow" +
-      "/experiments/restore\032\004\010\002\020\000\n1\n\004POST\022#/pre" +
-      "view/mlflow/experiments/restore\032\004\010\002\020\000\020\001*" +
-      "\022Restore Experiment\022\306\001\n\020updateExperiment" +
-      "\022\030.mlflow.UpdateExperiment\032!.mlflow.Upda" +
-      "teExperiment.Response\"u\362\206\031q\n(\n\004POST\022\032/ml" +
-      "flow/experiments/update\032\004\010\002\020\000\n0\n\004POST\022\"/" +
-      "preview/mlflow/experiments/update\032\004\010\002\020\000\020" +
-      "\001*\021Update Experiment\022\234\001\n\tcreateRun\022\021.mlf" +
-      "low.CreateRun\032\032.mlflow.CreateRun.Respons" +
-      "e\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/create\032\004\010\002" +
-      "\020\000\n)\n\004POST\022\033/preview/mlflow/runs/create\032" +
-      "\004\010\002\020\000\020\001*\nCreate Run\022\234\001\n\tupdateRun\022\021.mlfl" +
-      "ow.UpdateRun\032\032.mlflow.UpdateRun.Response" +
-      "\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/update\032\004\010\002\020" +
-      "\000\n)\n\004POST\022\033/preview/mlflow/runs/update\032\004" +
-      "\010\002\020\000\020\001*\nUpdate Run\022\234\001\n\tdeleteRun\022\021.mlflo" +
-      "w.DeleteRun\032\032.mlflow.DeleteRun.Response\"" +
-      "`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/delete\032\004\010\002\020\000" +
-      "\n)\n\004POST\022\033/preview/mlflow/runs/delete\032\004\010" +
-      "\002\020\000\020\001*\nDelete Run\022\242\001\n\nrestoreRun\022\022.mlflo" +
-      "w.RestoreRun\032\033.mlflow.RestoreRun.Respons" +
-      "e\"c\362\206\031_\n\"\n\004POST\022\024/mlflow/runs/restore\032\004\010" +
-      "\002\020\000\n*\n\004POST\022\034/preview/mlflow/runs/restor" +
-      "e\032\004\010\002\020\000\020\001*\013Restore Run\022\244\001\n\tlogMetric\022\021.m" +
-      "lflow.LogMetric\032\032.mlflow.LogMetric.Respo" +
-      "nse\"h\362\206\031d\n%\n\004POST\022\027/mlflow/runs/log-metr" +
-      "ic\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlflow/runs/l" +
-      "og-metric\032\004\010\002\020\000\020\001*\nLog Metric\022\246\001\n\010logPar" +
-      "am\022\020.mlflow.LogParam\032\031.mlflow.LogParam.R" +
-      "esponse\"m\362\206\031i\n(\n\004POST\022\032/mlflow/runs/log-" +
-      "parameter\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlflow" +
-      "/runs/log-parameter\032\004\010\002\020\000\020\001*\tLog Param\022\341" +
-      "\001\n\020setExperimentTag\022\030.mlflow.SetExperime" +
-      "ntTag\032!.mlflow.SetExperimentTag.Response" +
-      "\"\217\001\362\206\031\212\001\n4\n\004POST\022&/mlflow/experiments/se" +
-      "t-experiment-tag\032\004\010\002\020\000\n<\n\004POST\022./preview" +
-      "/mlflow/experiments/set-experiment-tag\032\004" +
-      "\010\002\020\000\020\001*\022Set Experiment Tag\022\222\001\n\006setTag\022\016." +
-      "mlflow.SetTag\032\027.mlflow.SetTag.Response\"_" +
-      "\362\206\031[\n\"\n\004POST\022\024/mlflow/runs/set-tag\032\004\010\002\020\000" +
-      "\n*\n\004POST\022\034/preview/mlflow/runs/set-tag\032\004" +
-      "\010\002\020\000\020\001*\007Set Tag\022\244\001\n\tdeleteTag\022\021.mlflow.D" +
-      "eleteTag\032\032.mlflow.DeleteTag.Response\"h\362\206" +
-      "\031d\n%\n\004POST\022\027/mlflow/runs/delete-tag\032\004\010\002\020" +
-      "\000\n-\n\004POST\022\037/preview/mlflow/runs/delete-t" +
-      "ag\032\004\010\002\020\000\020\001*\nDelete Tag\022\210\001\n\006getRun\022\016.mlfl" +
-      "ow.GetRun\032\027.mlflow.GetRun.Response\"U\362\206\031Q" +
-      "\n\035\n\003GET\022\020/mlflow/runs/get\032\004\010\002\020\000\n%\n\003GET\022\030" +
-      "/preview/mlflow/runs/get\032\004\010\002\020\000\020\001*\007Get Ru" +
-      "n\022\314\001\n\nsearchRuns\022\022.mlflow.SearchRuns\032\033.m" +
-      "lflow.SearchRuns.Response\"\214\001\362\206\031\207\001\n!\n\004POS" +
-      "T\022\023/mlflow/runs/search\032\004\010\002\020\000\n)\n\004POST\022\033/p" +
-      "review/mlflow/runs/search\032\004\010\002\020\000\n(\n\003GET\022\033" +
-      "/preview/mlflow/runs/search\032\004\010\002\020\000\020\001*\013Sea" +
-      "rch Runs\022\260\001\n\rlistArtifacts\022\025.mlflow.List" +
-      "Artifacts\032\036.mlflow.ListArtifacts.Respons" +
-      "e\"h\362\206\031d\n#\n\003GET\022\026/mlflow/artifacts/list\032\004" +
-      "\010\002\020\000\n+\n\003GET\022\036/preview/mlflow/artifacts/l" +
-      "ist\032\004\010\002\020\000\020\001*\016List Artifacts\022\307\001\n\020getMetri" +
-      "cHistory\022\030.mlflow.GetMetricHistory\032!.mlf" +
-      "low.GetMetricHistory.Response\"v\362\206\031r\n(\n\003G" +
-      "ET\022\033/mlflow/metrics/get-history\032\004\010\002\020\000\n0\n" +
-      "\003GET\022#/preview/mlflow/metrics/get-histor" +
-      "y\032\004\010\002\020\000\020\001*\022Get Metric History\022\236\001\n\010logBat" +
-      "ch\022\020.mlflow.LogBatch\032\031.mlflow.LogBatch.R" +
-      "esponse\"e\362\206\031a\n$\n\004POST\022\026/mlflow/runs/log-" +
-      "batch\032\004\010\002\020\000\n,\n\004POST\022\036/preview/mlflow/run" +
-      "s/log-batch\032\004\010\002\020\000\020\001*\tLog Batch\022\236\001\n\010logMo" +
-      "del\022\020.mlflow.LogModel\032\031.mlflow.LogModel." +
-      "Response\"e\362\206\031a\n$\n\004POST\022\026/mlflow/runs/log" +
-      "-model\032\004\010\002\020\000\n,\n\004POST\022\036/preview/mlflow/ru" +
-      "ns/log-model\032\004\010\002\020\000\020\001*\tLog ModelB\036\n\024org.m" +
-      "lflow.api.proto\220\001\001\342?\002\020\001"
+      "Response]\"\300\001\n\nCreateRuns\022\025\n\rexperiment_i" +
+      "d\030\001 \001(\t\022\017\n\007user_id\030\002 \001(\t\022\022\n\nstart_time\030\003" +
+      " \001(\003\022\"\n\truns_data\030\004 \003(\0132\017.mlflow.RunData" +
+      "\032%\n\010Response\022\031\n\004runs\030\001 \003(\0132\013.mlflow.Run:" +
+      "+\342?(\n&com.databricks.rpc.RPC[$this.Respo" +
+      "nse]\"\262\001\n\rTerminateRuns\022\017\n\007run_ids\030\001 \003(\t\022" +
+      "!\n\006status\030\002 \001(\0162\021.mlflow.RunStatus\022\020\n\010en" +
+      "d_time\030\003 \001(\003\032.\n\010Response\022\"\n\trun_infos\030\001 " +
+      "\003(\0132\017.mlflow.RunInfo:+\342?(\n&com.databrick" +
+      "s.rpc.RPC[$this.Response]\"V\n\nDeleteRuns\022" +
+      "\017\n\007run_ids\030\001 \003(\t\032\n\n\010Response:+\342?(\n&com.d" +
+      "atabricks.rpc.RPC[$this.Response]\"g\n\010Log" +
+      "Model\022\016\n\006run_id\030\001 \001(\t\022\022\n\nmodel_json\030\002 \001(" +
+      "\t\032\n\n\010Response:+\342?(\n&com.databricks.rpc.R" +
+      "PC[$this.Response]\"\225\001\n\023GetExperimentByNa" +
+      "me\022\035\n\017experiment_name\030\001 \001(\tB\004\370\206\031\001\0322\n\010Res" +
+      "ponse\022&\n\nexperiment\030\001 \001(\0132\022.mlflow.Exper" +
+      "iment:+\342?(\n&com.databricks.rpc.RPC[$this" +
+      ".Response]*6\n\010ViewType\022\017\n\013ACTIVE_ONLY\020\001\022" +
+      "\020\n\014DELETED_ONLY\020\002\022\007\n\003ALL\020\003*I\n\nSourceType" +
+      "\022\014\n\010NOTEBOOK\020\001\022\007\n\003JOB\020\002\022\013\n\007PROJECT\020\003\022\t\n\005" +
+      "LOCAL\020\004\022\014\n\007UNKNOWN\020\350\007*M\n\tRunStatus\022\013\n\007RU" +
+      "NNING\020\001\022\r\n\tSCHEDULED\020\002\022\014\n\010FINISHED\020\003\022\n\n\006" +
+      "FAILED\020\004\022\n\n\006KILLED\020\0052\200#\n\rMlflowService\022\246" +
+      "\001\n\023getExperimentByName\022\033.mlflow.GetExper" +
+      "imentByName\032$.mlflow.GetExperimentByName" +
+      ".Response\"L\362\206\031H\n,\n\003GET\022\037/mlflow/experime" +
+      "nts/get-by-name\032\004\010\002\020\000\020\001*\026Get Experiment " +
+      "By Name\022\306\001\n\020createExperiment\022\030.mlflow.Cr" +
+      "eateExperiment\032!.mlflow.CreateExperiment" +
+      ".Response\"u\362\206\031q\n(\n\004POST\022\032/mlflow/experim" +
+      "ents/create\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlfl" +
+      "ow/experiments/create\032\004\010\002\020\000\020\001*\021Create Ex" +
+      "periment\022\274\001\n\017listExperiments\022\027.mlflow.Li" +
+      "stExperiments\032 .mlflow.ListExperiments.R" +
+      "esponse\"n\362\206\031j\n%\n\003GET\022\030/mlflow/experiment" +
+      "s/list\032\004\010\002\020\000\n-\n\003GET\022 /preview/mlflow/exp" +
+      "eriments/list\032\004\010\002\020\000\020\001*\020List Experiments\022" +
+      "\262\001\n\rgetExperiment\022\025.mlflow.GetExperiment" +
+      "\032\036.mlflow.GetExperiment.Response\"j\362\206\031f\n$" +
+      "\n\003GET\022\027/mlflow/experiments/get\032\004\010\002\020\000\n,\n\003" +
+      "GET\022\037/preview/mlflow/experiments/get\032\004\010\002" +
+      "\020\000\020\001*\016Get Experiment\022\306\001\n\020deleteExperimen" +
+      "t\022\030.mlflow.DeleteExperiment\032!.mlflow.Del" +
+      "eteExperiment.Response\"u\362\206\031q\n(\n\004POST\022\032/m" +
+      "lflow/experiments/delete\032\004\010\002\020\000\n0\n\004POST\022\"" +
+      "/preview/mlflow/experiments/delete\032\004\010\002\020\000" +
+      "\020\001*\021Delete Experiment\022\314\001\n\021restoreExperim" +
+      "ent\022\031.mlflow.RestoreExperiment\032\".mlflow." +
+      "RestoreExperiment.Response\"x\362\206\031t\n)\n\004POST" +
+      "\022\033/mlflow/experiments/restore\032\004\010\002\020\000\n1\n\004P" +
+      "OST\022#/preview/mlflow/experiments/restore" +
+      "\032\004\010\002\020\000\020\001*\022Restore Experiment\022\306\001\n\020updateE" +
+      "xperiment\022\030.mlflow.UpdateExperiment\032!.ml" +
+      "flow.UpdateExperiment.Response\"u\362\206\031q\n(\n\004" +
+      "POST\022\032/mlflow/experiments/update\032\004\010\002\020\000\n0" +
+      "\n\004POST\022\"/preview/mlflow/experiments/upda" +
+      "te\032\004\010\002\020\000\020\001*\021Update Experiment\022\234\001\n\tcreate" +
+      "Run\022\021.mlflow.CreateRun\032\032.mlflow.CreateRu" +
+      "n.Response\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/c" +
+      "reate\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/run" +
+      "s/create\032\004\010\002\020\000\020\001*\nCreate Run\022\234\001\n\tupdateR" +
+      "un\022\021.mlflow.UpdateRun\032\032.mlflow.UpdateRun" +
+      ".Response\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/up" +
+      "date\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/runs" +
+      "/update\032\004\010\002\020\000\020\001*\nUpdate Run\022\234\001\n\tdeleteRu" +
+      "n\022\021.mlflow.DeleteRun\032\032.mlflow.DeleteRun." +
+      "Response\"`\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/del" +
+      "ete\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/runs/" +
+      "delete\032\004\010\002\020\000\020\001*\nDelete Run\022\242\001\n\nrestoreRu" +
+      "n\022\022.mlflow.RestoreRun\032\033.mlflow.RestoreRu" +
+      "n.Response\"c\362\206\031_\n\"\n\004POST\022\024/mlflow/runs/r" +
+      "estore\032\004\010\002\020\000\n*\n\004POST\022\034/preview/mlflow/ru" +
+      "ns/restore\032\004\010\002\020\000\020\001*\013Restore Run\022\244\001\n\tlogM" +
+      "etric\022\021.mlflow.LogMetric\032\032.mlflow.LogMet" +
+      "ric.Response\"h\362\206\031d\n%\n\004POST\022\027/mlflow/runs" +
+      "/log-metric\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlfl" +
+      "ow/runs/log-metric\032\004\010\002\020\000\020\001*\nLog Metric\022\246" +
+      "\001\n\010logParam\022\020.mlflow.LogParam\032\031.mlflow.L" +
+      "ogParam.Response\"m\362\206\031i\n(\n\004POST\022\032/mlflow/" +
+      "runs/log-parameter\032\004\010\002\020\000\n0\n\004POST\022\"/previ" +
+      "ew/mlflow/runs/log-parameter\032\004\010\002\020\000\020\001*\tLo" +
+      "g Param\022\341\001\n\020setExperimentTag\022\030.mlflow.Se" +
+      "tExperimentTag\032!.mlflow.SetExperimentTag" +
+      ".Response\"\217\001\362\206\031\212\001\n4\n\004POST\022&/mlflow/exper" +
+      "iments/set-experiment-tag\032\004\010\002\020\000\n<\n\004POST\022" +
+      "./preview/mlflow/experiments/set-experim" +
+      "ent-tag\032\004\010\002\020\000\020\001*\022Set Experiment Tag\022\222\001\n\006" +
+      "setTag\022\016.mlflow.SetTag\032\027.mlflow.SetTag.R" +
+      "esponse\"_\362\206\031[\n\"\n\004POST\022\024/mlflow/runs/set-" +
+      "tag\032\004\010\002\020\000\n*\n\004POST\022\034/preview/mlflow/runs/" +
+      "set-tag\032\004\010\002\020\000\020\001*\007Set Tag\022\244\001\n\tdeleteTag\022\021" +
+      ".mlflow.DeleteTag\032\032.mlflow.DeleteTag.Res" +
+      "ponse\"h\362\206\031d\n%\n\004POST\022\027/mlflow/runs/delete" +
+      "-tag\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlflow/runs" +
+      "/delete-tag\032\004\010\002\020\000\020\001*\nDelete Tag\022\210\001\n\006getR" +
+      "un\022\016.mlflow.GetRun\032\027.mlflow.GetRun.Respo" +
+      "nse\"U\362\206\031Q\n\035\n\003GET\022\020/mlflow/runs/get\032\004\010\002\020\000" +
+      "\n%\n\003GET\022\030/preview/mlflow/runs/get\032\004\010\002\020\000\020" +
+      "\001*\007Get Run\022\314\001\n\nsearchRuns\022\022.mlflow.Searc" +
+      "hRuns\032\033.mlflow.SearchRuns.Response\"\214\001\362\206\031" +
+      "\207\001\n!\n\004POST\022\023/mlflow/runs/search\032\004\010\002\020\000\n)\n" +
+      "\004POST\022\033/preview/mlflow/runs/search\032\004\010\002\020\000" +
+      "\n(\n\003GET\022\033/preview/mlflow/runs/search\032\004\010\002" +
+      "\020\000\020\001*\013Search Runs\022\260\001\n\rlistArtifacts\022\025.ml" +
+      "flow.ListArtifacts\032\036.mlflow.ListArtifact" +
+      "s.Response\"h\362\206\031d\n#\n\003GET\022\026/mlflow/artifac" +
+      "ts/list\032\004\010\002\020\000\n+\n\003GET\022\036/preview/mlflow/ar" +
+      "tifacts/list\032\004\010\002\020\000\020\001*\016List Artifacts\022\307\001\n" +
+      "\020getMetricHistory\022\030.mlflow.GetMetricHist" +
+      "ory\032!.mlflow.GetMetricHistory.Response\"v" +
+      "\362\206\031r\n(\n\003GET\022\033/mlflow/metrics/get-history" +
+      "\032\004\010\002\020\000\n0\n\003GET\022#/preview/mlflow/metrics/g" +
+      "et-history\032\004\010\002\020\000\020\001*\022Get Metric History\022\236" +
+      "\001\n\010logBatch\022\020.mlflow.LogBatch\032\031.mlflow.L" +
+      "ogBatch.Response\"e\362\206\031a\n$\n\004POST\022\026/mlflow/" +
+      "runs/log-batch\032\004\010\002\020\000\n,\n\004POST\022\036/preview/m" +
+      "lflow/runs/log-batch\032\004\010\002\020\000\020\001*\tLog Batch\022" +
+      "\254\001\n\ncreateRuns\022\022.mlflow.CreateRuns\032\033.mlf" +
+      "low.CreateRuns.Response\"m\362\206\031i\n\'\n\004POST\022\031/" +
+      "mlflow/runs/create-batch\032\004\010\002\020\000\n/\n\004POST\022!" +
+      "/preview/mlflow/runs/create-batch\032\004\010\002\020\000\020" +
+      "\001*\013Create Runs\022\276\001\n\rterminateRuns\022\025.mlflo" +
+      "w.TerminateRuns\032\036.mlflow.TerminateRuns.R" +
+      "esponse\"v\362\206\031r\n*\n\004POST\022\034/mlflow/runs/term" +
+      "inate-batch\032\004\010\002\020\000\n2\n\004POST\022$/preview/mlfl" +
+      "ow/runs/terminate-batch\032\004\010\002\020\000\020\001*\016Termina" +
+      "te Runs\022\254\001\n\ndeleteRuns\022\022.mlflow.DeleteRu" +
+      "ns\032\033.mlflow.DeleteRuns.Response\"m\362\206\031i\n\'\n" +
+      "\004POST\022\031/mlflow/runs/delete-batch\032\004\010\002\020\000\n/" +
+      "\n\004POST\022!/preview/mlflow/runs/delete-batc" +
+      "h\032\004\010\002\020\000\020\001*\013Delete Runs\022\236\001\n\010logModel\022\020.ml" +
+      "flow.LogModel\032\031.mlflow.LogModel.Response" +
+      "\"e\362\206\031a\n$\n\004POST\022\026/mlflow/runs/log-model\032\004" +
+      "\010\002\020\000\n,\n\004POST\022\036/preview/mlflow/runs/log-m" +
+      "odel\032\004\010\002\020\000\020\001*\tLog ModelB\036\n\024org.mlflow.ap" +
+      "i.proto\220\001\001\342?\002\020\001"
     };
     com.google.protobuf.Descriptors.FileDescriptor.InternalDescriptorAssigner assigner =
         new com.google.protobuf.Descriptors.FileDescriptor.    InternalDescriptorAssigner() {
@@ -48762,13 +54929,13 @@ public final class Service {
     internal_static_mlflow_GetRun_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetRun_descriptor,
-        new java.lang.String[] { "RunId", "RunUuid", });
+        new java.lang.String[] { "RunId", "RunUuid", "SinceVersion", });
     internal_static_mlflow_GetRun_Response_descriptor =
       internal_static_mlflow_GetRun_descriptor.getNestedTypes().get(0);
     internal_static_mlflow_GetRun_Response_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetRun_Response_descriptor,
-        new java.lang.String[] { "Run", });
+        new java.lang.String[] { "Run", "Version", });
     internal_static_mlflow_SearchRuns_descriptor =
       getDescriptor().getMessageTypes().get(24);
     internal_static_mlflow_SearchRuns_fieldAccessorTable = new
@@ -48786,7 +54953,7 @@ public final class Service {
     internal_static_mlflow_ListArtifacts_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_ListArtifacts_descriptor,
-        new java.lang.String[] { "RunId", "RunUuid", "Path", "PageToken", });
+        new java.lang.String[] { "RunId", "RunUuid", "Path", "PageToken", "Recursive", });
     internal_static_mlflow_ListArtifacts_Response_descriptor =
       internal_static_mlflow_ListArtifacts_descriptor.getNestedTypes().get(0);
     internal_static_mlflow_ListArtifacts_Response_fieldAccessorTable = new
@@ -48804,7 +54971,7 @@ public final class Service {
     internal_static_mlflow_GetMetricHistory_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetMetricHistory_descriptor,
-        new java.lang.String[] { "RunId", "RunUuid", "MetricKey", });
+        new java.lang.String[] { "RunId", "RunUuid", "MetricKey", "SinceStep", "SinceTimestamp", });
     internal_static_mlflow_GetMetricHistory_Response_descriptor =
       internal_static_mlflow_GetMetricHistory_descriptor.getNestedTypes().get(0);
     internal_static_mlflow_GetMetricHistory_Response_fieldAccessorTable = new
@@ -48823,8 +54990,44 @@ public final class Service {
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogBatch_Response_descriptor,
         new java.lang.String[] { });
-    internal_static_mlflow_LogModel_descriptor =
+    internal_static_mlflow_CreateRuns_descriptor =
       getDescriptor().getMessageTypes().get(29);
+    internal_static_mlflow_CreateRuns_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_CreateRuns_descriptor,
+        new java.lang.String[] { "ExperimentId", "UserId", "StartTime", "RunsData", });
+    internal_static_mlflow_CreateRuns_Response_descriptor =
+      internal_static_mlflow_CreateRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_CreateRuns_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_CreateRuns_Response_descriptor,
+        new java.lang.String[] { "Runs", });
+    internal_static_mlflow_TerminateRuns_descriptor =
+      getDescriptor().getMessageTypes().get(30);
+    internal_static_mlflow_TerminateRuns_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_TerminateRuns_descriptor,
+        new java.lang.String[] { "RunIds", "Status", "EndTime", });
+    internal_static_mlflow_TerminateRuns_Response_descriptor =
+      internal_static_mlflow_TerminateRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_TerminateRuns_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_TerminateRuns_Response_descriptor,
+        new java.lang.String[] { "RunInfos", });
+    internal_static_mlflow_DeleteRuns_descriptor =
+      getDescriptor().getMessageTypes().get(31);
+    internal_static_mlflow_DeleteRuns_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_DeleteRuns_descriptor,
+        new java.lang.String[] { "RunIds", });
+    internal_static_mlflow_DeleteRuns_Response_descriptor =
+      internal_static_mlflow_DeleteRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_DeleteRuns_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_DeleteRuns_Response_descriptor,
+        new java.lang.String[] { });
+    internal_static_mlflow_LogModel_descriptor =
+      getDescriptor().getMessageTypes().get(32);
     internal_static_mlflow_LogModel_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogModel_descriptor,
@@ -48836,7 +55039,7 @@ public final class Service {
         internal_static_mlflow_LogModel_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_GetExperimentByName_descriptor =
-      getDescriptor().getMessageTypes().get(30);
+      getDescriptor().getMessageTypes().get(33);
     internal_static_mlflow_GetExperimentByName_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetExperimentByName_descriptor,
@@ -5,6 +5,7 @@ import click
 import json
 import mlflow.tracking
 from mlflow.entities import ViewType
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking import _get_store
 from tabulate import tabulate
 from mlflow.utils.mlflow_tags import MLFLOW_RUN_NAME
@@ -87,3 +88,51 @@ def describe_run(run_id):
     run = store.get_run(run_id)
     json_run = json.dumps(run.to_dictionary(), indent=4)
     print(json_run)
+
+
+@commands.command("explain")
+@click.option(
+    "--experiment-id",
+    "experiment_ids",
+    envvar=mlflow.tracking._EXPERIMENT_ID_ENV_VAR,
+    type=click.STRING,
+    multiple=True,
+    required=True,
+    help="ID of an experiment to search. Can be specified multiple times.",
+)
+@click.option("--filter", "filter_string", default="", help="Filter query string of the search.")
+@click.option(
+    "--order-by",
+    multiple=True,
+    help="Column to order the runs by, such as 'metrics.rmse DESC'. Can be specified multiple "
+    "times.",
+)
+@click.option(
+    "--view",
+    "-v",
+    default="active_only",
+    help="Select view type for the search. Valid view types are "
+    "'active_only' (default), 'deleted_only', and 'all'.",
+)
+@click.option(
+    "--max-results",
+    type=click.INT,
+    default=SEARCH_MAX_RESULTS_DEFAULT,
+    help="Maximum number of runs of the search.",
+)
+def explain_search(experiment_ids, filter_string, order_by, view, max_results):
+    """
+    Print the SQL query with which the configured tracking database searches runs, and the query
+    plan reported by the EXPLAIN statement of the database, without executing the search. Set the
+    MLFLOW_TRACKING_URI environment variable to the URI of the database, such as
+    ``sqlite:///mlruns.db``.
+    """
+    store = _get_store()
+    view_type = ViewType.from_string(view) if view else ViewType.ACTIVE_ONLY
+    explanation = store.explain_search_runs(
+        list(experiment_ids), filter_string, view_type, max_results, list(order_by) or None
+    )
+    print(explanation["sql"])
+    print("\nQuery plan:")
+    for line in explanation["plan"]:
+        print(line)
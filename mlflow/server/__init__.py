@@ -19,6 +19,16 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
+RESPONSE_CACHE_ENV_VAR = "_MLFLOW_SERVER_RESPONSE_CACHE"
+RESPONSE_CACHE_TTL_ENV_VAR = "_MLFLOW_SERVER_RESPONSE_CACHE_TTL"
+ASGI_MAX_THREADS_ENV_VAR = "_MLFLOW_SERVER_ASGI_MAX_THREADS"
+CLIENT_RATE_LIMIT_ENV_VAR = "_MLFLOW_SERVER_CLIENT_RATE_LIMIT"
+CONCURRENCY_LIMITS_ENV_VAR = "_MLFLOW_SERVER_CONCURRENCY_LIMITS"
+ADMISSION_CONTROL_STATE_ENV_VAR = "_MLFLOW_SERVER_ADMISSION_CONTROL_STATE"
+TRUST_PROXY_AUTH_ENV_VAR = "_MLFLOW_SERVER_TRUST_PROXY_AUTH"
+ARTIFACTS_DESTINATION_ENV_VAR = "_MLFLOW_SERVER_ARTIFACTS_DESTINATION"
+PRELOAD_ENV_VAR = "_MLFLOW_SERVER_PRELOAD"
+WORKERS_ENV_VAR = "_MLFLOW_SERVER_WORKERS"
 
 REL_STATIC_DIR = "js/build"
 
@@ -29,13 +39,14 @@ STATIC_DIR = os.path.join(app.root_path, REL_STATIC_DIR)
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
-if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
-    from mlflow.server.prometheus_exporter import activate_prometheus_exporter
+for http_path, handler, methods in handlers.get_artifact_proxy_endpoints():
+    app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
-    prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
-    if not os.path.exists(prometheus_metrics_path):
-        os.makedirs(prometheus_metrics_path)
-    activate_prometheus_exporter(app)
+for http_path, handler, methods in handlers.get_metric_stream_endpoints():
+    app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
+
+for http_path, handler, methods in handlers.get_run_export_endpoints():
+    app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
 
 # Provide a health check endpoint to ensure the application is responsive
@@ -44,6 +55,17 @@ def health():
     return "OK", 200
 
 
+# Provide a readiness check endpoint, passing once the stores of the worker are warm
+@app.route("/ready")
+def ready():
+    from mlflow.server import warmup
+
+    if warmup.is_ready():
+        return "OK", 200
+    warmup.start_warmup()
+    return "Warming up", 503
+
+
 # Serve the "get-artifact" route.
 @app.route(_add_static_prefix("/get-artifact"))
 def serve_artifacts():
@@ -87,6 +109,45 @@ def serve():
     return Response(text, mimetype="text/plain")
 
 
+# Configured once all the routes are registered, so that they are all instrumented
+if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
+    from mlflow.server.prometheus_exporter import activate_prometheus_exporter
+
+    prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
+    if not os.path.exists(prometheus_metrics_path):
+        os.makedirs(prometheus_metrics_path)
+    activate_prometheus_exporter(app)
+
+if os.getenv(CLIENT_RATE_LIMIT_ENV_VAR) or os.getenv(CONCURRENCY_LIMITS_ENV_VAR):
+    from mlflow.server.admission_control import (
+        AdmissionController,
+        get_limiter_state,
+        get_worker_limits,
+        parse_client_rate_limit,
+        parse_concurrency_limits,
+    )
+
+    admission_control_state = os.getenv(ADMISSION_CONTROL_STATE_ENV_VAR, "memory")
+    client_rate_limit = os.getenv(CLIENT_RATE_LIMIT_ENV_VAR)
+    client_rate_limit, concurrency_limits = get_worker_limits(
+        admission_control_state,
+        parse_client_rate_limit(client_rate_limit) if client_rate_limit else None,
+        parse_concurrency_limits(os.getenv(CONCURRENCY_LIMITS_ENV_VAR, "")),
+        int(os.getenv(WORKERS_ENV_VAR, "1")),
+    )
+    AdmissionController(
+        get_limiter_state(admission_control_state),
+        client_rate_limit,
+        concurrency_limits,
+        trust_proxy_auth=bool(os.getenv(TRUST_PROXY_AUTH_ENV_VAR)),
+    ).install(app)
+
+if os.getenv(PRELOAD_ENV_VAR):
+    from mlflow.server import warmup
+
+    warmup.preload()
+
+
 def _build_waitress_command(waitress_opts, host, port):
     opts = shlex.split(waitress_opts) if waitress_opts else []
     return (
@@ -96,12 +157,33 @@ def _build_waitress_command(waitress_opts, host, port):
     )
 
 
-def _build_gunicorn_command(gunicorn_opts, host, port, workers):
+def _build_gunicorn_command(gunicorn_opts, host, port, workers, preload=False):
     bind_address = "%s:%s" % (host, port)
     opts = shlex.split(gunicorn_opts) if gunicorn_opts else []
+    if preload:
+        opts.append("--preload")
     return ["gunicorn"] + opts + ["-b", bind_address, "-w", "%s" % workers, "mlflow.server:app"]
 
 
+def _build_uvicorn_command(uvicorn_opts, host, port, workers):
+    opts = shlex.split(uvicorn_opts) if uvicorn_opts else []
+    return (
+        ["uvicorn"]
+        + opts
+        + [
+            "--host",
+            host,
+            "--port",
+            "%s" % port,
+            "--workers",
+            "%s" % workers,
+            "--lifespan",
+            "on",
+            "mlflow.server.asgi:app",
+        ]
+    )
+
+
 def _run_server(
     file_store_path,
     default_artifact_root,
@@ -112,11 +194,45 @@ def _run_server(
     gunicorn_opts=None,
     waitress_opts=None,
     expose_prometheus=None,
+    response_cache=None,
+    response_cache_ttl=None,
+    asgi=False,
+    asgi_max_threads=None,
+    uvicorn_opts=None,
+    client_rate_limit=None,
+    concurrency_limits=None,
+    admission_control_state=None,
+    trust_proxy_auth=False,
+    artifacts_destination=None,
+    preload=False,
 ):
     """
-    Run the MLflow server, wrapping it in gunicorn or waitress on windows
+    Run the MLflow server, wrapping it in gunicorn or waitress on windows, or in uvicorn if
+    ``asgi`` is set
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param response_cache: If set, URI of the cache used to serve read-heavy endpoints, see
+                           :py:func:`mlflow.server.response_cache.get_response_cache`.
+    :param response_cache_ttl: If set, time-to-live of the cached responses, see
+                               :py:func:`mlflow.server.response_cache.parse_response_cache_ttls`.
+    :param asgi: If True, serve the ASGI application :py:mod:`mlflow.server.asgi` with uvicorn.
+    :param asgi_max_threads: Number of threads handling requests in each uvicorn worker, see
+                             :py:func:`mlflow.server.asgi.get_max_threads`.
+    :param client_rate_limit: If set, per-client rate limit of requests, see
+                              :py:func:`mlflow.server.admission_control.parse_client_rate_limit`.
+    :param concurrency_limits: If set, maximum numbers of concurrent requests per endpoint class,
+                               see
+                               :py:func:`mlflow.server.admission_control.parse_concurrency_limits`.
+    :param admission_control_state: URI of the state of the admission controller, see
+                                    :py:func:`mlflow.server.admission_control.get_limiter_state`.
+                                    Defaults to a state held by each worker, which enforces its
+                                    share of the limits.
+    :param trust_proxy_auth: If True, rate limit clients by their ``Authorization`` header, as
+                             verified by an authenticating proxy, rather than by IP address.
+    :param artifacts_destination: If set, URI of the artifact repository served by the proxied
+                                  artifact access endpoints under ``/api/2.0/mlflow-artifacts``.
+    :param preload: If True, initialize the stores before serving requests, once before forking
+                    the workers with gunicorn, see :py:mod:`mlflow.server.warmup`.
     :return: None
     """
     env_map = {}
@@ -129,10 +245,33 @@ def _run_server(
 
     if expose_prometheus:
         env_map[PROMETHEUS_EXPORTER_ENV_VAR] = expose_prometheus
+    if response_cache:
+        env_map[RESPONSE_CACHE_ENV_VAR] = response_cache
+    if response_cache_ttl:
+        env_map[RESPONSE_CACHE_TTL_ENV_VAR] = response_cache_ttl
+
+    if asgi_max_threads:
+        env_map[ASGI_MAX_THREADS_ENV_VAR] = str(asgi_max_threads)
+    if client_rate_limit:
+        env_map[CLIENT_RATE_LIMIT_ENV_VAR] = client_rate_limit
+    if concurrency_limits:
+        env_map[CONCURRENCY_LIMITS_ENV_VAR] = concurrency_limits
+    if admission_control_state:
+        env_map[ADMISSION_CONTROL_STATE_ENV_VAR] = admission_control_state
+    if trust_proxy_auth:
+        env_map[TRUST_PROXY_AUTH_ENV_VAR] = "true"
+    if artifacts_destination:
+        env_map[ARTIFACTS_DESTINATION_ENV_VAR] = artifacts_destination
+    if preload:
+        env_map[PRELOAD_ENV_VAR] = "true"
 
     # TODO: eventually may want waitress on non-win32
-    if sys.platform == "win32":
+    if asgi:
+        env_map[WORKERS_ENV_VAR] = str(workers or 4)
+        full_command = _build_uvicorn_command(uvicorn_opts, host, port, workers or 4)
+    elif sys.platform == "win32":
         full_command = _build_waitress_command(waitress_opts, host, port)
     else:
-        full_command = _build_gunicorn_command(gunicorn_opts, host, port, workers or 4)
+        env_map[WORKERS_ENV_VAR] = str(workers or 4)
+        full_command = _build_gunicorn_command(gunicorn_opts, host, port, workers or 4, preload)
     exec_cmd(full_command, env=env_map, stream_output=True)
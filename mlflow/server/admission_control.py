@@ -0,0 +1,447 @@
+"""
+Admission control for the tracking server.
+
+Requests to the REST API and artifact endpoints are admitted only if
+
+- the client issuing them (identified by its IP address, or by its user name or access token if
+  the server trusts an authenticating proxy) has a token left in its token bucket, which is
+  refilled at a fixed rate up to a maximum burst size, and
+- fewer requests of the same endpoint class (``writes``, ``searches``, ``artifacts`` or
+  ``streams``) than the configured maximum are being served.
+
+Other requests are rejected with HTTP 429 and a ``Retry-After`` header. The token buckets and the
+number of requests in flight are kept in a limiter state, which is either held in the memory of
+each worker process of the server, enforcing its share of the limits, or persisted in a local
+SQLite database file so that it is shared by all the workers. The shared state enforces the exact
+limits of the server at the cost of a write transaction to the file per request.
+"""
+import base64
+import collections
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+
+from flask import Response, g, request
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, REQUEST_LIMIT_EXCEEDED
+
+WRITES = "writes"
+SEARCHES = "searches"
+ARTIFACTS = "artifacts"
+STREAMS = "streams"
+ENDPOINT_CLASSES = [WRITES, SEARCHES, ARTIFACTS, STREAMS]
+
+# Number of seconds after which clients rejected by a concurrency limit are asked to retry
+CONCURRENCY_LIMIT_RETRY_AFTER = 1
+
+
+class LimiterState:
+    """
+    Abstract state of the admission controller: the token buckets of the clients and the number of
+    requests being served per endpoint class.
+    """
+
+    def consume_token(self, client, rate, burst):
+        """
+        Take a token from the bucket of ``client``, which holds up to ``burst`` tokens and is
+        refilled with ``rate`` tokens per second.
+
+        :return: ``0`` if a token was taken, otherwise the number of seconds until the bucket
+                 holds a token again.
+        """
+        raise NotImplementedError()
+
+    def acquire_slot(self, endpoint_class, limit):
+        """
+        Reserve one of the ``limit`` slots of ``endpoint_class`` for a request.
+
+        :return: An identifier of the reserved slot to pass to :py:meth:`release_slot`, or
+                 ``None`` if all the slots are taken.
+        """
+        raise NotImplementedError()
+
+    def release_slot(self, endpoint_class, slot_id):
+        """
+        Release a slot previously reserved with :py:meth:`acquire_slot`.
+        """
+        raise NotImplementedError()
+
+
+def _refill(tokens, updated_at, now, rate, burst):
+    return min(burst, tokens + (now - updated_at) * rate)
+
+
+def _retry_after(tokens, rate):
+    return (1 - tokens) / rate
+
+
+class InMemoryLimiterState(LimiterState):
+    """
+    Limiter state held in the memory of the current process.
+    """
+
+    # Number of token buckets above which the buckets that are full again are dropped
+    _MAX_BUCKETS = 100000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # client -> (tokens, last refill time)
+        self._buckets = {}
+        self._slots = collections.Counter()
+        self._slot_ids = 0
+
+    def consume_token(self, client, rate, burst):
+        now = time.time()
+        with self._lock:
+            if client not in self._buckets and len(self._buckets) >= self._MAX_BUCKETS:
+                # Drop the buckets that are full again, which behave like missing ones
+                self._buckets = {
+                    key: bucket
+                    for key, bucket in self._buckets.items()
+                    if _refill(bucket[0], bucket[1], now, rate, burst) < burst
+                }
+            tokens, updated_at = self._buckets.get(client, (burst, now))
+            tokens = _refill(tokens, updated_at, now, rate, burst)
+            retry_after = 0 if tokens >= 1 else _retry_after(tokens, rate)
+            self._buckets[client] = (tokens if retry_after else tokens - 1, now)
+            return retry_after
+
+    def acquire_slot(self, endpoint_class, limit):
+        with self._lock:
+            if self._slots[endpoint_class] >= limit:
+                return None
+            self._slots[endpoint_class] += 1
+            self._slot_ids += 1
+            return self._slot_ids
+
+    def release_slot(self, endpoint_class, slot_id):
+        with self._lock:
+            self._slots[endpoint_class] -= 1
+
+
+class SqliteLimiterState(LimiterState):
+    """
+    Limiter state persisted in a local SQLite database file, so that it is shared by all the worker
+    processes of a server running on the same host. Slots held by worker processes that died while
+    serving a request are reclaimed when an endpoint class runs out of slots.
+    """
+
+    # Number of token bucket updates between two purges of the buckets that are full again
+    _PURGE_INTERVAL = 1000
+
+    def __init__(self, path):
+        self._path = os.path.abspath(path)
+        self._local = threading.local()
+        self._update_count = 0
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(client TEXT PRIMARY KEY, tokens REAL, updated_at REAL, full_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS slots "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, endpoint_class TEXT, pid INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS slots_class ON slots (endpoint_class)")
+
+    def _connect(self):
+        # SQLite connections must not be used across forks, e.g. by workers of a preloaded server
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            dirname = os.path.dirname(self._path)
+            if not os.path.exists(dirname):
+                os.makedirs(dirname)
+            # Transactions are managed explicitly, see `_transaction`
+            conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        # Take the write lock upfront so that the read-modify-write cycles of concurrent workers
+        # are serialized
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def consume_token(self, client, rate, burst):
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE client = ?", (client,)
+            ).fetchone()
+            tokens = _refill(row[0], row[1], now, rate, burst) if row else burst
+            retry_after = 0 if tokens >= 1 else _retry_after(tokens, rate)
+            if not retry_after:
+                tokens -= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                (client, tokens, now, now + (burst - tokens) / rate),
+            )
+            self._update_count += 1
+            if self._update_count % self._PURGE_INTERVAL == 0:
+                conn.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+            return retry_after
+
+    def acquire_slot(self, endpoint_class, limit):
+        with self._transaction() as conn:
+            if self._count_slots(conn, endpoint_class) >= limit:
+                self._reclaim_slots_of_dead_processes(conn, endpoint_class)
+                if self._count_slots(conn, endpoint_class) >= limit:
+                    return None
+            cursor = conn.execute(
+                "INSERT INTO slots (endpoint_class, pid) VALUES (?, ?)",
+                (endpoint_class, os.getpid()),
+            )
+            return cursor.lastrowid
+
+    def release_slot(self, endpoint_class, slot_id):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM slots WHERE id = ?", (slot_id,))
+
+    @staticmethod
+    def _count_slots(conn, endpoint_class):
+        query = "SELECT COUNT(*) FROM slots WHERE endpoint_class = ?"
+        return conn.execute(query, (endpoint_class,)).fetchone()[0]
+
+    @staticmethod
+    def _reclaim_slots_of_dead_processes(conn, endpoint_class):
+        query = "SELECT DISTINCT pid FROM slots WHERE endpoint_class = ?"
+        for (pid,) in conn.execute(query, (endpoint_class,)).fetchall():
+            if not _is_process_alive(pid):
+                conn.execute("DELETE FROM slots WHERE pid = ?", (pid,))
+
+
+def _is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # e.g. the process exists but belongs to another user
+        pass
+    return True
+
+
+def get_limiter_state(state_uri):
+    """
+    Create the limiter state described by ``state_uri``, which is either ``memory`` for a state
+    held by the current process or ``sqlite:///path/to/state.db`` for a state shared across the
+    workers of the server.
+    """
+    parsed = urllib.parse.urlparse(state_uri)
+    scheme = parsed.scheme or parsed.path
+    if scheme == "memory":
+        return InMemoryLimiterState()
+    elif scheme == "sqlite" and parsed.path:
+        return SqliteLimiterState(parsed.path)
+    raise MlflowException(
+        "Invalid admission control state URI: '{}'. Supported URIs are 'memory' and "
+        "'sqlite:///path/to/state.db'.".format(state_uri),
+        error_code=INVALID_PARAMETER_VALUE,
+    )
+
+
+def get_worker_limits(state_uri, client_rate_limit, concurrency_limits, num_workers):
+    """
+    Divide the limits of a server among its worker processes, unless their limiter state is shared.
+    Each worker then holds its own token buckets refilled at its share of the rate, and admits its
+    share of the concurrent requests, rounded up. The limits of the server are thus enforced as
+    long as the requests are spread evenly across the workers, while a client whose requests are
+    all served by the same worker (e.g. over a single keep-alive connection) is limited to its
+    share.
+
+    :param state_uri: URI of the limiter state, see :py:func:`get_limiter_state`.
+    :param client_rate_limit: ``(rate, burst)`` tuple of the server, or ``None``.
+    :param concurrency_limits: Dictionary of the concurrency limits of the server.
+    :param num_workers: Number of worker processes of the server.
+
+    :return: A tuple of the client rate limit and the concurrency limits of each worker.
+    """
+    if urllib.parse.urlparse(state_uri).scheme == "sqlite" or num_workers <= 1:
+        return client_rate_limit, concurrency_limits
+    if client_rate_limit is not None:
+        rate, burst = client_rate_limit
+        client_rate_limit = (rate / num_workers, max(1, burst / num_workers))
+    concurrency_limits = {
+        endpoint_class: -(-limit // num_workers)
+        for endpoint_class, limit in concurrency_limits.items()
+    }
+    return client_rate_limit, concurrency_limits
+
+
+def parse_client_rate_limit(rate_limit_spec):
+    """
+    Parse a per-client rate limit of the form ``RATE[,BURST]``, e.g. ``20,100`` for 20 requests
+    per second sustained with bursts of up to 100 requests. The burst size defaults to the rate.
+
+    :return: A ``(rate, burst)`` tuple.
+    """
+    try:
+        values = [float(value) for value in rate_limit_spec.split(",")]
+        if len(values) not in (1, 2) or min(values) <= 0:
+            raise ValueError()
+    except ValueError:
+        raise MlflowException(
+            "Invalid client rate limit: '{}'. Expected a positive number of requests per second, "
+            "optionally followed by a burst size, e.g. '20,100'.".format(rate_limit_spec),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    rate = values[0]
+    return rate, max(1, values[1] if len(values) == 2 else rate)
+
+
+def parse_concurrency_limits(limits_spec):
+    """
+    Parse per-endpoint class concurrency limits of the form
+    ``writes=32,searches=8,artifacts=4,streams=16``.
+
+    :return: A dictionary mapping endpoint classes to their maximum number of requests in flight.
+    """
+    limits = {}
+    for item in limits_spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        endpoint_class, _, limit = item.partition("=")
+        endpoint_class = endpoint_class.strip()
+        try:
+            limit = int(limit)
+        except ValueError:
+            limit = 0
+        if endpoint_class not in ENDPOINT_CLASSES or limit <= 0:
+            raise MlflowException(
+                "Invalid concurrency limit: '{}'. Expected a positive number of requests for "
+                "one of the endpoint classes {}, e.g. 'searches=8'.".format(item, ENDPOINT_CLASSES),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        limits[endpoint_class] = limit
+    return limits
+
+
+def get_endpoint_class(method, path):
+    """
+    :return: The endpoint class of a request to the REST API or the artifact endpoints, or ``None``
+             for other requests (e.g. to the UI or to the health check), which are always admitted.
+    """
+    if "get-artifact" in path or "/artifacts/" in path or "/mlflow-artifacts/" in path:
+        return ARTIFACTS
+    if "api/2.0/" not in path:
+        return None
+    if path.endswith("/metrics/stream"):
+        # Metric streams are long-lived but mostly idle, so they have their own class rather than
+        # starving the other ones
+        return STREAMS
+    if method == "GET" or path.endswith("/search") or path.endswith("/runs/export"):
+        return SEARCHES
+    return WRITES
+
+
+def get_client_id(flask_request, trust_proxy_auth=False):
+    """
+    Identify the client issuing ``flask_request`` by its IP address or, if ``trust_proxy_auth``,
+    by the user name of basic authentication or by a digest of its bearer token.
+
+    :param trust_proxy_auth: Whether the ``Authorization`` header of the request was verified by
+                             an authenticating proxy in front of the server. The server does not
+                             verify it itself, so unless a proxy does, any client could send
+                             requests under the identity of another one, or under a new identity
+                             per request to evade its rate limit.
+    """
+    if not trust_proxy_auth:
+        return "ip:" + str(flask_request.remote_addr)
+    authorization = flask_request.headers.get("Authorization", "")
+    scheme, _, credentials = authorization.partition(" ")
+    if scheme.lower() == "basic" and credentials:
+        try:
+            user = base64.b64decode(credentials).decode("utf-8").partition(":")[0]
+            return "user:" + user
+        except ValueError:
+            pass
+    if scheme.lower() == "bearer" and credentials:
+        return "token:" + hashlib.sha256(credentials.encode("utf-8")).hexdigest()[:32]
+    return "ip:" + str(flask_request.remote_addr)
+
+
+class AdmissionController:
+    """
+    Admission control of the requests to a Flask application.
+
+    :param state: :py:class:`LimiterState` shared by the workers of the server.
+    :param client_rate_limit: Optional ``(rate, burst)`` token bucket parameters of each client.
+    :param concurrency_limits: Optional dictionary mapping endpoint classes to their maximum number
+                               of requests in flight.
+    :param trust_proxy_auth: Whether to identify clients by their ``Authorization`` header, see
+                             :py:func:`get_client_id`.
+    """
+
+    def __init__(
+        self, state, client_rate_limit=None, concurrency_limits=None, trust_proxy_auth=False
+    ):
+        self.state = state
+        self.client_rate_limit = client_rate_limit
+        self.concurrency_limits = concurrency_limits or {}
+        self.trust_proxy_auth = trust_proxy_auth
+
+    def install(self, app):
+        app.before_request(self._admit)
+        app.after_request(self._release_on_close)
+        app.teardown_request(self._release_on_error)
+        return app
+
+    def _admit(self):
+        endpoint_class = get_endpoint_class(request.method, request.path)
+        if endpoint_class is None:
+            return None
+        if self.client_rate_limit is not None:
+            rate, burst = self.client_rate_limit
+            retry_after = self.state.consume_token(
+                get_client_id(request, self.trust_proxy_auth), rate, burst
+            )
+            if retry_after:
+                return _too_many_requests(
+                    "Rate limit of {:g} requests per second exceeded.".format(rate), retry_after
+                )
+        limit = self.concurrency_limits.get(endpoint_class)
+        if limit is not None:
+            slot_id = self.state.acquire_slot(endpoint_class, limit)
+            if slot_id is None:
+                return _too_many_requests(
+                    "Too many concurrent {} requests.".format(endpoint_class),
+                    CONCURRENCY_LIMIT_RETRY_AFTER,
+                )
+            g.admission_control_slot = (endpoint_class, slot_id)
+        return None
+
+    def _release_on_close(self, response):
+        slot = g.pop("admission_control_slot", None)
+        if slot is not None:
+            # Streamed responses, e.g. artifact downloads, hold their slot until fully sent
+            response.call_on_close(lambda: self.state.release_slot(*slot))
+        return response
+
+    def _release_on_error(self, exc):  # pylint: disable=unused-argument
+        slot = g.pop("admission_control_slot", None)
+        if slot is not None:
+            self.state.release_slot(*slot)
+
+
+def _too_many_requests(message, retry_after):
+    response = Response(mimetype="application/json")
+    response.set_data(MlflowException(message, REQUEST_LIMIT_EXCEEDED).serialize_as_json())
+    response.status_code = 429
+    response.headers["Retry-After"] = str(max(1, int(math.ceil(retry_after))))
+    return response
@@ -0,0 +1,262 @@
+"""
+ASGI adapter of the tracking server, served with ``mlflow server --asgi``.
+
+This is not an asynchronous implementation of the tracking server: the ASGI application runs the
+synchronous handlers of the Flask application in ``mlflow.server`` in a bounded pool of threads.
+Each request holds a thread of the pool for as long as its handler runs, including while the
+handler waits for the backend or for the next part of the request body, and each metric stream
+holds one for as long as it is open. What the adapter moves to the event loop is the I/O with the
+clients: idle keep-alive connections, receiving request bodies and writing responses. Streamed
+responses, such as artifact downloads, are pulled from the handler one chunk at a time in the pool,
+so a download to a slow client only holds a thread while the next chunk is read from the backend.
+
+The pool is sized by :py:func:`get_max_threads` from ``--asgi-max-threads`` and the concurrency
+limits of the admission controller (``--max-concurrent-requests``).
+"""
+import asyncio
+import io
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow.server import (
+    app as wsgi_app,
+    ADMISSION_CONTROL_STATE_ENV_VAR,
+    ASGI_MAX_THREADS_ENV_VAR,
+    CONCURRENCY_LIMITS_ENV_VAR,
+    WORKERS_ENV_VAR,
+)
+from mlflow.server.admission_control import STREAMS, get_worker_limits, parse_concurrency_limits
+from mlflow.server.metric_stream import MAX_CONCURRENT_STREAMS
+
+_logger = logging.getLogger(__name__)
+
+# Default number of threads handling requests other than metric streams
+DEFAULT_ASGI_MAX_THREADS = 32
+
+_END_OF_RESPONSE = object()
+
+
+class AsgiApp:
+    """
+    ASGI application adapting a WSGI application, by default the Flask application of the tracking
+    server, whose requests are handled in a bounded pool of ``max_threads`` threads.
+    """
+
+    def __init__(self, wsgi_app, max_threads=DEFAULT_ASGI_MAX_THREADS):
+        self.wsgi_app = wsgi_app
+        self.max_threads = max_threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_threads, thread_name_prefix="mlflow-asgi"
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            await self._handle_http(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+        else:
+            raise ValueError("Unsupported ASGI scope type: '{}'".format(scope["type"]))
+
+    async def _handle_lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self._executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle_http(self, scope, receive, send):
+        loop = asyncio.get_event_loop()
+        body = io.BufferedReader(_RequestBodyReader(receive, loop))
+        environ = _build_wsgi_environ(scope, body)
+        response_start = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            response_start["status"] = int(status.split(" ", 1)[0])
+            response_start["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in response_headers
+            ]
+
+        response = await loop.run_in_executor(
+            self._executor, self.wsgi_app, environ, start_response
+        )
+        try:
+            # Responses that are already materialized, e.g. JSON payloads, are written directly;
+            # other responses are iterated in the thread pool as they may block on the backend.
+            if isinstance(response, (list, tuple)):
+                chunks = [chunk for chunk in response if chunk]
+                await _send_response_start(send, response_start)
+                for chunk in chunks:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            else:
+                iterator = iter(response)
+                started = False
+                while True:
+                    chunk = await loop.run_in_executor(
+                        self._executor, next, iterator, _END_OF_RESPONSE
+                    )
+                    if chunk is _END_OF_RESPONSE:
+                        break
+                    if not started:
+                        await _send_response_start(send, response_start)
+                        started = True
+                    if chunk:
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                if not started:
+                    await _send_response_start(send, response_start)
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            if hasattr(response, "close"):
+                await loop.run_in_executor(self._executor, response.close)
+
+
+class _RequestBodyReader(io.RawIOBase):
+    """
+    WSGI input stream of the body of an ASGI request, read by the handler in its thread. Each read
+    of data not received yet awaits the next message of the request on the event loop, so that
+    the handler starts before the whole body has arrived, and at most one message of the body is
+    held in memory at a time.
+    """
+
+    def __init__(self, receive, loop):
+        self._receive = receive
+        self._loop = loop
+        self._chunk = memoryview(b"")
+        self._more_body = True
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._chunk and self._more_body:
+            message = asyncio.run_coroutine_threadsafe(self._receive(), self._loop).result()
+            # Bodies of disconnected clients end early, which handlers report as truncated
+            self._more_body = message["type"] == "http.request" and message.get("more_body", False)
+            self._chunk = memoryview(message.get("body", b""))
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+async def _send_response_start(send, response_start):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": response_start["status"],
+            "headers": response_start["headers"],
+        }
+    )
+
+
+def _build_wsgi_environ(scope, body):
+    """
+    Build the WSGI environment (PEP 3333) of the request described by the ASGI HTTP ``scope``.
+    """
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1] if server[1] is not None else 80),
+        "SERVER_PROTOCOL": "HTTP/{}".format(scope.get("http_version", "1.1")),
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_TYPE" or name == "CONTENT_LENGTH":
+            key = name
+        else:
+            key = "HTTP_" + name
+        environ[key] = environ[key] + "," + value if key in environ else value
+    if "CONTENT_LENGTH" not in environ:
+        # The body of chunked requests ends with the last message of the request
+        environ["wsgi.input_terminated"] = True
+    return environ
+
+
+def get_max_threads(max_threads=None, concurrency_limits=None):
+    """
+    Size the thread pool of the ASGI application of each server process.
+
+    Every request holds a thread while its handler runs and every metric stream holds one while it
+    is open, so requests admitted by the concurrency limits but finding no free thread wait for one
+    instead of being rejected with HTTP 429. By default, the pool therefore has a thread for each
+    metric stream that a process serves at most, plus as many threads as the limits of the other
+    endpoint classes admit, and at least ``DEFAULT_ASGI_MAX_THREADS`` of them.
+
+    :param max_threads: Number of threads set with ``mlflow server --asgi-max-threads``, if any.
+                        Pools too small for the concurrency limits are logged as a warning.
+    :param concurrency_limits: Maximum numbers of concurrent requests per endpoint class, see
+                               :py:func:`mlflow.server.admission_control.parse_concurrency_limits`.
+    :return: The number of threads of the pool.
+    """
+    concurrency_limits = concurrency_limits or {}
+    stream_threads = min(
+        MAX_CONCURRENT_STREAMS, concurrency_limits.get(STREAMS, MAX_CONCURRENT_STREAMS)
+    )
+    request_threads = sum(
+        limit for endpoint_class, limit in concurrency_limits.items() if endpoint_class != STREAMS
+    )
+    if max_threads is None:
+        return stream_threads + max(DEFAULT_ASGI_MAX_THREADS, request_threads)
+    if max_threads <= stream_threads:
+        _logger.warning(
+            "The %d threads of the ASGI server can all be held by metric streams, which are "
+            "served up to %d at a time. Pass more threads with --asgi-max-threads, or limit "
+            "streams with --max-concurrent-requests streams=<N>.",
+            max_threads,
+            stream_threads,
+        )
+    elif max_threads < stream_threads + request_threads:
+        _logger.warning(
+            "The %d threads of the ASGI server are fewer than the %d requests admitted by the "
+            "concurrency limits, so admitted requests may wait for a thread.",
+            max_threads,
+            stream_threads + request_threads,
+        )
+    return max_threads
+
+
+def create_app(max_threads=None):
+    """
+    Create the ASGI application of the tracking server.
+
+    :param max_threads: Number of threads handling requests, and thus maximum number of requests
+                        handled concurrently. Defaults to the value passed to
+                        ``mlflow server --asgi-max-threads``, or to the size computed by
+                        :py:func:`get_max_threads` from the concurrency limits.
+    """
+    if max_threads is None and os.environ.get(ASGI_MAX_THREADS_ENV_VAR):
+        max_threads = int(os.environ[ASGI_MAX_THREADS_ENV_VAR])
+    _, concurrency_limits = get_worker_limits(
+        os.environ.get(ADMISSION_CONTROL_STATE_ENV_VAR, "memory"),
+        None,
+        parse_concurrency_limits(os.environ.get(CONCURRENCY_LIMITS_ENV_VAR, "")),
+        int(os.environ.get(WORKERS_ENV_VAR, "1")),
+    )
+    return AsgiApp(wsgi_app, get_max_threads(max_threads, concurrency_limits))
+
+
+app = create_app()
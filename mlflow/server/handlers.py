@@ -1,16 +1,27 @@
 # Define all the service endpoint handlers here.
+import collections
+import datetime
+import hashlib
 import json
+import mimetypes
 import os
+import posixpath
 import re
+import shutil
+import tempfile
+import threading
+import time
 
 import logging
 from functools import wraps
 
-from flask import Response, request, send_file
+from flask import Response, request
 from google.protobuf import descriptor
 from querystring_parser import parser
+from werkzeug.datastructures import ContentRange
+from werkzeug.http import is_resource_modified
 
-from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
+from mlflow.entities import Metric, Param, RunData, RunTag, ViewType, ExperimentTag
 from mlflow.entities.model_registry import RegisteredModelTag, ModelVersionTag
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
@@ -26,7 +37,9 @@ from mlflow.protos.service_pb2 import (
     ListArtifacts,
     GetMetricHistory,
     CreateRun,
+    CreateRuns,
     UpdateRun,
+    TerminateRuns,
     LogMetric,
     LogParam,
     SetTag,
@@ -35,6 +48,7 @@ from mlflow.protos.service_pb2 import (
     RestoreExperiment,
     RestoreRun,
     DeleteRun,
+    DeleteRuns,
     UpdateExperiment,
     LogBatch,
     DeleteTag,
@@ -64,19 +78,48 @@ from mlflow.protos.model_registry_pb2 import (
     SetModelVersionTag,
     DeleteModelVersionTag,
 )
-from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, INVALID_PARAMETER_VALUE
+from mlflow.protos.databricks_pb2 import (
+    ENDPOINT_NOT_FOUND,
+    FEATURE_DISABLED,
+    RESOURCE_DOES_NOT_EXIST,
+    INVALID_PARAMETER_VALUE,
+    REQUEST_LIMIT_EXCEEDED,
+)
+from mlflow.server import metric_stream
+from mlflow.server.response_cache import get_response_cache, parse_response_cache_ttls
+from mlflow.store.artifact.artifact_repo import ARTIFACT_STREAM_CHUNK_SIZE
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.store.tracking import EXPORT_MAX_RESULTS_THRESHOLD
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils import proto_json_utils
+from mlflow.utils.arrow_utils import (
+    ARROW_STREAM_FORMAT,
+    get_mime_type,
+    serialize_tables,
+    validate_export_format,
+)
+from mlflow.utils.proto_json_utils import parse_dict
+from mlflow.utils.validation import _validate_batch_log_api_req, bad_path_message, path_not_unique
 from mlflow.utils.string_utils import is_string_type
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 
 _logger = logging.getLogger(__name__)
 _tracking_store = None
 _model_registry_store = None
+_response_cache = None
+_response_cache_ttls = None
+# Least recently used experiment IDs of runs, used to invalidate the cached responses of their
+# experiments on run writes
+_RUN_EXPERIMENT_IDS_MAX_SIZE = 100000
+_run_experiment_ids = collections.OrderedDict()
+_run_experiment_ids_lock = threading.Lock()
+_artifacts_destination_repo = None
+# Callables wrapping the stores of the server once created, see `add_store_wrapper`
+_store_wrappers = []
+# Callables notified of the time spent serializing each response, see `add_serialization_listener`
+_serialization_listeners = []
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
 
 
@@ -128,7 +171,7 @@ def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
     if _tracking_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = default_artifact_root or os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
-        _tracking_store = _tracking_store_registry.get_store(store_uri, artifact_root)
+        _tracking_store = _wrap_store(_tracking_store_registry.get_store(store_uri, artifact_root))
     return _tracking_store
 
 
@@ -138,10 +181,75 @@ def _get_model_registry_store(backend_store_uri=None):
     global _model_registry_store
     if _model_registry_store is None:
         store_uri = backend_store_uri or os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
-        _model_registry_store = _model_registry_store_registry.get_store(store_uri)
+        _model_registry_store = _wrap_store(_model_registry_store_registry.get_store(store_uri))
     return _model_registry_store
 
 
+def _wrap_store(store):
+    for wrapper in _store_wrappers:
+        store = wrapper(store)
+    return store
+
+
+def add_store_wrapper(wrapper):
+    """
+    Register a callable invoked as ``wrapper(store)`` on the tracking and model registry stores of
+    the server, whose return value is used in place of the store, e.g. to time store calls. Stores
+    created before the registration are wrapped immediately.
+    """
+    global _tracking_store, _model_registry_store
+    _store_wrappers.append(wrapper)
+    if _tracking_store is not None:
+        _tracking_store = wrapper(_tracking_store)
+    if _model_registry_store is not None:
+        _model_registry_store = wrapper(_model_registry_store)
+
+
+def add_serialization_listener(listener):
+    """
+    Register a callable invoked as ``listener(seconds)`` with the time spent serializing each
+    response message of the current request to JSON.
+    """
+    _serialization_listeners.append(listener)
+
+
+def _message_to_json(message):
+    start = time.time()
+    json_string = proto_json_utils.message_to_json(message)
+    for listener in _serialization_listeners:
+        listener(time.time() - start)
+    return json_string
+
+
+def _get_response_cache():
+    from mlflow.server import RESPONSE_CACHE_ENV_VAR, RESPONSE_CACHE_TTL_ENV_VAR
+
+    global _response_cache, _response_cache_ttls
+    if _response_cache_ttls is None:
+        cache_uri = os.environ.get(RESPONSE_CACHE_ENV_VAR, None)
+        _response_cache = get_response_cache(cache_uri) if cache_uri else None
+        _response_cache_ttls = parse_response_cache_ttls(
+            os.environ.get(RESPONSE_CACHE_TTL_ENV_VAR, None)
+        )
+    return _response_cache
+
+
+def _get_artifacts_destination_repo():
+    from mlflow.server import ARTIFACTS_DESTINATION_ENV_VAR
+
+    global _artifacts_destination_repo
+    if _artifacts_destination_repo is None:
+        artifacts_destination = os.environ.get(ARTIFACTS_DESTINATION_ENV_VAR, None)
+        if not artifacts_destination:
+            raise MlflowException(
+                "Proxied artifact access is disabled. Start the server with "
+                "--artifacts-destination to enable it.",
+                error_code=ENDPOINT_NOT_FOUND,
+            )
+        _artifacts_destination_repo = get_artifact_repository(artifacts_destination)
+    return _artifacts_destination_repo
+
+
 def initialize_backend_stores(backend_store_uri=None, default_artifact_root=None):
     _get_tracking_store(backend_store_uri, default_artifact_root)
     try:
@@ -176,6 +284,11 @@ def _get_request_message(request_message, flask_request=request):
             ):
                 if not isinstance(request_dict[field.name], list):
                     request_dict[field.name] = [request_dict[field.name]]
+            # Likewise, boolean values are parsed as the strings that protobuf rejects
+            elif field.type == descriptor.FieldDescriptor.TYPE_BOOL and request_dict.get(
+                field.name
+            ) in ["true", "false"]:
+                request_dict[field.name] = request_dict[field.name] == "true"
         parse_dict(request_dict, request_message)
         return request_message
 
@@ -196,14 +309,72 @@ def _get_request_message(request_message, flask_request=request):
 
 
 def _send_artifact(artifact_repository, path):
-    filename = os.path.abspath(artifact_repository.download_artifacts(path))
-    extension = os.path.splitext(filename)[-1].replace(".", "")
-    # Always send artifacts as attachments to prevent the browser from displaying them on our web
-    # server's domain, which might enable XSS.
+    """
+    Stream the artifact file at ``path`` to the client, honoring conditional (``If-None-Match``,
+    ``If-Modified-Since``) and single byte range (``Range``, ``If-Range``) requests.
+    """
+    stat = artifact_repository.get_artifact_stat(path)
+    last_modified = (
+        datetime.datetime.utcfromtimestamp(stat.last_modified)
+        if stat.last_modified is not None
+        else None
+    )
+    etag = stat.etag
+    if etag is None and stat.size is not None and stat.last_modified is not None:
+        etag = "{:x}-{:x}".format(int(stat.last_modified), stat.size)
+
+    extension = os.path.splitext(path)[-1].replace(".", "")
     if extension in _TEXT_EXTENSIONS:
-        return send_file(filename, mimetype="text/plain", as_attachment=True)
+        mimetype = "text/plain"
     else:
-        return send_file(filename, as_attachment=True)
+        mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    response = Response(mimetype=mimetype)
+    # Always send artifacts as attachments to prevent the browser from displaying them on our web
+    # server's domain, which might enable XSS.
+    response.headers.add("Content-Disposition", "attachment", filename=posixpath.basename(path))
+    if etag is not None:
+        response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response.status_code = 304
+        return response
+
+    start, end = None, None
+    if stat.size is not None:
+        response.accept_ranges = "bytes"
+        if _should_serve_range(etag, last_modified):
+            byte_range = request.range.range_for_length(stat.size)
+            if byte_range is None:
+                response.status_code = 416
+                response.content_range = ContentRange("bytes", None, None, stat.size)
+                return response
+            start, end = byte_range
+            response.status_code = 206
+            response.content_range = ContentRange("bytes", start, end, stat.size)
+            response.content_length = end - start
+        else:
+            response.content_length = stat.size
+
+    if request.method != "HEAD":
+        response.response = artifact_repository.open_artifact(path, start, end)
+    return response
+
+
+def _should_serve_range(etag, last_modified):
+    """
+    Return whether the current request asks for a single byte range that should be honored,
+    i.e. it has a ``Range`` header and any ``If-Range`` precondition still holds. Requests for
+    multiple ranges are answered with the full contents, as permitted by RFC 7233.
+    """
+    if request.range is None or len(request.range.ranges) != 1 or request.range.units != "bytes":
+        return False
+    if "HTTP_IF_RANGE" in request.environ:
+        return not is_resource_modified(
+            request.environ, etag=etag, last_modified=last_modified, ignore_if_range=False
+        )
+    return True
 
 
 def catch_mlflow_exception(func):
@@ -220,6 +391,126 @@ def catch_mlflow_exception(func):
     return wrapper
 
 
+_EXPERIMENT_LIST_CACHE_TAG = "experiments"
+
+
+def _cached_response(request_class, get_tags):
+    """
+    Serve the decorated read handler from the response cache, if configured. Successful responses
+    are cached under the invalidation tags returned by ``get_tags(request_message)``.
+    """
+    endpoint = request_class.DESCRIPTOR.name
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _get_response_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+            request_hash = hashlib.sha256(request.method.encode("utf-8"))
+            request_hash.update(request.query_string)
+            request_hash.update(b"\0")
+            request_hash.update(request.get_data())
+            key = "{}:{}".format(endpoint, request_hash.hexdigest())
+            cached = cache.get(key)
+            cache.record_lookup(endpoint, cached is not None)
+            if cached is not None:
+                response = Response(mimetype="application/json")
+                response.set_data(cached)
+                return response
+            started_at = time.time()
+            response = func(*args, **kwargs)
+            if response.status_code == 200:
+                ttl = _response_cache_ttls.get(endpoint, _response_cache_ttls[None])
+                tags = get_tags(_get_request_message(request_class()))
+                # Not cached if a concurrent write invalidated these tags in the meantime
+                cache.set(key, response.get_data(), ttl, tags, since=started_at)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidates_cached_responses(request_class, get_tags):
+    """
+    Invalidate the cached responses labeled with any of the tags returned by
+    ``get_tags(request_message)`` once the decorated write handler has run, if a response cache is
+    configured. Responses computed by concurrent reads from the state preceding the write are then
+    rejected by the cache, see :py:mod:`mlflow.server.response_cache`.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cache = _get_response_cache()
+                if cache is not None:
+                    cache.invalidate(get_tags(_get_request_message(request_class())))
+
+        return wrapper
+
+    return decorator
+
+
+def _experiment_cache_tags(experiment_ids):
+    return ["experiment:{}".format(experiment_id) for experiment_id in experiment_ids]
+
+
+def _run_cache_tags(run_ids):
+    """
+    Return the invalidation tags of the specified runs, which include the tags of the experiments
+    containing them since run writes affect the ``SearchRuns`` results of these experiments.
+    """
+    tags = []
+    for run_id in run_ids:
+        tags.append("run:{}".format(run_id))
+        experiment_id = _get_run_experiment_id(run_id)
+        if experiment_id is not None:
+            tags.extend(_experiment_cache_tags([experiment_id]))
+    return tags
+
+
+def _remember_run_experiment_ids(run_infos):
+    """
+    Record the experiments of runs returned by the tracking store, so that the invalidation of
+    their later writes does not need to fetch them. The experiment of a run never changes.
+    """
+    if _get_response_cache() is None:
+        return
+    with _run_experiment_ids_lock:
+        for run_info in run_infos:
+            _run_experiment_ids.pop(run_info.run_id, None)
+            _run_experiment_ids[run_info.run_id] = run_info.experiment_id
+        while len(_run_experiment_ids) > _RUN_EXPERIMENT_IDS_MAX_SIZE:
+            _run_experiment_ids.popitem(last=False)
+
+
+def _get_run_experiment_id(run_id):
+    with _run_experiment_ids_lock:
+        experiment_id = _run_experiment_ids.get(run_id)
+        if experiment_id is not None:
+            _run_experiment_ids.move_to_end(run_id)
+            return experiment_id
+    # Only runs created by other servers, or least recently used ones, are fetched
+    try:
+        run_info = _get_tracking_store().get_run(run_id).info
+    except MlflowException:
+        return None
+    _remember_run_experiment_ids([run_info])
+    return run_info.experiment_id
+
+
+def _registered_model_cache_tags(names):
+    return ["registered-model:{}".format(name) for name in names]
+
+
+def _get_run_id(request_message):
+    return request_message.run_id or getattr(request_message, "run_uuid", "")
+
+
 _TEXT_EXTENSIONS = [
     "txt",
     "log",
@@ -253,6 +544,7 @@ def _not_implemented():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(CreateExperiment, lambda m: [_EXPERIMENT_LIST_CACHE_TAG])
 def _create_experiment():
     request_message = _get_request_message(CreateExperiment())
     experiment_id = _get_tracking_store().create_experiment(
@@ -261,18 +553,19 @@ def _create_experiment():
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_cached_response(GetExperiment, lambda m: _experiment_cache_tags([m.experiment_id]))
 def _get_experiment():
     request_message = _get_request_message(GetExperiment())
     response_message = GetExperiment.Response()
     experiment = _get_tracking_store().get_experiment(request_message.experiment_id).to_proto()
     response_message.experiment.MergeFrom(experiment)
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
@@ -289,31 +582,43 @@ def _get_experiment_by_name():
     experiment = store_exp.to_proto()
     response_message.experiment.MergeFrom(experiment)
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    DeleteExperiment,
+    lambda m: [_EXPERIMENT_LIST_CACHE_TAG] + _experiment_cache_tags([m.experiment_id]),
+)
 def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_tracking_store().delete_experiment(request_message.experiment_id)
     response_message = DeleteExperiment.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    RestoreExperiment,
+    lambda m: [_EXPERIMENT_LIST_CACHE_TAG] + _experiment_cache_tags([m.experiment_id]),
+)
 def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_tracking_store().restore_experiment(request_message.experiment_id)
     response_message = RestoreExperiment.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    UpdateExperiment,
+    lambda m: [_EXPERIMENT_LIST_CACHE_TAG] + _experiment_cache_tags([m.experiment_id]),
+)
 def _update_experiment():
     request_message = _get_request_message(UpdateExperiment())
     if request_message.new_name:
@@ -322,11 +627,12 @@ def _update_experiment():
         )
     response_message = UpdateExperiment.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(CreateRun, lambda m: _experiment_cache_tags([m.experiment_id]))
 def _create_run():
     request_message = _get_request_message(CreateRun())
 
@@ -338,47 +644,99 @@ def _create_run():
         tags=tags,
     )
 
+    _remember_run_experiment_ids([run.info])
+
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
+    return response
+
+
+@catch_mlflow_exception
+@_invalidates_cached_responses(CreateRuns, lambda m: _experiment_cache_tags([m.experiment_id]))
+def _create_runs():
+    request_message = _get_request_message(CreateRuns())
+    runs_data = [RunData.from_proto(run_data) for run_data in request_message.runs_data]
+    runs = _get_tracking_store().create_runs(
+        experiment_id=request_message.experiment_id,
+        user_id=request_message.user_id,
+        start_time=request_message.start_time,
+        runs_data=runs_data,
+    )
+    _remember_run_experiment_ids([run.info for run in runs])
+    response_message = CreateRuns.Response(runs=[run.to_proto() for run in runs])
+    response = Response(mimetype="application/json")
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(UpdateRun, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _update_run():
     request_message = _get_request_message(UpdateRun())
     run_id = request_message.run_id or request_message.run_uuid
     updated_info = _get_tracking_store().update_run_info(
         run_id, request_message.status, request_message.end_time
     )
+    _remember_run_experiment_ids([updated_info])
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(TerminateRuns, lambda m: _run_cache_tags(m.run_ids))
+def _terminate_runs():
+    request_message = _get_request_message(TerminateRuns())
+    updated_infos = _get_tracking_store().update_run_infos(
+        list(request_message.run_ids), request_message.status, request_message.end_time
+    )
+    _remember_run_experiment_ids(updated_infos)
+    response_message = TerminateRuns.Response(
+        run_infos=[run_info.to_proto() for run_info in updated_infos]
+    )
+    response = Response(mimetype="application/json")
+    response.set_data(_message_to_json(response_message))
+    return response
+
+
+@catch_mlflow_exception
+@_invalidates_cached_responses(DeleteRun, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_tracking_store().delete_run(request_message.run_id)
     response_message = DeleteRun.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
+    return response
+
+
+@catch_mlflow_exception
+@_invalidates_cached_responses(DeleteRuns, lambda m: _run_cache_tags(m.run_ids))
+def _delete_runs():
+    request_message = _get_request_message(DeleteRuns())
+    _get_tracking_store().delete_runs(list(request_message.run_ids))
+    response_message = DeleteRuns.Response()
+    response = Response(mimetype="application/json")
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(RestoreRun, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_tracking_store().restore_run(request_message.run_id)
     response_message = RestoreRun.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(LogMetric, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _log_metric():
     request_message = _get_request_message(LogMetric())
     metric = Metric(
@@ -386,13 +744,15 @@ def _log_metric():
     )
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_metric(run_id, metric)
+    metric_stream.notify(run_id)
     response_message = LogMetric.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(LogParam, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _log_param():
     request_message = _get_request_message(LogParam())
     param = Param(request_message.key, request_message.value)
@@ -400,22 +760,27 @@ def _log_param():
     _get_tracking_store().log_param(run_id, param)
     response_message = LogParam.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    SetExperimentTag,
+    lambda m: [_EXPERIMENT_LIST_CACHE_TAG] + _experiment_cache_tags([m.experiment_id]),
+)
 def _set_experiment_tag():
     request_message = _get_request_message(SetExperimentTag())
     tag = ExperimentTag(request_message.key, request_message.value)
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
     response_message = SetExperimentTag.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(SetTag, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _set_tag():
     request_message = _get_request_message(SetTag())
     tag = RunTag(request_message.key, request_message.value)
@@ -423,32 +788,54 @@ def _set_tag():
     _get_tracking_store().set_tag(run_id, tag)
     response_message = SetTag.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(DeleteTag, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _delete_tag():
     request_message = _get_request_message(DeleteTag())
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
     response_message = DeleteTag.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_cached_response(GetRun, lambda m: ["run:{}".format(_get_run_id(m))])
 def _get_run():
     request_message = _get_request_message(GetRun())
     response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
+    run = _get_tracking_store().get_run(run_id)
+    _remember_run_experiment_ids([run.info])
+    response_message.version = _get_run_version(run)
+    if response_message.version != request_message.since_version:
+        response_message.run.MergeFrom(run.to_proto())
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
+def _get_run_version(run):
+    """
+    :return: A digest of the metadata and data of ``run``, independent of the order in which the
+             store returns its metrics, params and tags.
+    """
+    # pylint: disable=protected-access
+    content = [
+        sorted(dict(run.info).items()),
+        sorted((m.key, repr(m.value), m.timestamp, m.step) for m in run.data._metric_objs),
+        sorted(run.data.params.items()),
+        sorted(run.data.tags.items()),
+    ]
+    return hashlib.sha256(json.dumps(content).encode("utf-8")).hexdigest()
+
+
 @catch_mlflow_exception
+@_cached_response(SearchRuns, lambda m: _experiment_cache_tags(m.experiment_ids))
 def _search_runs():
     request_message = _get_request_message(SearchRuns())
     response_message = SearchRuns.Response()
@@ -467,10 +854,48 @@ def _search_runs():
     if run_entities.token:
         response_message.next_page_token = run_entities.token
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
+@catch_mlflow_exception
+def _export_runs():
+    request_message = _get_request_message(SearchRuns())
+    export_format = request.args.get("format", ARROW_STREAM_FORMAT)
+    validate_export_format(export_format)
+    run_view_type = ViewType.ACTIVE_ONLY
+    if request_message.HasField("run_view_type"):
+        run_view_type = ViewType.from_proto(request_message.run_view_type)
+    max_results = EXPORT_MAX_RESULTS_THRESHOLD
+    if request_message.HasField("max_results"):
+        max_results = request_message.max_results
+    if not 0 < max_results <= EXPORT_MAX_RESULTS_THRESHOLD:
+        raise MlflowException(
+            "Invalid value for parameter 'max_results' supplied. It must be a positive integer "
+            "at most {}, got {}.".format(EXPORT_MAX_RESULTS_THRESHOLD, max_results),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    schema, tables = _get_tracking_store().export_run_batches(
+        request_message.experiment_ids,
+        request_message.filter,
+        run_view_type,
+        max_results,
+        request_message.order_by,
+    )
+    # Streamed one page of runs at a time, so that large exports are not held in memory
+    return Response(
+        serialize_tables(schema, tables, export_format), mimetype=get_mime_type(export_format)
+    )
+
+
+def get_run_export_endpoints():
+    """
+    :return: List of tuples (path, handler, methods) of the export of search results as Apache
+             Arrow or Parquet
+    """
+    return [(http_path, _export_runs, ["POST"]) for http_path in _get_paths("/mlflow/runs/export")]
+
+
 @catch_mlflow_exception
 def _list_artifacts():
     request_message = _get_request_message(ListArtifacts())
@@ -481,11 +906,14 @@ def _list_artifacts():
         path = None
     run_id = request_message.run_id or request_message.run_uuid
     run = _get_tracking_store().get_run(run_id)
-    artifact_entities = _get_artifact_repo(run).list_artifacts(path)
+    if request_message.recursive:
+        artifact_entities = _get_artifact_repo(run).list_files(path)
+    else:
+        artifact_entities = _get_artifact_repo(run).list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = _get_artifact_repo(run).artifact_uri
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
@@ -494,21 +922,37 @@ def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
     response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    metric_entites = _get_tracking_store().get_metric_history(run_id, request_message.metric_key)
+    if request_message.HasField("since_step") != request_message.HasField("since_timestamp"):
+        raise MlflowException(
+            "Parameters 'since_step' and 'since_timestamp' must be specified together.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if request_message.HasField("since_step"):
+        metric_entites = _get_tracking_store().get_metric_history_since(
+            run_id,
+            request_message.metric_key,
+            request_message.since_step,
+            request_message.since_timestamp,
+        )
+    else:
+        metric_entites = _get_tracking_store().get_metric_history(
+            run_id, request_message.metric_key
+        )
     response_message.metrics.extend([m.to_proto() for m in metric_entites])
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_cached_response(ListExperiments, lambda m: [_EXPERIMENT_LIST_CACHE_TAG])
 def _list_experiments():
     request_message = _get_request_message(ListExperiments())
     experiment_entities = _get_tracking_store().list_experiments(request_message.view_type)
     response_message = ListExperiments.Response()
     response_message.experiments.extend([e.to_proto() for e in experiment_entities])
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
@@ -518,6 +962,7 @@ def _get_artifact_repo(run):
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(LogBatch, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _log_batch():
     _validate_batch_log_api_req(_get_request_json())
     request_message = _get_request_message(LogBatch())
@@ -527,13 +972,16 @@ def _log_batch():
     _get_tracking_store().log_batch(
         run_id=request_message.run_id, metrics=metrics, params=params, tags=tags
     )
+    if metrics:
+        metric_stream.notify(request_message.run_id)
     response_message = LogBatch.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(LogModel, lambda m: _run_cache_tags([_get_run_id(m)]))
 def _log_model():
     request_message = _get_request_message(LogModel())
     try:
@@ -559,17 +1007,20 @@ def _log_model():
     )
     response_message = LogModel.Response()
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 def _wrap_response(response_message):
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(_message_to_json(response_message))
     return response
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    CreateRegisteredModel, lambda m: _registered_model_cache_tags([m.name])
+)
 def _create_registered_model():
     request_message = _get_request_message(CreateRegisteredModel())
     registered_model = _get_model_registry_store().create_registered_model(
@@ -590,6 +1041,9 @@ def _get_registered_model():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    UpdateRegisteredModel, lambda m: _registered_model_cache_tags([m.name])
+)
 def _update_registered_model():
     request_message = _get_request_message(UpdateRegisteredModel())
     name = request_message.name
@@ -602,6 +1056,9 @@ def _update_registered_model():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    RenameRegisteredModel, lambda m: _registered_model_cache_tags([m.name, m.new_name])
+)
 def _rename_registered_model():
     request_message = _get_request_message(RenameRegisteredModel())
     name = request_message.name
@@ -614,6 +1071,9 @@ def _rename_registered_model():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    DeleteRegisteredModel, lambda m: _registered_model_cache_tags([m.name])
+)
 def _delete_registered_model():
     request_message = _get_request_message(DeleteRegisteredModel())
     _get_model_registry_store().delete_registered_model(name=request_message.name)
@@ -651,6 +1111,7 @@ def _search_registered_models():
 
 
 @catch_mlflow_exception
+@_cached_response(GetLatestVersions, lambda m: _registered_model_cache_tags([m.name]))
 def _get_latest_versions():
     request_message = _get_request_message(GetLatestVersions())
     latest_versions = _get_model_registry_store().get_latest_versions(
@@ -662,6 +1123,9 @@ def _get_latest_versions():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    SetRegisteredModelTag, lambda m: _registered_model_cache_tags([m.name])
+)
 def _set_registered_model_tag():
     request_message = _get_request_message(SetRegisteredModelTag())
     tag = RegisteredModelTag(key=request_message.key, value=request_message.value)
@@ -670,6 +1134,9 @@ def _set_registered_model_tag():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    DeleteRegisteredModelTag, lambda m: _registered_model_cache_tags([m.name])
+)
 def _delete_registered_model_tag():
     request_message = _get_request_message(DeleteRegisteredModelTag())
     _get_model_registry_store().delete_registered_model_tag(
@@ -679,6 +1146,7 @@ def _delete_registered_model_tag():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(CreateModelVersion, lambda m: _registered_model_cache_tags([m.name]))
 def _create_model_version():
     request_message = _get_request_message(CreateModelVersion())
     model_version = _get_model_registry_store().create_model_version(
@@ -715,6 +1183,7 @@ def _get_model_version():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(UpdateModelVersion, lambda m: _registered_model_cache_tags([m.name]))
 def _update_model_version():
     request_message = _get_request_message(UpdateModelVersion())
     new_description = None
@@ -727,6 +1196,9 @@ def _update_model_version():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    TransitionModelVersionStage, lambda m: _registered_model_cache_tags([m.name])
+)
 def _transition_stage():
     request_message = _get_request_message(TransitionModelVersionStage())
     model_version = _get_model_registry_store().transition_model_version_stage(
@@ -741,6 +1213,7 @@ def _transition_stage():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(DeleteModelVersion, lambda m: _registered_model_cache_tags([m.name]))
 def _delete_model_version():
     request_message = _get_request_message(DeleteModelVersion())
     _get_model_registry_store().delete_model_version(
@@ -769,6 +1242,7 @@ def _search_model_versions():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(SetModelVersionTag, lambda m: _registered_model_cache_tags([m.name]))
 def _set_model_version_tag():
     request_message = _get_request_message(SetModelVersionTag())
     tag = ModelVersionTag(key=request_message.key, value=request_message.value)
@@ -779,6 +1253,9 @@ def _set_model_version_tag():
 
 
 @catch_mlflow_exception
+@_invalidates_cached_responses(
+    DeleteModelVersionTag, lambda m: _registered_model_cache_tags([m.name])
+)
 def _delete_model_version_tag():
     request_message = _get_request_message(DeleteModelVersionTag())
     _get_model_registry_store().delete_model_version_tag(
@@ -829,6 +1306,216 @@ def get_endpoints():
     return get_service_endpoints(MlflowService) + get_service_endpoints(ModelRegistryService)
 
 
+@catch_mlflow_exception
+def _stream_metrics():
+    # Streams hold their thread for minutes, which would take a whole worker out of service with
+    # servers handling one request at a time per worker, such as the default gunicorn workers
+    if not request.environ.get("wsgi.multithread"):
+        raise MlflowException(
+            "Metric streams are only served by servers handling requests concurrently in "
+            "threads. Start the server with `mlflow server --asgi`, or with threaded gunicorn "
+            "workers, e.g. `--gunicorn-opts '--threads 8'`.",
+            error_code=FEATURE_DISABLED,
+        )
+    run_ids = request.args.getlist("run_id")
+    if not run_ids or len(run_ids) > metric_stream.MAX_STREAMED_RUNS:
+        raise MlflowException(
+            "Metric streams must follow between 1 and {} runs, specified with the 'run_id' "
+            "parameter, got {}.".format(metric_stream.MAX_STREAMED_RUNS, len(run_ids)),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if not metric_stream.acquire_stream_slot():
+        raise MlflowException(
+            "Too many concurrent metric streams, at most {} are served per server process.".format(
+                metric_stream.MAX_CONCURRENT_STREAMS
+            ),
+            error_code=REQUEST_LIMIT_EXCEEDED,
+        )
+    try:
+        stream = metric_stream.MetricStream(
+            _get_tracking_store(), run_ids, request.args.getlist("metric_key")
+        )
+    except Exception:
+        metric_stream.release_stream_slot()
+        raise
+    response = Response(iter(stream), mimetype="text/event-stream")
+    response.call_on_close(metric_stream.release_stream_slot)
+    response.headers["Cache-Control"] = "no-cache"
+    # Disable the buffering of reverse proxies such as nginx
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+def get_metric_stream_endpoints():
+    """
+    :return: List of tuples (path, handler, methods) of the Server-Sent Events stream of the
+             metric values logged to a set of runs
+    """
+    return [
+        (http_path, _stream_metrics, ["GET"]) for http_path in _get_paths("/mlflow/metrics/stream")
+    ]
+
+
+# Proxied artifact access: the handlers below serve the artifacts of the repository configured
+# with --artifacts-destination, so that clients can upload and download artifacts through the
+# tracking server without credentials for the underlying storage.
+
+# Maximum size of the parts of multipart uploads spooled in memory before going to disk
+_MAX_SPOOLED_PART_SIZE = 8 * ARTIFACT_STREAM_CHUNK_SIZE
+# Part numbers range of multipart uploads, as supported by all the storage backends
+_MAX_PART_NUMBER = 10000
+
+
+def _validate_proxied_artifact_path(artifact_path):
+    if path_not_unique(artifact_path):
+        raise MlflowException(
+            "Invalid artifact path: '{}'. {}".format(
+                artifact_path, bad_path_message(artifact_path)
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
+def _get_required_query_arg(name):
+    value = request.args.get(name)
+    if not value:
+        raise MlflowException(
+            "Missing value for required parameter '{}'.".format(name),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return value
+
+
+def _json_response(data):
+    response = Response(mimetype="application/json")
+    response.set_data(json.dumps(data))
+    return response
+
+
+@catch_mlflow_exception
+def _list_proxied_artifacts():
+    path = request.args.get("path") or None
+    if path is not None:
+        _validate_proxied_artifact_path(path)
+    recursive = request.args.get("recursive", "").lower() == "true"
+    artifact_repo = _get_artifacts_destination_repo()
+    if recursive:
+        artifact_entities = artifact_repo.list_files(path)
+    else:
+        artifact_entities = artifact_repo.list_artifacts(path)
+    files = [
+        {"path": f.path, "is_dir": f.is_dir, "file_size": f.file_size} for f in artifact_entities
+    ]
+    # Tells clients that the listing is recursive, which older servers ignore
+    return _json_response({"files": files, "recursive": recursive})
+
+
+@catch_mlflow_exception
+def _download_proxied_artifact(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    return _send_artifact(_get_artifacts_destination_repo(), artifact_path)
+
+
+@catch_mlflow_exception
+def _upload_proxied_artifact(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    # The body is streamed to the storage as it is received, large files being uploaded by clients
+    # in parts through the multipart upload endpoints
+    _get_artifacts_destination_repo().log_artifact_stream(request.stream, artifact_path)
+    return _json_response({})
+
+
+@catch_mlflow_exception
+def _create_multipart_upload(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    upload_id = _get_artifacts_destination_repo().create_multipart_upload(artifact_path)
+    return _json_response({"upload_id": upload_id})
+
+
+@catch_mlflow_exception
+def _upload_part(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    upload_id = _get_required_query_arg("upload_id")
+    part_number = _get_required_query_arg("part_number")
+    if not part_number.isdigit() or not 1 <= int(part_number) <= _MAX_PART_NUMBER:
+        raise MlflowException(
+            "Invalid part number: '{}'. Part numbers must be between 1 and {}.".format(
+                part_number, _MAX_PART_NUMBER
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    # Storage backends need the length of the parts they upload, which is not known in advance for
+    # chunked requests, so each part is spooled before being forwarded.
+    with tempfile.SpooledTemporaryFile(max_size=_MAX_SPOOLED_PART_SIZE) as f:
+        shutil.copyfileobj(request.stream, f, ARTIFACT_STREAM_CHUNK_SIZE)
+        f.seek(0)
+        part = _get_artifacts_destination_repo().upload_part(
+            artifact_path, upload_id, int(part_number), f
+        )
+    return _json_response({"part_number": part.part_number, "size": part.size, "etag": part.etag})
+
+
+@catch_mlflow_exception
+def _list_multipart_upload_parts(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    parts = _get_artifacts_destination_repo().list_multipart_upload_parts(
+        artifact_path, _get_required_query_arg("upload_id")
+    )
+    return _json_response({"parts": [part._asdict() for part in parts]})
+
+
+@catch_mlflow_exception
+def _complete_multipart_upload(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    request_json = _get_request_json() or {}
+    try:
+        parts = [(int(part["part_number"]), part["etag"]) for part in request_json["parts"]]
+    except (KeyError, TypeError, ValueError):
+        raise MlflowException(
+            "The request body must be a JSON object with a list of 'parts', each with a "
+            "'part_number' and an 'etag'.",
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    _get_artifacts_destination_repo().complete_multipart_upload(
+        artifact_path, _get_required_query_arg("upload_id"), parts
+    )
+    return _json_response({})
+
+
+@catch_mlflow_exception
+def _abort_multipart_upload(artifact_path):
+    _validate_proxied_artifact_path(artifact_path)
+    _get_artifacts_destination_repo().abort_multipart_upload(
+        artifact_path, _get_required_query_arg("upload_id")
+    )
+    return _json_response({})
+
+
+def get_artifact_proxy_endpoints():
+    """
+    :return: List of tuples (path, handler, methods) of the proxied artifact access endpoints
+    """
+    endpoints = [
+        ("/mlflow-artifacts/artifacts", _list_proxied_artifacts, ["GET"]),
+        ("/mlflow-artifacts/artifacts/<path:artifact_path>", _download_proxied_artifact, ["GET"]),
+        ("/mlflow-artifacts/artifacts/<path:artifact_path>", _upload_proxied_artifact, ["PUT"]),
+        ("/mlflow-artifacts/mpu/create/<path:artifact_path>", _create_multipart_upload, ["POST"]),
+        ("/mlflow-artifacts/mpu/upload/<path:artifact_path>", _upload_part, ["PUT"]),
+        ("/mlflow-artifacts/mpu/parts/<path:artifact_path>", _list_multipart_upload_parts, ["GET"]),
+        (
+            "/mlflow-artifacts/mpu/complete/<path:artifact_path>",
+            _complete_multipart_upload,
+            ["POST"],
+        ),
+        ("/mlflow-artifacts/mpu/abort/<path:artifact_path>", _abort_multipart_upload, ["POST"]),
+    ]
+    return [
+        (http_path, handler, methods)
+        for base_path, handler, methods in endpoints
+        for http_path in _get_paths(base_path)
+    ]
+
+
 HANDLERS = {
     # Tracking Server APIs
     CreateExperiment: _create_experiment,
@@ -838,8 +1525,11 @@ HANDLERS = {
     RestoreExperiment: _restore_experiment,
     UpdateExperiment: _update_experiment,
     CreateRun: _create_run,
+    CreateRuns: _create_runs,
     UpdateRun: _update_run,
+    TerminateRuns: _terminate_runs,
     DeleteRun: _delete_run,
+    DeleteRuns: _delete_runs,
     RestoreRun: _restore_run,
     LogParam: _log_param,
     LogMetric: _log_metric,
@@ -0,0 +1,184 @@
+"""
+Server-Sent Events stream of the metric values logged to a set of runs, served at
+``/api/2.0/mlflow/metrics/stream``, so that live dashboards receive new metric values as they are
+logged rather than polling the full metric histories of active runs.
+
+Each stream keeps a ``(step, timestamp)`` cursor per metric, starting at the latest value of the
+metric when the stream is opened, and sends the values logged after it. The runs of a stream are
+checked as soon as a metric is logged to one of them through the same server process, and every
+few seconds otherwise, which covers the values logged through other processes or servers sharing
+the backend store. Streams end once all their runs are terminated, or after a few minutes, after
+which ``EventSource`` clients reconnect and receive the values logged after the reconnection.
+
+Each stream holds a server thread while it is open, so streams are only served by servers handling
+requests concurrently in threads (``mlflow server --asgi``, or gunicorn with ``--threads``), and
+each server process serves at most ``MAX_CONCURRENT_STREAMS`` streams at a time.
+"""
+import json
+import threading
+import time
+
+from mlflow.entities import RunStatus
+from mlflow.utils.proto_json_utils import message_to_json
+
+# Maximum number of runs followed by one stream
+MAX_STREAMED_RUNS = 100
+# Number of seconds between checks of the runs of a stream in the absence of notifications
+POLL_INTERVAL = 2
+# Number of seconds between comments sent to keep idle streams open through proxies
+HEARTBEAT_INTERVAL = 15
+# Number of seconds after which streams end, so that they do not hold server threads indefinitely
+MAX_STREAM_DURATION = 300
+# Maximum number of streams served concurrently by each server process
+MAX_CONCURRENT_STREAMS = 8
+
+_stream_slots = threading.BoundedSemaphore(MAX_CONCURRENT_STREAMS)
+
+
+def acquire_stream_slot():
+    """
+    Reserve one of the ``MAX_CONCURRENT_STREAMS`` stream slots of the current process.
+
+    :return: Whether a slot was reserved, to be released with :py:func:`release_stream_slot`.
+    """
+    return _stream_slots.acquire(blocking=False)
+
+
+def release_stream_slot():
+    _stream_slots.release()
+
+
+class _MetricNotifier:
+    """
+    Wakes up the streams following a run when metrics are logged to it by the current process.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # Run ID -> [number of streams following the run, number of notifications]
+        self._runs = {}
+
+    def follow(self, run_ids):
+        with self._condition:
+            for run_id in run_ids:
+                self._runs.setdefault(run_id, [0, 0])[0] += 1
+
+    def unfollow(self, run_ids):
+        with self._condition:
+            for run_id in run_ids:
+                self._runs[run_id][0] -= 1
+                if self._runs[run_id][0] == 0:
+                    del self._runs[run_id]
+
+    def notify(self, run_id):
+        with self._condition:
+            if run_id in self._runs:
+                self._runs[run_id][1] += 1
+                self._condition.notify_all()
+
+    def get_versions(self, run_ids):
+        with self._condition:
+            return self._get_versions(run_ids)
+
+    def wait(self, versions, timeout):
+        """
+        Wait until metrics are logged to any of the runs of ``versions``, as returned by
+        :py:meth:`get_versions`, or until ``timeout`` seconds have elapsed.
+
+        :return: The current versions of the runs.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._get_versions(versions) != versions, timeout)
+            return self._get_versions(versions)
+
+    def _get_versions(self, run_ids):
+        return {run_id: self._runs[run_id][1] for run_id in run_ids}
+
+
+_notifier = _MetricNotifier()
+
+
+def notify(run_id):
+    """
+    Notify the metric streams following ``run_id`` that metrics were logged to the run.
+    """
+    _notifier.notify(run_id)
+
+
+class MetricStream:
+    """
+    Iterable over the Server-Sent Events of a metric stream. The runs are fetched when the stream
+    is created, so that missing runs are reported before the response starts.
+
+    :param store: Tracking store of the runs.
+    :param run_ids: IDs of the runs to follow.
+    :param metric_keys: Names of the metrics to follow, or an empty list to follow all metrics.
+    """
+
+    def __init__(self, store, run_ids, metric_keys):
+        self._store = store
+        self._run_ids = list(dict.fromkeys(run_ids))
+        self._metric_keys = set(metric_keys)
+        self._cursors = {}
+        for run_id in self._run_ids:
+            for metric in self._get_latest_metrics(store.get_run(run_id)):
+                self._cursors[(run_id, metric.key)] = (metric.step, metric.timestamp)
+
+    def __iter__(self):
+        _notifier.follow(self._run_ids)
+        try:
+            yield from self._events()
+        finally:
+            _notifier.unfollow(self._run_ids)
+
+    def _events(self):
+        deadline = time.time() + MAX_STREAM_DURATION
+        last_event_time = time.time()
+        versions = _notifier.get_versions(self._run_ids)
+        while True:
+            terminated = True
+            for run_id in self._run_ids:
+                run = self._store.get_run(run_id)
+                terminated = terminated and RunStatus.is_terminated(
+                    RunStatus.from_string(run.info.status)
+                )
+                for metric in self._get_new_metrics(run):
+                    last_event_time = time.time()
+                    yield _format_event(run_id, metric)
+            now = time.time()
+            if terminated or now >= deadline:
+                return
+            if now - last_event_time >= HEARTBEAT_INTERVAL:
+                last_event_time = now
+                yield ": keep-alive\n\n"
+            versions = _notifier.wait(versions, min(POLL_INTERVAL, deadline - now))
+
+    def _get_latest_metrics(self, run):
+        # pylint: disable=protected-access
+        return [
+            metric
+            for metric in run.data._metric_objs
+            if not self._metric_keys or metric.key in self._metric_keys
+        ]
+
+    def _get_new_metrics(self, run):
+        run_id = run.info.run_id
+        for latest in self._get_latest_metrics(run):
+            cursor = self._cursors.get((run_id, latest.key))
+            if cursor is None:
+                metrics = sorted(
+                    self._store.get_metric_history(run_id, latest.key),
+                    key=lambda metric: (metric.step, metric.timestamp),
+                )
+            elif (latest.step, latest.timestamp) > cursor:
+                metrics = self._store.get_metric_history_since(run_id, latest.key, *cursor)
+            else:
+                continue
+            if metrics:
+                self._cursors[(run_id, latest.key)] = (metrics[-1].step, metrics[-1].timestamp)
+            yield from metrics
+
+
+def _format_event(run_id, metric):
+    data = {"run_id": run_id, "metric": json.loads(message_to_json(metric.to_proto()))}
+    return "event: metric\ndata: {}\n\n".format(json.dumps(data, separators=(",", ":")))
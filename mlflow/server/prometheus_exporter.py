@@ -1,5 +1,44 @@
+import threading
+import time
+
+from prometheus_client import Counter, Histogram, REGISTRY
 from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
 from flask import request
+from sqlalchemy import event
+
+from mlflow.server import handlers
+from mlflow.server.handlers import (
+    _get_response_cache,
+    get_artifact_proxy_endpoints,
+    get_endpoints,
+    get_metric_stream_endpoints,
+    get_run_export_endpoints,
+)
+from mlflow.store.model_registry.abstract_store import AbstractStore as AbstractModelRegistryStore
+from mlflow.store.tracking.abstract_store import AbstractStore as AbstractTrackingStore
+
+_BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, float("inf"))
+_SECONDS_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, float("inf"))
+
+# Views of `mlflow.server` serving artifacts besides the handlers of the endpoints
+_ARTIFACT_VIEWS = {"serve_artifacts", "serve_model_version_artifact"}
 
 
 def activate_prometheus_exporter(app):
@@ -9,18 +48,250 @@ def activate_prometheus_exporter(app):
     histogram = metrics.histogram(
         "mlflow_requests_by_status_and_path",
         "Request latencies and count by status and path",
-        labels={
-            "status": lambda r: r.status_code,
-            "path": lambda: change_path_for_metric(request.path),
-        },
+        labels={"status": lambda r: r.status_code, "path": _get_metric_path},
     )
+    handler_names = get_instrumented_view_names()
     for func_name, func in endpoint.items():
-        if func_name in ["_search_runs", "_log_metric", "_log_param", "_set_tag", "_create_run"]:
+        if func_name in handler_names:
             app.view_functions[func_name] = histogram(func)
 
+    instrument_server(app, ServerMetrics(), handler_names)
+
+    response_cache = _get_response_cache()
+    if response_cache is not None:
+        lookups = Counter(
+            "mlflow_response_cache_lookups",
+            "Response cache lookups by endpoint and result (hit or miss)",
+            ["endpoint", "result"],
+        )
+        response_cache.add_lookup_listener(
+            lambda endpoint, hit: lookups.labels(endpoint, "hit" if hit else "miss").inc()
+        )
+
     return app
 
 
+def get_instrumented_view_names():
+    """
+    :return: The names of the views of the tracking server whose requests are instrumented: the
+             REST API, including the proxied artifact access, metric stream and run export
+             endpoints, and the artifact downloads, i.e. all of them but the UI and the health and
+             readiness checks.
+    """
+    endpoints = (
+        get_endpoints()
+        + get_artifact_proxy_endpoints()
+        + get_metric_stream_endpoints()
+        + get_run_export_endpoints()
+    )
+    return {handler.__name__ for _, handler, _ in endpoints} | _ARTIFACT_VIEWS
+
+
+def _get_metric_path():
+    # Label requests by their URL rule, so that the artifact paths of the proxied artifact access
+    # endpoints do not create a metric per artifact
+    rule = request.url_rule.rule if request.url_rule is not None else request.path
+    return change_path_for_metric(rule)
+
+
+class ServerMetrics:
+    """
+    Metrics breaking down the time spent serving the tracking server endpoints, labeled by the
+    path of the endpoint (see :py:func:`change_path_for_metric`).
+    """
+
+    def __init__(self, registry=REGISTRY):
+        self.request_size = Histogram(
+            "mlflow_request_body_bytes",
+            "Size of request bodies by path",
+            ["path"],
+            buckets=_BYTES_BUCKETS,
+            registry=registry,
+        )
+        self.response_size = Histogram(
+            "mlflow_response_body_bytes",
+            "Size of response bodies by path",
+            ["path"],
+            buckets=_BYTES_BUCKETS,
+            registry=registry,
+        )
+        self.serialization_time = Histogram(
+            "mlflow_response_serialization_seconds",
+            "Time spent serializing response messages to JSON by path",
+            ["path"],
+            buckets=_SECONDS_BUCKETS,
+            registry=registry,
+        )
+        self.store_call_time = Histogram(
+            "mlflow_store_call_seconds",
+            "Time spent in store calls by path, store (tracking or model_registry) and method",
+            ["path", "store", "method"],
+            buckets=_SECONDS_BUCKETS,
+            registry=registry,
+        )
+        self.db_query_time = Histogram(
+            "mlflow_db_query_seconds",
+            "Duration of database queries by path",
+            ["path"],
+            buckets=_SECONDS_BUCKETS,
+            registry=registry,
+        )
+        self.db_queries_per_request = Histogram(
+            "mlflow_db_queries_per_request",
+            "Number of database queries issued per request by path",
+            ["path"],
+            buckets=_COUNT_BUCKETS,
+            registry=registry,
+        )
+        self.db_pool_connections_in_use = Histogram(
+            "mlflow_db_pool_connections_in_use",
+            "Number of connections checked out of the connection pool, including the connection "
+            "being checked out, at each checkout by path",
+            ["path"],
+            buckets=_COUNT_BUCKETS,
+            registry=registry,
+        )
+        self.db_connect_time = Histogram(
+            "mlflow_db_connect_seconds",
+            "Time spent opening new database connections for the connection pool by path",
+            ["path"],
+            buckets=_SECONDS_BUCKETS,
+            registry=registry,
+        )
+
+
+# Per-thread state of the request being served: its metric path and number of database queries
+_request_state = threading.local()
+
+
+def _current_path():
+    return getattr(_request_state, "path", None) or "other"
+
+
+def instrument_server(app, metrics, handler_names):
+    """
+    Record ``metrics`` for the requests served by the handlers named ``handler_names``, and for the
+    calls to the stores of the server and their database queries.
+    """
+
+    @app.before_request
+    def _start_request():  # pylint: disable=unused-variable
+        if request.endpoint in handler_names:
+            _request_state.path = _get_metric_path()
+            _request_state.db_queries = 0
+        else:
+            _request_state.path = None
+
+    @app.after_request
+    def _finish_request(response):  # pylint: disable=unused-variable
+        path = getattr(_request_state, "path", None)
+        if path is not None:
+            metrics.request_size.labels(path).observe(request.content_length or 0)
+            response_size = response.calculate_content_length()
+            if response_size is not None:
+                metrics.response_size.labels(path).observe(response_size)
+            metrics.db_queries_per_request.labels(path).observe(_request_state.db_queries)
+            _request_state.path = None
+        return response
+
+    def serialization_listener(seconds):
+        metrics.serialization_time.labels(_current_path()).observe(seconds)
+
+    instrumented_engines = set()
+
+    def store_wrapper(store):
+        engines = [getattr(store, "engine", None)] + list(
+            getattr(store, "read_replica_engines", [])
+        )
+        for engine in engines:
+            if engine is not None and id(engine) not in instrumented_engines:
+                _instrument_engine(engine, metrics)
+                instrumented_engines.add(id(engine))
+        return _InstrumentedStore(store, metrics)
+
+    handlers.add_serialization_listener(serialization_listener)
+    handlers.add_store_wrapper(store_wrapper)
+
+
+def _instrument_engine(engine, metrics):
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, *args):  # pylint: disable=unused-variable
+        conn.info.setdefault("mlflow_query_start_times", []).append(time.time())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, *args):  # pylint: disable=unused-variable
+        start = conn.info["mlflow_query_start_times"].pop()
+        metrics.db_query_time.labels(_current_path()).observe(time.time() - start)
+        if getattr(_request_state, "path", None) is not None:
+            _request_state.db_queries += 1
+
+    # SQLAlchemy fires no event before a connection is requested from the pool, so the wait for a
+    # connection is not timed. Requests wait for connections when the number of connections in use
+    # reaches the size of the pool plus its overflow, or while new connections are being opened.
+    lock = threading.Lock()
+    checked_out = [0]
+
+    @event.listens_for(engine.pool, "checkout")
+    def _checkout(*args):  # pylint: disable=unused-variable
+        with lock:
+            checked_out[0] += 1
+            in_use = checked_out[0]
+        metrics.db_pool_connections_in_use.labels(_current_path()).observe(in_use)
+
+    @event.listens_for(engine.pool, "checkin")
+    def _checkin(*args):  # pylint: disable=unused-variable
+        with lock:
+            # Connections checked out before the instrumentation are not counted
+            checked_out[0] = max(0, checked_out[0] - 1)
+
+    @event.listens_for(engine, "do_connect")
+    def _do_connect(dialect, connection_record, *args):  # pylint: disable=unused-variable
+        connection_record.info["mlflow_connect_start_time"] = time.time()
+
+    @event.listens_for(engine.pool, "connect")
+    def _connect(dbapi_connection, connection_record):  # pylint: disable=unused-variable
+        start = connection_record.info.pop("mlflow_connect_start_time", None)
+        if start is not None:
+            metrics.db_connect_time.labels(_current_path()).observe(time.time() - start)
+
+
+class _InstrumentedStore:
+    """
+    Proxy of a tracking or model registry store timing the calls to the methods of its abstract
+    store interface.
+    """
+
+    def __init__(self, store, metrics):
+        self._store = store
+        self._metrics = metrics
+        if isinstance(store, AbstractModelRegistryStore):
+            self._store_type = "model_registry"
+            self._timed_methods = _public_methods(AbstractModelRegistryStore)
+        else:
+            self._store_type = "tracking"
+            self._timed_methods = _public_methods(AbstractTrackingStore)
+
+    def __getattr__(self, name):
+        attr = getattr(self._store, name)
+        if name not in self._timed_methods or not callable(attr):
+            return attr
+
+        def timed_call(*args, **kwargs):
+            start = time.time()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._metrics.store_call_time.labels(
+                    _current_path(), self._store_type, name
+                ).observe(time.time() - start)
+
+        return timed_call
+
+
+def _public_methods(cls):
+    return {name for name in dir(cls) if not name.startswith("_") and callable(getattr(cls, name))}
+
+
 def change_path_for_metric(path):
     """
     Replace the '/' in the metric path by '_' so grafana can correctly use it.
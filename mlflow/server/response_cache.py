@@ -0,0 +1,332 @@
+"""
+Caches for the responses of read-heavy tracking server endpoints.
+
+Cached responses are keyed by the endpoint and the raw request, and are labeled with a set of
+invalidation tags (e.g. ``run:<run_id>``) describing the entities they were computed from. Write
+handlers invalidate every cached response carrying one of the tags of the entities they modify,
+while the per-endpoint time-to-live bounds the staleness of responses affected by writes that
+bypass this server (e.g. other server instances sharing the same backend store).
+
+Since a read handler may compute its response from the state preceding a concurrent write whose
+invalidation runs once the write is committed, the caches remember when each tag was last
+invalidated, and do not store a response computed since before the last invalidation of one of its
+tags.
+"""
+import collections
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+DEFAULT_RESPONSE_CACHE_TTL = 60
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 10000
+# Number of seconds for which the last invalidation time of a tag is remembered. Responses whose
+# computation started longer ago than that are not cached.
+INVALIDATION_RETENTION = 3600
+
+
+class ResponseCache:
+    """
+    Abstract response cache. Derived classes store serialized responses; this base class keeps
+    track of per-endpoint hit and miss counts.
+    """
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._stats = collections.defaultdict(lambda: [0, 0])
+        self._lookup_listeners = []
+
+    def get(self, key):
+        """
+        :param key: String key of the cached response.
+
+        :return: The cached response as ``bytes``, or ``None`` if there is no live entry for
+                 ``key``.
+        """
+        raise NotImplementedError()
+
+    def set(self, key, value, ttl, tags, since=None):
+        """
+        :param key: String key of the cached response.
+        :param value: Serialized response, as ``bytes``.
+        :param ttl: Number of seconds after which the entry expires, or ``None`` for an entry
+                    that only expires when evicted or invalidated.
+        :param tags: Invalidation tags of the entry.
+        :param since: Time at which the computation of the response started, in seconds since the
+                      UNIX epoch. If specified, the entry is not stored when one of its tags was
+                      invalidated since then, as the response may predate the invalidating write.
+        """
+        raise NotImplementedError()
+
+    def invalidate(self, tags):
+        """
+        Remove all entries labeled with any of the specified invalidation tags, and record the
+        time of their invalidation.
+
+        :param tags: Invalidation tags whose entries to remove.
+        """
+        raise NotImplementedError()
+
+    def add_lookup_listener(self, listener):
+        """
+        Register a callable invoked as ``listener(endpoint, hit)`` on every recorded lookup,
+        e.g. to export the hit ratio of the cache as a metric.
+        """
+        self._lookup_listeners.append(listener)
+
+    def record_lookup(self, endpoint, hit):
+        with self._stats_lock:
+            self._stats[endpoint][0 if hit else 1] += 1
+        for listener in self._lookup_listeners:
+            listener(endpoint, hit)
+
+    def get_stats(self):
+        """
+        :return: A dictionary mapping each endpoint to a ``(hits, misses)`` tuple.
+        """
+        with self._stats_lock:
+            return {endpoint: tuple(counts) for endpoint, counts in self._stats.items()}
+
+    def hit_ratio(self, endpoint=None):
+        """
+        :param endpoint: Endpoint whose hit ratio to compute. If unspecified, the hit ratio across
+                         all endpoints is returned.
+
+        :return: Fraction of lookups that were served from the cache, or ``None`` if no lookup
+                 has been recorded yet.
+        """
+        stats = self.get_stats()
+        if endpoint is not None:
+            counts = [stats[endpoint]] if endpoint in stats else []
+        else:
+            counts = stats.values()
+        hits = sum(count[0] for count in counts)
+        total = hits + sum(count[1] for count in counts)
+        return hits / total if total else None
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Least-recently-used response cache held in the memory of the current process.
+    """
+
+    def __init__(self, max_entries=DEFAULT_RESPONSE_CACHE_MAX_ENTRIES):
+        super().__init__()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (value, expiration time, tags), in least-recently-used first order
+        self._entries = collections.OrderedDict()
+        self._keys_by_tag = collections.defaultdict(set)
+        # tag -> time of its last invalidation, in least-recently-invalidated first order
+        self._invalidated_at = collections.OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl, tags, since=None):
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            if since is not None and (
+                since < now - INVALIDATION_RETENTION
+                or any(self._invalidated_at.get(tag, since - 1) >= since for tag in tags)
+            ):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires_at, tuple(tags))
+            for tag in tags:
+                self._keys_by_tag[tag].add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags):
+        now = time.time()
+        with self._lock:
+            for tag in tags:
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+                self._invalidated_at.pop(tag, None)
+                self._invalidated_at[tag] = now
+            while next(iter(self._invalidated_at.values()), now) < now - INVALIDATION_RETENTION:
+                self._invalidated_at.popitem(last=False)
+
+    def _remove(self, key):
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
+
+
+class SqliteResponseCache(ResponseCache):
+    """
+    Response cache persisted in a local SQLite database file, so that it is shared by all the
+    worker processes of a server running on the same host.
+    """
+
+    # Number of ``set`` calls between two purges of the expired entries
+    _PURGE_INTERVAL = 100
+
+    def __init__(self, path, max_entries=DEFAULT_RESPONSE_CACHE_MAX_ENTRIES):
+        super().__init__()
+        self._path = os.path.abspath(path)
+        self._max_entries = max_entries
+        self._local = threading.local()
+        self._set_count = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB, expires_at REAL, accessed_at REAL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS entry_tags (tag TEXT, key TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entry_tags_tag ON entry_tags (tag)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entry_tags_key ON entry_tags (key)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS invalidations "
+                "(tag TEXT PRIMARY KEY, invalidated_at REAL)"
+            )
+
+    def _connect(self):
+        # SQLite connections must not be used across forks, e.g. by workers of a preloaded server
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            dirname = os.path.dirname(self._path)
+            if not os.path.exists(dirname):
+                os.makedirs(dirname)
+            conn = sqlite3.connect(self._path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key):
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM entries"
+                " WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            return bytes(row[0])
+
+    def set(self, key, value, ttl, tags, since=None):
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        tags = list(set(tags))
+        with self._connect() as conn:
+            # Checks the invalidations and stores the entry atomically with respect to the
+            # invalidations of the other processes
+            conn.execute("BEGIN IMMEDIATE")
+            if since is not None:
+                if since < now - INVALIDATION_RETENTION:
+                    return
+                invalidated = conn.execute(
+                    "SELECT 1 FROM invalidations WHERE invalidated_at >= ? AND tag IN ({})".format(
+                        ", ".join("?" * len(tags))
+                    ),
+                    [since] + tags,
+                ).fetchone()
+                if invalidated is not None:
+                    return
+            conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), expires_at, now),
+            )
+            conn.executemany("INSERT INTO entry_tags VALUES (?, ?)", [(tag, key) for tag in tags])
+            self._set_count += 1
+            if self._set_count % self._PURGE_INTERVAL == 0:
+                self._purge(conn, now)
+
+    def invalidate(self, tags):
+        tags = list(set(tags))
+        if not tags:
+            return
+        placeholders = ", ".join("?" * len(tags))
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO invalidations VALUES (?, ?)", [(tag, now) for tag in tags]
+            )
+            condition = "key IN (SELECT key FROM entry_tags WHERE tag IN ({}))".format(placeholders)
+            conn.execute("DELETE FROM entries WHERE " + condition, tags)
+            conn.execute("DELETE FROM entry_tags WHERE " + condition, tags)
+
+    def _purge(self, conn, now):
+        conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        # Evict the least recently used entries in excess of the maximum number of entries
+        conn.execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+        conn.execute("DELETE FROM entry_tags WHERE key NOT IN (SELECT key FROM entries)")
+        conn.execute(
+            "DELETE FROM invalidations WHERE invalidated_at < ?", (now - INVALIDATION_RETENTION,)
+        )
+
+
+def get_response_cache(cache_uri):
+    """
+    Create the response cache described by ``cache_uri``, which is either ``memory`` for an
+    in-process cache or ``sqlite:///path/to/cache.db`` for a cache shared across the workers of
+    the server. Both accept a ``max_entries`` query parameter, e.g. ``memory:?max_entries=100``.
+    """
+    parsed = urllib.parse.urlparse(cache_uri)
+    query = urllib.parse.parse_qs(parsed.query)
+    max_entries = int(query.get("max_entries", [DEFAULT_RESPONSE_CACHE_MAX_ENTRIES])[0])
+    scheme = parsed.scheme or parsed.path
+    if scheme == "memory":
+        return InMemoryResponseCache(max_entries)
+    elif scheme == "sqlite" and parsed.path:
+        return SqliteResponseCache(parsed.path, max_entries)
+    raise MlflowException(
+        "Invalid response cache URI: '{}'. Supported URIs are 'memory' and "
+        "'sqlite:///path/to/cache.db'.".format(cache_uri),
+        error_code=INVALID_PARAMETER_VALUE,
+    )
+
+
+def parse_response_cache_ttls(ttl_spec):
+    """
+    Parse a time-to-live specification of the form ``30,GetRun=5,SearchRuns=10``, where an
+    unnamed value overrides the default time-to-live of all endpoints, and named values set the
+    time-to-live of individual endpoints, in seconds.
+
+    :return: A dictionary mapping endpoint names to time-to-live values, with the default
+             time-to-live stored under the ``None`` key.
+    """
+    ttls = {None: DEFAULT_RESPONSE_CACHE_TTL}
+    for item in (ttl_spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        endpoint, _, ttl = item.rpartition("=")
+        try:
+            ttls[endpoint.strip() or None] = float(ttl)
+        except ValueError:
+            raise MlflowException(
+                "Invalid response cache time-to-live: '{}'. Expected a number of seconds, "
+                "optionally prefixed by an endpoint name, e.g. 'GetRun=5'.".format(item),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+    return ttls
@@ -0,0 +1,146 @@
+"""
+Warm-up of the tracking server workers, so that the first requests after a deployment or a worker
+recycle do not pay for the creation of the backend stores (database engines, schema verification,
+store registries) and of their database connections.
+
+In preload mode (``mlflow server --preload``), the stores are created once by :py:func:`preload` in
+the process importing :py:mod:`mlflow.server`, i.e. the gunicorn master before it forks its
+workers. Database connections are not shared across processes: the pools are emptied before
+forking, connections inherited nonetheless are discarded on checkout, and each forked worker warms
+its own pools in the background. The readiness endpoint (``/ready``) only passes in a worker once
+its stores and pools are warm, see :py:func:`is_ready`.
+"""
+import logging
+import os
+import threading
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+from mlflow.server import handlers
+
+_logger = logging.getLogger(__name__)
+
+# ID of the process whose stores are warm, compared with the current process ID so that forked
+# workers do not inherit the readiness of their parent
+_ready_pid = None
+_warmup_lock = threading.Lock()
+_warmup_thread = None
+
+
+def is_ready():
+    """
+    :return: Whether the stores of the current process are initialized and their database
+             connection pools warm.
+    """
+    return _ready_pid == os.getpid()
+
+
+def warm_up():
+    """
+    Initialize the tracking and model registry stores of the server and fill the connection pools
+    of their database engines, then mark the current process as ready.
+    """
+    global _ready_pid
+    handlers.initialize_backend_stores()
+    handlers._get_response_cache()
+    for engine in _get_store_engines():
+        _fill_pool(engine)
+    _ready_pid = os.getpid()
+
+
+def start_warmup():
+    """
+    Warm up the current process in a background thread, unless it is ready or warming up. Failed
+    warm-ups are retried by the next call.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if is_ready() or (_warmup_thread is not None and _warmup_thread.is_alive()):
+            return
+        _warmup_thread = threading.Thread(target=_warm_up_safely, name="mlflow-warmup")
+        _warmup_thread.daemon = True
+        _warmup_thread.start()
+
+
+def _warm_up_safely():
+    try:
+        warm_up()
+    except Exception:  # pylint: disable=broad-except
+        _logger.exception("Failed to warm up the tracking server")
+
+
+def preload():
+    """
+    Warm up the current process before it forks the server workers, and make the database engines
+    of its stores safe to use in the forked workers, which warm up in the background once forked.
+    """
+    handlers.initialize_backend_stores()
+    for engine in _get_store_engines():
+        # Close the connections opened while creating the store, before tagging new connections.
+        # Pools are emptied in place rather than recreated with `engine.dispose`, to keep their
+        # instrumentation (see `mlflow.server.prometheus_exporter`)
+        engine.pool.dispose()
+        _discard_connections_across_forks(engine)
+    warm_up()
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(before=_dispose_pools, after_in_child=_after_fork_in_child)
+
+
+def _after_fork_in_child():
+    global _warmup_lock, _warmup_thread
+    # The lock may have been held by another thread of the parent when forking
+    _warmup_lock = threading.Lock()
+    _warmup_thread = None
+    start_warmup()
+
+
+def _get_store_engines():
+    engines = []
+    for store in [handlers._tracking_store, handlers._model_registry_store]:
+        for engine in [getattr(store, "engine", None)] + list(
+            getattr(store, "read_replica_engines", [])
+        ):
+            if engine is not None and engine not in engines:
+                engines.append(engine)
+    return engines
+
+
+def _fill_pool(engine):
+    """
+    Open as many connections as the pool of ``engine`` keeps, and return them to the pool.
+    """
+    size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def _dispose_pools():
+    for engine in _get_store_engines():
+        engine.pool.dispose()
+
+
+def _discard_connections_across_forks(engine):
+    # Connections are tagged with the process that opened them, and connections checked out in
+    # another process are dropped without being closed, which would close them for their owner as
+    # well (see "Using Connection Pools with Multiprocessing" in the SQLAlchemy documentation)
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):  # pylint: disable=unused-variable
+        connection_record.info["pid"] = os.getpid()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(  # pylint: disable=unused-variable
+        dbapi_connection, connection_record, connection_proxy
+    ):
+        if connection_record.info.get("pid") != os.getpid():
+            connection_record.connection = connection_proxy.connection = None
+            raise exc.DisconnectionError(
+                "Connection record belongs to pid {}, attempting to check out in pid {}".format(
+                    connection_record.info.get("pid"), os.getpid()
+                )
+            )
@@ -7,7 +7,7 @@ from numbers import Number
 import numpy as np
 import time
 
-from mlflow.entities import Metric, Param
+from mlflow.entities import Metric, Param, RunData
 from mlflow.tracking.client import MlflowClient
 from mlflow.utils.autologging_utils import try_mlflow_log
 from mlflow.utils.file_utils import TempDir
@@ -18,6 +18,7 @@ from mlflow.utils.validation import (
     MAX_ENTITIES_PER_BATCH,
     MAX_ENTITY_KEY_LENGTH,
     MAX_PARAM_VAL_LENGTH,
+    MAX_RUNS_PER_BATCH,
 )
 
 _logger = logging.getLogger(__name__)
@@ -516,6 +517,11 @@ def _chunk_dict(d, chunk_size):
         yield {k: d[k] for k in islice(it, chunk_size)}
 
 
+def _chunk_list(lst, chunk_size):
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i : i + chunk_size]
+
+
 def _truncate_dict(d, max_key_length=None, max_value_length=None):
     def _truncate_and_ellipsize(value, max_length):
         return str(value)[: (max_length - 3)] + "..."
@@ -638,19 +644,15 @@ def _create_child_runs_for_parameter_search(cv_estimator, parent_run, child_tags
     # in the result row
     base_params = seed_estimator.get_params(deep=should_log_params_deeply)
 
-    cv_results_df = pd.DataFrame.from_dict(cv_estimator.cv_results_)
-    for _, result_row in cv_results_df.iterrows():
-        tags_to_log = dict(child_tags) if child_tags else {}
-        tags_to_log.update({MLFLOW_PARENT_RUN_ID: parent_run.info.run_id})
-        tags_to_log.update(_get_estimator_info_tags(seed_estimator))
-        child_run = client.create_run(
-            experiment_id=parent_run.info.experiment_id,
-            start_time=child_run_start_time,
-            tags=tags_to_log,
-        )
+    tags_to_log = dict(child_tags) if child_tags else {}
+    tags_to_log.update({MLFLOW_PARENT_RUN_ID: parent_run.info.run_id})
+    tags_to_log.update(_get_estimator_info_tags(seed_estimator))
 
-        from itertools import zip_longest
+    cv_results_df = pd.DataFrame.from_dict(cv_estimator.cv_results_)
+    from itertools import zip_longest
 
+    entity_batches_per_row = []
+    for _, result_row in cv_results_df.iterrows():
         params_to_log = dict(base_params)
         params_to_log.update(result_row.get("params", {}))
         param_batches_to_log = _chunk_dict(params_to_log, chunk_size=MAX_PARAMS_TAGS_PER_BATCH)
@@ -671,11 +673,14 @@ def _create_child_runs_for_parameter_search(cv_estimator, parent_run, child_tags
                 if not any([key.startswith(prefix) for prefix in excluded_metric_prefixes])
                 and isinstance(value, Number)
             },
+            # The first batch of each child run is logged together with its tags when the run is
+            # created, so leave room for a full batch of tags
             chunk_size=min(
-                MAX_ENTITIES_PER_BATCH - MAX_PARAMS_TAGS_PER_BATCH, MAX_METRICS_PER_BATCH
+                MAX_ENTITIES_PER_BATCH - 2 * MAX_PARAMS_TAGS_PER_BATCH, MAX_METRICS_PER_BATCH
             ),
         )
 
+        entity_batches = []
         for params_batch, metrics_batch in zip_longest(
             param_batches_to_log, metric_batches_to_log, fillvalue={}
         ):
@@ -687,18 +692,38 @@ def _create_child_runs_for_parameter_search(cv_estimator, parent_run, child_tags
             truncated_metrics_batch = _truncate_dict(
                 metrics_batch, max_key_length=MAX_ENTITY_KEY_LENGTH
             )
-            client.log_batch(
-                run_id=child_run.info.run_id,
-                params=[
-                    Param(str(key), str(value)) for key, value in truncated_params_batch.items()
-                ],
-                metrics=[
-                    Metric(key=str(key), value=value, timestamp=child_run_end_time, step=0)
-                    for key, value in truncated_metrics_batch.items()
-                ],
+            entity_batches.append(
+                (
+                    [Param(str(key), str(value)) for key, value in truncated_params_batch.items()],
+                    [
+                        Metric(key=str(key), value=value, timestamp=child_run_end_time, step=0)
+                        for key, value in truncated_metrics_batch.items()
+                    ],
+                )
             )
+        entity_batches_per_row.append(entity_batches)
 
-        client.set_terminated(run_id=child_run.info.run_id, end_time=child_run_end_time)
+    # Create, populate, and terminate the child runs with bulk requests rather than issuing
+    # separate requests for every point in the parameter search space
+    for row_batches in _chunk_list(entity_batches_per_row, chunk_size=MAX_RUNS_PER_BATCH):
+        child_runs = client.create_runs(
+            experiment_id=parent_run.info.experiment_id,
+            runs_data=[
+                RunData(metrics=batches[0][1], params=batches[0][0]) if batches else RunData()
+                for batches in row_batches
+            ],
+            start_time=child_run_start_time,
+            tags=tags_to_log,
+        )
+        for child_run, batches in zip(child_runs, row_batches):
+            for params_batch, metrics_batch in batches[1:]:
+                client.log_batch(
+                    run_id=child_run.info.run_id, params=params_batch, metrics=metrics_batch
+                )
+        client.set_terminated_runs(
+            run_ids=[child_run.info.run_id for child_run in child_runs],
+            end_time=child_run_end_time,
+        )
 
 
 def _is_supported_version():
@@ -0,0 +1,246 @@
+"""
+Opt-in local cache of downloaded artifacts, enabled by setting ``MLFLOW_ARTIFACT_CACHE_DIR`` to a
+directory shared by the processes of a host, so that loading the same model repeatedly (e.g. from
+serving replicas, batch jobs or Spark drivers) downloads it once.
+
+Cache entries are keyed by the resolved URI of the artifacts, e.g. the download URI of the model
+version that a ``models:/<name>/<stage>`` URI refers to at the time of the download, and by the
+size, entity tag and modification time of each of their files, obtained from the recursive
+listing of object stores or from ``get_artifact_stat`` calls to other artifact repositories.
+Cached files are made read-only and hard-linked into the destination directory of each download,
+or cloned or copied if they cannot be linked. The least recently used entries are evicted once the
+cache exceeds ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` bytes.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import uuid
+from contextlib import contextmanager
+
+from mlflow.store.artifact.artifact_repo import _get_env_int
+from mlflow.store.artifact.databricks_models_artifact_repo import DatabricksModelsArtifactRepository
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+from mlflow.utils.file_utils import copy_file
+
+_logger = logging.getLogger(__name__)
+
+ARTIFACT_CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+ARTIFACT_CACHE_MAX_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_SIZE"
+DEFAULT_ARTIFACT_CACHE_MAX_SIZE = 10 * 1024 * 1024 * 1024
+
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def get_artifact_cache():
+    """
+    :return: The :py:class:`ArtifactCache` configured by ``MLFLOW_ARTIFACT_CACHE_DIR`` and
+             ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE``, or ``None`` if the cache is disabled.
+    """
+    cache_dir = os.environ.get(ARTIFACT_CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    max_size = _get_env_int(ARTIFACT_CACHE_MAX_SIZE_ENV_VAR, DEFAULT_ARTIFACT_CACHE_MAX_SIZE)
+    return ArtifactCache(cache_dir, max_size)
+
+
+class ArtifactCache:
+    """
+    Local cache of downloaded artifacts.
+
+    :param cache_dir: Directory of the cache, created if needed.
+    :param max_size: Total size of the cached files in bytes above which the least recently used
+                     entries are evicted.
+    """
+
+    def __init__(self, cache_dir, max_size=DEFAULT_ARTIFACT_CACHE_MAX_SIZE):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self._entries_dir = os.path.join(self.cache_dir, "entries")
+        self._tmp_dir = os.path.join(self.cache_dir, "tmp")
+        self._lock_file = os.path.join(self.cache_dir, ".lock")
+        os.makedirs(self._entries_dir, exist_ok=True)
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+    def download_artifacts(self, repo, artifact_path, dst_path=None):
+        """
+        Download artifacts like :py:func:`ArtifactRepository.download_artifacts
+        <mlflow.store.artifact.artifact_repo.ArtifactRepository.download_artifacts>`, from the
+        cache if they did not change since they were cached. The downloaded files are read-only.
+
+        :param repo: Artifact repository of the artifacts.
+        :param artifact_path: Relative source path to the desired artifacts.
+        :param dst_path: Absolute path of the local filesystem destination directory, which must
+                         already exist. If unspecified, a new directory is created.
+
+        :return: Absolute path of the local filesystem location containing the artifacts.
+        """
+        source_uri, source_repo = _resolve_repo(repo)
+        if isinstance(source_repo, LocalArtifactRepository) or (
+            dst_path is not None and not os.path.isdir(dst_path)
+        ):
+            # Local artifacts gain nothing from the cache, and invalid destinations are reported
+            # by the repository
+            return repo.download_artifacts(artifact_path, dst_path)
+
+        manifest = _get_manifest(source_repo, artifact_path)
+        key = hashlib.sha256(
+            json.dumps([source_uri, artifact_path, manifest]).encode("utf-8")
+        ).hexdigest()
+        entry_dir = os.path.join(self._entries_dir, key)
+        dst_path = os.path.abspath(dst_path or tempfile.mkdtemp())
+        with self._lock():
+            cached = os.path.isdir(entry_dir)
+            if cached:
+                _touch_entry(entry_dir)
+        if cached:
+            _logger.debug("Using cached artifacts of %s from %s", source_uri, entry_dir)
+        else:
+            self._add_entry(source_repo, source_uri, artifact_path, key)
+        try:
+            return _use_entry(entry_dir, dst_path)
+        except FileNotFoundError:
+            # Entries are linked without holding the lock, so another process may evict the entry
+            # meanwhile, which is only likely when the cache is much smaller than its entries
+            _logger.debug("Artifact cache entry %s was evicted while in use", entry_dir)
+            return source_repo.download_artifacts(artifact_path, dst_path)
+
+    def _add_entry(self, source_repo, source_uri, artifact_path, key):
+        tmp_entry_dir = os.path.join(self._tmp_dir, uuid.uuid4().hex)
+        data_dir = os.path.join(tmp_entry_dir, "data")
+        os.makedirs(data_dir)
+        try:
+            local_path = source_repo.download_artifacts(artifact_path, data_dir)
+            size = 0
+            for root, _, filenames in os.walk(data_dir):
+                for f in filenames:
+                    path = os.path.join(root, f)
+                    size += os.path.getsize(path)
+                    os.chmod(path, _READ_ONLY)
+            with open(os.path.join(tmp_entry_dir, "entry.json"), "w") as f:
+                json.dump({"uri": source_uri, "path": os.path.relpath(local_path, data_dir)}, f)
+            with open(os.path.join(tmp_entry_dir, "size"), "w") as f:
+                f.write(str(size))
+
+            entry_dir = os.path.join(self._entries_dir, key)
+            with self._lock():
+                if not os.path.isdir(entry_dir):
+                    os.rename(tmp_entry_dir, entry_dir)
+                _touch_entry(entry_dir)
+                self._evict(keep=key)
+        finally:
+            shutil.rmtree(tmp_entry_dir, ignore_errors=True)
+
+    def _evict(self, keep):
+        entries = []
+        for key in os.listdir(self._entries_dir):
+            size_file = os.path.join(self._entries_dir, key, "size")
+            try:
+                with open(size_file) as f:
+                    entries.append((os.path.getmtime(size_file), int(f.read()), key))
+            except (OSError, ValueError):
+                entries.append((0, 0, key))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if key != keep:
+                _logger.debug("Evicting artifact cache entry %s", key)
+                shutil.rmtree(os.path.join(self._entries_dir, key), ignore_errors=True)
+                total_size -= size
+
+    @contextmanager
+    def _lock(self):
+        """
+        Lock the cache against the other threads and processes sharing it, with an advisory lock
+        on its lock file, which the operating system releases if the holder crashes. The lock is
+        only held to look up, add and evict entries, not while downloading or linking artifacts.
+        """
+        with open(self._lock_file, "a+b") as f:
+            if sys.platform == "win32":
+                import msvcrt
+
+                f.seek(0)
+                while True:
+                    try:
+                        # Raises after retrying for 10 seconds
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _touch_entry(entry_dir):
+    # The modification time of the size file records the last use of the entry
+    os.utime(os.path.join(entry_dir, "size"))
+
+
+def _raise(error):
+    raise error
+
+
+def _use_entry(entry_dir, dst_path):
+    """
+    Link the files of a cache entry into ``dst_path``.
+
+    :return: The local path of the cached artifacts in ``dst_path``.
+    :raises FileNotFoundError: If the entry is evicted meanwhile.
+    """
+    with open(os.path.join(entry_dir, "entry.json")) as f:
+        relative_path = json.load(f)["path"]
+    data_dir = os.path.join(entry_dir, "data")
+    for root, _, filenames in os.walk(data_dir, onerror=_raise):
+        dst_dir = os.path.join(dst_path, os.path.relpath(root, data_dir))
+        os.makedirs(dst_dir, exist_ok=True)
+        for f in filenames:
+            copy_file(os.path.join(root, f), os.path.join(dst_dir, f), "hardlink")
+    return os.path.normpath(os.path.join(dst_path, relative_path))
+
+
+def _resolve_repo(repo):
+    """
+    :return: The resolved URI of the artifacts of ``repo``, and the repository storing them.
+    """
+    if isinstance(repo, (ModelsArtifactRepository, RunsArtifactRepository)):
+        repo = repo.repo
+    if isinstance(repo, DatabricksModelsArtifactRepository):
+        uri = "models://{}/{}/{}".format(
+            repo.databricks_profile_uri, repo.model_name, repo.model_version
+        )
+        return uri, repo
+    return repo.artifact_uri, repo
+
+
+def _get_manifest(repo, artifact_path):
+    """
+    :return: The ``[path, size, etag, last_modified]`` of the files of the artifacts, from
+             :py:func:`ArtifactRepository.list_file_stats` or, for a single file, from
+             :py:func:`ArtifactRepository.get_artifact_stat`.
+    """
+    if repo._is_directory(artifact_path):
+        file_stats = repo.list_file_stats(artifact_path)
+    else:
+        file_stats = [(artifact_path, repo.get_artifact_stat(artifact_path))]
+    return [
+        [path, artifact_stat.size, artifact_stat.etag, artifact_stat.last_modified]
+        for path, artifact_stat in file_stats
+    ]
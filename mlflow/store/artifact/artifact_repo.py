@@ -1,13 +1,126 @@
+import http.client
+import inspect
+import io
+import logging
 import os
 import posixpath
+import shutil
 import tempfile
+import time
 from abc import abstractmethod, ABCMeta
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
+import requests
+import urllib3
+
+from mlflow.entities import FileInfo
 from mlflow.utils.validation import path_not_unique, bad_path_message
 from mlflow.utils.annotations import experimental
+from mlflow.utils.file_utils import (
+    MultipartDownloadSettings,
+    download_file_in_parts,
+    relative_path_to_artifact_path,
+)
+from mlflow.utils.transfer_journal import TransferJournal
 
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.protos.databricks_pb2 import (
+    ErrorCode,
+    FEATURE_DISABLED,
+    INVALID_PARAMETER_VALUE,
+    RESOURCE_DOES_NOT_EXIST,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Size of the chunks yielded when streaming the contents of an artifact file.
+ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Environment variable setting the number of threads listing and downloading the files of an
+# artifact directory concurrently.
+DOWNLOAD_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_DOWNLOAD_WORKERS"
+DEFAULT_DOWNLOAD_WORKERS = 8
+# Number of attempts to download each artifact file, and number of seconds before the first retry,
+# doubling after each further failure. Only transient errors are retried.
+DOWNLOAD_MAX_ATTEMPTS = 3
+DOWNLOAD_RETRY_BACKOFF = 0.5
+# Errors of the optional client libraries of artifact stores that fail to connect or to transfer
+# data, identified by the qualified names of their classes so that the libraries are not imported.
+_TRANSIENT_ERROR_CLASS_NAMES = {
+    "botocore.exceptions.ConnectionError",
+    "botocore.exceptions.HTTPClientError",
+    "botocore.exceptions.IncompleteReadError",
+    "azure.core.exceptions.ServiceRequestError",
+    "azure.core.exceptions.ServiceResponseError",
+    "google.auth.exceptions.TransportError",
+}
+# Error codes of S3 responses to throttled or timed out requests, some of which have 4xx statuses.
+_THROTTLING_ERROR_CODES = {
+    "RequestTimeout",
+    "RequestLimitExceeded",
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+}
+# Environment variables setting the size from which single artifact files are downloaded in ranged
+# parts, and the size of these parts. The parts of a file are read concurrently by
+# ``MLFLOW_ARTIFACT_DOWNLOAD_WORKERS`` threads.
+MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE_ENV_VAR = "MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE"
+DEFAULT_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE = 8 * 1024 * 1024
+MULTIPART_DOWNLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE"
+DEFAULT_MULTIPART_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Environment variable setting the number of threads uploading the files of a local directory
+# concurrently in ``log_artifacts``.
+UPLOAD_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_UPLOAD_WORKERS"
+DEFAULT_UPLOAD_WORKERS = 8
+# Environment variables setting the size from which single artifact files are uploaded in parts
+# that can be resumed after a failure, and the size of these parts, for the artifact repositories
+# without their own transfer settings. The parts of a file are uploaded concurrently by
+# ``MLFLOW_ARTIFACT_UPLOAD_WORKERS`` threads. Uploads through the tracking server have larger
+# defaults, see ``mlflow.store.artifact.http_artifact_repo``.
+MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR = "MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE"
+DEFAULT_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE = 8 * 1024 * 1024
+MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE"
+DEFAULT_MULTIPART_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Maximum number of parts of a multipart upload, as in the S3 API
+MAX_MULTIPART_UPLOAD_PARTS = 10000
+
+ArtifactStat = namedtuple("ArtifactStat", ["size", "last_modified", "etag"])
+ArtifactStat.__doc__ = """
+Metadata of a single artifact file, as returned by
+:py:func:`ArtifactRepository.get_artifact_stat`.
+
+:param size: Size of the file in bytes, or ``None`` if unknown.
+:param last_modified: Last modification time of the file, in seconds since the UNIX epoch, or
+                      ``None`` if unknown.
+:param etag: Opaque, unquoted entity tag identifying the current contents of the file, or ``None``
+             if the storage backend does not provide one.
+"""
+
+MultipartUploadPart = namedtuple("MultipartUploadPart", ["part_number", "size", "etag"])
+MultipartUploadPart.__doc__ = """
+A part of a multipart upload, as returned by :py:func:`ArtifactRepository.upload_part` and
+:py:func:`ArtifactRepository.list_multipart_upload_parts`.
+
+:param part_number: Number of the part, starting from 1, defining its position in the file.
+:param size: Size of the part in bytes, or ``None`` if unknown.
+:param etag: Opaque entity tag identifying the contents of the part, to pass back to
+             :py:func:`ArtifactRepository.complete_multipart_upload`.
+"""
+
+MultipartUploadSettings = namedtuple(
+    "MultipartUploadSettings", ["minimum_file_size", "part_size", "max_workers"]
+)
+MultipartUploadSettings.__doc__ = """
+Settings of the uploads of large files in parts, see
+:py:func:`ArtifactRepository._upload_file_in_parts`.
+
+:param minimum_file_size: Size in bytes from which files are uploaded in parts.
+:param part_size: Size in bytes of the parts.
+:param max_workers: Number of threads uploading the parts of a file concurrently.
+"""
 
 
 class ArtifactRepository:
@@ -46,26 +159,159 @@ class ArtifactRepository:
         """
         pass
 
+    def _upload_dir(self, local_dir, artifact_path, upload_file):
+        """
+        Upload the files of a local directory concurrently by :py:data:`UPLOAD_WORKERS_ENV_VAR`
+        threads, for the implementations of :py:func:`log_artifacts`. The uploads are reported in
+        the order of the files as they complete, and the files that failed to upload are reported
+        together once all the other files are uploaded.
+
+        :param local_dir: Directory of local artifacts to log.
+        :param artifact_path: Directory within the run's artifact directory in which to log the
+                              artifacts, or ``None``.
+        :param upload_file: Function called with the path of each local file and the relative
+                            artifact path of the directory in which to log it, ``""`` for the
+                            root directory.
+        """
+        artifact_path = artifact_path or ""
+        local_dir = os.path.abspath(local_dir)
+        uploads = []
+        for (root, dirnames, filenames) in os.walk(local_dir):
+            dirnames.sort()
+            artifact_dir = artifact_path
+            if root != local_dir:
+                rel_path = relative_path_to_artifact_path(os.path.relpath(root, local_dir))
+                artifact_dir = posixpath.join(artifact_path, rel_path)
+            uploads.extend((os.path.join(root, f), artifact_dir) for f in sorted(filenames))
+
+        failures = []
+        max_workers = _get_env_int(UPLOAD_WORKERS_ENV_VAR, DEFAULT_UPLOAD_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(upload_file, *upload) for upload in uploads]
+            for (local_file, artifact_dir), future in zip(uploads, futures):
+                error = future.exception()
+                if error is None:
+                    _logger.debug(
+                        "Uploaded %s to artifact directory '%s'", local_file, artifact_dir
+                    )
+                else:
+                    failures.append((local_file, error))
+        if failures:
+            raise MlflowException(
+                "Failed to upload {} of {} artifact files from {}:\n{}".format(
+                    len(failures),
+                    len(uploads),
+                    local_dir,
+                    "\n".join("  {}: {}".format(local_file, e) for local_file, e in failures),
+                )
+            ) from failures[0][1]
+
     @abstractmethod
-    def list_artifacts(self, path):
+    def list_artifacts(self, path, recursive=False):
         """
         Return all the artifacts for this run_id directly under path. If path is a file, returns
         an empty list. Will error if path is neither a file nor directory.
 
         :param path: Relative source path that contains desired artifacts
+        :param recursive: If ``True``, return the files at any depth under path instead, and the
+                          directories without any file. Object stores list them with a single
+                          prefix listing, while the other repositories walk the directories
+                          concurrently with :py:func:`_list_artifacts_recursive`.
 
-        :return: List of artifacts as FileInfo listed directly under path.
+        :return: List of artifacts as FileInfo listed directly under path, sorted by path.
         """
         pass
 
+    def _list_artifacts_recursive(self, path):
+        """
+        List the files at any depth under path and the directories without any file, by listing
+        the directories concurrently with :py:func:`list_artifacts`. Used by the implementations
+        of ``list_artifacts(path, recursive=True)`` whose storage cannot list them at once.
+        """
+        infos = []
+        executor = ThreadPoolExecutor(max_workers=self._get_download_workers())
+        try:
+            pending = {executor.submit(self._list_dir, path): path}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dir_path = pending.pop(future)
+                    listing = future.result()
+                    if not listing and dir_path != path:
+                        infos.append(FileInfo(dir_path, True, None))
+                    for file_info in listing:
+                        if file_info.is_dir:
+                            pending[
+                                executor.submit(self._list_dir, file_info.path)
+                            ] = file_info.path
+                        else:
+                            infos.append(file_info)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        return sorted(infos, key=lambda f: f.path)
+
+    def _list_dir(self, path):
+        return [  # prevent infinite loop, sometimes the dir is recursively included
+            file_info
+            for file_info in self.list_artifacts(path)
+            if file_info.path != "." and file_info.path != path
+        ]
+
+    def list_files(self, path=None):
+        """
+        Return the files at any depth under path and the directories without any file, with
+        ``list_artifacts(path, recursive=True)`` if the repository supports it, or by walking the
+        directories with :py:func:`list_artifacts` otherwise. Callers listing the artifacts of any
+        repository recursively should use this method rather than passing ``recursive=True`` to
+        :py:func:`list_artifacts`, which the repositories of plugins may not accept.
+
+        :param path: Relative source path that contains the desired artifacts.
+
+        :return: List of artifacts as FileInfo, sorted by path.
+        """
+        # The repositories of plugins may predate recursive listings
+        if "recursive" in inspect.signature(self.list_artifacts).parameters:
+            return self.list_artifacts(path, recursive=True)
+        return self._list_artifacts_recursive(path)
+
+    def list_file_stats(self, path=None):
+        """
+        Return the files at any depth under path with their metadata, as reported by
+        :py:func:`get_artifact_stat`. This base implementation lists the files with
+        :py:func:`list_files` and, if the repository provides a specialized implementation of
+        :py:func:`get_artifact_stat`, stats them concurrently with the threads of
+        :py:data:`DOWNLOAD_WORKERS_ENV_VAR`. Repositories whose listings report the modification
+        time and entity tag of files override it to get them from a single recursive listing.
+
+        :param path: Relative source path that contains the desired artifacts.
+
+        :return: List of ``(path, ArtifactStat)`` tuples of the files, sorted by path.
+        """
+        files = [file_info for file_info in self.list_files(path) if not file_info.is_dir]
+        if type(self).get_artifact_stat is ArtifactRepository.get_artifact_stat:
+            return [
+                (file_info.path, ArtifactStat(file_info.file_size, None, None))
+                for file_info in files
+            ]
+        paths = [file_info.path for file_info in files]
+        with ThreadPoolExecutor(max_workers=self._get_download_workers()) as executor:
+            return list(zip(paths, executor.map(self.get_artifact_stat, paths)))
+
     def _is_directory(self, artifact_path):
         listing = self.list_artifacts(artifact_path)
         return len(listing) > 0
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
-        local path for it.
+        local path for it. The files of a directory are listed up front with
+        ``list_artifacts(path, recursive=True)`` and downloaded concurrently by
+        :py:data:`DOWNLOAD_WORKERS_ENV_VAR` threads, and each file download is attempted up to
+        :py:data:`DOWNLOAD_MAX_ATTEMPTS` times.
         The caller is responsible for managing the lifecycle of the downloaded artifacts.
 
         :param artifact_path: Relative source path to the desired artifacts.
@@ -74,40 +320,12 @@ class ArtifactRepository:
                          If unspecified, the artifacts will either be downloaded to a new
                          uniquely-named directory on the local filesystem or will be returned
                          directly in the case of the LocalArtifactRepository.
+        :param progress_callback: Optional function called with the relative path and the local
+                                  path of each file once it is downloaded, from the thread that
+                                  called ``download_artifacts``.
 
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
-
-        # TODO: Probably need to add a more efficient method to stream just a single artifact
-        #       without downloading it, or to get a pre-signed URL for cloud storage.
-        def download_file(fullpath):
-            fullpath = fullpath.rstrip("/")  # Prevents incorrect split if fullpath ends with a '/'
-            dirpath, _ = posixpath.split(fullpath)
-            local_dir_path = os.path.join(dst_path, dirpath)
-            local_file_path = os.path.join(dst_path, fullpath)
-            if not os.path.exists(local_dir_path):
-                os.makedirs(local_dir_path)
-            self._download_file(remote_file_path=fullpath, local_path=local_file_path)
-            return local_file_path
-
-        def download_artifact_dir(dir_path):
-            local_dir = os.path.join(dst_path, dir_path)
-            dir_content = [  # prevent infinite loop, sometimes the dir is recursively included
-                file_info
-                for file_info in self.list_artifacts(dir_path)
-                if file_info.path != "." and file_info.path != dir_path
-            ]
-            if not dir_content:  # empty dir
-                if not os.path.exists(local_dir):
-                    os.makedirs(local_dir)
-            else:
-                for file_info in dir_content:
-                    if file_info.is_dir:
-                        download_artifact_dir(dir_path=file_info.path)
-                    else:
-                        download_file(file_info.path)
-            return local_dir
-
         if dst_path is None:
             dst_path = tempfile.mkdtemp()
         dst_path = os.path.abspath(dst_path)
@@ -131,9 +349,196 @@ class ArtifactRepository:
 
         # Check if the artifacts points to a directory
         if self._is_directory(artifact_path):
-            return download_artifact_dir(artifact_path)
-        else:
-            return download_file(artifact_path)
+            return self._download_artifact_dir(artifact_path, dst_path, progress_callback)
+        local_path = self._download_file_with_retries(artifact_path, dst_path)
+        if progress_callback is not None:
+            progress_callback(artifact_path.rstrip("/"), local_path)
+        return local_path
+
+    def _get_download_workers(self):
+        """
+        Return the number of threads listing and downloading the files of an artifact directory.
+        Derived classes whose storage clients cannot be shared across threads may override it.
+        """
+        return _get_env_int(DOWNLOAD_WORKERS_ENV_VAR, DEFAULT_DOWNLOAD_WORKERS)
+
+    def _download_artifact_dir(self, dir_path, dst_path, progress_callback):
+        # All the files are listed up front, with a single listing of object stores, then
+        # downloaded concurrently.
+        infos = self.list_files(dir_path)
+        executor = ThreadPoolExecutor(max_workers=self._get_download_workers())
+        futures = {}
+        try:
+            for file_info in infos:
+                if file_info.is_dir:  # empty dir
+                    os.makedirs(os.path.join(dst_path, file_info.path), exist_ok=True)
+                else:
+                    future = executor.submit(
+                        self._download_file_with_retries,
+                        file_info.path,
+                        dst_path,
+                        file_info.file_size,
+                    )
+                    futures[future] = file_info.path
+            for future in as_completed(futures):
+                local_path = future.result()
+                if progress_callback is not None:
+                    progress_callback(futures[future], local_path)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        return os.path.join(dst_path, dir_path)
+
+    def _download_file_with_retries(self, remote_file_path, dst_path, file_size=None):
+        """
+        Download a file with :py:func:`_download_file`, retrying attempts failing with transient
+        errors, as told by :py:func:`_is_transient_error`. The size of the file, if known from a
+        listing, is passed on to the implementations of
+        :py:func:`_download_file` accepting a ``file_size`` argument, which then need not look
+        it up.
+        """
+        remote_file_path = remote_file_path.rstrip("/")  # Prevents incorrect split
+        dirpath, _ = posixpath.split(remote_file_path)
+        local_file_path = os.path.join(dst_path, remote_file_path)
+        os.makedirs(os.path.join(dst_path, dirpath), exist_ok=True)
+        kwargs = {}
+        if (
+            file_size is not None
+            and "file_size" in inspect.signature(self._download_file).parameters
+        ):
+            kwargs["file_size"] = file_size
+        for attempt in range(1, DOWNLOAD_MAX_ATTEMPTS + 1):
+            try:
+                self._download_file(
+                    remote_file_path=remote_file_path, local_path=local_file_path, **kwargs
+                )
+                return local_file_path
+            except Exception as e:
+                if attempt == DOWNLOAD_MAX_ATTEMPTS or not _is_transient_error(e):
+                    raise
+                sleep_duration = DOWNLOAD_RETRY_BACKOFF * (2 ** (attempt - 1))
+                _logger.warning(
+                    "Failed to download artifact '%s' (attempt %d of %d): %s. "
+                    "Retrying in %.1f seconds",
+                    remote_file_path,
+                    attempt,
+                    DOWNLOAD_MAX_ATTEMPTS,
+                    e,
+                    sleep_duration,
+                )
+                time.sleep(sleep_duration)
+
+    def _download_file_in_parts(
+        self, remote_file_path, local_path, size, md5=None, etag=None, settings=None, sha256=None
+    ):
+        """
+        Download a single large file in ranged parts read concurrently with
+        :py:func:`open_artifact` and written at their offsets in ``local_path``, for the
+        implementations of :py:func:`_download_file`. The size of each part is verified as it is
+        written, and the MD5 and SHA-256 digests of the file, if given, once all the parts are
+        written. If the MD5 digest or the entity tag of the remote file is given, a download of
+        the same file to the same path after a failure only reads the parts that were not written
+        yet.
+
+        :param remote_file_path: Source path to the remote file, relative to the root
+                                 directory of the artifact repository.
+        :param local_path: The path to which to save the downloaded file.
+        :param size: Size of the remote file in bytes.
+        :param md5: Hexadecimal MD5 digest of the remote file, or ``None`` if unknown.
+        :param etag: Entity tag of the remote file, or ``None`` if unknown.
+        :param settings: :py:class:`MultipartDownloadSettings
+                         <mlflow.utils.file_utils.MultipartDownloadSettings>` of the download,
+                         defaulting to the settings of ``MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE`` and
+                         ``MLFLOW_ARTIFACT_DOWNLOAD_WORKERS``.
+        :param sha256: Hexadecimal SHA-256 digest of the remote file, or ``None`` if unknown.
+        """
+        settings = settings or _get_multipart_download_settings()
+        journal_key = None
+        if md5 is not None or etag is not None:
+            journal_key = [self.artifact_uri, remote_file_path, etag]
+        download_file_in_parts(
+            local_path,
+            size,
+            lambda start, end: self.open_artifact(remote_file_path, start, end),
+            settings.part_size,
+            settings.max_workers,
+            md5,
+            journal_key,
+            sha256,
+        )
+
+    def _upload_file_in_parts(self, local_file, artifact_path, settings=None):
+        """
+        Upload a single large file in parts with the multipart upload API of the repository, for
+        the implementations of :py:func:`log_artifact` and :py:func:`log_artifacts`. The parts are
+        read from ``local_file`` and uploaded concurrently, and the upload and its completed parts
+        are recorded in a :py:class:`TransferJournal
+        <mlflow.utils.transfer_journal.TransferJournal>`: if the upload fails, uploading the same
+        unmodified file to the same path again only uploads the parts that are missing.
+
+        :param local_file: Path to the local file.
+        :param artifact_path: Relative destination path of the artifact file.
+        :param settings: :py:class:`MultipartUploadSettings` of the upload, defaulting to the
+                         settings of ``MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE`` and
+                         ``MLFLOW_ARTIFACT_UPLOAD_WORKERS``.
+        """
+        settings = settings or _get_multipart_upload_settings()
+        size = os.path.getsize(local_file)
+        part_size = max(settings.part_size, -(-size // MAX_MULTIPART_UPLOAD_PARTS))
+        journal = TransferJournal(
+            "upload",
+            self.artifact_uri,
+            artifact_path,
+            os.path.abspath(local_file),
+            size,
+            os.path.getmtime(local_file),
+            part_size,
+        )
+        state, records = journal.load()
+        parts = {}
+        upload_id = None
+        if state is not None:
+            upload_id = state["upload_id"]
+            try:
+                uploaded_parts = set(self.list_multipart_upload_parts(artifact_path, upload_id))
+            except MlflowException as e:
+                if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                    raise
+                # The upload was completed or aborted since, e.g. by a lifecycle rule
+                upload_id = None
+            else:
+                for record in records:
+                    part = MultipartUploadPart(**record)
+                    if part in uploaded_parts:
+                        parts[part.part_number] = part
+                _logger.info(
+                    "Resuming upload of %s to '%s' with %d parts already uploaded",
+                    local_file,
+                    artifact_path,
+                    len(parts),
+                )
+        if upload_id is None:
+            upload_id = self.create_multipart_upload(artifact_path)
+            journal.start({"upload_id": upload_id})
+
+        def upload_part(part_number):
+            with open(local_file, "rb") as f:
+                f.seek((part_number - 1) * part_size)
+                fileobj = io.BytesIO(f.read(part_size))
+            part = self.upload_part(artifact_path, upload_id, part_number, fileobj)
+            journal.record(part._asdict())
+            return part
+
+        num_parts = max(-(-size // part_size), 1)
+        missing_part_numbers = [n for n in range(1, num_parts + 1) if n not in parts]
+        with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
+            for part in executor.map(upload_part, missing_part_numbers):
+                parts[part.part_number] = part
+        self.complete_multipart_upload(artifact_path, upload_id, list(parts.values()))
+        journal.delete()
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -147,6 +552,129 @@ class ArtifactRepository:
         """
         pass
 
+    def get_artifact_stat(self, artifact_path):
+        """
+        Return metadata about a single artifact file. This is a base implementation looking the
+        file up in the listing of its parent directory; derived classes may provide a specialized
+        implementation that also reports the modification time and entity tag of the file.
+
+        :param artifact_path: Relative source path to the desired artifact file.
+
+        :return: An :py:class:`ArtifactStat` describing the file.
+        """
+        parent_path = posixpath.dirname(artifact_path.rstrip("/"))
+        for file_info in self.list_artifacts(parent_path or None):
+            if file_info.path == artifact_path and not file_info.is_dir:
+                return ArtifactStat(file_info.file_size, None, None)
+        raise MlflowException(
+            "No such artifact file: '{}'".format(artifact_path), error_code=RESOURCE_DOES_NOT_EXIST
+        )
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        """
+        Stream the contents of a single artifact file without staging it on the local filesystem
+        of the caller, optionally restricted to the byte range ``[start, end)``. This is a base
+        implementation downloading the file to a temporary directory that is removed once the
+        returned iterator is exhausted or closed; derived classes should provide a specialized
+        implementation reading directly from the storage backend.
+
+        :param artifact_path: Relative source path to the desired artifact file.
+        :param start: Offset of the first byte to read. Defaults to the beginning of the file.
+        :param end: Offset one past the last byte to read. Defaults to the end of the file.
+
+        :return: An iterator over ``bytes`` chunks of the requested contents.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            local_path = self.download_artifacts(artifact_path, dst_path=tmp_dir)
+            fileobj = open(local_path, "rb")
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        def iter_and_cleanup():
+            try:
+                for chunk in _iter_file_range(fileobj, start, end):
+                    yield chunk
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return iter_and_cleanup()
+
+    def log_artifact_stream(self, fileobj, artifact_path):
+        """
+        Log the contents of a binary file object as the artifact file at ``artifact_path``,
+        streaming them to the storage backend as they are read, e.g. to forward a request body
+        without staging it on the local filesystem. Derived classes implement this with the upload
+        API of their storage backend; this base implementation raises an ``MlflowException`` with
+        the error code ``FEATURE_DISABLED``.
+
+        :param fileobj: Binary file object to read the contents of the file from, up to its end.
+        :param artifact_path: Relative destination path of the artifact file.
+        """
+        raise _unsupported_operation(self, "streamed uploads")
+
+    def create_multipart_upload(self, artifact_path):
+        """
+        Start a multipart upload of the artifact file at ``artifact_path``, whose parts can be
+        uploaded independently, in any order and across processes, then assembled with
+        :py:func:`complete_multipart_upload`. Derived classes implement the multipart upload
+        methods with the multipart API of their storage backend; these base implementations raise
+        an ``MlflowException`` with the error code ``FEATURE_DISABLED``.
+
+        :param artifact_path: Relative destination path of the artifact file.
+
+        :return: The string identifier of the upload.
+        """
+        raise _unsupported_operation(self, "multipart uploads")
+
+    def upload_part(self, artifact_path, upload_id, part_number, fileobj):
+        """
+        Upload a part of a multipart upload started with :py:func:`create_multipart_upload`,
+        replacing any part previously uploaded with the same number.
+
+        :param artifact_path: Relative destination path of the artifact file.
+        :param upload_id: Identifier of the upload.
+        :param part_number: Number of the part, between 1 and 10000.
+        :param fileobj: Seekable binary file object to read the contents of the part from.
+
+        :return: The uploaded :py:class:`MultipartUploadPart`.
+        """
+        raise _unsupported_operation(self, "multipart uploads")
+
+    def list_multipart_upload_parts(self, artifact_path, upload_id):
+        """
+        List the parts uploaded so far in a multipart upload, e.g. to resume an interrupted
+        upload.
+
+        :param artifact_path: Relative destination path of the artifact file.
+        :param upload_id: Identifier of the upload.
+
+        :return: List of :py:class:`MultipartUploadPart`, sorted by part number.
+        """
+        raise _unsupported_operation(self, "multipart uploads")
+
+    def complete_multipart_upload(self, artifact_path, upload_id, parts):
+        """
+        Assemble the artifact file at ``artifact_path`` from the specified uploaded parts, in
+        part number order, and end the multipart upload.
+
+        :param artifact_path: Relative destination path of the artifact file.
+        :param upload_id: Identifier of the upload.
+        :param parts: List of ``(part_number, etag)`` pairs (e.g. :py:class:`MultipartUploadPart`)
+                      identifying the parts to assemble.
+        """
+        raise _unsupported_operation(self, "multipart uploads")
+
+    def abort_multipart_upload(self, artifact_path, upload_id):
+        """
+        Abort a multipart upload, discarding its uploaded parts.
+
+        :param artifact_path: Relative destination path of the artifact file.
+        :param upload_id: Identifier of the upload.
+        """
+        raise _unsupported_operation(self, "multipart uploads")
+
     @experimental
     def delete_artifacts(self, artifact_path=None):
         """
@@ -158,8 +686,129 @@ class ArtifactRepository:
         pass
 
 
+def _unsupported_operation(artifact_repo, operation):
+    return MlflowException(
+        "{} does not support {}.".format(type(artifact_repo).__name__, operation),
+        error_code=FEATURE_DISABLED,
+    )
+
+
+def _no_such_upload(upload_id):
+    return MlflowException(
+        "No such multipart upload: '{}'".format(upload_id), error_code=RESOURCE_DOES_NOT_EXIST
+    )
+
+
+def _iter_file_range(fileobj, start=None, end=None, chunk_size=ARTIFACT_STREAM_CHUNK_SIZE):
+    """
+    Yield the contents of the seekable binary file object ``fileobj`` in the byte range
+    ``[start, end)`` as chunks of at most ``chunk_size`` bytes, closing the file object afterwards.
+    """
+    try:
+        if start:
+            fileobj.seek(start)
+        remaining = None if end is None else end - (start or 0)
+        while remaining is None or remaining > 0:
+            chunk = fileobj.read(chunk_size if remaining is None else min(chunk_size, remaining))
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+def _get_env_int(name, default):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        raise MlflowException(
+            "Invalid value for {}: '{}', expected a positive integer".format(
+                name, os.environ[name]
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return value
+
+
+def _get_multipart_download_settings():
+    return MultipartDownloadSettings(
+        minimum_file_size=_get_env_int(
+            MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE_ENV_VAR,
+            DEFAULT_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE,
+        ),
+        part_size=_get_env_int(
+            MULTIPART_DOWNLOAD_CHUNK_SIZE_ENV_VAR, DEFAULT_MULTIPART_DOWNLOAD_CHUNK_SIZE
+        ),
+        max_workers=_get_env_int(DOWNLOAD_WORKERS_ENV_VAR, DEFAULT_DOWNLOAD_WORKERS),
+    )
+
+
+def _get_multipart_upload_settings():
+    return MultipartUploadSettings(
+        minimum_file_size=_get_env_int(
+            MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR, DEFAULT_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE
+        ),
+        part_size=_get_env_int(
+            MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR, DEFAULT_MULTIPART_UPLOAD_CHUNK_SIZE
+        ),
+        max_workers=_get_env_int(UPLOAD_WORKERS_ENV_VAR, DEFAULT_UPLOAD_WORKERS),
+    )
+
+
 def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException(
             "Invalid artifact path: '%s'. %s" % (artifact_path, bad_path_message(artifact_path))
         )
+
+
+def _is_transient_error(error):
+    """
+    :return: Whether a failed download may succeed when retried, i.e. whether it failed to connect,
+             timed out, was cut short, was throttled or got a server error. Missing files, denied
+             access, invalid destinations and other client errors are not transient, whereas
+             truncated or corrupted downloads raise :py:class:`MlflowException` with the
+             ``INTERNAL_ERROR`` code and are retried.
+    """
+    if isinstance(error, MlflowException):
+        status = error.get_http_status_code()
+        return status >= 500 or status == 429
+    if isinstance(
+        error,
+        (
+            ConnectionError,
+            TimeoutError,
+            http.client.HTTPException,
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            urllib3.exceptions.ProtocolError,
+            urllib3.exceptions.TimeoutError,
+        ),
+    ):
+        return True
+    if any(
+        "{}.{}".format(cls.__module__, cls.__qualname__) in _TRANSIENT_ERROR_CLASS_NAMES
+        for cls in type(error).__mro__
+    ):
+        return True
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        # botocore ``ClientError``
+        if response.get("Error", {}).get("Code") in _THROTTLING_ERROR_CODES:
+            return True
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    elif isinstance(response, requests.Response):
+        # requests ``HTTPError`` and the errors of google-resumable-media
+        status = response.status_code
+    else:
+        # azure-core ``HttpResponseError`` and google-api-core ``GoogleAPICallError``
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    return isinstance(status, int) and (status >= 500 or status == 429)
@@ -2,10 +2,18 @@ import os
 import posixpath
 import re
 import urllib.parse
+import uuid
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStat,
+    MultipartUploadPart,
+    _get_multipart_download_settings,
+    _get_multipart_upload_settings,
+)
 
 
 class AzureBlobArtifactRepository(ArtifactRepository):
@@ -62,33 +70,40 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             path = path[1:]
         return container, storage_account, path
 
+    def _log_file(self, container_client, local_file, artifact_path):
+        if os.path.getsize(local_file) >= _get_multipart_upload_settings().minimum_file_size:
+            # Stage the blocks of large files with the multipart upload API, so that a retry after
+            # a failure only stages the missing blocks
+            self._upload_file_in_parts(local_file, artifact_path)
+            return
+        (_, _, root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        with open(local_file, "rb") as file:
+            container_client.upload_blob(posixpath.join(root_path, artifact_path), file)
+
     def log_artifact(self, local_file, artifact_path=None):
-        (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
+        (container, _, _) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
+        dest_path = os.path.basename(local_file)
         if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
-        dest_path = posixpath.join(dest_path, os.path.basename(local_file))
-        with open(local_file, "rb") as file:
-            container_client.upload_blob(dest_path, file)
+            dest_path = posixpath.join(artifact_path, dest_path)
+        self._log_file(container_client, local_file, dest_path)
 
     def log_artifacts(self, local_dir, artifact_path=None):
-        (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
+        (container, _, _) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                remote_file_path = posixpath.join(upload_path, f)
-                local_file_path = os.path.join(root, f)
-                with open(local_file_path, "rb") as file:
-                    container_client.upload_blob(remote_file_path, file)
-
-    def list_artifacts(self, path=None):
+
+        def upload_file(local_file, artifact_dir):
+            dest_path = posixpath.join(artifact_dir, os.path.basename(local_file))
+            self._log_file(container_client, local_file, dest_path)
+
+        self._upload_dir(local_dir, artifact_path, upload_file)
+
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return [
+                FileInfo(file_path, False, artifact_stat.size)
+                for file_path, artifact_stat in self.list_file_stats(path)
+            ]
         # Newer versions of `azure-storage-blob` (>= 12.4.0) provide a public
         # `azure.storage.blob.BlobPrefix` object to signify that a blob is a directory,
         # while older versions only expose this API internally as
@@ -128,12 +143,123 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             return []
         return sorted(infos, key=lambda f: f.path)
 
+    def list_file_stats(self, path=None):
+        (container, _, artifact_path) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+        # A single listing of all the blobs under the prefix, which reports their sizes,
+        # modification times and entity tags
+        file_stats = []
+        for blob in container_client.list_blobs(name_starts_with=prefix):
+            if not blob.name.startswith(artifact_path):
+                raise MlflowException(
+                    "The name of the listed Azure blob does not begin with the specified"
+                    " artifact path. Artifact path: {artifact_path}. Blob name:"
+                    " {blob_name}".format(artifact_path=artifact_path, blob_name=blob.name)
+                )
+            artifact_stat = ArtifactStat(
+                blob.size,
+                blob.last_modified.timestamp() if blob.last_modified is not None else None,
+                blob.etag.strip('"') if blob.etag is not None else None,
+            )
+            file_stats.append((posixpath.relpath(blob.name, artifact_path), artifact_stat))
+        return sorted(file_stats, key=lambda file_stat: file_stat[0])
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
         container_client = self.client.get_container_client(container)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
+        properties = container_client.get_blob_client(remote_full_path).get_blob_properties()
+        if properties.size >= _get_multipart_download_settings().minimum_file_size:
+            content_md5 = properties.content_settings.content_md5
+            md5 = bytes(content_md5).hex() if content_md5 else None
+            self._download_file_in_parts(
+                remote_file_path, local_path, properties.size, md5, properties.etag.strip('"')
+            )
+            return
         with open(local_path, "wb") as file:
             container_client.download_blob(remote_full_path).readinto(file)
 
+    def _get_blob_client(self, artifact_path):
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        return self.client.get_container_client(container).get_blob_client(remote_full_path)
+
+    def get_artifact_stat(self, artifact_path):
+        properties = self._get_blob_client(artifact_path).get_blob_properties()
+        return ArtifactStat(
+            properties.size, properties.last_modified.timestamp(), properties.etag.strip('"')
+        )
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        kwargs = {}
+        if start is not None or end is not None:
+            kwargs["offset"] = start or 0
+            if end is not None:
+                kwargs["length"] = end - kwargs["offset"]
+        return self._get_blob_client(artifact_path).download_blob(**kwargs).chunks()
+
+    def log_artifact_stream(self, fileobj, artifact_path):
+        # Streams of unknown length are staged as blocks of the maximum block size of the client,
+        # committed once the stream is exhausted
+        self._get_blob_client(artifact_path).upload_blob(fileobj)
+
+    # Multipart uploads stage the parts as uncommitted blocks of the destination blob, identified by
+    # the upload ID and the part number (all the block IDs of a blob must have the same length),
+    # and commit them on completion. The block ID of a part is used as its entity tag.
+
+    def create_multipart_upload(self, artifact_path):
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def _get_block_id(upload_id, part_number):
+        return "{}-{:05d}".format(upload_id, part_number)
+
+    def upload_part(self, artifact_path, upload_id, part_number, fileobj):
+        block_id = self._get_block_id(upload_id, part_number)
+        start = fileobj.tell()
+        size = fileobj.seek(0, os.SEEK_END) - start
+        fileobj.seek(start)
+        self._get_blob_client(artifact_path).stage_block(block_id, fileobj, length=size)
+        return MultipartUploadPart(part_number, size, block_id)
+
+    def list_multipart_upload_parts(self, artifact_path, upload_id):
+        # The blob does not exist until its first blocks are committed
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            _, uncommitted = self._get_blob_client(artifact_path).get_block_list("uncommitted")
+        except ResourceNotFoundError:
+            return []
+        prefix = upload_id + "-"
+        return sorted(
+            MultipartUploadPart(int(block.id[len(prefix) :]), block.size, block.id)
+            for block in uncommitted
+            if block.id.startswith(prefix)
+        )
+
+    def complete_multipart_upload(self, artifact_path, upload_id, parts):
+        from azure.storage.blob import BlobBlock
+
+        block_list = []
+        for part in sorted(parts, key=lambda part: part[0]):
+            block_id = self._get_block_id(upload_id, part[0])
+            if part[-1] != block_id:
+                raise MlflowException(
+                    "Part {} of upload '{}' has a different entity tag than '{}'.".format(
+                        part[0], upload_id, part[-1]
+                    ),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            block_list.append(BlobBlock(block_id))
+        self._get_blob_client(artifact_path).commit_block_list(block_list)
+
+    def abort_multipart_upload(self, artifact_path, upload_id):
+        # Uncommitted blocks cannot be deleted individually, Azure discards them after a week
+        pass
+
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
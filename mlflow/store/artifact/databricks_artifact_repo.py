@@ -19,11 +19,13 @@ from mlflow.protos.databricks_artifacts_pb2 import (
     ArtifactCredentialType,
 )
 from mlflow.protos.service_pb2 import MlflowService, GetRun, ListArtifacts
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    _get_multipart_download_settings,
+)
 from mlflow.utils.databricks_utils import get_databricks_host_creds
 from mlflow.utils.file_utils import (
     download_file_using_http_uri,
-    relative_path_to_artifact_path,
     yield_file_in_chunks,
 )
 from mlflow.utils.proto_json_utils import message_to_json
@@ -237,7 +239,12 @@ class DatabricksArtifactRepository(ArtifactRepository):
             )
         try:
             signed_read_uri = cloud_credential.signed_uri
-            download_file_using_http_uri(signed_read_uri, local_file_path, _DOWNLOAD_CHUNK_SIZE)
+            download_file_using_http_uri(
+                signed_read_uri,
+                local_file_path,
+                _DOWNLOAD_CHUNK_SIZE,
+                multipart_settings=_get_multipart_download_settings(),
+            )
         except Exception as err:
             raise MlflowException(err)
 
@@ -255,18 +262,13 @@ class DatabricksArtifactRepository(ArtifactRepository):
         self._upload_to_cloud(write_credentials, local_file, run_relative_artifact_path)
 
     def log_artifacts(self, local_dir, artifact_path=None):
-        artifact_path = artifact_path or ""
-        for (dirpath, _, filenames) in os.walk(local_dir):
-            artifact_subdir = artifact_path
-            if dirpath != local_dir:
-                rel_path = os.path.relpath(dirpath, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                artifact_subdir = posixpath.join(artifact_path, rel_path)
-            for name in filenames:
-                file_path = os.path.join(dirpath, name)
-                self.log_artifact(file_path, artifact_subdir)
+        # The write credentials of each file are fetched by the thread uploading it, so that the
+        # credentials of several files are requested concurrently.
+        self._upload_dir(local_dir, artifact_path, self.log_artifact)
 
-    def list_artifacts(self, path=None):
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return self._list_artifacts_recursive(path)
         if path:
             run_relative_path = posixpath.join(self.run_relative_artifact_repo_root_path, path)
         else:
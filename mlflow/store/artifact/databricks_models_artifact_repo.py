@@ -5,7 +5,10 @@ import mlflow.tracking
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    _get_multipart_download_settings,
+)
 from mlflow.utils.databricks_utils import get_databricks_host_creds
 from mlflow.utils.file_utils import download_file_using_http_uri
 from mlflow.utils.rest_utils import http_request
@@ -62,7 +65,9 @@ class DatabricksModelsArtifactRepository(ArtifactRepository):
             body["page_token"] = page_token
         return body
 
-    def list_artifacts(self, path=None):
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return self._list_artifacts_recursive(path)
         infos = []
         page_token = None
         if not path:
@@ -113,7 +118,12 @@ class DatabricksModelsArtifactRepository(ArtifactRepository):
     def _download_file(self, remote_file_path, local_path):
         try:
             signed_uri = self._get_signed_download_uri(remote_file_path)
-            download_file_using_http_uri(signed_uri, local_path, _DOWNLOAD_CHUNK_SIZE)
+            download_file_using_http_uri(
+                signed_uri,
+                local_path,
+                _DOWNLOAD_CHUNK_SIZE,
+                multipart_settings=_get_multipart_download_settings(),
+            )
         except Exception as err:
             raise MlflowException(err)
 
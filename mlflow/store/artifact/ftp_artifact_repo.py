@@ -72,6 +72,13 @@ class FTPArtifactRepository(ArtifactRepository):
                 ftp.cwd(artifact_dir)
                 ftp.storbinary("STOR " + os.path.basename(local_file), f)
 
+    def log_artifact_stream(self, fileobj, artifact_path):
+        remote_path = posixpath.join(self.path, artifact_path)
+        with self.get_ftp_client() as ftp:
+            self._mkdir(ftp, posixpath.dirname(remote_path))
+            ftp.cwd(posixpath.dirname(remote_path))
+            ftp.storbinary("STOR " + posixpath.basename(remote_path), fileobj)
+
     def log_artifacts(self, local_dir, artifact_path=None):
         dest_path = posixpath.join(self.path, artifact_path) if artifact_path else self.path
 
@@ -95,7 +102,9 @@ class FTPArtifactRepository(ArtifactRepository):
         with self.get_ftp_client() as ftp:
             return self._is_dir(ftp, list_dir)
 
-    def list_artifacts(self, path=None):
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return self._list_artifacts_recursive(path)
         with self.get_ftp_client() as ftp:
             artifact_dir = self.path
             list_dir = posixpath.join(artifact_dir, path) if path else artifact_dir
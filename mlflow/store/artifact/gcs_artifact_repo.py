@@ -1,12 +1,46 @@
+import base64
+import logging
 import os
+from mimetypes import guess_type
 
 import posixpath
+import re
+import requests
+import time
 import urllib.parse
+import uuid
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStat,
+    ARTIFACT_STREAM_CHUNK_SIZE,
+    MultipartUploadPart,
+    _get_multipart_download_settings,
+    _get_multipart_upload_settings,
+    _no_such_upload,
+)
 from mlflow.exceptions import MlflowException
+from mlflow.utils.file_utils import download_file_in_parts
+from mlflow.utils.transfer_journal import TransferJournal
+
+_logger = logging.getLogger(__name__)
+
+_RESUMABLE_UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+# Connect and read timeouts of the requests of resumable uploads, in seconds, and number of
+# attempts to send each chunk, with the number of seconds before the first retry, doubling after
+# each further failure.
+_RESUMABLE_UPLOAD_TIMEOUT = (10, 300)
+_RESUMABLE_UPLOAD_MAX_ATTEMPTS = 5
+_RESUMABLE_UPLOAD_RETRY_BACKOFF = 0.5
+
+# Prefix of the bucket under which multipart uploads store their parts as separate blobs until they
+# are composed into the destination blob, and maximum number of source blobs of a composition.
+MULTIPART_UPLOAD_PREFIX = ".mlflow-multipart-uploads/"
+_MAX_COMPOSE_SOURCES = 32
+_UPLOAD_ID_REGEX = re.compile(r"^[0-9a-f]{32}$")
+_PART_NAME_REGEX = re.compile(r"^(\d{5})$")
 
 
 class GCSArtifactRepository(ArtifactRepository):
@@ -46,34 +80,128 @@ class GCSArtifactRepository(ArtifactRepository):
             storage_client = self.gcs.Client.create_anonymous_client()
         return storage_client.bucket(bucket)
 
+    def _log_file(self, gcs_bucket, local_file, artifact_path):
+        (_, root_path) = self.parse_gcs_uri(self.artifact_uri)
+        blob = gcs_bucket.blob(posixpath.join(root_path, artifact_path))
+        settings = _get_multipart_upload_settings()
+        if os.path.getsize(local_file) >= settings.minimum_file_size:
+            self._upload_file_resumable(blob, local_file, artifact_path, settings.part_size)
+            return
+        blob.upload_from_filename(local_file)
+
+    def _upload_file_resumable(self, blob, local_file, artifact_path, chunk_size):
+        """
+        Upload a large file in a resumable upload session, in chunks sent sequentially. The URI of
+        the session is recorded in a local :py:class:`TransferJournal
+        <mlflow.utils.transfer_journal.TransferJournal>`: if the upload fails, uploading the same
+        unmodified file to the same path again resumes the session from the offset persisted by
+        GCS.
+        """
+        size = os.path.getsize(local_file)
+        # The chunks of resumable uploads must be multiples of 256 KiB
+        chunk_size = max(chunk_size // _RESUMABLE_UPLOAD_CHUNK_ALIGNMENT, 1)
+        chunk_size *= _RESUMABLE_UPLOAD_CHUNK_ALIGNMENT
+        journal = TransferJournal(
+            "upload",
+            self.artifact_uri,
+            artifact_path,
+            os.path.abspath(local_file),
+            size,
+            os.path.getmtime(local_file),
+        )
+        state, _ = journal.load()
+        offset = None
+        if state is not None:
+            session_url = state["session_url"]
+            # The sessions expire after a week
+            response = _query_resumable_upload(session_url, size)
+            if response.status_code not in [404, 410]:
+                offset = _get_persisted_offset(response, size)
+                _logger.info(
+                    "Resuming upload of %s to '%s' from offset %d",
+                    local_file,
+                    artifact_path,
+                    offset,
+                )
+        if offset is None:
+            session_url = blob.create_resumable_upload_session(
+                content_type=guess_type(local_file)[0], size=size
+            )
+            journal.start({"session_url": session_url})
+            offset = 0
+
+        with open(local_file, "rb") as f:
+            attempt = 1
+            while offset < size:
+                f.seek(offset)
+                chunk = f.read(chunk_size)
+                content_range = "bytes {}-{}/{}".format(offset, offset + len(chunk) - 1, size)
+                try:
+                    response = requests.put(
+                        session_url,
+                        data=chunk,
+                        headers={"Content-Range": content_range},
+                        timeout=_RESUMABLE_UPLOAD_TIMEOUT,
+                    )
+                    persisted_offset = _get_persisted_offset(response, size)
+                except requests.RequestException as e:
+                    if attempt == _RESUMABLE_UPLOAD_MAX_ATTEMPTS or not _is_retryable_error(e):
+                        raise
+                    sleep_duration = _RESUMABLE_UPLOAD_RETRY_BACKOFF * (2 ** (attempt - 1))
+                    _logger.warning(
+                        "Failed to upload %s to '%s' at offset %d (attempt %d of %d): %s. "
+                        "Retrying in %.1f seconds",
+                        local_file,
+                        artifact_path,
+                        offset,
+                        attempt,
+                        _RESUMABLE_UPLOAD_MAX_ATTEMPTS,
+                        e,
+                        sleep_duration,
+                    )
+                    time.sleep(sleep_duration)
+                    attempt += 1
+                    # The failed request may have persisted part of its chunk
+                    try:
+                        response = _query_resumable_upload(session_url, size)
+                        offset = _get_persisted_offset(response, size)
+                    except requests.RequestException as e:
+                        if not _is_retryable_error(e):
+                            raise
+                    continue
+                if persisted_offset <= offset:
+                    raise MlflowException(
+                        "Resumable upload of {} made no progress at offset {}".format(
+                            local_file, offset
+                        )
+                    )
+                offset = persisted_offset
+                attempt = 1
+        journal.delete()
+
     def log_artifact(self, local_file, artifact_path=None):
-        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        (bucket, _) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = os.path.basename(local_file)
         if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
-        dest_path = posixpath.join(dest_path, os.path.basename(local_file))
-
-        gcs_bucket = self._get_bucket(bucket)
-        blob = gcs_bucket.blob(dest_path)
-        blob.upload_from_filename(local_file)
+            dest_path = posixpath.join(artifact_path, dest_path)
+        self._log_file(self._get_bucket(bucket), local_file, dest_path)
 
     def log_artifacts(self, local_dir, artifact_path=None):
-        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
+        (bucket, _) = self.parse_gcs_uri(self.artifact_uri)
         gcs_bucket = self._get_bucket(bucket)
 
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
-
-    def list_artifacts(self, path=None):
+        def upload_file(local_file, artifact_dir):
+            dest_path = posixpath.join(artifact_dir, os.path.basename(local_file))
+            self._log_file(gcs_bucket, local_file, dest_path)
+
+        self._upload_dir(local_dir, artifact_path, upload_file)
+
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return [
+                FileInfo(file_path, False, artifact_stat.size)
+                for file_path, artifact_stat in self.list_file_stats(path)
+            ]
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
         dest_path = artifact_path
         if path:
@@ -95,6 +223,21 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return sorted(infos, key=lambda f: f.path)
 
+    def list_file_stats(self, path=None):
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path if dest_path.endswith("/") else dest_path + "/"
+        # A single listing of all the blobs under the prefix, skipping the placeholder blobs of
+        # directories, which reports their sizes, modification times and entity tags
+        file_stats = [
+            (posixpath.relpath(blob.name, artifact_path), _get_blob_stat(blob))
+            for blob in self._get_bucket(bucket).list_blobs(prefix=prefix)
+            if not blob.name.endswith("/")
+        ]
+        return sorted(file_stats, key=lambda file_stat: file_stat[0])
+
     def _list_folders(self, bkt, prefix, artifact_path):
         results = bkt.list_blobs(prefix=prefix, delimiter="/")
         dir_paths = set()
@@ -107,7 +250,191 @@ class GCSArtifactRepository(ArtifactRepository):
         (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
         gcs_bucket = self._get_bucket(bucket)
-        gcs_bucket.blob(remote_full_path).download_to_filename(local_path)
+        blob = gcs_bucket.blob(remote_full_path)
+        blob.reload()
+        settings = _get_multipart_download_settings()
+        if blob.size < settings.minimum_file_size:
+            blob.download_to_filename(local_path)
+            return
+        # The MD5 digest is missing for composite objects
+        md5 = base64.b64decode(blob.md5_hash).hex() if blob.md5_hash else None
+        download_file_in_parts(
+            local_path,
+            blob.size,
+            # GCS byte ranges are inclusive of their last byte
+            lambda start, end: [blob.download_as_string(start=start, end=end - 1)],
+            settings.part_size,
+            settings.max_workers,
+            md5,
+            [self.artifact_uri, remote_file_path, blob.etag],
+        )
+
+    def _get_blob(self, artifact_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        blob = self._get_bucket(bucket).get_blob(remote_full_path)
+        if blob is None:
+            raise MlflowException(
+                "No such artifact file: '{}'".format(artifact_path),
+                error_code=RESOURCE_DOES_NOT_EXIST,
+            )
+        return blob
+
+    def get_artifact_stat(self, artifact_path):
+        return _get_blob_stat(self._get_blob(artifact_path))
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        blob = self._get_blob(artifact_path)
+        start = start or 0
+        end = blob.size if end is None else min(end, blob.size)
+
+        def iter_chunks():
+            # GCS byte ranges are inclusive of their last byte
+            for offset in range(start, end, ARTIFACT_STREAM_CHUNK_SIZE):
+                yield blob.download_as_string(
+                    start=offset, end=min(offset + ARTIFACT_STREAM_CHUNK_SIZE, end) - 1
+                )
+
+        return iter_chunks()
+
+    def log_artifact_stream(self, fileobj, artifact_path):
+        (bucket, root_path) = self.parse_gcs_uri(self.artifact_uri)
+        blob = self._get_bucket(bucket).blob(posixpath.join(root_path, artifact_path))
+        # Streams of unknown size are sent in a resumable upload session, chunk by chunk
+        blob.upload_from_file(fileobj, content_type=guess_type(artifact_path)[0])
+
+    # Multipart uploads store each part as a blob under the prefix of the upload, next to an empty
+    # marker blob recording the upload until it is completed or aborted, and compose the parts into
+    # the destination blob on completion. The hexadecimal MD5 digest of a part is its entity tag.
+
+    def _get_upload(self, upload_id):
+        """
+        :return: The bucket and the prefix of the blobs of an existing multipart upload.
+        """
+        if not _UPLOAD_ID_REGEX.match(upload_id):
+            raise _no_such_upload(upload_id)
+        (bucket, _) = self.parse_gcs_uri(self.artifact_uri)
+        gcs_bucket = self._get_bucket(bucket)
+        prefix = "{}{}/".format(MULTIPART_UPLOAD_PREFIX, upload_id)
+        if gcs_bucket.get_blob(prefix + "upload") is None:
+            raise _no_such_upload(upload_id)
+        return gcs_bucket, prefix
+
+    @staticmethod
+    def _delete_upload(gcs_bucket, prefix):
+        marker = None
+        for blob in gcs_bucket.list_blobs(prefix=prefix):
+            if blob.name == prefix + "upload":
+                marker = blob
+            else:
+                blob.delete()
+        if marker is not None:
+            marker.delete()
+
+    def create_multipart_upload(self, artifact_path):
+        (bucket, _) = self.parse_gcs_uri(self.artifact_uri)
+        upload_id = uuid.uuid4().hex
+        marker = "{}{}/upload".format(MULTIPART_UPLOAD_PREFIX, upload_id)
+        self._get_bucket(bucket).blob(marker).upload_from_string(b"")
+        return upload_id
+
+    def upload_part(self, artifact_path, upload_id, part_number, fileobj):
+        gcs_bucket, prefix = self._get_upload(upload_id)
+        start = fileobj.tell()
+        size = fileobj.seek(0, os.SEEK_END) - start
+        fileobj.seek(start)
+        blob = gcs_bucket.blob("{}{:05d}".format(prefix, part_number))
+        blob.upload_from_file(fileobj, size=size)
+        return MultipartUploadPart(part_number, size, base64.b64decode(blob.md5_hash).hex())
+
+    def list_multipart_upload_parts(self, artifact_path, upload_id):
+        gcs_bucket, prefix = self._get_upload(upload_id)
+        parts = []
+        for blob in gcs_bucket.list_blobs(prefix=prefix):
+            match = _PART_NAME_REGEX.match(blob.name[len(prefix) :])
+            if match:
+                etag = base64.b64decode(blob.md5_hash).hex()
+                parts.append(MultipartUploadPart(int(match.group(1)), blob.size, etag))
+        return sorted(parts)
+
+    def complete_multipart_upload(self, artifact_path, upload_id, parts):
+        (_, root_path) = self.parse_gcs_uri(self.artifact_uri)
+        gcs_bucket, prefix = self._get_upload(upload_id)
+        uploaded_etags = {
+            part.part_number: part.etag
+            for part in self.list_multipart_upload_parts(artifact_path, upload_id)
+        }
+        for part in parts:
+            if uploaded_etags.get(part[0]) != part[-1].strip('"'):
+                raise MlflowException(
+                    "Part {} of upload '{}' was not uploaded or has a different entity tag than "
+                    "'{}'.".format(part[0], upload_id, part[-1]),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+        sources = [
+            gcs_bucket.blob("{}{:05d}".format(prefix, part_number))
+            for part_number in sorted(part[0] for part in parts)
+        ]
+        # Compositions have a limited number of sources, so the parts of larger uploads are
+        # composed into intermediate blobs first, in as many rounds as needed
+        composition_round = 0
+        while len(sources) > _MAX_COMPOSE_SOURCES:
+            composition_round += 1
+            composed = []
+            for i in range(0, len(sources), _MAX_COMPOSE_SOURCES):
+                blob = gcs_bucket.blob(
+                    "{}compose-{}-{:05d}".format(prefix, composition_round, len(composed))
+                )
+                blob.compose(sources[i : i + _MAX_COMPOSE_SOURCES])
+                composed.append(blob)
+            sources = composed
+        destination = gcs_bucket.blob(posixpath.join(root_path, artifact_path))
+        destination.content_type = guess_type(artifact_path)[0]
+        destination.compose(sources)
+        self._delete_upload(gcs_bucket, prefix)
+
+    def abort_multipart_upload(self, artifact_path, upload_id):
+        self._delete_upload(*self._get_upload(upload_id))
 
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
+
+
+def _get_blob_stat(blob):
+    last_modified = blob.updated.timestamp() if blob.updated is not None else None
+    return ArtifactStat(blob.size, last_modified, blob.etag)
+
+
+def _query_resumable_upload(session_url, size):
+    """
+    :return: The response to a request to a resumable upload session sending no data, with which
+             the session reports the number of bytes it persisted.
+    """
+    return requests.put(
+        session_url,
+        headers={"Content-Range": "bytes */{}".format(size)},
+        timeout=_RESUMABLE_UPLOAD_TIMEOUT,
+    )
+
+
+def _is_retryable_error(error):
+    """
+    :return: Whether a failed request of a resumable upload can be retried, i.e. whether it failed
+             to connect, timed out or got a server error.
+    """
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def _get_persisted_offset(response, size):
+    """
+    :return: The number of bytes persisted by a resumable upload session, from the response to a
+             request to the session.
+    """
+    # Incomplete sessions respond with the status 308 and the range of the persisted bytes, if any
+    if response.status_code == 308:
+        persisted_range = response.headers.get("Range")
+        return int(persisted_range.split("-")[1]) + 1 if persisted_range else 0
+    response.raise_for_status()
+    return size
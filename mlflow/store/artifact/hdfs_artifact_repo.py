@@ -1,12 +1,18 @@
 import os
 import posixpath
+import shutil
 import tempfile
 from contextlib import contextmanager
 import urllib.parse
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStat,
+    ARTIFACT_STREAM_CHUNK_SIZE,
+    _iter_file_range,
+)
 from mlflow.utils.file_utils import mkdir, relative_path_to_artifact_path
 
 
@@ -36,6 +42,12 @@ class HdfsArtifactRepository(ArtifactRepository):
             with hdfs.open(destination, "wb") as output:
                 output.write(open(local_file, "rb").read())
 
+    def log_artifact_stream(self, fileobj, artifact_path):
+        destination = _resolve_base_path(self.path, artifact_path)
+        with hdfs_system(scheme=self.scheme, host=self.host, port=self.port) as hdfs:
+            with hdfs.open(destination, "wb") as output:
+                shutil.copyfileobj(fileobj, output, ARTIFACT_STREAM_CHUNK_SIZE)
+
     def log_artifacts(self, local_dir, artifact_path=None):
         """
             Log artifacts in hdfs.
@@ -69,15 +81,19 @@ class HdfsArtifactRepository(ArtifactRepository):
                     with hdfs.open(destination, "wb") as output_stream:
                         output_stream.write(open(source, "rb").read())
 
-    def list_artifacts(self, path=None):
+    def list_artifacts(self, path=None, recursive=False):
         """
             Lists files and directories under artifacts directory for the current run_id.
             (self.path contains the base path - hdfs:/some/path/run_id/artifacts)
 
             :param path: Relative source path. Possible subdirectory existing under
                          hdfs:/some/path/run_id/artifacts
+            :param recursive: If True, list the files at any depth under path instead, and the
+                              directories without any file.
             :return: List of FileInfos under given path
         """
+        if recursive:
+            return self._list_artifacts_recursive(path)
         hdfs_base_path = _resolve_base_path(self.path, path)
 
         with hdfs_system(scheme=self.scheme, host=self.host, port=self.port) as hdfs:
@@ -105,7 +121,7 @@ class HdfsArtifactRepository(ArtifactRepository):
             else:
                 yield hdfs_path, False, hdfs.info(hdfs_path).get("size")
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
             Download an artifact file or directory to a local directory/file if applicable, and
             return a local path for it.
@@ -119,6 +135,8 @@ class HdfsArtifactRepository(ArtifactRepository):
                              exist. If unspecified, the artifacts will be downloaded to a new,
                              uniquely-named
                              directory on the local filesystem.
+            :param progress_callback: Optional function called with the relative path and the
+                                      local path of each file once it is downloaded.
 
             :return: Absolute path of the local filesystem location containing the downloaded
             artifacts - file/directory.
@@ -132,6 +150,8 @@ class HdfsArtifactRepository(ArtifactRepository):
             if not hdfs.isdir(hdfs_base_path):
                 local_path = os.path.join(local_dir, os.path.normpath(artifact_path))
                 _download_hdfs_file(hdfs, hdfs_base_path, local_path)
+                if progress_callback is not None:
+                    progress_callback(artifact_path, local_path)
                 return local_path
 
             for path, is_dir, _ in self._walk_path(hdfs, hdfs_base_path):
@@ -143,8 +163,30 @@ class HdfsArtifactRepository(ArtifactRepository):
                     mkdir(local_path)
                 else:
                     _download_hdfs_file(hdfs, path, local_path)
+                    if progress_callback is not None:
+                        progress_callback(posixpath.join(artifact_path, relative_path), local_path)
             return local_dir
 
+    def get_artifact_stat(self, artifact_path):
+        hdfs_base_path = _resolve_base_path(self.path, artifact_path)
+        with hdfs_system(scheme=self.scheme, host=self.host, port=self.port) as hdfs:
+            file_detail = hdfs.info(hdfs_base_path)
+        return ArtifactStat(file_detail.get("size"), file_detail.get("last_modified"), None)
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        """
+            Stream the contents of an artifact file straight from hdfs, keeping the connection
+            open until the returned iterator is exhausted or closed.
+        """
+        hdfs_base_path = _resolve_base_path(self.path, artifact_path)
+
+        def iter_chunks():
+            with hdfs_system(scheme=self.scheme, host=self.host, port=self.port) as hdfs:
+                for chunk in _iter_file_range(hdfs.open(hdfs_base_path, "rb"), start, end):
+                    yield chunk
+
+        return iter_chunks()
+
     def _download_file(self, remote_file_path, local_path):
         raise MlflowException("This is not implemented. Should never be called.")
 
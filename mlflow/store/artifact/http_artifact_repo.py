@@ -0,0 +1,265 @@
+import json
+import logging
+import os
+import posixpath
+import time
+import urllib.parse
+
+import requests
+
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import (
+    FEATURE_DISABLED,
+    INVALID_PARAMETER_VALUE,
+    RESOURCE_DOES_NOT_EXIST,
+    ErrorCode,
+)
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ARTIFACT_STREAM_CHUNK_SIZE,
+    MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR,
+    MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR,
+    _get_env_int,
+)
+from mlflow.tracking._tracking_service.utils import _get_default_host_creds
+from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.utils.rest_utils import http_request, http_request_safe, verify_rest_response
+from mlflow.utils.transfer_journal import TransferJournal
+
+_logger = logging.getLogger(__name__)
+
+ARTIFACTS_PROXY_API_PATH = "/api/2.0/mlflow-artifacts"
+# Defaults of the minimum file size and part size of multipart uploads through the server, larger
+# than for direct uploads to storage since each part is a request streamed by the server
+DEFAULT_PROXY_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE = 500 * 1024 * 1024
+DEFAULT_PROXY_MULTIPART_UPLOAD_CHUNK_SIZE = 100 * 1024 * 1024
+# Number of attempts of each upload request before giving up
+_MAX_UPLOAD_ATTEMPTS = 5
+
+
+class HttpArtifactRepository(ArtifactRepository):
+    """
+    Stores artifacts through the proxied artifact access endpoints of an MLflow tracking server
+    started with ``--artifacts-destination``.
+
+    This repository is used with URIs of the form
+    ``http(s)://<host>:<port>/api/2.0/mlflow-artifacts/artifacts/<path>``, and authenticates with
+    the ``MLFLOW_TRACKING_*`` environment variables. Files larger than
+    ``MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE`` bytes are uploaded in parts of
+    ``MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE`` bytes, streamed by the server to the multipart API of
+    its storage; such an upload interrupted by a failure is resumed from its last uploaded part by
+    the next attempt to log the same file. Files are uploaded in a single request instead if the
+    storage of the server has no multipart API.
+    """
+
+    def __init__(self, artifact_uri):
+        super().__init__(artifact_uri)
+        parsed = urllib.parse.urlparse(artifact_uri)
+        artifacts_path = ARTIFACTS_PROXY_API_PATH + "/artifacts"
+        base_path, separator, root_path = parsed.path.partition(artifacts_path)
+        if not separator or root_path[:1] not in ("", "/"):
+            raise MlflowException(
+                "HTTP artifact URI must be of the form "
+                "http(s)://<host>:<port>{}/<path>: {}".format(artifacts_path, artifact_uri),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        self._host = urllib.parse.urlunparse((parsed.scheme, parsed.netloc, base_path, "", "", ""))
+        self._root_path = root_path.strip("/")
+
+    def _get_host_creds(self):
+        return _get_default_host_creds(self._host)
+
+    def _get_full_path(self, artifact_path):
+        return posixpath.join(self._root_path, artifact_path) if artifact_path else self._root_path
+
+    @staticmethod
+    def _get_endpoint(action, full_path):
+        return "{}/{}/{}".format(ARTIFACTS_PROXY_API_PATH, action, urllib.parse.quote(full_path))
+
+    def _call_endpoint(self, action, full_path, method, **kwargs):
+        endpoint = self._get_endpoint(action, full_path)
+        response = http_request_safe(self._get_host_creds(), endpoint, method=method, **kwargs)
+        return json.loads(response.text)
+
+    def log_artifact(self, local_file, artifact_path=None):
+        full_path = self._get_full_path(
+            posixpath.join(artifact_path, os.path.basename(local_file))
+            if artifact_path
+            else os.path.basename(local_file)
+        )
+        size = os.path.getsize(local_file)
+        if size > 0 and size >= _get_env_int(
+            MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR,
+            DEFAULT_PROXY_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE,
+        ):
+            self._multipart_upload(local_file, full_path, size)
+        else:
+            self._upload(self._get_endpoint("artifacts", full_path), local_file, 0, size)
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        local_dir = os.path.abspath(local_dir)
+        for (root, _, filenames) in os.walk(local_dir):
+            upload_path = artifact_path
+            if root != local_dir:
+                rel_path = relative_path_to_artifact_path(os.path.relpath(root, local_dir))
+                upload_path = posixpath.join(artifact_path, rel_path) if artifact_path else rel_path
+            for f in filenames:
+                self.log_artifact(os.path.join(root, f), upload_path)
+
+    def list_artifacts(self, path=None, recursive=False):
+        full_path = self._get_full_path(path)
+        params = {"path": full_path} if full_path else {}
+        if recursive:
+            params["recursive"] = "true"
+        endpoint = ARTIFACTS_PROXY_API_PATH + "/artifacts"
+        response = http_request_safe(self._get_host_creds(), endpoint, method="GET", params=params)
+        response_json = json.loads(response.text)
+        if recursive and not response_json.get("recursive"):
+            # Tracking servers without recursive listings return the direct children of the path
+            return self._list_artifacts_recursive(path)
+        infos = []
+        for f in response_json.get("files", []):
+            rel_path = (
+                posixpath.relpath(f["path"], self._root_path) if self._root_path else f["path"]
+            )
+            infos.append(FileInfo(rel_path, f["is_dir"], f.get("file_size")))
+        return sorted(infos, key=lambda f: f.path)
+
+    def _download_file(self, remote_file_path, local_path):
+        endpoint = self._get_endpoint("artifacts", self._get_full_path(remote_file_path))
+        response = http_request(self._get_host_creds(), endpoint, method="GET", stream=True)
+        try:
+            if response.status_code != 200:
+                verify_rest_response(response, endpoint)
+            with open(local_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=ARTIFACT_STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+        finally:
+            response.close()
+
+    def _multipart_upload(self, local_file, full_path, size):
+        chunk_size = _get_env_int(
+            MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR, DEFAULT_PROXY_MULTIPART_UPLOAD_CHUNK_SIZE
+        )
+        # Uploads are only resumed for the same, unmodified file with the same parts
+        journal = TransferJournal(
+            "upload",
+            self._host,
+            full_path,
+            os.path.abspath(local_file),
+            size,
+            os.path.getmtime(local_file),
+            chunk_size,
+        )
+        upload_id, uploaded_parts = self._resume_multipart_upload(journal, full_path)
+        if upload_id is None:
+            try:
+                upload_id = self._call_endpoint("mpu/create", full_path, "POST")["upload_id"]
+            except MlflowException as e:
+                if e.error_code != ErrorCode.Name(FEATURE_DISABLED):
+                    raise
+                # The storage of the server has no multipart upload API
+                self._upload(self._get_endpoint("artifacts", full_path), local_file, 0, size)
+                return
+            journal.start({"upload_id": upload_id})
+
+        parts = []
+        for part_number, offset in enumerate(range(0, size, chunk_size), start=1):
+            length = min(chunk_size, size - offset)
+            part = uploaded_parts.get(part_number)
+            if part is None or part["size"] != length:
+                part = self._upload(
+                    self._get_endpoint("mpu/upload", full_path),
+                    local_file,
+                    offset,
+                    length,
+                    params={"upload_id": upload_id, "part_number": part_number},
+                )
+            parts.append({"part_number": part_number, "etag": part["etag"]})
+        self._call_endpoint(
+            "mpu/complete",
+            full_path,
+            "POST",
+            params={"upload_id": upload_id},
+            json={"parts": parts},
+        )
+        journal.delete()
+
+    def _resume_multipart_upload(self, journal, full_path):
+        """
+        :return: The ID of the multipart upload of an earlier attempt to upload the same file and
+                 its uploaded parts by number, or ``(None, {})`` if there is none to resume.
+        """
+        state, _ = journal.load()
+        if state is None:
+            return None, {}
+        upload_id = state["upload_id"]
+        try:
+            parts = self._call_endpoint(
+                "mpu/parts", full_path, "GET", params={"upload_id": upload_id}
+            )["parts"]
+        except MlflowException as e:
+            if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                raise
+            return None, {}
+        _logger.info("Resuming the upload of %s with %d uploaded parts", full_path, len(parts))
+        return upload_id, {part["part_number"]: part for part in parts}
+
+    def _upload(self, endpoint, local_file, offset, length, params=None):
+        """
+        Upload ``length`` bytes of ``local_file`` from ``offset`` with a PUT request to
+        ``endpoint``, retrying on connection errors, rate limiting and server errors. The request
+        body is read again from the file on each attempt.
+        """
+        for attempt in range(_MAX_UPLOAD_ATTEMPTS):
+            if attempt > 0:
+                time.sleep(2 ** (attempt - 1))
+            try:
+                with open(local_file, "rb") as f:
+                    response = http_request(
+                        self._get_host_creds(),
+                        endpoint,
+                        retries=1,
+                        retry_interval=0,
+                        max_rate_limit_interval=0,
+                        method="PUT",
+                        params=params,
+                        data=_FileSlice(f, offset, length),
+                    )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+            except MlflowException as e:
+                # Raised by `http_request` on server errors
+                error = e
+            else:
+                if response.status_code != 429:
+                    return json.loads(verify_rest_response(response, endpoint).text)
+                error = "rate limit exceeded"
+            _logger.warning("Upload to %s failed (%s), attempt %d", endpoint, error, attempt + 1)
+        raise MlflowException(
+            "Upload to {} failed after {} attempts".format(endpoint, _MAX_UPLOAD_ATTEMPTS)
+        )
+
+
+class _FileSlice:
+    """
+    Read-only file object over ``length`` bytes of the open file ``f`` from ``offset``, streamed
+    as the body of a request with a known Content-Length.
+    """
+
+    def __init__(self, f, offset, length):
+        f.seek(offset)
+        self._f = f
+        self._length = length
+        self._remaining = length
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
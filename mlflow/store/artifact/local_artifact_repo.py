@@ -1,9 +1,22 @@
-import distutils.dir_util as dir_util
+import hashlib
 import os
+import re
 import shutil
+import uuid
 
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStat,
+    ARTIFACT_STREAM_CHUNK_SIZE,
+    MultipartUploadPart,
+    verify_artifact_path,
+    _iter_file_range,
+    _no_such_upload,
+)
 from mlflow.utils.file_utils import (
+    copy_file,
     mkdir,
     list_all,
     get_file_info,
@@ -11,6 +24,26 @@ from mlflow.utils.file_utils import (
     relative_path_to_artifact_path,
 )
 
+# Environment variable setting how artifact files are copied into the artifact root when they are
+# logged, and out of it when they are downloaded to a destination directory: ``copy`` (default),
+# ``reflink`` to clone them with copy-on-write where the filesystem supports it, or ``hardlink``
+# to hard-link them where both directories are on the same filesystem, see
+# :py:func:`mlflow.utils.file_utils.copy_file`. Hard-linked artifacts share their contents with
+# the logged and downloaded files, so these files must not be modified in place.
+LINK_MODE_ENV_VAR = "MLFLOW_LOCAL_ARTIFACT_LINK_MODE"
+
+# Directory of the artifact root in which multipart uploads stage their parts until they are
+# completed, so that all the processes and hosts sharing the artifact root can upload parts. It is
+# hidden from the listings of the artifact root.
+MULTIPART_UPLOAD_DIR = ".mlflow-multipart-uploads"
+
+_UPLOAD_ID_REGEX = re.compile(r"^[0-9a-f]{32}$")
+_PART_NAME_REGEX = re.compile(r"^(\d{5})-([0-9a-f]{32})$")
+
+
+def _get_link_mode():
+    return os.environ.get(LINK_MODE_ENV_VAR) or "copy"
+
 
 class LocalArtifactRepository(ArtifactRepository):
     """Stores artifacts as files in a local directory."""
@@ -35,7 +68,9 @@ class LocalArtifactRepository(ArtifactRepository):
         )
         if not os.path.exists(artifact_dir):
             mkdir(artifact_dir)
-        shutil.copyfile(local_file, os.path.join(artifact_dir, os.path.basename(local_file)))
+        copy_file(
+            local_file, os.path.join(artifact_dir, os.path.basename(local_file)), _get_link_mode()
+        )
 
     def _is_directory(self, artifact_path):
         # NOTE: The path is expected to be in posix format.
@@ -53,25 +88,36 @@ class LocalArtifactRepository(ArtifactRepository):
         artifact_dir = (
             os.path.join(self.artifact_dir, artifact_path) if artifact_path else self.artifact_dir
         )
-        if not os.path.exists(artifact_dir):
-            mkdir(artifact_dir)
-        dir_util.copy_tree(src=local_dir, dst=artifact_dir, preserve_mode=0, preserve_times=0)
+        if not os.path.isdir(local_dir):
+            raise MlflowException(
+                "Cannot log artifacts of '{}': not a directory".format(local_dir),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        link_mode = _get_link_mode()
+        for root, _, filenames in os.walk(local_dir, followlinks=True):
+            dst_dir = os.path.normpath(os.path.join(artifact_dir, os.path.relpath(root, local_dir)))
+            os.makedirs(dst_dir, exist_ok=True)
+            for f in filenames:
+                copy_file(os.path.join(root, f), os.path.join(dst_dir, f), link_mode)
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
         Artifacts tracked by ``LocalArtifactRepository`` already exist on the local filesystem.
         If ``dst_path`` is ``None``, the absolute filesystem path of the specified artifact is
-        returned. If ``dst_path`` is not ``None``, the local artifact is copied to ``dst_path``.
+        returned. If ``dst_path`` is not ``None``, the local artifact is copied to ``dst_path``,
+        or linked according to ``MLFLOW_LOCAL_ARTIFACT_LINK_MODE``.
 
         :param artifact_path: Relative source path to the desired artifacts.
         :param dst_path: Absolute path of the local filesystem destination directory to which to
                          download the specified artifacts. This directory must already exist. If
                          unspecified, the absolute path of the local artifact will be returned.
+        :param progress_callback: Optional function called with the relative path and the local
+                                  path of each file once it is copied to ``dst_path``.
 
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
         if dst_path:
-            return super().download_artifacts(artifact_path, dst_path)
+            return super().download_artifacts(artifact_path, dst_path, progress_callback)
         # NOTE: The artifact_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         local_artifact_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
@@ -79,14 +125,31 @@ class LocalArtifactRepository(ArtifactRepository):
             raise IOError("No such file or directory: '{}'".format(local_artifact_path))
         return os.path.abspath(local_artifact_path)
 
-    def list_artifacts(self, path=None):
+    def list_artifacts(self, path=None, recursive=False):
         # NOTE: The path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         if path:
             path = os.path.normpath(path)
         list_dir = os.path.join(self.artifact_dir, path) if path else self.artifact_dir
-        if os.path.isdir(list_dir):
+        if recursive and os.path.isdir(list_dir):
+            infos = []
+            for root, dirnames, filenames in os.walk(list_dir, followlinks=True):
+                if root == self.artifact_dir and MULTIPART_UPLOAD_DIR in dirnames:
+                    dirnames.remove(MULTIPART_UPLOAD_DIR)
+                full_paths = [os.path.join(root, f) for f in filenames]
+                if not dirnames and not filenames and root != list_dir:
+                    full_paths.append(root)  # empty dir
+                for full_path in full_paths:
+                    artifact_path = relative_path_to_artifact_path(
+                        os.path.relpath(full_path, self.artifact_dir)
+                    )
+                    infos.append(get_file_info(full_path, artifact_path))
+            return sorted(infos, key=lambda f: f.path)
+        elif os.path.isdir(list_dir):
             artifact_files = list_all(list_dir, full_path=True)
+            if not path:
+                upload_dir = os.path.join(self.artifact_dir, MULTIPART_UPLOAD_DIR)
+                artifact_files = [f for f in artifact_files if f != upload_dir]
             infos = [
                 get_file_info(
                     f, relative_path_to_artifact_path(os.path.relpath(f, self.artifact_dir))
@@ -101,7 +164,128 @@ class LocalArtifactRepository(ArtifactRepository):
         # NOTE: The remote_file_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
-        shutil.copyfile(remote_file_path, local_path)
+        copy_file(remote_file_path, local_path, _get_link_mode())
+
+    def _get_local_file_path(self, artifact_path):
+        # NOTE: The artifact_path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        local_file_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        if not os.path.isfile(local_file_path):
+            raise MlflowException(
+                "No such artifact file: '{}'".format(artifact_path),
+                error_code=RESOURCE_DOES_NOT_EXIST,
+            )
+        return local_file_path
+
+    def get_artifact_stat(self, artifact_path):
+        stat = os.stat(self._get_local_file_path(artifact_path))
+        etag = "{:x}-{:x}".format(stat.st_mtime_ns, stat.st_size)
+        return ArtifactStat(stat.st_size, stat.st_mtime, etag)
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        fileobj = open(self._get_local_file_path(artifact_path), "rb")
+        return _iter_file_range(fileobj, start, end)
+
+    def _write_file(self, artifact_path, write):
+        """
+        Write the artifact file at ``artifact_path`` by calling ``write`` with a binary file
+        object, replacing any existing file once the call returns so that readers never see a
+        partially written file.
+        """
+        verify_artifact_path(artifact_path)
+        local_path = os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        tmp_path = "{}.{}.tmp".format(local_path, uuid.uuid4().hex)
+        try:
+            with open(tmp_path, "xb") as f:
+                write(f)
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def log_artifact_stream(self, fileobj, artifact_path):
+        self._write_file(
+            artifact_path, lambda f: shutil.copyfileobj(fileobj, f, ARTIFACT_STREAM_CHUNK_SIZE)
+        )
+
+    # Multipart uploads stage each part as a file named after its number and the MD5 digest of its
+    # contents, used as its entity tag, and concatenate the parts into the destination file on
+    # completion.
+
+    def _get_upload_dir(self, upload_id):
+        if not _UPLOAD_ID_REGEX.match(upload_id):
+            raise _no_such_upload(upload_id)
+        return os.path.join(self.artifact_dir, MULTIPART_UPLOAD_DIR, upload_id)
+
+    def create_multipart_upload(self, artifact_path):
+        verify_artifact_path(artifact_path)
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._get_upload_dir(upload_id))
+        return upload_id
+
+    def upload_part(self, artifact_path, upload_id, part_number, fileobj):
+        upload_dir = self._get_upload_dir(upload_id)
+        if not os.path.isdir(upload_dir):
+            raise _no_such_upload(upload_id)
+        md5 = hashlib.md5()
+        size = 0
+        tmp_path = os.path.join(upload_dir, ".part-{}".format(uuid.uuid4().hex))
+        try:
+            with open(tmp_path, "xb") as f:
+                for chunk in iter(lambda: fileobj.read(ARTIFACT_STREAM_CHUNK_SIZE), b""):
+                    md5.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+            for name in os.listdir(upload_dir):
+                if name.startswith("%05d-" % part_number):
+                    os.remove(os.path.join(upload_dir, name))
+            etag = md5.hexdigest()
+            os.replace(tmp_path, os.path.join(upload_dir, "%05d-%s" % (part_number, etag)))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return MultipartUploadPart(part_number, size, etag)
+
+    def list_multipart_upload_parts(self, artifact_path, upload_id):
+        upload_dir = self._get_upload_dir(upload_id)
+        if not os.path.isdir(upload_dir):
+            raise _no_such_upload(upload_id)
+        parts = []
+        for name in os.listdir(upload_dir):
+            match = _PART_NAME_REGEX.match(name)
+            if match:
+                size = os.path.getsize(os.path.join(upload_dir, name))
+                parts.append(MultipartUploadPart(int(match.group(1)), size, match.group(2)))
+        return sorted(parts)
+
+    def complete_multipart_upload(self, artifact_path, upload_id, parts):
+        upload_dir = self._get_upload_dir(upload_id)
+        uploaded_etags = {
+            part.part_number: part.etag
+            for part in self.list_multipart_upload_parts(artifact_path, upload_id)
+        }
+        for part in parts:
+            if uploaded_etags.get(part[0]) != part[-1].strip('"'):
+                raise MlflowException(
+                    "Part {} of upload '{}' was not uploaded or has a different entity tag than "
+                    "'{}'.".format(part[0], upload_id, part[-1]),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+
+        def concatenate_parts(f):
+            for part_number in sorted(part[0] for part in parts):
+                part_name = "%05d-%s" % (part_number, uploaded_etags[part_number])
+                with open(os.path.join(upload_dir, part_name), "rb") as part_file:
+                    shutil.copyfileobj(part_file, f, ARTIFACT_STREAM_CHUNK_SIZE)
+
+        self._write_file(artifact_path, concatenate_parts)
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+    def abort_multipart_upload(self, artifact_path, upload_id):
+        shutil.rmtree(self._get_upload_dir(upload_id), ignore_errors=True)
 
     def delete_artifacts(self, artifact_path=None):
         artifact_path = (
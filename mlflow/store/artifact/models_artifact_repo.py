@@ -81,18 +81,22 @@ class ModelsArtifactRepository(ArtifactRepository):
             "log_artifacts is not supported for models:/ URIs. Use register_model instead."
         )
 
-    def list_artifacts(self, path):
+    def list_artifacts(self, path, recursive=False):
         """
         Return all the artifacts for this run_id directly under path. If path is a file, returns
         an empty list. Will error if path is neither a file nor directory.
 
         :param path: Relative source path that contain desired artifacts
+        :param recursive: If True, return the files at any depth under path instead, and the
+                          directories without any file.
 
         :return: List of artifacts as FileInfo listed directly under path.
         """
+        if recursive:
+            return self.repo.list_files(path)
         return self.repo.list_artifacts(path)
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, progress_callback=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
         local path for it.
@@ -104,10 +108,12 @@ class ModelsArtifactRepository(ArtifactRepository):
                          If unspecified, the artifacts will either be downloaded to a new
                          uniquely-named directory on the local filesystem or will be returned
                          directly in the case of the LocalArtifactRepository.
+        :param progress_callback: Optional function called with the relative path and the local
+                                  path of each file once it is downloaded.
 
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
-        return self.repo.download_artifacts(artifact_path, dst_path)
+        return self.repo.download_artifacts(artifact_path, dst_path, progress_callback)
 
     def _download_file(self, remote_file_path, local_path):
         """
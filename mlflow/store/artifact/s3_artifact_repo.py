@@ -1,4 +1,8 @@
+import base64
 import os
+import re
+import threading
+from contextlib import contextmanager
 from mimetypes import guess_type
 
 import posixpath
@@ -7,8 +11,44 @@ import urllib.parse
 from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStat,
+    ARTIFACT_STREAM_CHUNK_SIZE,
+    MultipartUploadPart,
+    MultipartUploadSettings,
+    _get_env_int,
+    _get_multipart_download_settings,
+)
+from mlflow.utils.file_utils import MultipartDownloadSettings
+
+MULTIPART_THRESHOLD_ENV_VAR = "MLFLOW_S3_MULTIPART_THRESHOLD"
+MULTIPART_CHUNKSIZE_ENV_VAR = "MLFLOW_S3_MULTIPART_CHUNKSIZE"
+MAX_CONCURRENCY_ENV_VAR = "MLFLOW_S3_MAX_CONCURRENCY"
+MAX_POOL_CONNECTIONS_ENV_VAR = "MLFLOW_S3_MAX_POOL_CONNECTIONS"
+# Enough connections for the concurrent transfers of each of the files of a directory upload or
+# download to reuse their connections, rather than botocore's default of 10
+DEFAULT_MAX_POOL_CONNECTIONS = 64
+
+# Environment variables from which boto3 resolves the credentials and region of clients
+_CREDENTIALS_ENV_VARS = [
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_PROFILE",
+    "AWS_DEFAULT_REGION",
+    "AWS_CA_BUNDLE",
+]
+
+# boto3 creates clients from a default session that is not safe to use concurrently, e.g. from the
+# threads of a directory download. The clients themselves are thread-safe, and are cached per
+# configuration since creating one takes tens of milliseconds.
+_client_creation_lock = threading.Lock()
+_clients = {}
+# Process that created the cached clients, whose connections must not be shared with forked
+# processes
+_clients_pid = None
 
 
 class S3ArtifactRepository(ArtifactRepository):
@@ -36,6 +76,8 @@ class S3ArtifactRepository(ArtifactRepository):
             return None
 
     def _get_s3_client(self):
+        global _clients_pid
+
         import boto3
         from botocore.client import Config
 
@@ -49,16 +91,35 @@ class S3ArtifactRepository(ArtifactRepository):
         # NOTE: If you need to specify this env variable, please file an issue at
         # https://github.com/mlflow/mlflow/issues so we know your use-case!
         signature_version = os.environ.get("MLFLOW_EXPERIMENTAL_S3_SIGNATURE_VERSION", "s3v4")
-        return boto3.client(
-            "s3",
-            config=Config(signature_version=signature_version),
-            endpoint_url=s3_endpoint_url,
-            verify=verify,
+        max_pool_connections = _get_env_int(
+            MAX_POOL_CONNECTIONS_ENV_VAR, DEFAULT_MAX_POOL_CONNECTIONS
+        )
+        key = (
+            signature_version,
+            s3_endpoint_url,
+            verify,
+            max_pool_connections,
+            tuple(os.environ.get(name) for name in _CREDENTIALS_ENV_VARS),
         )
+        with _client_creation_lock:
+            if _clients_pid != os.getpid():
+                _clients.clear()
+                _clients_pid = os.getpid()
+            if key not in _clients:
+                _clients[key] = boto3.client(
+                    "s3",
+                    config=Config(
+                        signature_version=signature_version,
+                        max_pool_connections=max_pool_connections,
+                    ),
+                    endpoint_url=s3_endpoint_url,
+                    verify=verify,
+                )
+            return _clients[key]
 
-    def _upload_file(self, s3_client, local_file, bucket, key):
+    def _get_upload_extra_args(self, file_path):
         extra_args = dict()
-        guessed_type, guessed_encoding = guess_type(local_file)
+        guessed_type, guessed_encoding = guess_type(file_path)
         if guessed_type is not None:
             extra_args["ContentType"] = guessed_type
         if guessed_encoding is not None:
@@ -66,38 +127,71 @@ class S3ArtifactRepository(ArtifactRepository):
         environ_extra_args = self.get_s3_file_upload_extra_args()
         if environ_extra_args is not None:
             extra_args.update(environ_extra_args)
-        s3_client.upload_file(Filename=local_file, Bucket=bucket, Key=key, ExtraArgs=extra_args)
+        return extra_args
+
+    def _upload_file(self, s3_client, local_file, bucket, key):
+        extra_args = self._get_upload_extra_args(local_file)
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs=extra_args,
+            Config=self._get_transfer_config(),
+        )
+
+    def _log_file(self, s3_client, local_file, artifact_path):
+        transfer_config = self._get_transfer_config()
+        if os.path.getsize(local_file) >= transfer_config.multipart_threshold:
+            # Upload large files with the multipart upload API rather than the S3 transfer manager,
+            # so that a retry after a failure resumes the upload
+            settings = MultipartUploadSettings(
+                transfer_config.multipart_threshold,
+                transfer_config.multipart_chunksize,
+                transfer_config.max_concurrency,
+            )
+            self._upload_file_in_parts(local_file, artifact_path, settings)
+            return
+        (bucket, root_path) = data.parse_s3_uri(self.artifact_uri)
+        self._upload_file(
+            s3_client=s3_client,
+            local_file=local_file,
+            bucket=bucket,
+            key=posixpath.join(root_path, artifact_path),
+        )
 
     def log_artifact(self, local_file, artifact_path=None):
-        (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
+        dest_path = os.path.basename(local_file)
         if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
-        dest_path = posixpath.join(dest_path, os.path.basename(local_file))
-        self._upload_file(
-            s3_client=self._get_s3_client(), local_file=local_file, bucket=bucket, key=dest_path
+            dest_path = posixpath.join(artifact_path, dest_path)
+        self._log_file(self._get_s3_client(), local_file, dest_path)
+
+    def log_artifact_stream(self, fileobj, artifact_path):
+        (bucket, root_path) = data.parse_s3_uri(self.artifact_uri)
+        # The transfer manager reads the stream in parts of the multipart chunk size, uploaded with
+        # the multipart upload API once the stream reaches the multipart threshold
+        self._get_s3_client().upload_fileobj(
+            Fileobj=fileobj,
+            Bucket=bucket,
+            Key=posixpath.join(root_path, artifact_path),
+            ExtraArgs=self._get_upload_extra_args(artifact_path),
+            Config=self._get_transfer_config(),
         )
 
     def log_artifacts(self, local_dir, artifact_path=None):
-        (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
         s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                self._upload_file(
-                    s3_client=s3_client,
-                    local_file=os.path.join(root, f),
-                    bucket=bucket,
-                    key=posixpath.join(upload_path, f),
-                )
 
-    def list_artifacts(self, path=None):
+        def upload_file(local_file, artifact_dir):
+            dest_path = posixpath.join(artifact_dir, os.path.basename(local_file))
+            self._log_file(s3_client, local_file, dest_path)
+
+        self._upload_dir(local_dir, artifact_path, upload_file)
+
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return [
+                FileInfo(file_path, False, artifact_stat.size)
+                for file_path, artifact_stat in self.list_file_stats(path)
+            ]
         (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
         dest_path = artifact_path
         if path:
@@ -129,6 +223,30 @@ class S3ArtifactRepository(ArtifactRepository):
                 infos.append(FileInfo(file_rel_path, False, file_size))
         return sorted(infos, key=lambda f: f.path)
 
+    def list_file_stats(self, path=None):
+        (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path + "/" if dest_path else ""
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        # A single listing of all the objects under the prefix, which reports their sizes,
+        # modification times and entity tags like HEAD requests
+        file_stats = []
+        for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in result.get("Contents", []):
+                file_path = obj.get("Key")
+                self._verify_listed_object_contains_artifact_path_prefix(
+                    listed_object_path=file_path, artifact_path=artifact_path
+                )
+                if file_path.endswith("/"):  # placeholder object of a directory
+                    continue
+                artifact_stat = ArtifactStat(
+                    int(obj["Size"]), obj["LastModified"].timestamp(), obj["ETag"].strip('"')
+                )
+                file_stats.append((posixpath.relpath(file_path, artifact_path), artifact_stat))
+        return sorted(file_stats, key=lambda file_stat: file_stat[0])
+
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
         if not listed_object_path.startswith(artifact_path):
@@ -140,11 +258,177 @@ class S3ArtifactRepository(ArtifactRepository):
                 )
             )
 
-    def _download_file(self, remote_file_path, local_path):
+    def _download_file(self, remote_file_path, local_path, file_size=None):
         (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
         s3_full_path = posixpath.join(s3_root_path, remote_file_path)
-        s3_client = self._get_s3_client()
-        s3_client.download_file(bucket, s3_full_path, local_path)
+        transfer_config = self._get_transfer_config()
+        if file_size is None or file_size >= transfer_config.multipart_threshold:
+            head = self._get_s3_client().head_object(
+                Bucket=bucket, Key=s3_full_path, ChecksumMode="ENABLED"
+            )
+            file_size = int(head["ContentLength"])
+            if file_size >= transfer_config.multipart_threshold:
+                # Download large files in ranged parts rather than with the S3 transfer manager,
+                # so that a retry after a failure resumes the download
+                md5, sha256 = _get_digests(head)
+                self._download_file_in_parts(
+                    remote_file_path,
+                    local_path,
+                    file_size,
+                    md5=md5,
+                    etag=head["ETag"].strip('"'),
+                    settings=MultipartDownloadSettings(
+                        transfer_config.multipart_threshold,
+                        transfer_config.multipart_chunksize,
+                        transfer_config.max_concurrency,
+                    ),
+                    sha256=sha256,
+                )
+                return
+        # Small files are read with a single GET, without the HEAD request of the transfer manager
+        with open(local_path, "wb") as f:
+            for chunk in self.open_artifact(remote_file_path):
+                f.write(chunk)
+
+    @staticmethod
+    def _get_transfer_config():
+        """
+        :return: The ``TransferConfig`` of the uploads and downloads of files, whose multipart
+                 threshold, part size and concurrency default to the settings of multipart
+                 downloads and can be overridden for S3 by ``MLFLOW_S3_MULTIPART_THRESHOLD``,
+                 ``MLFLOW_S3_MULTIPART_CHUNKSIZE`` and ``MLFLOW_S3_MAX_CONCURRENCY``.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        # The S3 transfer manager uploads large files in parts and downloads them in ranged parts
+        # written at their offsets
+        settings = _get_multipart_download_settings()
+        return TransferConfig(
+            multipart_threshold=_get_env_int(
+                MULTIPART_THRESHOLD_ENV_VAR, settings.minimum_file_size
+            ),
+            multipart_chunksize=_get_env_int(MULTIPART_CHUNKSIZE_ENV_VAR, settings.part_size),
+            max_concurrency=_get_env_int(MAX_CONCURRENCY_ENV_VAR, settings.max_workers),
+        )
+
+    def get_artifact_stat(self, artifact_path):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        head = self._get_s3_client().head_object(Bucket=bucket, Key=s3_full_path)
+        return ArtifactStat(
+            int(head["ContentLength"]), head["LastModified"].timestamp(), head["ETag"].strip('"')
+        )
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        kwargs = {}
+        if start is not None or end is not None:
+            # HTTP byte ranges are inclusive of their last byte
+            kwargs["Range"] = "bytes={}-{}".format(start or 0, "" if end is None else end - 1)
+        response = self._get_s3_client().get_object(Bucket=bucket, Key=s3_full_path, **kwargs)
+        return response["Body"].iter_chunks(ARTIFACT_STREAM_CHUNK_SIZE)
+
+    def create_multipart_upload(self, artifact_path):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        response = self._get_s3_client().create_multipart_upload(
+            Bucket=bucket, Key=s3_full_path, **self._get_upload_extra_args(artifact_path)
+        )
+        return response["UploadId"]
+
+    def upload_part(self, artifact_path, upload_id, part_number, fileobj):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        start = fileobj.tell()
+        size = fileobj.seek(0, os.SEEK_END) - start
+        fileobj.seek(start)
+        with _translate_no_such_upload(upload_id):
+            response = self._get_s3_client().upload_part(
+                Bucket=bucket,
+                Key=s3_full_path,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=fileobj,
+                ContentLength=size,
+            )
+        return MultipartUploadPart(part_number, size, response["ETag"].strip('"'))
+
+    def list_multipart_upload_parts(self, artifact_path, upload_id):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        paginator = self._get_s3_client().get_paginator("list_parts")
+        parts = []
+        with _translate_no_such_upload(upload_id):
+            for result in paginator.paginate(Bucket=bucket, Key=s3_full_path, UploadId=upload_id):
+                parts.extend(
+                    MultipartUploadPart(part["PartNumber"], part["Size"], part["ETag"].strip('"'))
+                    for part in result.get("Parts", [])
+                )
+        return sorted(parts)
+
+    def complete_multipart_upload(self, artifact_path, upload_id, parts):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        multipart_upload = {
+            "Parts": [
+                {"PartNumber": part[0], "ETag": '"{}"'.format(part[-1].strip('"'))}
+                for part in sorted(parts, key=lambda part: part[0])
+            ]
+        }
+        with _translate_no_such_upload(upload_id):
+            self._get_s3_client().complete_multipart_upload(
+                Bucket=bucket,
+                Key=s3_full_path,
+                UploadId=upload_id,
+                MultipartUpload=multipart_upload,
+            )
+
+    def abort_multipart_upload(self, artifact_path, upload_id):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, artifact_path)
+        with _translate_no_such_upload(upload_id):
+            self._get_s3_client().abort_multipart_upload(
+                Bucket=bucket, Key=s3_full_path, UploadId=upload_id
+            )
 
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
+
+
+@contextmanager
+def _translate_no_such_upload(upload_id):
+    from botocore.exceptions import ClientError
+
+    try:
+        yield
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+            raise
+        raise MlflowException(
+            "No such multipart upload: '{}'".format(upload_id), error_code=RESOURCE_DOES_NOT_EXIST
+        )
+
+
+def _get_digests(head):
+    """
+    :param head: Response of an S3 ``head_object`` request with ``ChecksumMode="ENABLED"``.
+
+    :return: The hexadecimal MD5 and SHA-256 digests of the contents of the object, or ``None``
+             where unknown. The entity tag of an object is the MD5 digest of its contents unless
+             it was uploaded in parts (its entity tag then ends with ``-<number of parts>``) or
+             encrypted with SSE-KMS or SSE-C. The SHA-256 checksum of an object is only known if
+             it was uploaded with one, and is a checksum of the checksums of its parts if it was
+             uploaded in parts.
+    """
+    md5 = head["ETag"].strip('"').lower()
+    if (
+        not re.fullmatch("[0-9a-f]{32}", md5)
+        or head.get("ServerSideEncryption", "").startswith("aws:kms")
+        or "SSECustomerAlgorithm" in head
+    ):
+        md5 = None
+    sha256 = head.get("ChecksumSHA256")
+    if sha256 is not None:
+        sha256 = base64.b64decode(sha256).hex() if "-" not in sha256 else None
+    return md5, sha256
@@ -1,11 +1,12 @@
 import os
 import sys
+import threading
 
 import posixpath
 import urllib.parse
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStat, _iter_file_range
 from mlflow.exceptions import MlflowException
 
 
@@ -35,6 +36,9 @@ class SFTPArtifactRepository(ArtifactRepository):
         }
         self.path = parsed.path
 
+        self._connect = None
+        self._connections = threading.local()
+        self._owner_thread = threading.get_ident()
         if client:
             self.sftp = client
         else:
@@ -67,15 +71,36 @@ class SFTPArtifactRepository(ArtifactRepository):
             if "identityfile" in user_config:
                 self.config["private_key"] = user_config["identityfile"][0]
 
-            self.sftp = pysftp.Connection(**self.config)
+            self._connect = lambda: pysftp.Connection(**self.config)
+            self.sftp = self._connect()
 
         super().__init__(artifact_uri)
 
+    def _get_sftp(self):
+        """
+        Return the connection of the calling thread. SFTP connections cannot be shared across
+        threads, so the threads of a directory download open their own connection.
+        """
+        if self._connect is None or threading.get_ident() == self._owner_thread:
+            return self.sftp
+        if getattr(self._connections, "sftp", None) is None:
+            self._connections.sftp = self._connect()
+        return self._connections.sftp
+
+    def _get_download_workers(self):
+        # A connection supplied by the caller cannot be opened again by other threads
+        return super()._get_download_workers() if self._connect is not None else 1
+
     def log_artifact(self, local_file, artifact_path=None):
         artifact_dir = posixpath.join(self.path, artifact_path) if artifact_path else self.path
         self.sftp.makedirs(artifact_dir)
         self.sftp.put(local_file, posixpath.join(artifact_dir, os.path.basename(local_file)))
 
+    def log_artifact_stream(self, fileobj, artifact_path):
+        remote_path = posixpath.join(self.path, artifact_path)
+        self.sftp.makedirs(posixpath.dirname(remote_path))
+        self.sftp.putfo(fileobj, remote_path)
+
     def log_artifacts(self, local_dir, artifact_path=None):
         artifact_dir = posixpath.join(self.path, artifact_path) if artifact_path else self.path
         self.sftp.makedirs(artifact_dir)
@@ -87,27 +112,38 @@ class SFTPArtifactRepository(ArtifactRepository):
     def _is_directory(self, artifact_path):
         artifact_dir = self.path
         path = posixpath.join(artifact_dir, artifact_path) if artifact_path else artifact_dir
-        return self.sftp.isdir(path)
+        return self._get_sftp().isdir(path)
 
-    def list_artifacts(self, path=None):
+    def list_artifacts(self, path=None, recursive=False):
+        if recursive:
+            return self._list_artifacts_recursive(path)
         artifact_dir = self.path
         list_dir = posixpath.join(artifact_dir, path) if path else artifact_dir
-        if not self.sftp.isdir(list_dir):
+        sftp = self._get_sftp()
+        if not sftp.isdir(list_dir):
             return []
-        artifact_files = self.sftp.listdir(list_dir)
+        artifact_files = sftp.listdir(list_dir)
         infos = []
         for file_name in artifact_files:
             file_path = file_name if path is None else posixpath.join(path, file_name)
             full_file_path = posixpath.join(list_dir, file_name)
-            if self.sftp.isdir(full_file_path):
+            if sftp.isdir(full_file_path):
                 infos.append(FileInfo(file_path, True, None))
             else:
-                infos.append(FileInfo(file_path, False, self.sftp.stat(full_file_path).st_size))
+                infos.append(FileInfo(file_path, False, sftp.stat(full_file_path).st_size))
         return infos
 
     def _download_file(self, remote_file_path, local_path):
         remote_full_path = posixpath.join(self.path, remote_file_path)
-        self.sftp.get(remote_full_path, local_path)
+        self._get_sftp().get(remote_full_path, local_path)
+
+    def get_artifact_stat(self, artifact_path):
+        stat = self._get_sftp().stat(posixpath.join(self.path, artifact_path))
+        return ArtifactStat(stat.st_size, stat.st_mtime, None)
+
+    def open_artifact(self, artifact_path, start=None, end=None):
+        fileobj = self._get_sftp().open(posixpath.join(self.path, artifact_path), "rb")
+        return _iter_file_range(fileobj, start, end)
 
     def delete_artifacts(self, artifact_path=None):
         raise MlflowException("Not implemented yet")
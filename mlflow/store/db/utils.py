@@ -1,4 +1,8 @@
+import collections
+import itertools
 import os
+import re
+import threading
 import time
 
 from contextlib import contextmanager
@@ -10,7 +14,7 @@ import sqlalchemy
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.tracking.dbmodels.initial_models import Base as InitialBase
-from mlflow.protos.databricks_pb2 import INTERNAL_ERROR
+from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, RESOURCE_DOES_NOT_EXIST, ErrorCode
 from mlflow.store.db.db_types import SQLITE
 
 _logger = logging.getLogger(__name__)
@@ -18,6 +22,12 @@ _logger = logging.getLogger(__name__)
 
 MLFLOW_SQLALCHEMYSTORE_POOL_SIZE = "MLFLOW_SQLALCHEMYSTORE_POOL_SIZE"
 MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW = "MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW"
+MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS = "MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS"
+MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW = (
+    "MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW"
+)
+# Seconds after a write during which lookups of the written entities read from the primary
+DEFAULT_READ_REPLICA_WRITE_WINDOW = 5
 MAX_RETRY_COUNT = 15
 
 
@@ -91,6 +101,147 @@ def _get_managed_session_maker(SessionMaker, db_type):
     return make_managed_session
 
 
+def _get_read_replica_uris(read_replica_uris=None):
+    """
+    Return the read replica URIs explicitly passed to a store or, if there are none, the
+    comma-separated URIs of the ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS`` environment variable.
+    """
+    if read_replica_uris:
+        return list(read_replica_uris)
+    env_uris = os.environ.get(MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS, "")
+    return [uri.strip() for uri in env_uris.split(",") if uri.strip()]
+
+
+def _get_read_replica_session_maker(engines):
+    """
+    Creates a factory for producing managed SQLAlchemy sessions (see
+    ``_get_managed_session_maker``) that are bound to the specified read replica engines in a
+    round-robin fashion. Sessions produced by this factory must only be used for reads.
+    """
+    session_makers = [
+        _get_managed_session_maker(sqlalchemy.orm.sessionmaker(bind=engine), engine.dialect.name)
+        for engine in engines
+    ]
+    replica_indices = itertools.count()
+
+    def make_read_replica_session():
+        return session_makers[next(replica_indices) % len(session_makers)]()
+
+    return make_read_replica_session
+
+
+def _get_attribute_values(obj, attribute):
+    """
+    Return the current and, if it changed in the pending flush, the previous values of an
+    attribute of a database object, without loading it from the database.
+    """
+    history = sqlalchemy.inspect(obj).attrs[attribute].history
+    return [
+        value
+        for value in itertools.chain(history.added, history.unchanged, history.deleted)
+        if value is not None
+    ]
+
+
+class _ReadReplicaRouter:
+    """
+    Routes lookups of single entities by ID or name to read replicas of the database, falling
+    back to the primary database when the replica misses the entity, and reading from the primary
+    the entities written through this router's primary sessions in the last ``write_window``
+    seconds, which the replicas may not have replicated yet.
+
+    :param primary_session_maker: ``sqlalchemy.orm.sessionmaker`` of the primary database, whose
+                                  flushes are tracked.
+    :param managed_primary_session_maker: Managed session maker of the primary database (see
+                                          ``_get_managed_session_maker``).
+    :param replica_engines: Engines of the read replicas.
+    :param get_entity_keys: Function returning the keys of the entities that a written database
+                            object belongs to, e.g. ``[("run", run_id)]``.
+    :param write_window: Seconds after a write during which lookups of the written entities read
+                         from the primary. Defaults to the
+                         ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW`` environment
+                         variable, or ``DEFAULT_READ_REPLICA_WRITE_WINDOW``.
+    """
+
+    def __init__(
+        self,
+        primary_session_maker,
+        managed_primary_session_maker,
+        replica_engines,
+        get_entity_keys,
+        write_window=None,
+    ):
+        self._primary_session_maker = managed_primary_session_maker
+        self._replica_session_maker = (
+            _get_read_replica_session_maker(replica_engines) if replica_engines else None
+        )
+        self._get_entity_keys = get_entity_keys
+        if write_window is None:
+            write_window = float(
+                os.environ.get(
+                    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW,
+                    DEFAULT_READ_REPLICA_WRITE_WINDOW,
+                )
+            )
+        self._write_window = write_window
+        # Write times of the entity keys, oldest first. Keys older than the write window are
+        # pruned on every write, which bounds the map by the entities written within the window
+        self._write_times = collections.OrderedDict()
+        self._lock = threading.Lock()
+        if self._replica_session_maker is not None:
+            sqlalchemy.event.listen(primary_session_maker, "after_flush", self._record_flush)
+
+    def _record_flush(self, session, flush_context):  # pylint: disable=unused-argument
+        keys = set()
+        for obj in itertools.chain(session.new, session.dirty, session.deleted):
+            keys.update(self._get_entity_keys(obj))
+        self.record_writes(keys)
+
+    def record_writes(self, keys):
+        """
+        Record that the entities with the specified keys were written now.
+        """
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                self._write_times[key] = now
+                self._write_times.move_to_end(key)
+            while self._write_times:
+                key, write_time = next(iter(self._write_times.items()))
+                if write_time >= now - self._write_window:
+                    break
+                del self._write_times[key]
+
+    def _was_written_recently(self, keys):
+        oldest_write_time = time.time() - self._write_window
+        with self._lock:
+            return any(self._write_times.get(key, 0) >= oldest_write_time for key in keys)
+
+    def lookup(self, keys, read):
+        """
+        Look up entities with a read replica session, or with a primary session if there are no
+        replicas, if the entities with the specified keys were written within the write window, or
+        if the replica misses them.
+
+        :param keys: Keys of the looked up entities, e.g. ``[("run", run_id)]``.
+        :param read: Function reading the entities from a session. Raising an ``MlflowException``
+                     with error code ``RESOURCE_DOES_NOT_EXIST`` or returning ``None`` or an empty
+                     list signals a miss.
+        :return: The result of ``read``.
+        """
+        if self._replica_session_maker is not None and not self._was_written_recently(keys):
+            try:
+                with self._replica_session_maker() as session:
+                    result = read(session)
+                if result is not None and result != []:
+                    return result
+            except MlflowException as e:
+                if e.error_code != ErrorCode.Name(RESOURCE_DOES_NOT_EXIST):
+                    raise
+        with self._primary_session_maker() as session:
+            return read(session)
+
+
 def _get_alembic_config(db_url, alembic_dir=None):
     """
     Constructs an alembic Config object referencing the specified database and migration script
@@ -220,4 +371,16 @@ def create_sqlalchemy_engine(db_uri):
         pool_kwargs["max_overflow"] = int(pool_max_overflow)
     if pool_kwargs:
         _logger.info("Create SQLAlchemy engine with pool options %s", pool_kwargs)
-    return sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **pool_kwargs)
+    engine = sqlalchemy.create_engine(db_uri, pool_pre_ping=True, **pool_kwargs)
+    if engine.dialect.name == SQLITE:
+        sqlalchemy.event.listen(engine, "connect", _register_sqlite_functions)
+    return engine
+
+
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    # SQLite defines the REGEXP operator, used by search filters, but does not implement it
+    dbapi_connection.create_function("regexp", 2, _sqlite_regexp)
+
+
+def _sqlite_regexp(pattern, value):
+    return value is not None and re.search(pattern, value) is not None
@@ -69,11 +69,16 @@ class SqlAlchemyStore(AbstractStore):
     This store interacts with SQL store using SQLAlchemy abstractions defined for MLflow entities.
     :py:class:`mlflow.store.model_registry.models.RegisteredModel` and
     :py:class:`mlflow.store.model_registry.models.ModelVersion`
+
+    Read-only queries (``get_registered_model``, ``search_registered_models``,
+    ``get_latest_versions``, ``get_model_version``, ``get_model_version_download_uri`` and
+    ``search_model_versions``) can be offloaded to read replicas of the database, while writes,
+    and reads made as part of writes, always go to the primary.
     """
 
     CREATE_MODEL_VERSION_RETRIES = 3
 
-    def __init__(self, db_uri):
+    def __init__(self, db_uri, read_replica_uris=None):
         """
         Create a database backed store.
 
@@ -82,8 +87,11 @@ class SqlAlchemyStore(AbstractStore):
                        <https://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls>`_
                        for format specifications. Mlflow supports the dialects ``mysql``,
                        ``mssql``, ``sqlite``, and ``postgresql``.
-        :param default_artifact_root: Path/URI to location suitable for large data (such as a blob
-                                      store object, DBFS path, or shared NFS file system).
+        :param read_replica_uris: Optional list of SQLAlchemy database URIs of read replicas of
+                                  the database, across which read-only queries are balanced.
+                                  Defaults to the comma-separated URIs of the
+                                  ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS`` environment
+                                  variable, if set.
         """
         super().__init__()
         self.db_uri = db_uri
@@ -97,6 +105,26 @@ class SqlAlchemyStore(AbstractStore):
         self.ManagedSessionMaker = mlflow.store.db.utils._get_managed_session_maker(
             SessionMaker, self.db_type
         )
+        self.read_replica_uris = mlflow.store.db.utils._get_read_replica_uris(read_replica_uris)
+        self.read_replica_engines = [
+            mlflow.store.db.utils.create_sqlalchemy_engine_with_retry(uri)
+            for uri in self.read_replica_uris
+        ]
+        # Searches, which tolerate the replication lag, are balanced across the replicas. So are
+        # lookups of registered models and model versions by name, which read from the primary
+        # the models that the replica misses or that were written in the last seconds
+        if self.read_replica_engines:
+            self.ReadOnlySessionMaker = mlflow.store.db.utils._get_read_replica_session_maker(
+                self.read_replica_engines
+            )
+        else:
+            self.ReadOnlySessionMaker = self.ManagedSessionMaker
+        self._read_replica_router = mlflow.store.db.utils._ReadReplicaRouter(
+            SessionMaker,
+            self.ManagedSessionMaker,
+            self.read_replica_engines,
+            _get_written_entity_keys,
+        )
         # TODO: verify schema here once we add logic to initialize the registry tables if they
         # don't exist (schema verification will fail in tests otherwise)
         # mlflow.store.db.utils._verify_schema(self.engine)
@@ -363,7 +391,7 @@ class SqlAlchemyStore(AbstractStore):
                 + sample_query,
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        with self.ManagedSessionMaker() as session:
+        with self.ReadOnlySessionMaker() as session:
             query = (
                 session.query(SqlRegisteredModel)
                 .filter(*conditions)
@@ -422,9 +450,12 @@ class SqlAlchemyStore(AbstractStore):
         :param name: Registered model name.
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        with self.ManagedSessionMaker() as session:
+
+        def read(session):
             return self._get_registered_model(session, name, eager=True).to_mlflow_entity()
 
+        return self._read_replica_router.lookup([("registered_model", name)], read)
+
     def get_latest_versions(self, name, stages=None):
         """
         Latest version models for each requested stage. If no ``stages`` argument is provided,
@@ -435,7 +466,8 @@ class SqlAlchemyStore(AbstractStore):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
-        with self.ManagedSessionMaker() as session:
+
+        def read(session):
             sql_registered_model = self._get_registered_model(session, name)
             # Convert to RegisteredModel entity first and then extract latest_versions
             latest_versions = sql_registered_model.to_mlflow_entity().latest_versions
@@ -447,6 +479,8 @@ class SqlAlchemyStore(AbstractStore):
                 expected_stages = set([get_canonical_stage(stage) for stage in stages])
             return [mv for mv in latest_versions if mv.current_stage in expected_stages]
 
+        return self._read_replica_router.lookup([("registered_model", name)], read)
+
     @classmethod
     def _get_registered_model_tag(cls, session, name, key):
         tags = (
@@ -711,10 +745,13 @@ class SqlAlchemyStore(AbstractStore):
         :param version: Registered model version.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        with self.ManagedSessionMaker() as session:
+
+        def read(session):
             sql_model_version = self._get_sql_model_version(session, name, version, eager=True)
             return sql_model_version.to_mlflow_entity()
 
+        return self._read_replica_router.lookup([("registered_model", name)], read)
+
     def get_model_version_download_uri(self, name, version):
         """
         Get the download location in Model Registry for this model version.
@@ -725,9 +762,11 @@ class SqlAlchemyStore(AbstractStore):
         :param version: Registered model version.
         :return: A single URI location that allows reads for downloading.
         """
-        with self.ManagedSessionMaker() as session:
-            sql_model_version = self._get_sql_model_version(session, name, version)
-            return sql_model_version.source
+
+        def read(session):
+            return self._get_sql_model_version(session, name, version).source
+
+        return self._read_replica_router.lookup([("registered_model", name)], read)
 
     def search_model_versions(self, filter_string):
         """
@@ -774,7 +813,7 @@ class SqlAlchemyStore(AbstractStore):
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        with self.ManagedSessionMaker() as session:
+        with self.ReadOnlySessionMaker() as session:
             conditions.append(SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL)
             sql_model_version = session.query(SqlModelVersion).filter(*conditions).all()
             model_versions = [mv.to_mlflow_entity() for mv in sql_model_version]
@@ -838,3 +877,18 @@ class SqlAlchemyStore(AbstractStore):
             existing_tag = self._get_model_version_tag(session, name, version, key)
             if existing_tag is not None:
                 session.delete(existing_tag)
+
+
+def _get_written_entity_keys(obj):
+    """
+    Return the keys of the registered models, looked up by the store with
+    ``_ReadReplicaRouter.lookup``, that a written database object belongs to.
+    """
+    if isinstance(
+        obj, (SqlRegisteredModel, SqlModelVersion, SqlRegisteredModelTag, SqlModelVersionTag)
+    ):
+        return [
+            ("registered_model", value)
+            for value in mlflow.store.db.utils._get_attribute_values(obj, "name")
+        ]
+    return []
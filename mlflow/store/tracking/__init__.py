@@ -12,3 +12,9 @@ Several constants are used by multiple backend store implementations.
 DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH = "./mlruns"
 SEARCH_MAX_RESULTS_DEFAULT = 1000
 SEARCH_MAX_RESULTS_THRESHOLD = 50000
+# Maximum number of runs exported at once as an Arrow table, the default maximum number of runs
+# returned by `mlflow.search_runs`
+EXPORT_MAX_RESULTS_THRESHOLD = 100000
+# Number of runs searched and converted at once when exporting runs, which bounds the memory used by
+# the export of large searches
+EXPORT_BATCH_SIZE = 1000
@@ -1,8 +1,14 @@
 from abc import abstractmethod, ABCMeta
 
-from mlflow.entities import ViewType
+from mlflow.entities import Param, RunTag, ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_MAX_RESULTS_THRESHOLD,
+    SEARCH_MAX_RESULTS_DEFAULT,
+)
 from mlflow.utils.annotations import experimental
 
 
@@ -127,6 +133,21 @@ class AbstractStore:
         """
         pass
 
+    def update_run_infos(self, run_ids, run_status, end_time):
+        """
+        Update the status and end time of multiple runs. This is a base implementation issuing
+        one ``update_run_info`` call per run; derived classes may provide a specialized
+        implementation that updates all runs at once.
+
+        :param run_ids: List of string ids of the runs to update
+        :param run_status: New :py:class:`mlflow.entities.RunStatus` of the runs
+        :param end_time: New end time of the runs, in milliseconds since the UNIX epoch
+
+        :return: A list of :py:class:`mlflow.entities.RunInfo` describing the updated runs, in
+                 the same order as ``run_ids``
+        """
+        return [self.update_run_info(run_id, run_status, end_time) for run_id in run_ids]
+
     @abstractmethod
     def create_run(self, experiment_id, user_id, start_time, tags):
         """
@@ -140,6 +161,39 @@ class AbstractStore:
         """
         pass
 
+    def create_runs(self, experiment_id, user_id, start_time, runs_data):
+        """
+        Create multiple runs under the specified experiment ID, initializing each of them with
+        its own metrics, params, and tags. This is a base implementation issuing one
+        ``create_run`` and one ``log_batch`` call per run; derived classes may provide a
+        specialized implementation that creates all runs at once.
+
+        :param experiment_id: String id of the experiment for the runs
+        :param user_id: ID of the user launching the runs
+        :param start_time: Start time of the runs, in milliseconds since the UNIX epoch
+        :param runs_data: List of :py:class:`mlflow.entities.RunData` objects, one per run to
+                          create, holding the initial metrics, params, and tags of the run
+
+        :return: A list of the created :py:class:`mlflow.entities.Run` objects, in the same
+                 order as ``runs_data``
+        """
+        runs = []
+        for run_data in runs_data:
+            run = self.create_run(
+                experiment_id,
+                user_id,
+                start_time,
+                [RunTag(key, value) for key, value in run_data.tags.items()],
+            )
+            params = [Param(key, value) for key, value in run_data.params.items()]
+            if run_data._metric_objs or params:
+                self.log_batch(
+                    run.info.run_id, metrics=run_data._metric_objs, params=params, tags=[]
+                )
+                run = self.get_run(run.info.run_id)
+            runs.append(run)
+        return runs
+
     @abstractmethod
     def delete_run(self, run_id):
         """
@@ -149,6 +203,17 @@ class AbstractStore:
         """
         pass
 
+    def delete_runs(self, run_ids):
+        """
+        Delete multiple runs. This is a base implementation issuing one ``delete_run`` call per
+        run; derived classes may provide a specialized implementation that deletes all runs at
+        once.
+
+        :param run_ids: List of string ids of the runs to delete
+        """
+        for run_id in run_ids:
+            self.delete_run(run_id)
+
     @abstractmethod
     def restore_run(self, run_id):
         """
@@ -206,6 +271,28 @@ class AbstractStore:
         """
         pass
 
+    def get_metric_history_since(self, run_id, metric_key, since_step, since_timestamp):
+        """
+        Return the values logged for a given metric after a ``(step, timestamp)`` cursor, typically
+        the step and timestamp of the last value fetched by an earlier call. This lets clients
+        following an active run fetch its new values rather than the full metric history.
+
+        :param run_id: Unique identifier for run
+        :param metric_key: Metric name within the run
+        :param since_step: Step of the cursor
+        :param since_timestamp: Timestamp of the cursor, in milliseconds since the UNIX epoch
+
+        :return: A list of :py:class:`mlflow.entities.Metric` entities whose ``(step, timestamp)``
+                 is greater than the cursor, sorted by step and timestamp
+        """
+        cursor = (since_step, since_timestamp)
+        metrics = [
+            metric
+            for metric in self.get_metric_history(run_id, metric_key)
+            if (metric.step, metric.timestamp) > cursor
+        ]
+        return sorted(metrics, key=lambda metric: (metric.step, metric.timestamp))
+
     def search_runs(
         self,
         experiment_ids,
@@ -236,6 +323,113 @@ class AbstractStore:
         )
         return PagedList(runs, token)
 
+    def explain_search_runs(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Describe how the store executes a ``search_runs`` call with the given arguments, without
+        executing it. Supported by database-backed stores.
+
+        See ``search_runs`` for parameter descriptions.
+
+        :return: A dictionary with the SQL query selecting the runs under ``"sql"``, and the lines
+            of the query plan reported by the ``EXPLAIN`` statement of the database under
+            ``"plan"``.
+        """
+        raise MlflowException(
+            "Explaining searches is not supported by {}. It is supported by database-backed "
+            "tracking stores.".format(type(self).__name__),
+            INVALID_PARAMETER_VALUE,
+        )
+
+    def export_runs(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results=EXPORT_MAX_RESULTS_THRESHOLD,
+        order_by=None,
+    ):
+        """
+        Return the runs that match the given list of search expressions within the experiments as
+        an Apache Arrow table, with one row per run and one column per run attribute, metric,
+        param and tag. Requires ``pyarrow``.
+
+        :param experiment_ids: List of experiment ids to scope the search
+        :param filter_string: A search filter string.
+        :param run_view_type: ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+        :param max_results: Maximum number of runs to export.
+        :param order_by: List of order_by clauses.
+
+        :return: A ``pyarrow.Table`` with the columns described in
+            :py:func:`mlflow.utils.arrow_utils.runs_to_arrow_table`.
+        """
+        import pyarrow as pa
+
+        _, tables = self.export_run_batches(
+            experiment_ids, filter_string, run_view_type, max_results, order_by
+        )
+        return pa.concat_tables(list(tables))
+
+    def export_run_batches(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results=EXPORT_MAX_RESULTS_THRESHOLD,
+        order_by=None,
+    ):
+        """
+        Export runs like ``export_runs``, as a sequence of tables holding successive pages of at
+        most ``EXPORT_BATCH_SIZE`` runs, which are searched as the tables are consumed so that
+        only one page is held in memory at a time. If the runs do not fit in a single page, they
+        are searched twice: first to collect the columns of the tables, then to fill them. Values
+        of metrics, params and tags first logged in between are omitted.
+
+        See ``export_runs`` for parameter descriptions.
+
+        :return: A tuple of the ``pyarrow.Schema`` shared by the tables, and a generator of
+            ``pyarrow.Table``.
+        """
+        from mlflow.utils.arrow_utils import get_data_keys, get_runs_schema, runs_to_arrow_table
+
+        def search_pages():
+            num_runs = 0
+            page_token = None
+            while num_runs < max_results:
+                page = self.search_runs(
+                    experiment_ids,
+                    filter_string,
+                    run_view_type,
+                    min(max_results - num_runs, EXPORT_BATCH_SIZE),
+                    order_by,
+                    page_token,
+                )
+                num_runs += len(page)
+                yield page
+                page_token = page.token
+                if not page_token:
+                    break
+
+        pages = search_pages()
+        first_page = next(pages)
+        if not first_page.token or len(first_page) >= max_results:
+            table = runs_to_arrow_table(first_page)
+            return table.schema, iter([table])
+
+        data_keys = get_data_keys(first_page)
+        del first_page
+        for page in pages:
+            get_data_keys(page, data_keys)
+        schema = get_runs_schema(data_keys)
+        return schema, (runs_to_arrow_table(page, schema) for page in search_pages())
+
     @abstractmethod
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
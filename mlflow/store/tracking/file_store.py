@@ -27,6 +27,7 @@ from mlflow.models import Model
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, RESOURCE_DOES_NOT_EXIST
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, SEARCH_MAX_RESULTS_THRESHOLD
 from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.search_index import FileSearchIndex, is_file_search_index_enabled
 from mlflow.utils.validation import (
     _validate_metric_name,
     _validate_param_name,
@@ -726,15 +727,49 @@ class FileStore(AbstractStore):
                 "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD, max_results),
                 databricks_pb2.INVALID_PARAMETER_VALUE,
             )
+        search_filter = SearchUtils.compile_filter(filter_string)
+        use_search_index = is_file_search_index_enabled()
         runs = []
         for experiment_id in experiment_ids:
             run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
-        filtered = SearchUtils.filter(runs, filter_string)
-        sorted_runs = SearchUtils.sort(filtered, order_by)
-        runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+            if use_search_index:
+                runs.extend(self._get_indexed_runs(experiment_id, run_infos, search_filter))
+            else:
+                runs.extend(self._get_run_from_info(r) for r in run_infos)
+        filtered = search_filter.filter(runs)
+        runs, next_page_token = SearchUtils.sort_and_paginate(
+            filtered, order_by, page_token, max_results
+        )
         return runs, next_page_token
 
+    def _get_indexed_runs(self, experiment_id, run_infos, search_filter):
+        """
+        Get the runs of an experiment which may match a search filter, filtering them by their
+        params, tags and attributes before reading their metrics. The params and tags of the runs
+        are read from the search index of the experiment, and indexed if they are outdated.
+        """
+        index = FileSearchIndex(self._get_experiment_path(experiment_id, assert_exists=True))
+        prefilter = search_filter.exclude([SearchUtils._METRIC_IDENTIFIER])
+        runs = []
+        for run_info in run_infos:
+            values = index.get(run_info.run_id)
+            if values is None:
+                stamps = index.get_stamps(
+                    run_info.run_id, [FileStore.PARAMS_FOLDER_NAME, FileStore.TAGS_FOLDER_NAME]
+                )
+                values = (
+                    [[p.key, p.value] for p in self._get_all_params(run_info)],
+                    [[t.key, t.value] for t in self._get_all_tags(run_info)],
+                )
+                index.put(run_info.run_id, stamps, *values)
+            params = [Param(key, value) for key, value in values[0]]
+            tags = [RunTag(key, value) for key, value in values[1]]
+            if prefilter.matches(Run(run_info, RunData(params=params, tags=tags))):
+                metrics = self._get_all_metrics(run_info)
+                runs.append(Run(run_info, RunData(metrics, params, tags)))
+        index.save()
+        return runs
+
     def log_metric(self, run_id, metric):
         _validate_run_id(run_id)
         _validate_metric_name(metric.key)
@@ -822,8 +857,14 @@ class FileStore(AbstractStore):
     def _set_run_tag(self, run_info, tag):
         tag_path = self._get_tag_path(run_info.experiment_id, run_info.run_id, tag.key)
         make_containing_dirs(tag_path)
+        # Replace the tag file rather than rewriting it, so that readers never see partial values
+        # and the modification time of its directory changes, as expected by the search index
+        temp_path = os.path.join(
+            self._get_run_dir(run_info.experiment_id, run_info.run_id), ".tag-" + uuid.uuid4().hex
+        )
         # Don't add trailing newline
-        write_to(tag_path, self._writeable_value(tag.value))
+        write_to(temp_path, self._writeable_value(tag.value))
+        os.replace(temp_path, tag_path)
 
     def delete_tag(self, run_id, key):
         """
@@ -1,3 +1,5 @@
+import json
+
 from mlflow.entities import Experiment, Run, RunInfo, Metric, ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos import databricks_pb2
@@ -14,7 +16,10 @@ from mlflow.protos.service_pb2 import (
     SetTag,
     UpdateRun,
     CreateRun,
+    CreateRuns,
     DeleteRun,
+    DeleteRuns,
+    TerminateRuns,
     RestoreRun,
     DeleteExperiment,
     RestoreExperiment,
@@ -25,15 +30,19 @@ from mlflow.protos.service_pb2 import (
     SetExperimentTag,
     GetExperimentByName,
 )
+from mlflow.store.tracking import EXPORT_MAX_RESULTS_THRESHOLD
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import (
     call_endpoint,
     extract_api_info_for_service,
+    http_request,
+    verify_rest_response,
     _REST_API_PATH_PREFIX,
 )
 
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
+_EXPORT_RUNS_ENDPOINT = _REST_API_PATH_PREFIX + "/mlflow/runs/export"
 
 
 class RestStore(AbstractStore):
@@ -125,6 +134,14 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(UpdateRun, req_body)
         return RunInfo.from_proto(response_proto.run_info)
 
+    def update_run_infos(self, run_ids, run_status, end_time):
+        """ Updates the status and end time of multiple runs in a single request. """
+        req_body = message_to_json(
+            TerminateRuns(run_ids=run_ids, status=run_status, end_time=end_time)
+        )
+        response_proto = self._call_endpoint(TerminateRuns, req_body)
+        return [RunInfo.from_proto(run_info) for run_info in response_proto.run_infos]
+
     def create_run(self, experiment_id, user_id, start_time, tags):
         """
         Create a run under the specified experiment ID, setting the run's status to "RUNNING"
@@ -149,6 +166,29 @@ class RestStore(AbstractStore):
         run = Run.from_proto(response_proto.run)
         return run
 
+    def create_runs(self, experiment_id, user_id, start_time, runs_data):
+        """
+        Create multiple runs under the specified experiment ID in a single request, initializing
+        each of them with its own metrics, params, and tags.
+
+        :param experiment_id: ID of the experiment for the runs
+        :param user_id: ID of the user launching the runs
+        :param start_time: Start time of the runs, in milliseconds since the UNIX epoch
+        :param runs_data: List of :py:class:`mlflow.entities.RunData` objects, one per run
+
+        :return: A list of the created Run objects
+        """
+        req_body = message_to_json(
+            CreateRuns(
+                experiment_id=str(experiment_id),
+                user_id=user_id,
+                start_time=start_time,
+                runs_data=[run_data.to_proto() for run_data in runs_data],
+            )
+        )
+        response_proto = self._call_endpoint(CreateRuns, req_body)
+        return [Run.from_proto(run) for run in response_proto.runs]
+
     def log_metric(self, run_id, metric):
         """
         Log a metric for the specified run
@@ -228,6 +268,19 @@ class RestStore(AbstractStore):
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric) for metric in response_proto.metrics]
 
+    def get_metric_history_since(self, run_id, metric_key, since_step, since_timestamp):
+        req_body = message_to_json(
+            GetMetricHistory(
+                run_uuid=run_id,
+                run_id=run_id,
+                metric_key=metric_key,
+                since_step=since_step,
+                since_timestamp=since_timestamp,
+            )
+        )
+        response_proto = self._call_endpoint(GetMetricHistory, req_body)
+        return [Metric.from_proto(metric) for metric in response_proto.metrics]
+
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
@@ -249,10 +302,47 @@ class RestStore(AbstractStore):
             next_page_token = response_proto.next_page_token
         return runs, next_page_token
 
+    def export_runs(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results=EXPORT_MAX_RESULTS_THRESHOLD,
+        order_by=None,
+    ):
+        from mlflow.utils.arrow_utils import deserialize_table
+
+        sr = SearchRuns(
+            experiment_ids=[str(experiment_id) for experiment_id in experiment_ids],
+            filter=filter_string,
+            run_view_type=ViewType.to_proto(run_view_type),
+            max_results=max_results,
+            order_by=order_by,
+        )
+        response = http_request(
+            host_creds=self.get_host_creds(),
+            endpoint=_EXPORT_RUNS_ENDPOINT,
+            method="POST",
+            json=json.loads(message_to_json(sr)),
+        )
+        if _is_endpoint_not_found(response):
+            # Servers without the export endpoint, e.g. of earlier MLflow versions: search the
+            # runs page by page and convert them on the client
+            return super().export_runs(
+                experiment_ids, filter_string, run_view_type, max_results, order_by
+            )
+        if response.status_code != 200:
+            verify_rest_response(response, _EXPORT_RUNS_ENDPOINT)
+        return deserialize_table(response.content)
+
     def delete_run(self, run_id):
         req_body = message_to_json(DeleteRun(run_id=run_id))
         self._call_endpoint(DeleteRun, req_body)
 
+    def delete_runs(self, run_ids):
+        req_body = message_to_json(DeleteRuns(run_ids=run_ids))
+        self._call_endpoint(DeleteRuns, req_body)
+
     def restore_run(self, run_id):
         req_body = message_to_json(RestoreRun(run_id=run_id))
         self._call_endpoint(RestoreRun, req_body)
@@ -291,6 +381,16 @@ class RestStore(AbstractStore):
         self._call_endpoint(LogModel, req_body)
 
 
+def _is_endpoint_not_found(response):
+    if response.status_code != 404:
+        return False
+    try:
+        error_code = json.loads(response.text).get("error_code")
+    except ValueError:
+        return True
+    return error_code in (None, databricks_pb2.ErrorCode.Name(databricks_pb2.ENDPOINT_NOT_FOUND))
+
+
 class DatabricksRestStore(RestStore):
     """
     Databricks-specific RestStore implementation that provides different fallback
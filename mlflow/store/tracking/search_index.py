@@ -0,0 +1,354 @@
+"""
+Optional indexes over the values of run params and tags, including run names, which speed up the
+``LIKE`` and ``ILIKE`` search filters whose patterns contain literal substrings of at least
+three characters, such as ``tags.mlflow.runName LIKE '%bert%'`` or ``params.model ILIKE
+'resnet%'``.
+
+- On SQLite (3.34.0 and later) and PostgreSQL databases, ``mlflow db create-search-index``
+  creates trigram indexes over the values of the ``params`` and ``tags`` tables: an FTS5 table
+  maintained by triggers on SQLite, and ``pg_trgm`` GIN indexes on PostgreSQL.
+  :py:class:`SqlAlchemyStore <mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore>` detects
+  them and restricts the runs compared by ``LIKE`` and ``ILIKE`` to the runs they return.
+- :py:class:`FileStore <mlflow.store.tracking.file_store.FileStore>` caches the param and tag
+  values of the runs of each experiment in a :py:class:`FileSearchIndex` when the
+  ``MLFLOW_FILESTORE_SEARCH_INDEX`` environment variable is set to ``true``, so that runs are
+  filtered by their params, tags and attributes before their files are read.
+"""
+import json
+import logging
+import os
+import re
+import time
+import uuid
+
+import sqlalchemy
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.db.db_types import POSTGRES, SQLITE
+
+_logger = logging.getLogger(__name__)
+
+MLFLOW_FILESTORE_SEARCH_INDEX = "MLFLOW_FILESTORE_SEARCH_INDEX"
+
+# Minimum length of the literal substrings of LIKE patterns looked up in trigram indexes
+MIN_INDEXED_SUBSTRING_LENGTH = 3
+
+_INDEXED_TABLES = ["params", "tags"]
+
+# The SQLite index is an FTS5 table over a copy of the indexed values, whose INTEGER PRIMARY KEY
+# keeps its row IDs stable across VACUUM, unlike the row IDs of the ``params`` and ``tags`` tables
+_SQLITE_ENTRIES_TABLE = "search_index_entries"
+_SQLITE_FTS_TABLE = "search_index"
+_SQLITE_MIN_VERSION = (3, 34, 0)
+
+_metadata = sqlalchemy.MetaData()
+_sqlite_entries = sqlalchemy.Table(
+    _SQLITE_ENTRIES_TABLE,
+    _metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("entity", sqlalchemy.String),
+    sqlalchemy.Column("run_uuid", sqlalchemy.String),
+    sqlalchemy.Column("key", sqlalchemy.String),
+    sqlalchemy.Column("value", sqlalchemy.String),
+)
+_sqlite_fts = sqlalchemy.Table(
+    _SQLITE_FTS_TABLE,
+    _metadata,
+    sqlalchemy.Column("rowid", sqlalchemy.Integer),
+    # The hidden column named after an FTS5 table matches full-text queries over all its columns
+    sqlalchemy.Column(_SQLITE_FTS_TABLE, sqlalchemy.String),
+)
+
+
+def _get_postgres_index_name(table):
+    return "{}_value_trgm_idx".format(table)
+
+
+def _get_sqlite_trigger_names():
+    names = ["{}_{}".format(_SQLITE_ENTRIES_TABLE, event) for event in ["ai", "ad", "au"]]
+    for table in _INDEXED_TABLES:
+        names.extend("{}_search_index_{}".format(table, event) for event in ["ai", "ad", "au"])
+    return names
+
+
+def _get_sqlite_create_statements():
+    names = {"entries": _SQLITE_ENTRIES_TABLE, "fts": _SQLITE_FTS_TABLE}
+    statements = [
+        "CREATE TABLE {entries} (id INTEGER PRIMARY KEY, entity VARCHAR(50) NOT NULL, "
+        "run_uuid VARCHAR(32) NOT NULL, key VARCHAR(250) NOT NULL, value VARCHAR(5000), "
+        "UNIQUE (entity, run_uuid, key))",
+        "CREATE VIRTUAL TABLE {fts} USING fts5(value, content='{entries}', content_rowid='id', "
+        "tokenize='trigram')",
+        "CREATE TRIGGER {entries}_ai AFTER INSERT ON {entries} BEGIN "
+        "INSERT INTO {fts}(rowid, value) VALUES (new.id, new.value); END",
+        "CREATE TRIGGER {entries}_ad AFTER DELETE ON {entries} BEGIN "
+        "INSERT INTO {fts}({fts}, rowid, value) VALUES ('delete', old.id, old.value); END",
+        "CREATE TRIGGER {entries}_au AFTER UPDATE ON {entries} BEGIN "
+        "INSERT INTO {fts}({fts}, rowid, value) VALUES ('delete', old.id, old.value); "
+        "INSERT INTO {fts}(rowid, value) VALUES (new.id, new.value); END",
+    ]
+    statements = [statement.format(**names) for statement in statements]
+    condition = "entity = '{table}' AND run_uuid = old.run_uuid AND key = old.key"
+    table_statements = [
+        "CREATE TRIGGER {table}_search_index_ai AFTER INSERT ON {table} BEGIN "
+        "INSERT INTO {entries}(entity, run_uuid, key, value) "
+        "VALUES ('{table}', new.run_uuid, new.key, new.value); END",
+        "CREATE TRIGGER {table}_search_index_ad AFTER DELETE ON {table} BEGIN "
+        "DELETE FROM {entries} WHERE " + condition + "; END",
+        "CREATE TRIGGER {table}_search_index_au AFTER UPDATE ON {table} BEGIN "
+        "UPDATE {entries} SET run_uuid = new.run_uuid, key = new.key, value = new.value "
+        "WHERE " + condition + "; END",
+        # Index the existing values, which the triggers of the entries copy to the FTS5 table
+        "INSERT INTO {entries}(entity, run_uuid, key, value) "
+        "SELECT '{table}', run_uuid, key, value FROM {table}",
+    ]
+    for table in _INDEXED_TABLES:
+        statements.extend(statement.format(table=table, **names) for statement in table_statements)
+    return statements
+
+
+def _get_sqlite_drop_statements():
+    return ["DROP TRIGGER IF EXISTS {}".format(name) for name in _get_sqlite_trigger_names()] + [
+        "DROP TABLE IF EXISTS {}".format(_SQLITE_FTS_TABLE),
+        "DROP TABLE IF EXISTS {}".format(_SQLITE_ENTRIES_TABLE),
+    ]
+
+
+def _get_postgres_create_statements():
+    return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+        "CREATE INDEX IF NOT EXISTS {} ON {} USING gin (value gin_trgm_ops)".format(
+            _get_postgres_index_name(table), table
+        )
+        for table in _INDEXED_TABLES
+    ]
+
+
+def _get_postgres_drop_statements():
+    return [
+        "DROP INDEX IF EXISTS {}".format(_get_postgres_index_name(table))
+        for table in _INDEXED_TABLES
+    ]
+
+
+def _check_search_index_support(engine):
+    if engine.dialect.name == SQLITE:
+        with engine.connect() as connection:
+            version = connection.execute("SELECT sqlite_version()").scalar()
+        if tuple(int(part) for part in version.split(".")) < _SQLITE_MIN_VERSION:
+            raise MlflowException(
+                "Search indexes require SQLite {} or later, but the database uses SQLite "
+                "{}.".format(".".join(map(str, _SQLITE_MIN_VERSION)), version),
+                INVALID_PARAMETER_VALUE,
+            )
+    elif engine.dialect.name != POSTGRES:
+        raise MlflowException(
+            "Search indexes are only supported by SQLite and PostgreSQL databases, but the "
+            "database is a {} database.".format(engine.dialect.name),
+            INVALID_PARAMETER_VALUE,
+        )
+
+
+def create_search_index(engine):
+    """
+    Create the search index of a tracking database, or rebuild it if it already exists, for
+    instance after schema migrations recreating the ``params`` or ``tags`` tables.
+
+    :param engine: SQLAlchemy engine connected to a SQLite or PostgreSQL tracking database.
+    """
+    _check_search_index_support(engine)
+    if engine.dialect.name == SQLITE:
+        statements = _get_sqlite_drop_statements() + _get_sqlite_create_statements()
+    else:
+        statements = _get_postgres_create_statements()
+    with engine.begin() as connection:
+        for statement in statements:
+            connection.execute(statement)
+
+
+def drop_search_index(engine):
+    """
+    Drop the search index of a tracking database, if it exists.
+
+    :param engine: SQLAlchemy engine connected to a SQLite or PostgreSQL tracking database.
+    """
+    _check_search_index_support(engine)
+    if engine.dialect.name == SQLITE:
+        statements = _get_sqlite_drop_statements()
+    else:
+        statements = _get_postgres_drop_statements()
+    with engine.begin() as connection:
+        for statement in statements:
+            connection.execute(statement)
+
+
+def get_search_index(engine):
+    """
+    :param engine: SQLAlchemy engine connected to a tracking database.
+
+    :return: The type of the database, ``"sqlite"`` or ``"postgresql"``, if it has a complete
+             search index, or ``None``.
+    """
+    if engine.dialect.name == SQLITE:
+        expected = set(_get_sqlite_trigger_names() + [_SQLITE_ENTRIES_TABLE, _SQLITE_FTS_TABLE])
+        query = "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+    elif engine.dialect.name == POSTGRES:
+        expected = set(_get_postgres_index_name(table) for table in _INDEXED_TABLES)
+        query = "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()"
+    else:
+        return None
+    with engine.connect() as connection:
+        found = expected.intersection(row[0] for row in connection.execute(query))
+    if found == expected:
+        return engine.dialect.name
+    elif found:
+        _logger.warning(
+            "The search index of the tracking database is incomplete and will not be used. "
+            "Run 'mlflow db create-search-index' to rebuild it."
+        )
+    return None
+
+
+def get_indexed_substrings(pattern):
+    """
+    :param pattern: Pattern of a ``LIKE`` or ``ILIKE`` comparison.
+
+    :return: The literal substrings of the pattern which can be looked up in trigram indexes.
+    """
+    return [part for part in re.split("[%_]", pattern) if len(part) >= MIN_INDEXED_SUBSTRING_LENGTH]
+
+
+def select_sqlite_candidates(table, key, substrings):
+    """
+    :param table: Name of the indexed table, ``"params"`` or ``"tags"``.
+    :param key: Key of the params or tags.
+    :param substrings: Substrings returned by :py:func:`get_indexed_substrings`.
+
+    :return: A query selecting the UUIDs of the runs whose value of the param or tag contains all
+             the substrings, ignoring case.
+    """
+    query = " AND ".join('"{}"'.format(s.replace('"', '""')) for s in substrings)
+    matches = sqlalchemy.select([_sqlite_fts.c.rowid]).where(
+        _sqlite_fts.c[_SQLITE_FTS_TABLE].match(query)
+    )
+    return sqlalchemy.select([_sqlite_entries.c.run_uuid]).where(
+        sqlalchemy.and_(
+            _sqlite_entries.c.id.in_(matches),
+            _sqlite_entries.c.entity == table,
+            _sqlite_entries.c.key == key,
+        )
+    )
+
+
+def is_file_search_index_enabled():
+    return os.environ.get(MLFLOW_FILESTORE_SEARCH_INDEX, "false").lower() in ["true", "1"]
+
+
+class FileSearchIndex(object):
+    """
+    Cache of the param and tag values of the runs of a FileStore experiment, stored in the
+    experiment directory. The values of a run are valid as long as the modification times of its
+    directory and of the directories of its params and tags are unchanged, which holds as
+    FileStore creates, replaces and removes param and tag files rather than rewriting them.
+
+    The values of runs modified shortly before they are read are not cached, as directories may
+    be modified again without changing their modification times within the resolution of the
+    file system. Updates are written to a temporary file renamed over the index, so concurrent
+    searches read complete indexes and at worst lose the updates of each other.
+
+    :param experiment_dir: Directory of the experiment.
+    """
+
+    FILE_NAME = ".search_index.json"
+    VERSION = 1
+    # Number of seconds after their modification during which the values of runs are not cached
+    RACY_INTERVAL = 2
+
+    def __init__(self, experiment_dir):
+        self._experiment_dir = experiment_dir
+        self._path = os.path.join(experiment_dir, FileSearchIndex.FILE_NAME)
+        self._runs = self._read()
+        self._updated = False
+
+    def _read(self):
+        try:
+            with open(self._path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != FileSearchIndex.VERSION:
+            return {}
+        return index.get("runs", {})
+
+    @staticmethod
+    def _get_mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get_stamps(self, run_id, subfolders):
+        """
+        Capture the modification times validating the values of a run, before reading them.
+
+        :param run_id: ID of the run.
+        :param subfolders: Names of the param and tag directories of the run.
+
+        :return: Mapping from the paths of the directories, relative to the run directory, to
+                 their modification times.
+        """
+        run_dir = os.path.join(self._experiment_dir, run_id)
+        stamps = {".": self._get_mtime(run_dir)}
+        for subfolder in subfolders:
+            # Params and tags with '/' in their keys are stored in nested directories
+            for root, _, _ in os.walk(os.path.join(run_dir, subfolder)):
+                stamps[os.path.relpath(root, run_dir)] = self._get_mtime(root)
+        return stamps
+
+    def get(self, run_id):
+        """
+        :return: The cached ``(params, tags)`` of the run as lists of ``(key, value)`` pairs, or
+                 ``None`` if they are not cached or are outdated.
+        """
+        entry = self._runs.get(run_id)
+        if entry is None:
+            return None
+        run_dir = os.path.join(self._experiment_dir, run_id)
+        for path, mtime in entry["stamps"].items():
+            if mtime is None or self._get_mtime(os.path.join(run_dir, path)) != mtime:
+                return None
+        return entry["params"], entry["tags"]
+
+    def put(self, run_id, stamps, params, tags):
+        """
+        Cache the values of a run, read after capturing ``stamps`` with :py:meth:`get_stamps`.
+        """
+        racy_time = (time.time() - FileSearchIndex.RACY_INTERVAL) * 1e9
+        if any(mtime is None or mtime >= racy_time for mtime in stamps.values()):
+            self._updated = self._runs.pop(run_id, None) is not None or self._updated
+        else:
+            self._runs[run_id] = {"stamps": stamps, "params": params, "tags": tags}
+            self._updated = True
+
+    def save(self):
+        """
+        Write the index if it was updated, dropping the values of the runs which were deleted.
+        """
+        if not self._updated:
+            return
+        runs = {
+            run_id: entry
+            for run_id, entry in self._runs.items()
+            if os.path.isdir(os.path.join(self._experiment_dir, run_id))
+        }
+        index = {"version": FileSearchIndex.VERSION, "runs": runs}
+        temp_path = "{}.{}".format(self._path, uuid.uuid4().hex)
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, self._path)
+        except OSError:
+            _logger.warning("Failed to write search index %s", self._path, exc_info=True)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._updated = False
@@ -1,16 +1,23 @@
+import collections
+import functools
 import json
 import logging
+import operator
+import threading
+import time
 import uuid
 
 import math
 import sqlalchemy
 import sqlalchemy.sql.expression as sql
+from sqlalchemy.ext.compiler import compiles
 
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.models import Model
-from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.db.db_types import MYSQL, MSSQL
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT, SEARCH_MAX_RESULTS_THRESHOLD
+from mlflow.store.db.db_types import MYSQL, MSSQL, POSTGRES, SQLITE
 import mlflow.store.db.utils
+from mlflow.store.tracking import search_index
 from mlflow.store.tracking.dbmodels.models import (
     SqlExperiment,
     SqlRun,
@@ -21,7 +28,7 @@ from mlflow.store.tracking.dbmodels.models import (
     SqlLatestMetric,
 )
 from mlflow.store.db.base_sql_model import Base
-from mlflow.entities import RunStatus, SourceType, Experiment
+from mlflow.entities import RunStatus, SourceType, Experiment, Param, RunTag
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.entities import ViewType
 from mlflow.exceptions import MlflowException
@@ -40,6 +47,7 @@ from mlflow.utils.uri import append_to_uri_path
 from mlflow.utils.validation import (
     _validate_batch_log_limits,
     _validate_batch_log_data,
+    _validate_batch_runs_limit,
     _validate_run_id,
     _validate_metric,
     _validate_experiment_tag,
@@ -79,12 +87,16 @@ class SqlAlchemyStore(AbstractStore):
     :py:class:`mlflow.store.artifact_repo.ArtifactRepository`. Default artifact locations for
     user experiments are stored in the database along with metadata. Each run artifact location
     is recorded in :py:class:`mlflow.store.dbmodels.models.SqlRun` and stored in the backend DB.
+
+    Read-only queries (``get_experiment``, ``get_experiment_by_name``, ``list_experiments``,
+    ``get_run``, ``get_metric_history`` and ``search_runs``) can be offloaded to read replicas of
+    the database, while writes, and reads made as part of writes, always go to the primary.
     """
 
     ARTIFACTS_FOLDER_NAME = "artifacts"
     DEFAULT_EXPERIMENT_ID = "0"
 
-    def __init__(self, db_uri, default_artifact_root):
+    def __init__(self, db_uri, default_artifact_root, read_replica_uris=None):
         """
         Create a database backed store.
 
@@ -95,6 +107,11 @@ class SqlAlchemyStore(AbstractStore):
                        ``mssql``, ``sqlite``, and ``postgresql``.
         :param default_artifact_root: Path/URI to location suitable for large data (such as a blob
                                       store object, DBFS path, or shared NFS file system).
+        :param read_replica_uris: Optional list of SQLAlchemy database URIs of read replicas of
+                                  the database, across which read-only queries are balanced.
+                                  Defaults to the comma-separated URIs of the
+                                  ``MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS`` environment
+                                  variable, if set.
         """
         super().__init__()
         self.db_uri = db_uri
@@ -122,12 +139,40 @@ class SqlAlchemyStore(AbstractStore):
             SessionMaker, self.db_type
         )
         mlflow.store.db.utils._verify_schema(self.engine)
+        # Optional index of param and tag values created by ``mlflow db create-search-index``
+        self.search_index = search_index.get_search_index(self.engine)
+        # Statistics used to plan searches, read by the first search with a filter
+        self._search_statistics = None
+        self._search_statistics_time = 0
+        self._search_statistics_lock = threading.Lock()
+        self.read_replica_uris = mlflow.store.db.utils._get_read_replica_uris(read_replica_uris)
+        self.read_replica_engines = [
+            mlflow.store.db.utils.create_sqlalchemy_engine_with_retry(uri)
+            for uri in self.read_replica_uris
+        ]
+        for engine in self.read_replica_engines:
+            mlflow.store.db.utils._verify_schema(engine)
+        # Listings and searches, which tolerate the replication lag, are balanced across the
+        # replicas. So are lookups of experiments and runs by ID or name, which read from the
+        # primary the entities that the replica misses or that were written in the last seconds
+        if self.read_replica_engines:
+            self.ReadOnlySessionMaker = mlflow.store.db.utils._get_read_replica_session_maker(
+                self.read_replica_engines
+            )
+        else:
+            self.ReadOnlySessionMaker = self.ManagedSessionMaker
+        self._read_replica_router = mlflow.store.db.utils._ReadReplicaRouter(
+            SessionMaker,
+            self.ManagedSessionMaker,
+            self.read_replica_engines,
+            _get_written_entity_keys,
+        )
 
         if is_local_uri(default_artifact_root):
             mkdir(local_file_uri_to_path(default_artifact_root))
 
-        if len(self.list_experiments()) == 0:
-            with self.ManagedSessionMaker() as session:
+        with self.ManagedSessionMaker() as session:
+            if len(self._list_experiments(session=session)) == 0:
                 self._create_default_experiment(session)
 
     def _set_zero_value_insertion_for_autoincrement_column(self, session):
@@ -253,7 +298,7 @@ class SqlAlchemyStore(AbstractStore):
         return session.query(SqlExperiment).options(*query_options).filter(*conditions).all()
 
     def list_experiments(self, view_type=ViewType.ACTIVE_ONLY):
-        with self.ManagedSessionMaker() as session:
+        with self.ReadOnlySessionMaker() as session:
             return [
                 exp.to_mlflow_entity()
                 for exp in self._list_experiments(session=session, view_type=view_type, eager=True)
@@ -301,16 +346,19 @@ class SqlAlchemyStore(AbstractStore):
         ]
 
     def get_experiment(self, experiment_id):
-        with self.ManagedSessionMaker() as session:
+        def read(session):
             return self._get_experiment(
                 session, experiment_id, ViewType.ALL, eager=True
             ).to_mlflow_entity()
 
+        return self._read_replica_router.lookup([("experiment", str(experiment_id))], read)
+
     def get_experiment_by_name(self, experiment_name):
         """
         Specialized implementation for SQL backed store.
         """
-        with self.ManagedSessionMaker() as session:
+
+        def read(session):
             stages = LifecycleStage.view_type_to_stages(ViewType.ALL)
             experiment = (
                 session.query(SqlExperiment)
@@ -322,6 +370,8 @@ class SqlAlchemyStore(AbstractStore):
             )
             return experiment.to_mlflow_entity() if experiment is not None else None
 
+        return self._read_replica_router.lookup([("experiment_name", experiment_name)], read)
+
     def delete_experiment(self, experiment_id):
         with self.ManagedSessionMaker() as session:
             experiment = self._get_experiment(session, experiment_id, ViewType.ACTIVE_ONLY)
@@ -345,7 +395,7 @@ class SqlAlchemyStore(AbstractStore):
 
     def create_run(self, experiment_id, user_id, start_time, tags):
         with self.ManagedSessionMaker() as session:
-            experiment = self.get_experiment(experiment_id)
+            experiment = self._get_experiment(session, experiment_id, ViewType.ALL)
             self._check_experiment_is_active(experiment)
 
             run_id = uuid.uuid4().hex
@@ -376,6 +426,79 @@ class SqlAlchemyStore(AbstractStore):
 
             return run.to_mlflow_entity()
 
+    def create_runs(self, experiment_id, user_id, start_time, runs_data):
+        _validate_batch_runs_limit(len(runs_data))
+        params_per_run = []
+        for run_data in runs_data:
+            params = [Param(key, value) for key, value in run_data.params.items()]
+            tags = [RunTag(key, value) for key, value in run_data.tags.items()]
+            _validate_batch_log_data(run_data._metric_objs, params, tags)
+            _validate_batch_log_limits(run_data._metric_objs, params, tags)
+            params_per_run.append(params)
+        with self.ManagedSessionMaker() as session:
+            experiment = self._get_experiment(session, experiment_id, ViewType.ALL)
+            self._check_experiment_is_active(experiment)
+            runs = []
+            for run_data, params in zip(runs_data, params_per_run):
+                run_id = uuid.uuid4().hex
+                artifact_location = append_to_uri_path(
+                    experiment.artifact_location, run_id, SqlAlchemyStore.ARTIFACTS_FOLDER_NAME
+                )
+                run = SqlRun(
+                    name="",
+                    artifact_uri=artifact_location,
+                    run_uuid=run_id,
+                    experiment_id=experiment_id,
+                    source_type=SourceType.to_string(SourceType.UNKNOWN),
+                    source_name="",
+                    entry_point_name="",
+                    user_id=user_id,
+                    status=RunStatus.to_string(RunStatus.RUNNING),
+                    start_time=start_time,
+                    end_time=None,
+                    source_version="",
+                    lifecycle_stage=LifecycleStage.ACTIVE,
+                )
+                run.tags = [SqlTag(key=key, value=value) for key, value in run_data.tags.items()]
+                run.params = [SqlParam(key=param.key, value=param.value) for param in params]
+                # A freshly created run has no metric history, so the latest value of each metric
+                # can be computed in memory instead of being looked up in the ``latest_metrics``
+                # table for every logged value
+                metrics = {}
+                latest_metrics = {}
+                for metric in run_data._metric_objs:
+                    value, is_nan = _get_sql_metric_value(metric.value)
+                    sql_metric = SqlMetric(
+                        key=metric.key,
+                        value=value,
+                        timestamp=metric.timestamp,
+                        step=metric.step,
+                        is_nan=is_nan,
+                    )
+                    metrics[(metric.key, value, metric.timestamp, metric.step)] = sql_metric
+                    latest = latest_metrics.get(metric.key)
+                    if latest is None or (metric.step, metric.timestamp, value) > (
+                        latest.step,
+                        latest.timestamp,
+                        latest.value,
+                    ):
+                        latest_metrics[metric.key] = sql_metric
+                run.metrics = list(metrics.values())
+                run.latest_metrics = [
+                    SqlLatestMetric(
+                        key=metric.key,
+                        value=metric.value,
+                        timestamp=metric.timestamp,
+                        step=metric.step,
+                        is_nan=metric.is_nan,
+                    )
+                    for metric in latest_metrics.values()
+                ]
+                runs.append(run)
+            self._save_to_db(objs=runs, session=session)
+            session.flush()
+            return [run.to_mlflow_entity() for run in runs]
+
     def _get_run(self, session, run_uuid, eager=False):
         """
         :param eager: If ``True``, eagerly loads the run's summary metrics (``latest_metrics``),
@@ -454,6 +577,34 @@ class SqlAlchemyStore(AbstractStore):
 
             return run.info
 
+    def _get_runs(self, session, run_uuids):
+        """
+        Fetch the runs with the specified ids, raising an exception if any of them does not exist.
+
+        :return: A list of ``SqlRun`` objects, in the same order as ``run_uuids``.
+        """
+        runs = session.query(SqlRun).filter(SqlRun.run_uuid.in_(run_uuids)).all()
+        runs_by_id = {run.run_uuid: run for run in runs}
+        missing_run_ids = [run_uuid for run_uuid in run_uuids if run_uuid not in runs_by_id]
+        if missing_run_ids:
+            raise MlflowException(
+                "Runs with ids={} not found".format(missing_run_ids), RESOURCE_DOES_NOT_EXIST
+            )
+        return [runs_by_id[run_uuid] for run_uuid in run_uuids]
+
+    def update_run_infos(self, run_ids, run_status, end_time):
+        _validate_batch_runs_limit(len(run_ids))
+        with self.ManagedSessionMaker() as session:
+            runs = self._get_runs(session, run_ids)
+            for run in runs:
+                self._check_run_is_active(run)
+                run.status = RunStatus.to_string(run_status)
+                run.end_time = end_time
+
+            self._save_to_db(objs=runs, session=session)
+            session.flush()
+            return [run.to_mlflow_entity().info for run in runs]
+
     def _try_get_run_tag(self, session, run_id, tagKey, eager=False):
         query_options = self._get_eager_run_query_options() if eager else []
         tags = (
@@ -465,7 +616,7 @@ class SqlAlchemyStore(AbstractStore):
         return None if not tags else tags[0]
 
     def get_run(self, run_id):
-        with self.ManagedSessionMaker() as session:
+        def read(session):
             # Load the run with the specified id and eagerly load its summary metrics, params, and
             # tags. These attributes are referenced during the invocation of
             # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
@@ -473,6 +624,8 @@ class SqlAlchemyStore(AbstractStore):
             run = self._get_run(run_uuid=run_id, session=session, eager=True)
             return run.to_mlflow_entity()
 
+        return self._read_replica_router.lookup([("run", run_id)], read)
+
     def restore_run(self, run_id):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
@@ -487,6 +640,15 @@ class SqlAlchemyStore(AbstractStore):
             run.lifecycle_stage = LifecycleStage.DELETED
             self._save_to_db(objs=run, session=session)
 
+    def delete_runs(self, run_ids):
+        _validate_batch_runs_limit(len(run_ids))
+        with self.ManagedSessionMaker() as session:
+            runs = self._get_runs(session, run_ids)
+            for run in runs:
+                self._check_run_is_active(run)
+                run.lifecycle_stage = LifecycleStage.DELETED
+            self._save_to_db(objs=runs, session=session)
+
     def _hard_delete_run(self, run_id):
         """
         Permanently delete a run (metadata and metrics, tags, parameters).
@@ -507,14 +669,7 @@ class SqlAlchemyStore(AbstractStore):
 
     def log_metric(self, run_id, metric):
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
-        is_nan = math.isnan(metric.value)
-        if is_nan:
-            value = 0
-        elif math.isinf(metric.value):
-            #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
-            value = 1.7976931348623157e308 if metric.value > 0 else -1.7976931348623157e308
-        else:
-            value = metric.value
+        value, is_nan = _get_sql_metric_value(metric.value)
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
@@ -573,10 +728,31 @@ class SqlAlchemyStore(AbstractStore):
             )
 
     def get_metric_history(self, run_id, metric_key):
-        with self.ManagedSessionMaker() as session:
+        def read(session):
             metrics = session.query(SqlMetric).filter_by(run_uuid=run_id, key=metric_key).all()
             return [metric.to_mlflow_entity() for metric in metrics]
 
+        return self._read_replica_router.lookup([("run", run_id)], read)
+
+    def get_metric_history_since(self, run_id, metric_key, since_step, since_timestamp):
+        with self.ReadOnlySessionMaker() as session:
+            metrics = (
+                session.query(SqlMetric)
+                .filter(
+                    SqlMetric.run_uuid == run_id,
+                    SqlMetric.key == metric_key,
+                    sqlalchemy.or_(
+                        SqlMetric.step > since_step,
+                        sqlalchemy.and_(
+                            SqlMetric.step == since_step, SqlMetric.timestamp > since_timestamp
+                        ),
+                    ),
+                )
+                .order_by(SqlMetric.step, SqlMetric.timestamp)
+                .all()
+            )
+            return [metric.to_mlflow_entity() for metric in metrics]
+
     def log_param(self, run_id, param):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
@@ -678,6 +854,54 @@ class SqlAlchemyStore(AbstractStore):
                 )
             session.delete(filtered_tags[0])
 
+    def _get_search_statistics(self, session):
+        if time.time() - self._search_statistics_time > SEARCH_STATISTICS_TTL:
+            # A single search reads the expired statistics, while concurrent ones use the previous
+            # statistics instead of waiting for it
+            if self._search_statistics_lock.acquire(blocking=False):
+                try:
+                    if time.time() - self._search_statistics_time > SEARCH_STATISTICS_TTL:
+                        self._search_statistics = _SearchStatistics.collect(session)
+                        self._search_statistics_time = time.time()
+                finally:
+                    self._search_statistics_lock.release()
+        return self._search_statistics
+
+    def _get_search_runs_query(
+        self, session, experiment_ids, filter_string, run_view_type, max_results, order_by, offset
+    ):
+        if max_results > SEARCH_MAX_RESULTS_THRESHOLD:
+            raise MlflowException(
+                "Invalid value for request parameter max_results. It must be at "
+                "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD, max_results),
+                INVALID_PARAMETER_VALUE,
+            )
+
+        stages = set(LifecycleStage.view_type_to_stages(run_view_type))
+        parsed_filters = SearchUtils.parse_search_filter(filter_string)
+        parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
+        statistics = self._get_search_statistics(session) if parsed_filters else None
+
+        query = session.query(SqlRun)
+        # using an outer join is necessary here because we want to be able to sort
+        # on a column (tag, metric or param) without removing the lines that
+        # do not have a value for this column (which is what inner join would do)
+        for j in sorting_joins:
+            query = query.outerjoin(j)
+
+        return (
+            query.distinct()
+            .options(*self._get_eager_run_query_options())
+            .filter(
+                SqlRun.experiment_id.in_(experiment_ids),
+                SqlRun.lifecycle_stage.in_(stages),
+                *_get_sqlalchemy_filter_clauses(parsed_filters, self.search_index, statistics)
+            )
+            .order_by(*parsed_orderby)
+            .offset(offset)
+            .limit(max_results)
+        )
+
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
@@ -689,52 +913,57 @@ class SqlAlchemyStore(AbstractStore):
 
             return next_token
 
-        if max_results > SEARCH_MAX_RESULTS_THRESHOLD:
-            raise MlflowException(
-                "Invalid value for request parameter max_results. It must be at "
-                "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD, max_results),
-                INVALID_PARAMETER_VALUE,
-            )
-
-        stages = set(LifecycleStage.view_type_to_stages(run_view_type))
-
-        with self.ManagedSessionMaker() as session:
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        with self.ReadOnlySessionMaker() as session:
             # Fetch the appropriate runs and eagerly load their summary metrics, params, and
             # tags. These run attributes are referenced during the invocation of
             # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
             # that are otherwise executed at attribute access time under a lazy loading model.
-            parsed_filters = SearchUtils.parse_search_filter(filter_string)
-            parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
-
-            query = session.query(SqlRun)
-            for j in _get_sqlalchemy_filter_clauses(parsed_filters, session):
-                query = query.join(j)
-            # using an outer join is necessary here because we want to be able to sort
-            # on a column (tag, metric or param) without removing the lines that
-            # do not have a value for this column (which is what inner join would do)
-            for j in sorting_joins:
-                query = query.outerjoin(j)
-
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
-            queried_runs = (
-                query.distinct()
-                .options(*self._get_eager_run_query_options())
-                .filter(
-                    SqlRun.experiment_id.in_(experiment_ids),
-                    SqlRun.lifecycle_stage.in_(stages),
-                    *_get_attributes_filtering_clauses(parsed_filters)
-                )
-                .order_by(*parsed_orderby)
-                .offset(offset)
-                .limit(max_results)
-                .all()
-            )
+            queried_runs = self._get_search_runs_query(
+                session, experiment_ids, filter_string, run_view_type, max_results, order_by, offset
+            ).all()
 
             runs = [run.to_mlflow_entity() for run in queried_runs]
             next_page_token = compute_next_token(len(runs))
 
         return runs, next_page_token
 
+    def explain_search_runs(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Return the SQL query selecting the runs of a ``search_runs`` call, in which the clauses
+        of the filter are ordered by estimated selectivity, and the plan of the query reported by
+        the ``EXPLAIN`` statement of the database. The eager loading of the metrics, params and
+        tags of the runs is not included.
+
+        :return: A dictionary with the SQL query, as a string with the values of its parameters,
+                 under ``"sql"``, and the lines of the query plan under ``"plan"``.
+        """
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        with self.ReadOnlySessionMaker() as session:
+            query = self._get_search_runs_query(
+                session, experiment_ids, filter_string, run_view_type, max_results, order_by, offset
+            )
+            statement = query.statement
+            dialect = session.get_bind().dialect
+            try:
+                query_sql = str(
+                    statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+                )
+            except Exception:  # pylint: disable=broad-except
+                # Some values cannot be rendered as literals by all dialects
+                compiled = statement.compile(dialect=dialect)
+                query_sql = "{}\n-- parameters: {}".format(compiled, compiled.params)
+            plan = _explain_statement(session, statement, self.db_type)
+        return {"sql": query_sql, "plan": plan}
+
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
         _validate_batch_log_data(metrics, params, tags)
@@ -774,67 +1003,485 @@ class SqlAlchemyStore(AbstractStore):
             session.merge(SqlTag(key=MLFLOW_LOGGED_MODELS, value=value, run_uuid=run_id))
 
 
-def _get_attributes_filtering_clauses(parsed):
-    clauses = []
-    for sql_statement in parsed:
-        key_type = sql_statement.get("type")
-        key_name = sql_statement.get("key")
-        value = sql_statement.get("value")
+def _get_written_entity_keys(obj):
+    """
+    Return the keys of the experiments and runs, looked up by the store with
+    ``_ReadReplicaRouter.lookup``, that a written database object belongs to.
+    """
+    get_values = mlflow.store.db.utils._get_attribute_values
+    if isinstance(obj, SqlExperiment):
+        return [("experiment", str(value)) for value in get_values(obj, "experiment_id")] + [
+            ("experiment_name", value) for value in get_values(obj, "name")
+        ]
+    if isinstance(obj, SqlExperimentTag):
+        return [("experiment", str(value)) for value in get_values(obj, "experiment_id")]
+    if isinstance(obj, (SqlRun, SqlMetric, SqlLatestMetric, SqlParam, SqlTag)):
+        return [("run", value) for value in get_values(obj, "run_uuid")]
+    return []
+
+
+def _get_sql_metric_value(value):
+    """
+    :return: A tuple of the value to store in the database for the specified metric value, and
+             whether the metric value is NaN.
+    """
+    is_nan = math.isnan(value)
+    if is_nan:
+        return 0, is_nan
+    elif math.isinf(value):
+        #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
+        return 1.7976931348623157e308 if value > 0 else -1.7976931348623157e308, is_nan
+    return value, is_nan
+
+
+class _NumericValue(sql.ColumnElement):
+    """
+    Value of a string column converted to a float, or NULL if the value is not a number matching
+    ``SearchUtils.NUMERIC_VALUE_PATTERN``. Compiled for each database dialect, as converting other
+    strings raises errors on some databases.
+    """
+
+    type = sqlalchemy.types.Float()
+
+    def __init__(self, column):
+        self.column = column
+
+
+@compiles(_NumericValue)
+def _compile_numeric_value(element, compiler, **kw):
+    # SQLite defines the REGEXP operator, implemented by ``mlflow.store.db.utils``
+    return "CASE WHEN {column} REGEXP {pattern} THEN CAST({column} AS REAL) END".format(
+        column=compiler.process(element.column, **kw),
+        pattern=compiler.process(sql.literal(SearchUtils.NUMERIC_VALUE_PATTERN), **kw),
+    )
+
+
+@compiles(_NumericValue, POSTGRES)
+def _compile_numeric_value_postgres(element, compiler, **kw):
+    return "CASE WHEN {column} ~ {pattern} THEN CAST({column} AS DOUBLE PRECISION) END".format(
+        column=compiler.process(element.column, **kw),
+        pattern=compiler.process(sql.literal(SearchUtils.NUMERIC_VALUE_PATTERN), **kw),
+    )
+
+
+@compiles(_NumericValue, MYSQL)
+def _compile_numeric_value_mysql(element, compiler, **kw):
+    # Strings are converted to doubles in arithmetic operations, while CAST(... AS DOUBLE) is
+    # only supported by MySQL >= 8.0.17
+    return "CASE WHEN {column} REGEXP {pattern} THEN {column} + 0e0 END".format(
+        column=compiler.process(element.column, **kw),
+        pattern=compiler.process(sql.literal(SearchUtils.NUMERIC_VALUE_PATTERN), **kw),
+    )
+
+
+@compiles(_NumericValue, MSSQL)
+def _compile_numeric_value_mssql(element, compiler, **kw):
+    # SQL Server does not support regular expressions, but TRY_CAST returns NULL for the strings
+    # which are not numbers. Exclude the other strings it converts, such as '$1' or ' 1'.
+    return "CASE WHEN {column} NOT LIKE {pattern} THEN TRY_CAST({column} AS FLOAT) END".format(
+        column=compiler.process(element.column, **kw),
+        pattern=compiler.process(sql.literal("%[^0-9.eE+-]%"), **kw),
+    )
+
+
+def _get_comparison_clause(column, comparator, value):
+    if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+        return SearchUtils.get_sql_filter_ops(column, comparator)(value)
+    elif comparator == SearchUtils.IN_OPERATOR:
+        return column.in_(value)
+    return SearchUtils.filter_ops.get(comparator)(column, value)
+
+
+# Estimated fractions of the values of a key matching comparisons, for lack of value statistics
+_COMPARATOR_SELECTIVITY = {
+    "=": 0.1,
+    "!=": 0.9,
+    ">": 0.33,
+    ">=": 0.33,
+    "<": 0.33,
+    "<=": 0.33,
+    SearchUtils.LIKE_OPERATOR: 0.25,
+    SearchUtils.ILIKE_OPERATOR: 0.25,
+    SearchUtils.IS_NOT_NULL_OPERATOR: 1.0,
+}
+# Number of seconds during which the statistics used to plan searches are reused
+SEARCH_STATISTICS_TTL = 300
+
+
+class _SearchStatistics(object):
+    """
+    Estimated number of runs and of runs with a value for metric, param and tag keys, used to
+    estimate the fraction of runs matched by the clauses of search filters.
+
+    The estimates are read from the statistics kept by the database for its own query planner,
+    which are cheap to read but only as recent as the last ``ANALYZE`` of the tables. Keys without
+    a statistic of their own are assumed to have a value in as many runs as the average key of
+    their table, or in all runs if the table has no statistics.
+
+    :param num_runs: Estimated number of runs.
+    :param key_counts: Dictionary mapping ``(table name, key)`` pairs to their estimated number of
+                       rows.
+    :param rows_per_key: Dictionary mapping table names to their estimated average number of rows
+                         per key.
+    """
+
+    _TABLES = [SqlLatestMetric.__tablename__, SqlParam.__tablename__, SqlTag.__tablename__]
+
+    def __init__(self, num_runs, key_counts=None, rows_per_key=None):
+        self.num_runs = num_runs
+        self.key_counts = key_counts or {}
+        self.rows_per_key = rows_per_key or {}
+
+    @classmethod
+    def collect(cls, session):
+        """
+        :return: The statistics of the database of ``session``, or ``None`` if the database has
+                 no statistics of the runs table, e.g. before it is first analyzed.
+        """
+        collect_statistics = {
+            SQLITE: cls._collect_sqlite,
+            POSTGRES: cls._collect_postgres,
+            MYSQL: cls._collect_mysql,
+            MSSQL: cls._collect_mssql,
+        }.get(session.get_bind().dialect.name)
+        if collect_statistics is None:
+            return None
+        try:
+            # Read with a connection of its own, since a failure would abort the transaction of the
+            # session on some databases
+            with session.get_bind().connect() as connection:
+                statistics = collect_statistics(connection)
+        except sqlalchemy.exc.DBAPIError as e:
+            _logger.debug("Failed to read the statistics of the tracking database: %s", e)
+            return None
+        return statistics if statistics.num_runs else None
+
+    @classmethod
+    def _collect_sqlite(cls, connection):
+        # Tables analyzed by ``ANALYZE`` have a row per index, whose statistic is the number of rows
+        # followed by the average number of rows per distinct value of the first columns of the
+        # index. The primary keys of the metrics, params and tags tables start with their key.
+        has_statistics = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchall()
+        if not has_statistics:
+            return cls(None)
+        rows = connection.execute(
+            "SELECT tbl, stat FROM sqlite_stat1 WHERE idx = 'sqlite_autoindex_' || tbl || '_1'"
+        )
+        stats = {table: [int(n) for n in stat.split()[:2]] for table, stat in rows}
+        return cls(
+            stats.get(SqlRun.__tablename__, [None])[0],
+            rows_per_key={t: stats[t][1] for t in cls._TABLES if len(stats.get(t, [])) == 2},
+        )
+
+    @classmethod
+    def _collect_postgres(cls, connection):
+        tables = [SqlRun.__tablename__] + cls._TABLES
+        rows = connection.execute(
+            sql.text(
+                "SELECT c.relname, c.reltuples FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = current_schema() AND c.relname IN :tables"
+            ).bindparams(sql.bindparam("tables", tables, expanding=True))
+        )
+        # Tables never analyzed have -1 or 0 tuples
+        num_rows = {table: num for table, num in rows if num > 0}
+        # The statistics of the key columns have the frequencies of their most common values
+        stats = connection.execute(
+            sql.text(
+                "SELECT tablename, n_distinct, most_common_vals::text::text[], most_common_freqs "
+                "FROM pg_stats WHERE schemaname = current_schema() AND attname = 'key' "
+                "AND tablename IN :tables"
+            ).bindparams(sql.bindparam("tables", cls._TABLES, expanding=True))
+        )
+        key_counts = {}
+        rows_per_key = {}
+        for table, n_distinct, values, freqs in stats:
+            if table not in num_rows:
+                continue
+            # Negative numbers of distinct values are fractions of the number of rows
+            if n_distinct < 0:
+                n_distinct = -n_distinct * num_rows[table]
+            values, freqs = values or [], freqs or []
+            for value, freq in zip(values, freqs):
+                key_counts[(table, value)] = freq * num_rows[table]
+            if n_distinct > len(values):
+                other_rows = (1.0 - sum(freqs)) * num_rows[table]
+                rows_per_key[table] = other_rows / (n_distinct - len(values))
+        return cls(num_rows.get(SqlRun.__tablename__), key_counts, rows_per_key)
+
+    @classmethod
+    def _collect_mysql(cls, connection):
+        tables = [SqlRun.__tablename__] + cls._TABLES
+        rows = connection.execute(
+            sql.text(
+                "SELECT TABLE_NAME, TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :tables"
+            ).bindparams(sql.bindparam("tables", tables, expanding=True))
+        )
+        num_rows = {table: num for table, num in rows if num}
+        # The cardinality of the first column of the primary keys is their number of keys
+        cardinalities = connection.execute(
+            sql.text(
+                "SELECT TABLE_NAME, CARDINALITY FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND INDEX_NAME = 'PRIMARY' "
+                "AND SEQ_IN_INDEX = 1 AND TABLE_NAME IN :tables"
+            ).bindparams(sql.bindparam("tables", cls._TABLES, expanding=True))
+        )
+        rows_per_key = {
+            table: num_rows[table] / cardinality
+            for table, cardinality in cardinalities
+            if cardinality and table in num_rows
+        }
+        return cls(num_rows.get(SqlRun.__tablename__), rows_per_key=rows_per_key)
+
+    @classmethod
+    def _collect_mssql(cls, connection):
+        rows = connection.execute(
+            sql.text(
+                "SELECT OBJECT_NAME(object_id), SUM(row_count) FROM sys.dm_db_partition_stats "
+                "WHERE index_id IN (0, 1) AND OBJECT_NAME(object_id) = :table "
+                "GROUP BY object_id"
+            ),
+            table=SqlRun.__tablename__,
+        )
+        return cls(dict(rows.fetchall()).get(SqlRun.__tablename__))
+
+    def _get_key_fraction(self, entity, key):
+        table = entity.__tablename__
+        num_rows = self.key_counts.get((table, key), self.rows_per_key.get(table))
+        if num_rows is None:
+            return 1.0
+        return min(1.0, num_rows / self.num_runs)
+
+    def _get_comparison_selectivity(self, sql_statement):
         comparator = sql_statement.get("comparator").upper()
-        if SearchUtils.is_attribute(key_type, comparator):
-            # key_name is guaranteed to be a valid searchable attribute of entities.RunInfo
-            # by the call to parse_search_filter
-            attribute = getattr(SqlRun, SqlRun.get_attribute_name(key_name))
-            if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-                op = SearchUtils.get_sql_filter_ops(attribute, comparator)
-                clauses.append(op(value))
-            elif comparator in SearchUtils.filter_ops:
-                op = SearchUtils.filter_ops.get(comparator)
-                clauses.append(op(attribute, value))
-    return clauses
-
-
-def _to_sqlalchemy_filtering_statement(sql_statement, session):
+        if comparator == SearchUtils.IN_OPERATOR:
+            return min(1.0, _COMPARATOR_SELECTIVITY["="] * len(sql_statement.get("value")))
+        elif (
+            comparator == "="
+            and sql_statement.get("type") == SearchUtils._ATTRIBUTE_IDENTIFIER
+            and sql_statement.get("key") == "run_id"
+        ):
+            return 1.0 / max(self.num_runs, 1)
+        return _COMPARATOR_SELECTIVITY.get(comparator, 1.0)
+
+    def estimate(self, sql_statements):
+        """
+        :param sql_statements: Clauses returned by ``SearchUtils.parse_search_filter``, combined
+                               by ``AND``, comparing the same metric, param or tag if more than
+                               one.
+
+        :return: The estimated fraction of runs matching the clauses.
+        """
+        sql_statement = sql_statements[0]
+        key_type = sql_statement.get("type")
+        if key_type in [SearchUtils._AND_IDENTIFIER, SearchUtils._OR_IDENTIFIER]:
+            estimates = [self.estimate([clause]) for clause in sql_statement.get("clauses")]
+            if key_type == SearchUtils._AND_IDENTIFIER:
+                return functools.reduce(operator.mul, estimates, 1.0)
+            return min(1.0, sum(estimates))
+        selectivity = functools.reduce(
+            operator.mul, [self._get_comparison_selectivity(s) for s in sql_statements], 1.0
+        )
+        entity = _get_filter_entity(sql_statement)
+        if entity is None:
+            return selectivity
+        fraction = self._get_key_fraction(entity, sql_statement.get("key"))
+        if sql_statement.get("comparator").upper() == SearchUtils.IS_NULL_OPERATOR:
+            return 1.0 - fraction
+        return fraction * selectivity
+
+
+def _get_filter_entity(sql_statement):
+    """
+    :return: The model of the table of the metrics, params or tags compared by a clause returned
+             by ``SearchUtils.parse_search_filter``, or ``None`` if it compares an attribute.
+    """
     key_type = sql_statement.get("type")
-    key_name = sql_statement.get("key")
-    value = sql_statement.get("value")
     comparator = sql_statement.get("comparator").upper()
-
     if SearchUtils.is_metric(key_type, comparator):
-        entity = SqlLatestMetric
-        value = float(value)
-    elif SearchUtils.is_param(key_type, comparator):
-        entity = SqlParam
+        return SqlLatestMetric
+    elif SearchUtils.is_param(key_type, comparator, sql_statement.get("numeric", False)):
+        return SqlParam
     elif SearchUtils.is_tag(key_type, comparator):
-        entity = SqlTag
+        return SqlTag
     elif SearchUtils.is_attribute(key_type, comparator):
         return None
-    else:
-        raise MlflowException(
-            "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
+    raise MlflowException(
+        "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
+    )
+
+
+def _get_value_comparison_clause(entity, sql_statement):
+    comparator = sql_statement.get("comparator").upper()
+    value = sql_statement.get("value")
+    if entity is SqlLatestMetric:
+        return _get_comparison_clause(entity.value, comparator, float(value))
+    elif sql_statement.get("numeric", False):
+        return _get_comparison_clause(_NumericValue(entity.value), comparator, float(value))
+    return _get_comparison_clause(entity.value, comparator, value)
+
+
+def _get_entity_filtering_clause(entity, key, sql_statements, index_type=None):
+    """
+    Create a clause on ``SqlRun`` matching the runs whose metric, param or tag ``key`` satisfies
+    all the comparisons of ``sql_statements`` (``IS NOT NULL`` or comparisons of its value), with
+    a single subquery, as runs have at most one value per key.
+
+    The runs are compared by a correlated ``EXISTS`` subquery, unless the database has a search
+    index and the comparisons include ``LIKE`` or ``ILIKE`` patterns with literal substrings:
+    PostgreSQL then selects the runs with an uncorrelated subquery, which can use the trigram
+    indexes of the values, while SQLite restricts the compared runs to the candidates found in
+    its FTS5 index.
+    """
+    comparisons = [
+        _get_value_comparison_clause(entity, s)
+        for s in sql_statements
+        if s.get("comparator").upper() != SearchUtils.IS_NOT_NULL_OPERATOR
+    ]
+    substrings = []
+    if index_type and entity is not SqlLatestMetric:
+        for s in sql_statements:
+            if (
+                s.get("comparator").upper()
+                in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS
+            ):
+                substrings.extend(search_index.get_indexed_substrings(s.get("value")))
+    if substrings and index_type == POSTGRES:
+        matches = sql.select([entity.run_uuid]).where(sql.and_(entity.key == key, *comparisons))
+        return SqlRun.run_uuid.in_(matches)
+    exists = sql.exists().where(
+        sql.and_(entity.run_uuid == SqlRun.run_uuid, entity.key == key, *comparisons)
+    )
+    if substrings:
+        candidates = search_index.select_sqlite_candidates(entity.__tablename__, key, substrings)
+        return sql.and_(SqlRun.run_uuid.in_(candidates), exists)
+    return exists
+
+
+def _to_sqlalchemy_filtering_statement(sql_statement, index_type=None, statistics=None):
+    """
+    Translate a clause returned by ``SearchUtils.parse_search_filter`` into a boolean clause on
+    ``SqlRun``, in which metrics, params and tags are compared by correlated ``EXISTS``
+    subqueries so that clauses on them can be combined by ``OR``.
+
+    :param index_type: Type of the search index of the database, as returned by
+                       ``search_index.get_search_index``, used to look up the runs matching
+                       ``LIKE`` and ``ILIKE`` comparisons of params and tags, or ``None``.
+    :param statistics: ``_SearchStatistics`` used to order the clauses combined by ``AND``, or
+                       ``None`` to keep them in the order of the filter.
+    """
+    key_type = sql_statement.get("type")
+    if key_type == SearchUtils._AND_IDENTIFIER:
+        return sql.and_(
+            *_get_sqlalchemy_filter_clauses(sql_statement.get("clauses"), index_type, statistics)
+        )
+    elif key_type == SearchUtils._OR_IDENTIFIER:
+        return sql.or_(
+            *[
+                _to_sqlalchemy_filtering_statement(clause, index_type, statistics)
+                for clause in sql_statement.get("clauses")
+            ]
         )
 
-    if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-        op = SearchUtils.get_sql_filter_ops(entity.value, comparator)
-        return session.query(entity).filter(entity.key == key_name, op(value)).subquery()
-    elif comparator in SearchUtils.filter_ops:
-        op = SearchUtils.filter_ops.get(comparator)
-        return (
-            session.query(entity).filter(entity.key == key_name, op(entity.value, value)).subquery()
+    entity = _get_filter_entity(sql_statement)
+    comparator = sql_statement.get("comparator").upper()
+    if entity is None:
+        # key_name is guaranteed to be a valid searchable attribute of entities.RunInfo
+        # by the call to parse_search_filter
+        attribute = getattr(SqlRun, SqlRun.get_attribute_name(sql_statement.get("key")))
+        return _get_comparison_clause(attribute, comparator, sql_statement.get("value"))
+    elif comparator == SearchUtils.IS_NULL_OPERATOR:
+        return ~sql.exists().where(
+            sql.and_(entity.run_uuid == SqlRun.run_uuid, entity.key == sql_statement.get("key"))
         )
-    else:
-        return None
+    return _get_entity_filtering_clause(
+        entity, sql_statement.get("key"), [sql_statement], index_type
+    )
 
 
-def _get_sqlalchemy_filter_clauses(parsed, session):
-    """creates SqlAlchemy subqueries
-    that will be inner-joined to SQLRun to act as multi-clause filters."""
-    filters = []
-    for sql_statement in parsed:
-        filter_query = _to_sqlalchemy_filtering_statement(sql_statement, session)
-        if filter_query is not None:
-            filters.append(filter_query)
-    return filters
+def _get_sqlalchemy_filter_clauses(parsed, index_type=None, statistics=None):
+    """
+    Creates the SQLAlchemy boolean clauses filtering ``SqlRun`` by clauses of a parsed search
+    filter combined by ``AND``. The comparisons of the same metric, param or tag are merged into
+    one subquery and, given ``statistics``, the clauses are ordered by increasing estimated
+    fraction of matched runs, so that the most selective clauses are evaluated first.
+
+    :param index_type: Type of the search index of the database, or ``None``.
+    :param statistics: ``_SearchStatistics`` of the database, or ``None``.
+    """
+    groups = collections.OrderedDict()
+    for i, sql_statement in enumerate(parsed):
+        key_type = sql_statement.get("type")
+        if key_type not in [SearchUtils._AND_IDENTIFIER, SearchUtils._OR_IDENTIFIER]:
+            entity = _get_filter_entity(sql_statement)
+            comparator = sql_statement.get("comparator").upper()
+            if entity is not None and comparator != SearchUtils.IS_NULL_OPERATOR:
+                groups.setdefault((entity, sql_statement.get("key")), []).append(sql_statement)
+                continue
+        groups[i] = [sql_statement]
+
+    planned = []
+    for group_key, sql_statements in groups.items():
+        if isinstance(group_key, tuple):
+            entity, key = group_key
+            clause = _get_entity_filtering_clause(entity, key, sql_statements, index_type)
+        else:
+            clause = _to_sqlalchemy_filtering_statement(sql_statements[0], index_type, statistics)
+        estimate = statistics.estimate(sql_statements) if statistics else 0
+        planned.append((estimate, clause))
+    # Sorting is stable, which keeps the order of the filter for equal estimates
+    planned.sort(key=lambda p: p[0])
+    return [clause for _, clause in planned]
+
+
+def _explain_statement(session, statement, db_type):
+    """
+    :return: The lines of the plan of a SQL statement reported by the ``EXPLAIN`` statement of
+             the database.
+    """
+    compiled = statement.compile(dialect=session.get_bind().dialect)
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+    connection = session.connection()
+    if db_type == SQLITE:
+        rows = connection.execute("EXPLAIN QUERY PLAN " + str(compiled), params).fetchall()
+        # Rows are (id, parent id, unused, detail), in depth-first order
+        depths = {0: -1}
+        plan = []
+        for row in rows:
+            depths[row[0]] = depths.get(row[1], -1) + 1
+            plan.append("  " * depths[row[0]] + row[3])
+        return plan
+    elif db_type == MSSQL:
+        # SQL Server reports plans instead of executing statements while SHOWPLAN_TEXT is on,
+        # as one or more result sets
+        cursor = connection.connection.cursor()
+        cursor.execute("SET SHOWPLAN_TEXT ON")
+        try:
+            cursor.execute(str(compiled), params)
+            plan = []
+            while True:
+                if cursor.description:
+                    plan.extend(row[0] for row in cursor.fetchall())
+                if not cursor.nextset():
+                    break
+        finally:
+            cursor.execute("SET SHOWPLAN_TEXT OFF")
+            cursor.close()
+        return plan
+    result = connection.execute("EXPLAIN " + str(compiled), params)
+    if db_type == POSTGRES:
+        return [row[0] for row in result]
+    # MySQL reports one row per table access
+    return [
+        ", ".join("{}={}".format(column, value) for column, value in zip(result.keys(), row))
+        for row in result
+    ]
 
 
 def _get_orderby_clauses(order_by_list, session):
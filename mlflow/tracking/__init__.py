@@ -6,6 +6,7 @@ For a higher level API for managing an "active run", use the :py:mod:`mlflow` mo
 """
 
 from mlflow.tracking.client import MlflowClient
+from mlflow.tracking.async_client import AsyncMlflowClient
 from mlflow.tracking._tracking_service.utils import (
     set_tracking_uri,
     get_tracking_uri,
@@ -21,6 +22,7 @@ from mlflow.tracking.fluent import _EXPERIMENT_ID_ENV_VAR, _EXPERIMENT_NAME_ENV_
 
 __all__ = [
     "MlflowClient",
+    "AsyncMlflowClient",
     "get_tracking_uri",
     "set_tracking_uri",
     "is_tracking_uri_set",
@@ -8,7 +8,7 @@ import time
 import os
 
 from mlflow.models import Model
-from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import EXPORT_MAX_RESULTS_THRESHOLD, SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._tracking_service import utils
 from mlflow.utils.validation import (
     _validate_param_name,
@@ -18,7 +18,7 @@ from mlflow.utils.validation import (
     _validate_experiment_name,
     _validate_metric,
 )
-from mlflow.entities import Param, Metric, RunStatus, RunTag, ViewType, ExperimentTag
+from mlflow.entities import Param, Metric, RunData, RunStatus, RunTag, ViewType, ExperimentTag
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.utils.mlflow_tags import MLFLOW_USER
 from mlflow.utils.string_utils import is_string_type
@@ -54,15 +54,26 @@ class TrackingServiceClient(object):
         _validate_run_id(run_id)
         return self.store.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_metric_history(self, run_id, key, since=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param since: Optional ``(step, timestamp)`` cursor, typically of the last value returned
+                      by an earlier call. If specified, only the values whose step and timestamp
+                      are greater than the cursor are returned, sorted by step and timestamp.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
+        if since is not None:
+            since_step, since_timestamp = since
+            return self.store.get_metric_history_since(
+                run_id=run_id,
+                metric_key=key,
+                since_step=since_step,
+                since_timestamp=since_timestamp,
+            )
         return self.store.get_metric_history(run_id=run_id, metric_key=key)
 
     def create_run(self, experiment_id, start_time=None, tags=None):
@@ -94,6 +105,46 @@ class TrackingServiceClient(object):
             tags=[RunTag(key, value) for (key, value) in tags.items()],
         )
 
+    def create_runs(self, experiment_id, runs_data, start_time=None, tags=None):
+        """
+        Create multiple :py:class:`mlflow.entities.Run` objects at once, each initialized with its
+        own metrics, params, and tags.
+
+        :param experiment_id: The ID of the experiment to create the runs in.
+        :param runs_data: List of :py:class:`mlflow.entities.RunData` objects, one per run to
+                          create, holding the initial metrics, params, and tags of the run.
+        :param start_time: If not provided, use the current timestamp.
+        :param tags: A dictionary of key-value pairs set as tags on every created run, in addition
+                     to the tags of each :py:class:`mlflow.entities.RunData`.
+        :return: List of :py:class:`mlflow.entities.Run` that were created, in the same order as
+                 ``runs_data``.
+        """
+        tags = tags if tags else {}
+        user_id = tags.get(MLFLOW_USER, "unknown")
+
+        merged_runs_data = []
+        for run_data in runs_data:
+            for metric in run_data._metric_objs:
+                _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+            for key in run_data.params:
+                _validate_param_name(key)
+            run_tags = dict(tags, **run_data.tags)
+            for key in run_tags:
+                _validate_tag_name(key)
+            merged_runs_data.append(
+                RunData(
+                    metrics=run_data._metric_objs,
+                    params=[Param(key, value) for key, value in run_data.params.items()],
+                    tags=[RunTag(key, value) for key, value in run_tags.items()],
+                )
+            )
+        return self.store.create_runs(
+            experiment_id=experiment_id,
+            user_id=user_id,
+            start_time=start_time or int(time.time() * 1000),
+            runs_data=merged_runs_data,
+        )
+
     def list_run_infos(
         self,
         experiment_id,
@@ -286,16 +337,21 @@ class TrackingServiceClient(object):
         """
         self._get_artifact_repo(run_id).log_artifacts(local_dir, artifact_path)
 
-    def list_artifacts(self, run_id, path=None):
+    def list_artifacts(self, run_id, path=None, recursive=False):
         """
         List the artifacts for a run.
 
         :param run_id: The run to list artifacts from.
         :param path: The run's relative artifact path to list from. By default it is set to None
                      or the root artifact path.
+        :param recursive: If True, list the files at any depth under the path instead of its
+                          direct children, along with the directories that contain no file.
         :return: List of :py:class:`mlflow.entities.FileInfo`
         """
-        return self._get_artifact_repo(run_id).list_artifacts(path)
+        artifact_repo = self._get_artifact_repo(run_id)
+        if recursive:
+            return artifact_repo.list_files(path)
+        return artifact_repo.list_artifacts(path)
 
     def download_artifacts(self, run_id, path, dst_path=None):
         """
@@ -325,12 +381,31 @@ class TrackingServiceClient(object):
             run_id, run_status=RunStatus.from_string(status), end_time=end_time
         )
 
+    def set_terminated_runs(self, run_ids, status=None, end_time=None):
+        """Set the status of multiple runs to terminated.
+
+        :param run_ids: List of string IDs of the runs to terminate.
+        :param status: A string value of :py:class:`mlflow.entities.RunStatus`.
+                       Defaults to "FINISHED".
+        :param end_time: If not provided, defaults to the current time."""
+        end_time = end_time if end_time else int(time.time() * 1000)
+        status = status if status else RunStatus.to_string(RunStatus.FINISHED)
+        self.store.update_run_infos(
+            run_ids, run_status=RunStatus.from_string(status), end_time=end_time
+        )
+
     def delete_run(self, run_id):
         """
         Deletes a run with the given ID.
         """
         self.store.delete_run(run_id)
 
+    def delete_runs(self, run_ids):
+        """
+        Deletes the runs with the given IDs.
+        """
+        self.store.delete_runs(run_ids)
+
     def restore_run(self, run_id):
         """
         Restores a deleted run with the given ID.
@@ -345,6 +420,7 @@ class TrackingServiceClient(object):
         max_results=SEARCH_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        explain=False,
     ):
         """
         Search experiments that fit the search criteria.
@@ -359,13 +435,25 @@ class TrackingServiceClient(object):
                      The default ordering is to sort by ``start_time DESC``, then ``run_id``.
         :param page_token: Token specifying the next page of results. It should be obtained from
             a ``search_runs`` call.
+        :param explain: If True, describe how the search is executed instead of executing it.
 
         :return: A list of :py:class:`mlflow.entities.Run` objects that satisfy the search
             expressions. If the underlying tracking store supports pagination, the token for
             the next page may be obtained via the ``token`` attribute of the returned object.
+            If ``explain`` is True, a dictionary with the SQL query of the search under ``"sql"``
+            and the lines of its query plan under ``"plan"``.
         """
         if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
             experiment_ids = [experiment_ids]
+        if explain:
+            return self.store.explain_search_runs(
+                experiment_ids=experiment_ids,
+                filter_string=filter_string,
+                run_view_type=run_view_type,
+                max_results=max_results,
+                order_by=order_by,
+                page_token=page_token,
+            )
         return self.store.search_runs(
             experiment_ids=experiment_ids,
             filter_string=filter_string,
@@ -374,3 +462,34 @@ class TrackingServiceClient(object):
             order_by=order_by,
             page_token=page_token,
         )
+
+    def export_runs(
+        self,
+        experiment_ids,
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=EXPORT_MAX_RESULTS_THRESHOLD,
+        order_by=None,
+    ):
+        """
+        Search runs that fit the search criteria, and return them as an Apache Arrow table with one
+        row per run and one column per run attribute, metric, param and tag.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string id.
+        :param filter_string: Filter query string, defaults to searching all runs.
+        :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+                              defined in :py:class:`mlflow.entities.ViewType`.
+        :param max_results: Maximum number of runs to export.
+        :param order_by: List of columns to order by (e.g., "metrics.rmse").
+
+        :return: A ``pyarrow.Table``.
+        """
+        if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
+            experiment_ids = [experiment_ids]
+        return self.store.export_runs(
+            experiment_ids=experiment_ids,
+            filter_string=filter_string,
+            run_view_type=run_view_type,
+            max_results=max_results,
+            order_by=order_by,
+        )
@@ -9,6 +9,7 @@ import urllib.parse
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_cache import get_artifact_cache
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.dbfs_artifact_repo import DbfsRestArtifactRepository
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
@@ -57,7 +58,9 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
     """
     :param artifact_uri: The *absolute* URI of the artifact to download.
     :param output_path: The local filesystem path to which to download the artifact. If unspecified,
-                        a local output path will be created.
+                        a local output path will be created. If ``MLFLOW_ARTIFACT_CACHE_DIR`` is
+                        set, the artifact is downloaded through the cache of
+                        :py:mod:`mlflow.store.artifact.artifact_cache`.
     """
     parsed_uri = urllib.parse.urlparse(str(artifact_uri))
     prefix = ""
@@ -76,9 +79,11 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
         parsed_uri = parsed_uri._replace(path=posixpath.dirname(parsed_uri.path))
         root_uri = prefix + urllib.parse.urlunparse(parsed_uri)
 
-    return get_artifact_repository(artifact_uri=root_uri).download_artifacts(
-        artifact_path=artifact_path, dst_path=output_path
-    )
+    repo = get_artifact_repository(artifact_uri=root_uri)
+    artifact_cache = get_artifact_cache()
+    if artifact_cache is not None:
+        return artifact_cache.download_artifacts(repo, artifact_path, output_path)
+    return repo.download_artifacts(artifact_path=artifact_path, dst_path=output_path)
 
 
 def _upload_artifacts_to_databricks(
@@ -0,0 +1,920 @@
+"""
+Internal module implementing an asyncio-native client of the MLflow Tracking and Model Registry
+REST APIs. It is exposed in the :py:mod:`mlflow.tracking` module as
+:py:class:`mlflow.tracking.AsyncMlflowClient`.
+"""
+import asyncio
+import time
+
+from mlflow.entities import (
+    Experiment,
+    Metric,
+    Run,
+    RunInfo,
+    RunStatus,
+    RunTag,
+    ViewType,
+)
+from mlflow.entities.model_registry import (
+    ModelVersion,
+    ModelVersionTag,
+    RegisteredModel,
+    RegisteredModelTag,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.protos import databricks_pb2
+from mlflow.protos.databricks_pb2 import FEATURE_DISABLED, INVALID_PARAMETER_VALUE
+from mlflow.protos.model_registry_pb2 import (
+    ModelRegistryService,
+    CreateRegisteredModel,
+    UpdateRegisteredModel,
+    DeleteRegisteredModel,
+    ListRegisteredModels,
+    GetLatestVersions,
+    CreateModelVersion,
+    UpdateModelVersion,
+    DeleteModelVersion,
+    GetModelVersionDownloadUri,
+    SearchModelVersions,
+    RenameRegisteredModel,
+    GetRegisteredModel,
+    GetModelVersion,
+    TransitionModelVersionStage,
+    SearchRegisteredModels,
+    SetRegisteredModelTag,
+    SetModelVersionTag,
+    DeleteRegisteredModelTag,
+    DeleteModelVersionTag,
+)
+from mlflow.protos.service_pb2 import (
+    MlflowService,
+    CreateExperiment,
+    GetExperiment,
+    GetExperimentByName,
+    ListExperiments,
+    DeleteExperiment,
+    RestoreExperiment,
+    UpdateExperiment,
+    SetExperimentTag,
+    GetRun,
+    CreateRun,
+    CreateRuns,
+    UpdateRun,
+    TerminateRuns,
+    DeleteRun,
+    DeleteRuns,
+    RestoreRun,
+    SearchRuns,
+    GetMetricHistory,
+    LogMetric,
+    LogParam,
+    SetTag,
+    DeleteTag,
+    LogBatch,
+)
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.model_registry import SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.tracking._model_registry import utils as registry_utils
+from mlflow.tracking._tracking_service import utils
+from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
+from mlflow.utils.mlflow_tags import MLFLOW_USER
+from mlflow.utils.proto_json_utils import message_to_json
+from mlflow.utils.rest_utils import (
+    async_call_endpoint,
+    extract_api_info_for_service,
+    _REST_API_PATH_PREFIX,
+)
+from mlflow.utils.string_utils import is_string_type
+from mlflow.utils.validation import (
+    _validate_experiment_artifact_location,
+    _validate_experiment_name,
+    _validate_metric,
+    _validate_param_name,
+    _validate_run_id,
+    _validate_tag_name,
+)
+
+_TRACKING_METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
+_REGISTRY_METHOD_TO_INFO = extract_api_info_for_service(ModelRegistryService, _REST_API_PATH_PREFIX)
+
+# Default maximum number of concurrent connections to the tracking and registry servers
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _get_host_creds_getter(store, uri):
+    get_host_creds = getattr(store, "get_host_creds", None)
+    if get_host_creds is None:
+        raise MlflowException(
+            "AsyncMlflowClient only supports tracking and registry servers accessed via REST API"
+            " calls, such as 'http://...', 'https://...' or 'databricks://...' URIs. Got:"
+            " '{uri}'.".format(uri=uri),
+            INVALID_PARAMETER_VALUE,
+        )
+    return get_host_creds
+
+
+class AsyncMlflowClient(object):
+    """
+    Note:: Experimental: This entity may change or be removed in a future release without warning.
+
+    Asyncio-native client of an MLflow Tracking Server and of an MLflow Model Registry Server.
+    It mirrors the methods of :py:class:`mlflow.tracking.MlflowClient` as coroutines, issuing the
+    REST API requests through a pool of connections so that calls do not block the event loop
+    and many calls can be awaited concurrently, e.g. with ``asyncio.gather``.
+
+    Only stores accessed via REST API calls (``http``, ``https`` and ``databricks`` URIs) are
+    supported. This client requires the ``aiohttp`` package. It should be closed with
+    :py:meth:`close` once it is no longer needed, or used as an asynchronous context manager.
+
+    .. code-block:: python
+        :caption: Example
+
+        import asyncio
+
+        from mlflow.tracking import AsyncMlflowClient
+
+        async def main(run_ids):
+            async with AsyncMlflowClient("http://localhost:5000") as client:
+                runs = await client.get_runs(run_ids)
+                for run in runs:
+                    print("run_id: {}; metrics: {}".format(run.info.run_id, run.data.metrics))
+
+        asyncio.get_event_loop().run_until_complete(main(["<run_id_1>", "<run_id_2>"]))
+    """
+
+    def __init__(self, tracking_uri=None, registry_uri=None, max_concurrency=None):
+        """
+        :param tracking_uri: Address of remote tracking server. If not provided, defaults to the
+                             service set by ``mlflow.tracking.set_tracking_uri``.
+        :param registry_uri: Address of remote model registry server. If not provided, defaults
+                             to the service set by ``mlflow.tracking.set_registry_uri``. If no
+                             such service was set, defaults to the tracking uri of the client.
+        :param max_concurrency: Maximum number of requests sent concurrently by this client, i.e.
+                                the size of its connection pool. Additional requests wait for a
+                                connection to become available. Defaults to 16.
+        """
+        self._tracking_uri = utils._resolve_tracking_uri(tracking_uri)
+        self._registry_uri = registry_utils._resolve_registry_uri(registry_uri, tracking_uri)
+        self._get_tracking_host_creds = _get_host_creds_getter(
+            utils._get_store(self._tracking_uri), self._tracking_uri
+        )
+        # The registry store is resolved lazily, on the first Model Registry request, so that
+        # the client can be used for tracking against servers without a Model Registry
+        self._get_registry_host_creds = None
+        self._max_concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_concurrency)
+            )
+        return self._session
+
+    async def close(self):
+        """
+        Close the connections opened by this client.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _call_endpoint(self, api, request_message):
+        endpoint, method = _TRACKING_METHOD_TO_INFO[api]
+        return await async_call_endpoint(
+            self._get_session(),
+            self._get_tracking_host_creds(),
+            endpoint,
+            method,
+            message_to_json(request_message),
+            api.Response(),
+        )
+
+    async def _call_registry_endpoint(self, api, request_message):
+        if self._get_registry_host_creds is None:
+            try:
+                registry_store = registry_utils._get_store(self._registry_uri)
+            except UnsupportedModelRegistryStoreURIException as exc:
+                raise MlflowException(
+                    "Model Registry features are not supported by the store with URI:"
+                    " '{uri}'. Stores with the following URI schemes are supported:"
+                    " {schemes}.".format(uri=self._registry_uri, schemes=exc.supported_uri_schemes),
+                    FEATURE_DISABLED,
+                )
+            self._get_registry_host_creds = _get_host_creds_getter(
+                registry_store, self._registry_uri
+            )
+        endpoint, method = _REGISTRY_METHOD_TO_INFO[api]
+        return await async_call_endpoint(
+            self._get_session(),
+            self._get_registry_host_creds(),
+            endpoint,
+            method,
+            message_to_json(request_message),
+            api.Response(),
+        )
+
+    # Tracking API
+
+    async def get_run(self, run_id):
+        """
+        Fetch the run from backend store. See :py:meth:`mlflow.tracking.MlflowClient.get_run`.
+
+        :param run_id: Unique identifier for the run.
+
+        :return: A single :py:class:`mlflow.entities.Run` object, if the run exists. Otherwise,
+                 raises an exception.
+        """
+        _validate_run_id(run_id)
+        response_proto = await self._call_endpoint(GetRun, GetRun(run_uuid=run_id, run_id=run_id))
+        return Run.from_proto(response_proto.run)
+
+    async def get_runs(self, run_ids):
+        """
+        Fetch multiple runs concurrently. At most ``max_concurrency`` requests are in flight at
+        any time.
+
+        :param run_ids: List of unique identifiers of the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the same order as
+                 ``run_ids``. Raises an exception if any of the runs does not exist.
+        """
+        return list(await asyncio.gather(*[self.get_run(run_id) for run_id in run_ids]))
+
+    async def get_metric_history(self, run_id, key, since=None):
+        """
+        Return a list of metric objects corresponding to all values logged for a given metric.
+
+        :param run_id: Unique identifier for run
+        :param key: Metric name within the run
+        :param since: Optional ``(step, timestamp)`` cursor, typically of the last value returned
+                      by an earlier call. If specified, only the values whose step and timestamp
+                      are greater than the cursor are returned, sorted by step and timestamp.
+
+        :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
+        """
+        request_message = GetMetricHistory(run_uuid=run_id, run_id=run_id, metric_key=key)
+        if since is not None:
+            request_message.since_step, request_message.since_timestamp = since
+        response_proto = await self._call_endpoint(GetMetricHistory, request_message)
+        return [Metric.from_proto(metric) for metric in response_proto.metrics]
+
+    async def create_run(self, experiment_id, start_time=None, tags=None):
+        """
+        Create a :py:class:`mlflow.entities.Run` object. See
+        :py:meth:`mlflow.tracking.MlflowClient.create_run`.
+
+        :param experiment_id: The string ID of the experiment to create a run in.
+        :param start_time: If not provided, use the current timestamp.
+        :param tags: A dictionary of key-value pairs that are converted into
+                     :py:class:`mlflow.entities.RunTag` objects.
+        :return: :py:class:`mlflow.entities.Run` that was created.
+        """
+        tags = tags if tags else {}
+        request_message = CreateRun(
+            experiment_id=str(experiment_id),
+            user_id=tags.get(MLFLOW_USER, "unknown"),
+            start_time=start_time or int(time.time() * 1000),
+            tags=[RunTag(key, value).to_proto() for key, value in tags.items()],
+        )
+        response_proto = await self._call_endpoint(CreateRun, request_message)
+        return Run.from_proto(response_proto.run)
+
+    async def create_runs(self, experiment_id, runs_data, start_time=None, tags=None):
+        """
+        Create multiple :py:class:`mlflow.entities.Run` objects in a single request. See
+        :py:meth:`mlflow.tracking.MlflowClient.create_runs`.
+
+        :param experiment_id: The string ID of the experiment to create the runs in.
+        :param runs_data: List of :py:class:`mlflow.entities.RunData` objects, one per run to
+                          create, holding the initial metrics, params, and tags of the run.
+        :param start_time: If not provided, use the current timestamp.
+        :param tags: A dictionary of key-value pairs set as tags on every created run, in addition
+                     to the tags of each :py:class:`mlflow.entities.RunData`.
+        :return: List of :py:class:`mlflow.entities.Run` that were created, in the same order as
+                 ``runs_data``.
+        """
+        tags = tags if tags else {}
+        runs_data_protos = []
+        for run_data in runs_data:
+            run_data_proto = run_data.to_proto()
+            for key, value in tags.items():
+                if key not in run_data.tags:
+                    run_data_proto.tags.add(key=key, value=value)
+            runs_data_protos.append(run_data_proto)
+        request_message = CreateRuns(
+            experiment_id=str(experiment_id),
+            user_id=tags.get(MLFLOW_USER, "unknown"),
+            start_time=start_time or int(time.time() * 1000),
+            runs_data=runs_data_protos,
+        )
+        response_proto = await self._call_endpoint(CreateRuns, request_message)
+        return [Run.from_proto(run) for run in response_proto.runs]
+
+    async def list_experiments(self, view_type=None):
+        """
+        :return: List of :py:class:`mlflow.entities.Experiment`
+        """
+        view_type = ViewType.ACTIVE_ONLY if view_type is None else view_type
+        response_proto = await self._call_endpoint(
+            ListExperiments, ListExperiments(view_type=view_type)
+        )
+        return [Experiment.from_proto(experiment) for experiment in response_proto.experiments]
+
+    async def get_experiment(self, experiment_id):
+        """
+        Retrieve an experiment by experiment_id from the backend store
+
+        :param experiment_id: The experiment ID returned from ``create_experiment``.
+        :return: :py:class:`mlflow.entities.Experiment`
+        """
+        response_proto = await self._call_endpoint(
+            GetExperiment, GetExperiment(experiment_id=str(experiment_id))
+        )
+        return Experiment.from_proto(response_proto.experiment)
+
+    async def get_experiment_by_name(self, name):
+        """
+        Retrieve an experiment by experiment name from the backend store
+
+        :param name: The experiment name.
+        :return: :py:class:`mlflow.entities.Experiment` if it exists, otherwise None.
+        """
+        try:
+            response_proto = await self._call_endpoint(
+                GetExperimentByName, GetExperimentByName(experiment_name=name)
+            )
+        except MlflowException as e:
+            if e.error_code == databricks_pb2.ErrorCode.Name(
+                databricks_pb2.RESOURCE_DOES_NOT_EXIST
+            ):
+                return None
+            raise
+        return Experiment.from_proto(response_proto.experiment)
+
+    async def create_experiment(self, name, artifact_location=None):
+        """Create an experiment.
+
+        :param name: The experiment name. Must be unique.
+        :param artifact_location: The location to store run artifacts.
+                                  If not provided, the server picks an appropriate default.
+        :return: Integer ID of the created experiment.
+        """
+        _validate_experiment_name(name)
+        _validate_experiment_artifact_location(artifact_location)
+        response_proto = await self._call_endpoint(
+            CreateExperiment, CreateExperiment(name=name, artifact_location=artifact_location)
+        )
+        return response_proto.experiment_id
+
+    async def delete_experiment(self, experiment_id):
+        """
+        Delete an experiment from the backend store.
+
+        :param experiment_id: The experiment ID returned from ``create_experiment``.
+        """
+        await self._call_endpoint(
+            DeleteExperiment, DeleteExperiment(experiment_id=str(experiment_id))
+        )
+
+    async def restore_experiment(self, experiment_id):
+        """
+        Restore a deleted experiment unless permanently deleted.
+
+        :param experiment_id: The experiment ID returned from ``create_experiment``.
+        """
+        await self._call_endpoint(
+            RestoreExperiment, RestoreExperiment(experiment_id=str(experiment_id))
+        )
+
+    async def rename_experiment(self, experiment_id, new_name):
+        """
+        Update an experiment's name. The new name must be unique.
+
+        :param experiment_id: The experiment ID returned from ``create_experiment``.
+        """
+        await self._call_endpoint(
+            UpdateExperiment, UpdateExperiment(experiment_id=str(experiment_id), new_name=new_name)
+        )
+
+    async def log_metric(self, run_id, key, value, timestamp=None, step=None):
+        """
+        Log a metric against the run ID.
+
+        :param run_id: The run id to which the metric should be logged.
+        :param key: Metric name.
+        :param value: Metric value (float).
+        :param timestamp: Time when this metric was calculated. Defaults to the current system
+                          time.
+        :param step: Integer training step (iteration) at which was the metric calculated.
+                     Defaults to 0.
+        """
+        timestamp = timestamp if timestamp is not None else int(time.time() * 1000)
+        step = step if step is not None else 0
+        _validate_metric(key, value, timestamp, step)
+        request_message = LogMetric(
+            run_uuid=run_id, run_id=run_id, key=key, value=value, timestamp=timestamp, step=step
+        )
+        await self._call_endpoint(LogMetric, request_message)
+
+    async def log_param(self, run_id, key, value):
+        """
+        Log a parameter against the run ID. Value is converted to a string.
+        """
+        _validate_param_name(key)
+        request_message = LogParam(run_uuid=run_id, run_id=run_id, key=key, value=str(value))
+        await self._call_endpoint(LogParam, request_message)
+
+    async def set_experiment_tag(self, experiment_id, key, value):
+        """
+        Set a tag on the experiment with the specified ID. Value is converted to a string.
+
+        :param experiment_id: String ID of the experiment.
+        :param key: Name of the tag.
+        :param value: Tag value (converted to a string).
+        """
+        _validate_tag_name(key)
+        request_message = SetExperimentTag(
+            experiment_id=str(experiment_id), key=key, value=str(value)
+        )
+        await self._call_endpoint(SetExperimentTag, request_message)
+
+    async def set_tag(self, run_id, key, value):
+        """
+        Set a tag on the run with the specified ID. Value is converted to a string.
+
+        :param run_id: String ID of the run.
+        :param key: Name of the tag.
+        :param value: Tag value (converted to a string)
+        """
+        _validate_tag_name(key)
+        request_message = SetTag(run_uuid=run_id, run_id=run_id, key=key, value=str(value))
+        await self._call_endpoint(SetTag, request_message)
+
+    async def delete_tag(self, run_id, key):
+        """
+        Delete a tag from a run. This is irreversible.
+
+        :param run_id: String ID of the run
+        :param key: Name of the tag
+        """
+        await self._call_endpoint(DeleteTag, DeleteTag(run_id=run_id, key=key))
+
+    async def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Log multiple metrics, params, and/or tags.
+
+        :param run_id: String ID of the run
+        :param metrics: If provided, List of Metric(key, value, timestamp) instances.
+        :param params: If provided, List of Param(key, value) instances.
+        :param tags: If provided, List of RunTag(key, value) instances.
+
+        Raises an MlflowException if any errors occur.
+        :return: None
+        """
+        if len(metrics) == 0 and len(params) == 0 and len(tags) == 0:
+            return
+        for metric in metrics:
+            _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+        for param in params:
+            _validate_param_name(param.key)
+        for tag in tags:
+            _validate_tag_name(tag.key)
+        request_message = LogBatch(
+            run_id=run_id,
+            metrics=[metric.to_proto() for metric in metrics],
+            params=[param.to_proto() for param in params],
+            tags=[tag.to_proto() for tag in tags],
+        )
+        await self._call_endpoint(LogBatch, request_message)
+
+    async def set_terminated(self, run_id, status=None, end_time=None):
+        """Set a run's status to terminated.
+
+        :param status: A string value of :py:class:`mlflow.entities.RunStatus`.
+                       Defaults to "FINISHED".
+        :param end_time: If not provided, defaults to the current time.
+        :return: :py:class:`mlflow.entities.RunInfo` describing the updated run.
+        """
+        end_time = end_time if end_time else int(time.time() * 1000)
+        status = status if status else RunStatus.to_string(RunStatus.FINISHED)
+        request_message = UpdateRun(
+            run_uuid=run_id, run_id=run_id, status=RunStatus.from_string(status), end_time=end_time,
+        )
+        response_proto = await self._call_endpoint(UpdateRun, request_message)
+        return RunInfo.from_proto(response_proto.run_info)
+
+    async def set_terminated_runs(self, run_ids, status=None, end_time=None):
+        """Set the status of multiple runs to terminated in a single request.
+
+        :param run_ids: List of string IDs of the runs to terminate.
+        :param status: A string value of :py:class:`mlflow.entities.RunStatus`.
+                       Defaults to "FINISHED".
+        :param end_time: If not provided, defaults to the current time.
+        :return: List of :py:class:`mlflow.entities.RunInfo` describing the updated runs.
+        """
+        end_time = end_time if end_time else int(time.time() * 1000)
+        status = status if status else RunStatus.to_string(RunStatus.FINISHED)
+        request_message = TerminateRuns(
+            run_ids=run_ids, status=RunStatus.from_string(status), end_time=end_time
+        )
+        response_proto = await self._call_endpoint(TerminateRuns, request_message)
+        return [RunInfo.from_proto(run_info) for run_info in response_proto.run_infos]
+
+    async def delete_run(self, run_id):
+        """
+        Deletes a run with the given ID.
+        """
+        await self._call_endpoint(DeleteRun, DeleteRun(run_id=run_id))
+
+    async def delete_runs(self, run_ids):
+        """
+        Deletes the runs with the given IDs in a single request.
+        """
+        await self._call_endpoint(DeleteRuns, DeleteRuns(run_ids=run_ids))
+
+    async def restore_run(self, run_id):
+        """
+        Restores a deleted run with the given ID.
+        """
+        await self._call_endpoint(RestoreRun, RestoreRun(run_id=run_id))
+
+    async def search_runs(
+        self,
+        experiment_ids,
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search experiments that fit the search criteria. See
+        :py:meth:`mlflow.tracking.MlflowClient.search_runs`.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string id.
+        :param filter_string: Filter query string, defaults to searching all runs.
+        :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+                              defined in :py:class:`mlflow.entities.ViewType`.
+        :param max_results: Maximum number of runs desired.
+        :param order_by: List of columns to order by (e.g., "metrics.rmse").
+        :param page_token: Token specifying the next page of results. It should be obtained from
+            a ``search_runs`` call.
+
+        :return: A :py:class:`PagedList <mlflow.store.entities.PagedList>` of
+            :py:class:`mlflow.entities.Run` objects that satisfy the search expressions. The token
+            for the next page may be obtained via the ``token`` attribute of the returned object.
+        """
+        if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
+            experiment_ids = [experiment_ids]
+        request_message = SearchRuns(
+            experiment_ids=[str(experiment_id) for experiment_id in experiment_ids],
+            filter=filter_string,
+            run_view_type=ViewType.to_proto(run_view_type),
+            max_results=max_results,
+            order_by=order_by,
+            page_token=page_token,
+        )
+        response_proto = await self._call_endpoint(SearchRuns, request_message)
+        runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
+        # If next_page_token is not set, we will see it as "". We need to convert this to None.
+        next_page_token = None
+        if response_proto.next_page_token:
+            next_page_token = response_proto.next_page_token
+        return PagedList(runs, next_page_token)
+
+    # Registry API
+
+    async def create_registered_model(self, name, tags=None, description=None):
+        """
+        Create a new registered model in backend store.
+
+        :param name: Name of the new model. This is expected to be unique in the backend store.
+        :param tags: A dictionary of key-value pairs that are converted into
+                     :py:class:`mlflow.entities.model_registry.RegisteredModelTag` objects.
+        :param description: Description of the model.
+        :return: A single object of :py:class:`mlflow.entities.model_registry.RegisteredModel`
+                 created by backend.
+        """
+        request_message = CreateRegisteredModel(
+            name=name,
+            tags=[
+                RegisteredModelTag(key, str(value)).to_proto()
+                for key, value in (tags or {}).items()
+            ],
+            description=description,
+        )
+        response_proto = await self._call_registry_endpoint(CreateRegisteredModel, request_message)
+        return RegisteredModel.from_proto(response_proto.registered_model)
+
+    async def rename_registered_model(self, name, new_name):
+        """
+        Update registered model name.
+
+        :param name: Name of the registered model to update.
+        :param new_name: New proposed name for the registered model.
+
+        :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        response_proto = await self._call_registry_endpoint(
+            RenameRegisteredModel, RenameRegisteredModel(name=name, new_name=new_name)
+        )
+        return RegisteredModel.from_proto(response_proto.registered_model)
+
+    async def update_registered_model(self, name, description=None):
+        """
+        Updates metadata for RegisteredModel entity.
+
+        :param name: Name of the registered model to update.
+        :param description: (Optional) New description.
+        :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        response_proto = await self._call_registry_endpoint(
+            UpdateRegisteredModel, UpdateRegisteredModel(name=name, description=description)
+        )
+        return RegisteredModel.from_proto(response_proto.registered_model)
+
+    async def delete_registered_model(self, name):
+        """
+        Delete registered model.
+        Backend raises exception if a registered model with given name does not exist.
+
+        :param name: Name of the registered model to update.
+        """
+        await self._call_registry_endpoint(DeleteRegisteredModel, DeleteRegisteredModel(name=name))
+
+    async def list_registered_models(
+        self, max_results=SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT, page_token=None
+    ):
+        """
+        List of all registered models
+
+        :param max_results: Maximum number of registered models desired.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``list_registered_models`` call.
+        :return: A PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects
+                 that can satisfy the search expressions. The pagination token for the next page
+                 can be obtained via the ``token`` attribute of the object.
+        """
+        response_proto = await self._call_registry_endpoint(
+            ListRegisteredModels,
+            ListRegisteredModels(page_token=page_token, max_results=max_results),
+        )
+        return PagedList(
+            [
+                RegisteredModel.from_proto(registered_model)
+                for registered_model in response_proto.registered_models
+            ],
+            response_proto.next_page_token,
+        )
+
+    async def search_registered_models(
+        self,
+        filter_string=None,
+        max_results=SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search for registered models in backend that satisfy the filter criteria.
+
+        :param filter_string: Filter query string, defaults to searching all registered
+                models. Currently, it supports only a single filter condition as the name
+                of the model, for example, ``name = 'model_name'`` or a search expression
+                to match a pattern in the registered model name.
+                For example, ``name LIKE 'Boston%'`` (case sensitive) or
+                ``name ILIKE '%boston%'`` (case insensitive).
+        :param max_results: Maximum number of registered models desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_registered_models`` call.
+        :return: A PagedList of :py:class:`mlflow.entities.model_registry.RegisteredModel` objects
+                that satisfy the search expressions. The pagination token for the next page can be
+                obtained via the ``token`` attribute of the object.
+        """
+        request_message = SearchRegisteredModels(
+            filter=filter_string, max_results=max_results, order_by=order_by, page_token=page_token
+        )
+        response_proto = await self._call_registry_endpoint(SearchRegisteredModels, request_message)
+        return PagedList(
+            [
+                RegisteredModel.from_proto(registered_model)
+                for registered_model in response_proto.registered_models
+            ],
+            response_proto.next_page_token,
+        )
+
+    async def get_registered_model(self, name):
+        """
+        :param name: Name of the registered model to get.
+        :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
+        """
+        response_proto = await self._call_registry_endpoint(
+            GetRegisteredModel, GetRegisteredModel(name=name)
+        )
+        return RegisteredModel.from_proto(response_proto.registered_model)
+
+    async def get_latest_versions(self, name, stages=None):
+        """
+        Latest version models for each requests stage. If no ``stages`` provided, returns the
+        latest version for each stage.
+
+        :param name: Name of the registered model to get the latest versions of.
+        :param stages: List of desired stages. If input list is None, return latest versions for
+                       for ALL_STAGES.
+        :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+        """
+        response_proto = await self._call_registry_endpoint(
+            GetLatestVersions, GetLatestVersions(name=name, stages=stages)
+        )
+        return [
+            ModelVersion.from_proto(model_version)
+            for model_version in response_proto.model_versions
+        ]
+
+    async def set_registered_model_tag(self, name, key, value):
+        """
+        Set a tag for the registered model.
+
+        :param name: Registered model name.
+        :param key: Tag key to log.
+        :param value: Tag value log.
+        :return: None
+        """
+        _validate_tag_name(key)
+        await self._call_registry_endpoint(
+            SetRegisteredModelTag, SetRegisteredModelTag(name=name, key=key, value=str(value))
+        )
+
+    async def delete_registered_model_tag(self, name, key):
+        """
+        Delete a tag associated with the registered model.
+
+        :param name: Registered model name.
+        :param key: Registered model tag key.
+        :return: None
+        """
+        await self._call_registry_endpoint(
+            DeleteRegisteredModelTag, DeleteRegisteredModelTag(name=name, key=key)
+        )
+
+    async def create_model_version(
+        self, name, source, run_id=None, tags=None, run_link=None, description=None
+    ):
+        """
+        Create a new model version from given source (artifact URI).
+
+        :param name: Name for the containing registered model.
+        :param source: Source path where the MLflow model is stored.
+        :param run_id: Run ID from MLflow tracking server that generated the model
+        :param tags: A dictionary of key-value pairs that are converted into
+                     :py:class:`mlflow.entities.model_registry.ModelVersionTag` objects.
+        :param run_link: Link to the run from an MLflow tracking server that generated this model.
+        :param description: Description of the version.
+        :return: Single :py:class:`mlflow.entities.model_registry.ModelVersion` object created by
+                 backend.
+        """
+        request_message = CreateModelVersion(
+            name=name,
+            source=source,
+            run_id=run_id,
+            run_link=run_link,
+            tags=[
+                ModelVersionTag(key, str(value)).to_proto() for key, value in (tags or {}).items()
+            ],
+            description=description,
+        )
+        response_proto = await self._call_registry_endpoint(CreateModelVersion, request_message)
+        return ModelVersion.from_proto(response_proto.model_version)
+
+    async def update_model_version(self, name, version, description=None):
+        """
+        Update metadata associated with a model version in backend.
+
+        :param name: Name of the containing registered model.
+        :param version: Version number of the model version.
+        :param description: New description.
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        request_message = UpdateModelVersion(
+            name=name, version=str(version), description=description
+        )
+        response_proto = await self._call_registry_endpoint(UpdateModelVersion, request_message)
+        return ModelVersion.from_proto(response_proto.model_version)
+
+    async def transition_model_version_stage(
+        self, name, version, stage, archive_existing_versions=False
+    ):
+        """
+        Update model version stage.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param stage: New desired stage for this model version.
+        :param archive_existing_versions: If this flag is set to ``True``, all existing model
+            versions in the stage will be automically moved to the "archived" stage. Only valid
+            when ``stage`` is ``"staging"`` or ``"production"`` otherwise an error will be raised.
+
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        request_message = TransitionModelVersionStage(
+            name=name,
+            version=str(version),
+            stage=stage,
+            archive_existing_versions=archive_existing_versions,
+        )
+        response_proto = await self._call_registry_endpoint(
+            TransitionModelVersionStage, request_message
+        )
+        return ModelVersion.from_proto(response_proto.model_version)
+
+    async def delete_model_version(self, name, version):
+        """
+        Delete model version in backend.
+
+        :param name: Name of the containing registered model.
+        :param version: Version number of the model version.
+        """
+        await self._call_registry_endpoint(
+            DeleteModelVersion, DeleteModelVersion(name=name, version=str(version))
+        )
+
+    async def get_model_version(self, name, version):
+        """
+        :param name: Name of the containing registered model.
+        :param version: Version number as an integer of the model version.
+        :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
+        """
+        response_proto = await self._call_registry_endpoint(
+            GetModelVersion, GetModelVersion(name=name, version=str(version))
+        )
+        return ModelVersion.from_proto(response_proto.model_version)
+
+    async def get_model_version_download_uri(self, name, version):
+        """
+        Get the download location in Model Registry for this model version.
+
+        :param name: Name of the containing registered model.
+        :param version: Version number as an integer of the model version.
+        :return: A single URI location that allows reads for downloading.
+        """
+        response_proto = await self._call_registry_endpoint(
+            GetModelVersionDownloadUri, GetModelVersionDownloadUri(name=name, version=str(version))
+        )
+        return response_proto.artifact_uri
+
+    async def search_model_versions(self, filter_string):
+        """
+        Search for model versions in backend that satisfy the filter criteria.
+
+        :param filter_string: A filter string expression. Currently supports a single filter
+                              condition either name of model like ``name = 'model_name'`` or
+                              ``run_id = '...'``.
+        :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+        """
+        response_proto = await self._call_registry_endpoint(
+            SearchModelVersions, SearchModelVersions(filter=filter_string)
+        )
+        return PagedList(
+            [ModelVersion.from_proto(mvd) for mvd in response_proto.model_versions],
+            response_proto.next_page_token,
+        )
+
+    async def set_model_version_tag(self, name, version, key, value):
+        """
+        Set a tag for the model version.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param key: Tag key to log.
+        :param value: Tag value to log.
+        :return: None
+        """
+        _validate_tag_name(key)
+        request_message = SetModelVersionTag(
+            name=name, version=str(version), key=key, value=str(value)
+        )
+        await self._call_registry_endpoint(SetModelVersionTag, request_message)
+
+    async def delete_model_version_tag(self, name, version, key):
+        """
+        Delete a tag associated with the model version.
+
+        :param name: Registered model name.
+        :param version: Registered model version.
+        :param key: Tag key.
+        :return: None
+        """
+        await self._call_registry_endpoint(
+            DeleteModelVersionTag, DeleteModelVersionTag(name=name, version=str(version), key=key)
+        )
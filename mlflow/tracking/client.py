@@ -17,7 +17,7 @@ from mlflow.entities.model_registry.model_version_stages import ALL_STAGES
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import FEATURE_DISABLED
 from mlflow.store.model_registry import SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT
-from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import EXPORT_MAX_RESULTS_THRESHOLD, SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._model_registry.client import ModelRegistryClient
 from mlflow.tracking._model_registry import utils as registry_utils
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
@@ -141,12 +141,16 @@ class MlflowClient(object):
         """
         return self._tracking_client.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_metric_history(self, run_id, key, since=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param since: Optional ``(step, timestamp)`` cursor, typically of the last value returned
+                      by an earlier call. If specified, only the values whose step and timestamp
+                      are greater than the cursor are returned, sorted by step and timestamp, so
+                      that following an active run does not fetch its full history repeatedly.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
 
@@ -206,7 +210,7 @@ class MlflowClient(object):
             timestamp: 1603423788610
             --
         """
-        return self._tracking_client.get_metric_history(run_id, key)
+        return self._tracking_client.get_metric_history(run_id, key, since=since)
 
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
@@ -251,6 +255,60 @@ class MlflowClient(object):
         """
         return self._tracking_client.create_run(experiment_id, start_time, tags)
 
+    @experimental
+    def create_runs(self, experiment_id, runs_data, start_time=None, tags=None):
+        """
+        Create multiple :py:class:`mlflow.entities.Run` objects in a single request, each
+        initialized with its own metrics, params, and tags. This is equivalent to calling
+        :py:meth:`create_run` followed by :py:meth:`log_batch` for every run, but creates all
+        runs at once.
+
+        :param experiment_id: The string ID of the experiment to create the runs in.
+        :param runs_data: List of :py:class:`mlflow.entities.RunData` objects, one per run to
+                          create, holding the initial metrics, params, and tags of the run.
+        :param start_time: If not provided, use the current timestamp.
+        :param tags: A dictionary of key-value pairs set as tags on every created run, in addition
+                     to the tags of each :py:class:`mlflow.entities.RunData`.
+        :return: List of :py:class:`mlflow.entities.Run` that were created, in the same order as
+                 ``runs_data``.
+
+        .. code-block:: python
+            :caption: Example
+
+            import time
+
+            from mlflow.tracking import MlflowClient
+            from mlflow.entities import Metric, Param, RunData
+
+            # Create two runs with their own params and metrics under the default experiment
+            # (whose id is '0'), sharing a common tag.
+            timestamp = int(time.time() * 1000)
+            runs_data = [
+                RunData(metrics=[Metric("m", 0.5, timestamp, 0)], params=[Param("p", "a")]),
+                RunData(metrics=[Metric("m", 0.7, timestamp, 0)], params=[Param("p", "b")]),
+            ]
+            client = MlflowClient()
+            runs = client.create_runs("0", runs_data, tags={"engineering": "ML Platform"})
+            for run in runs:
+                print("Run id: {}".format(run.info.run_id))
+                print("params: {}".format(run.data.params))
+                print("metrics: {}".format(run.data.metrics))
+                print("tags: {}".format(run.data.tags))
+
+        .. code-block:: text
+            :caption: Output
+
+            Run id: 6d7bb5a1a8504d2ab9a5a6ff1d7e1a26
+            params: {'p': 'a'}
+            metrics: {'m': 0.5}
+            tags: {'engineering': 'ML Platform'}
+            Run id: 0a0f8b6df6c5444e8e4a1d6f2c1c3ab0
+            params: {'p': 'b'}
+            metrics: {'m': 0.7}
+            tags: {'engineering': 'ML Platform'}
+        """
+        return self._tracking_client.create_runs(experiment_id, runs_data, start_time, tags)
+
     def list_run_infos(
         self,
         experiment_id,
@@ -1228,13 +1286,17 @@ class MlflowClient(object):
         """
         self._tracking_client._record_logged_model(run_id, mlflow_model)
 
-    def list_artifacts(self, run_id, path=None):
+    def list_artifacts(self, run_id, path=None, recursive=False):
         """
         List the artifacts for a run.
 
         :param run_id: The run to list artifacts from.
         :param path: The run's relative artifact path to list from. By default it is set to None
                      or the root artifact path.
+        :param recursive: If True, list the files at any depth under the path instead of its
+                          direct children, along with the directories that contain no file.
+                          Artifacts stored in S3, Azure Blob Storage or Google Cloud Storage are
+                          listed with a single prefix listing.
         :return: List of :py:class:`mlflow.entities.FileInfo`
 
         .. code-block:: python
@@ -1277,7 +1339,7 @@ class MlflowClient(object):
             is_dir: False
             size: 5
         """
-        return self._tracking_client.list_artifacts(run_id, path)
+        return self._tracking_client.list_artifacts(run_id, path, recursive)
 
     def download_artifacts(self, run_id, path, dst_path=None):
         """
@@ -1368,6 +1430,36 @@ class MlflowClient(object):
         """
         self._tracking_client.set_terminated(run_id, status, end_time)
 
+    @experimental
+    def set_terminated_runs(self, run_ids, status=None, end_time=None):
+        """Set the status of multiple runs to terminated in a single request.
+
+        :param run_ids: List of string IDs of the runs to terminate.
+        :param status: A string value of :py:class:`mlflow.entities.RunStatus`.
+                       Defaults to "FINISHED".
+        :param end_time: If not provided, defaults to the current time.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow.entities import RunData
+            from mlflow.tracking import MlflowClient
+
+            # Create two runs under the default experiment (whose id is '0') and terminate both
+            client = MlflowClient()
+            runs = client.create_runs("0", [RunData(), RunData()])
+            client.set_terminated_runs([run.info.run_id for run in runs], status="KILLED")
+            for run in runs:
+                print("status: {}".format(client.get_run(run.info.run_id).info.status))
+
+        .. code-block:: text
+            :caption: Output
+
+            status: KILLED
+            status: KILLED
+        """
+        self._tracking_client.set_terminated_runs(run_ids, status, end_time)
+
     def delete_run(self, run_id):
         """Deletes a run with the given ID.
 
@@ -1397,6 +1489,34 @@ class MlflowClient(object):
         """
         self._tracking_client.delete_run(run_id)
 
+    @experimental
+    def delete_runs(self, run_ids):
+        """Deletes the runs with the given IDs in a single request.
+
+        :param run_ids: List of unique run ids to delete.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow.entities import RunData
+            from mlflow.tracking import MlflowClient
+
+            # Create two runs under the default experiment (whose id is '0') and delete both
+            client = MlflowClient()
+            runs = client.create_runs("0", [RunData(), RunData()])
+            client.delete_runs([run.info.run_id for run in runs])
+            for run in runs:
+                del_run = client.get_run(run.info.run_id)
+                print("lifecycle_stage: {}".format(del_run.info.lifecycle_stage))
+
+        .. code-block:: text
+            :caption: Output
+
+            lifecycle_stage: deleted
+            lifecycle_stage: deleted
+        """
+        self._tracking_client.delete_runs(run_ids)
+
     def restore_run(self, run_id):
         """
         Restores a deleted run with the given ID.
@@ -1438,6 +1558,7 @@ class MlflowClient(object):
         max_results=SEARCH_MAX_RESULTS_DEFAULT,
         order_by=None,
         page_token=None,
+        explain=False,
     ):
         """
         Search experiments that fit the search criteria.
@@ -1452,10 +1573,16 @@ class MlflowClient(object):
                      The default ordering is to sort by ``start_time DESC``, then ``run_id``.
         :param page_token: Token specifying the next page of results. It should be obtained from
             a ``search_runs`` call.
+        :param explain: If True, return the SQL query of the search and the plan of the query
+            reported by the ``EXPLAIN`` statement of the database instead of the runs, without
+            executing the search. Supported when tracking to a database, such as
+            ``sqlite:///mlruns.db``, rather than to a file store or a tracking server.
 
         :return: A list of :py:class:`mlflow.entities.Run` objects that satisfy the search
             expressions. If the underlying tracking store supports pagination, the token for
             the next page may be obtained via the ``token`` attribute of the returned object.
+            If ``explain`` is True, a dictionary with the SQL query under ``"sql"`` and the lines
+            of the query plan under ``"plan"``.
 
         .. code-block:: python
             :caption: Example
@@ -1518,7 +1645,64 @@ class MlflowClient(object):
             tags: {'s.release': '1.1.0-RC'}
         """
         return self._tracking_client.search_runs(
-            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token, explain
+        )
+
+    @experimental
+    def export_runs(
+        self,
+        experiment_ids,
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=EXPORT_MAX_RESULTS_THRESHOLD,
+        order_by=None,
+    ):
+        """
+        Search runs that fit the search criteria, and return them as an Apache Arrow table with one
+        row per run, in the order of the search. The table has the columns of the DataFrame
+        returned by :py:func:`mlflow.search_runs`: ``run_id``, ``experiment_id``, ``status``,
+        ``artifact_uri``, ``start_time`` and ``end_time``, then one ``metrics.<key>``,
+        ``params.<key>`` and ``tags.<key>`` column per metric, param and tag, sorted by key.
+        Values missing from a run are null. Requires ``pyarrow``.
+
+        Tracking servers build the table and send it in the Arrow IPC streaming format, which is
+        loaded without copying its columns. Other stores are searched page by page.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string id.
+        :param filter_string: Filter query string, defaults to searching all runs.
+        :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+                              defined in :py:class:`mlflow.entities.ViewType`.
+        :param max_results: Maximum number of runs to export, at most 100,000.
+        :param order_by: List of columns to order by (e.g., "metrics.rmse"). The ``order_by`` column
+                     can contain an optional ``DESC`` or ``ASC`` value. The default is ``ASC``.
+                     The default ordering is to sort by ``start_time DESC``, then ``run_id``.
+
+        :return: A ``pyarrow.Table``, convertible to a pandas DataFrame with ``to_pandas()``.
+
+        .. code-block:: python
+            :caption: Example
+
+            import mlflow
+            from mlflow.tracking import MlflowClient
+
+            experiment_id = mlflow.create_experiment("Social NLP Experiments")
+            with mlflow.start_run(experiment_id=experiment_id):
+                mlflow.log_metric("m", 1.55)
+            with mlflow.start_run(experiment_id=experiment_id):
+                mlflow.log_metric("m", 2.50)
+
+            table = MlflowClient().export_runs(experiment_id, order_by=["metrics.m DESC"])
+            print(table.to_pandas()[["metrics.m", "run_id"]])
+
+        .. code-block:: text
+            :caption: Output
+
+               metrics.m                            run_id
+            0       2.50  147eed886ab44633902cc8e19b2267e2
+            1       1.55  5cc7feaf532f496f885ad7750809c4d4
+        """
+        return self._tracking_client.export_runs(
+            experiment_ids, filter_string, run_view_type, max_results, order_by
         )
 
     # Registry API
@@ -0,0 +1,195 @@
+"""
+Conversion of runs to Apache Arrow tables, one row per run with the columns of
+:py:func:`mlflow.search_runs`, and their serialization in the Arrow IPC streaming format or as
+Parquet files. Requires ``pyarrow``.
+"""
+import io
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+ARROW_STREAM_FORMAT = "arrow"
+PARQUET_FORMAT = "parquet"
+EXPORT_FORMATS = [ARROW_STREAM_FORMAT, PARQUET_FORMAT]
+
+_MIME_TYPES = {
+    ARROW_STREAM_FORMAT: "application/vnd.apache.arrow.stream",
+    PARQUET_FORMAT: "application/vnd.apache.parquet",
+}
+
+
+_INFO_COLUMNS = ["run_id", "experiment_id", "status", "artifact_uri", "start_time", "end_time"]
+_DATA_COLUMNS = ["metrics", "params", "tags"]
+
+
+def get_data_keys(runs, data_keys=None):
+    """
+    Collect the keys of the metrics, params and tags of runs.
+
+    :param runs: List of :py:class:`mlflow.entities.Run`.
+    :param data_keys: Keys collected from other runs by an earlier call, updated in place.
+
+    :return: A tuple of the sets of metric, param and tag keys.
+    """
+    data_keys = data_keys or (set(), set(), set())
+    for run in runs:
+        for keys, prefix in zip(data_keys, _DATA_COLUMNS):
+            keys.update(getattr(run.data, prefix))
+    return data_keys
+
+
+def get_runs_schema(data_keys):
+    """
+    :param data_keys: Tuple of the metric, param and tag keys returned by
+                      :py:func:`get_data_keys`.
+
+    :return: The ``pyarrow.Schema`` with the ``run_id``, ``experiment_id``, ``status``,
+             ``artifact_uri``, ``start_time`` and ``end_time`` columns, followed by one
+             ``metrics.<key>``, ``params.<key>`` and ``tags.<key>`` column per key, sorted by key.
+    """
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("ms", tz="UTC")
+    fields = [
+        pa.field(name, timestamp if name.endswith("_time") else pa.string())
+        for name in _INFO_COLUMNS
+    ]
+    for keys, prefix, field_type in zip(
+        data_keys, _DATA_COLUMNS, [pa.float64(), pa.string(), pa.string()]
+    ):
+        fields.extend(pa.field("{}.{}".format(prefix, key), field_type) for key in sorted(keys))
+    return pa.schema(fields)
+
+
+def runs_to_arrow_table(runs, schema=None):
+    """
+    Pivot runs into an Arrow table with one row per run and the columns described in
+    :py:func:`get_runs_schema`. Values missing from a run are null.
+
+    :param runs: List of :py:class:`mlflow.entities.Run`.
+    :param schema: Schema of the table, e.g. shared by the tables of successive pages of runs. The
+                   metrics, params and tags without a column in the schema are omitted. If
+                   unspecified, the table has a column per metric, param and tag of any of the
+                   runs.
+
+    :return: A ``pyarrow.Table``.
+    """
+    import pyarrow as pa
+
+    schema = schema or get_runs_schema(get_data_keys(runs))
+    arrays = []
+    for field in schema:
+        prefix, _, key = field.name.partition(".")
+        if key:
+            values = [getattr(run.data, prefix).get(key) for run in runs]
+        else:
+            values = [getattr(run.info, field.name) for run in runs]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def validate_export_format(export_format):
+    if export_format not in EXPORT_FORMATS:
+        raise MlflowException(
+            "Invalid export format '{}'. Supported formats are {}.".format(
+                export_format, EXPORT_FORMATS
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
+def get_mime_type(export_format):
+    validate_export_format(export_format)
+    return _MIME_TYPES[export_format]
+
+
+def serialize_table(table, export_format=ARROW_STREAM_FORMAT):
+    """
+    :param table: A ``pyarrow.Table``.
+    :param export_format: ``"arrow"`` for the Arrow IPC streaming format, or ``"parquet"``.
+
+    :return: The serialized table, as ``bytes``.
+    """
+    return b"".join(serialize_tables(table.schema, [table], export_format))
+
+
+def serialize_tables(schema, tables, export_format=ARROW_STREAM_FORMAT):
+    """
+    Serialize tables sharing the same schema as a single table, one at a time, e.g. to stream a
+    table too large to hold in memory as an HTTP response. Each table is written as record batches
+    of an Arrow IPC stream, or as a row group of a Parquet file.
+
+    :param schema: The ``pyarrow.Schema`` of the tables.
+    :param tables: Iterable of ``pyarrow.Table``.
+    :param export_format: ``"arrow"`` for the Arrow IPC streaming format, or ``"parquet"``.
+
+    :return: A generator of the serialized chunks, as ``bytes``, yielding the chunk of each table
+             before consuming the next one.
+    """
+    import pyarrow as pa
+
+    validate_export_format(export_format)
+    sink = _ChunkSink()
+    if export_format == PARQUET_FORMAT:
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+    for table in tables:
+        writer.write_table(table)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+    writer.close()
+    yield sink.drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Writable file object buffering the data written to it until it is drained.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        """
+        :return: The data written since the last call, as ``bytes``.
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def deserialize_table(data, export_format=ARROW_STREAM_FORMAT):
+    """
+    :param data: A table serialized by :py:func:`serialize_table`, as ``bytes``. The columns of
+                 the returned table reference its memory rather than copying it.
+    :param export_format: Format of ``data``, ``"arrow"`` or ``"parquet"``.
+
+    :return: A ``pyarrow.Table``.
+    """
+    import pyarrow as pa
+
+    validate_export_format(export_format)
+    buffer = pa.py_buffer(data)
+    if export_format == PARQUET_FORMAT:
+        import pyarrow.parquet as pq
+
+        return pq.read_table(pa.BufferReader(buffer))
+    return pa.ipc.open_stream(buffer).read_all()
@@ -1,6 +1,7 @@
 import codecs
 import errno
 import gzip
+import hashlib
 import os
 import posixpath
 import requests
@@ -8,6 +9,8 @@ import shutil
 import sys
 import tarfile
 import tempfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import urllib.parse
 import urllib.request
@@ -22,10 +25,26 @@ except ImportError:
     from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
 
 from mlflow.entities import FileInfo
-from mlflow.exceptions import MissingConfigException
+from mlflow.exceptions import MissingConfigException, MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.transfer_journal import TransferJournal
 
 ENCODING = "utf-8"
 
+# Size of the chunks read from the responses of ranged requests, by each thread of a download.
+_PART_READ_CHUNK_SIZE = 1024 * 1024
+
+MultipartDownloadSettings = namedtuple(
+    "MultipartDownloadSettings", ["minimum_file_size", "part_size", "max_workers"]
+)
+MultipartDownloadSettings.__doc__ = """
+Settings of the ranged downloads of large files in parts, see :py:func:`download_file_in_parts`.
+
+:param minimum_file_size: Size in bytes from which files are downloaded in parts.
+:param part_size: Size in bytes of the parts.
+:param max_workers: Number of threads downloading the parts of a file concurrently.
+"""
+
 
 def is_directory(name):
     return os.path.isdir(name)
@@ -265,6 +284,73 @@ def mv(target, new_parent):
     shutil.move(target, new_parent)
 
 
+# Ways of copying files with :py:func:`copy_file`
+COPY_FILE_LINK_MODES = ["copy", "reflink", "hardlink"]
+# Linux ioctl cloning a file, from linux/fs.h
+_FICLONE = 0x40049409
+
+
+def copy_file(src, dst, link_mode="copy"):
+    """
+    Copy the file ``src`` to ``dst``, replacing any existing file, or link it without copying its
+    contents:
+
+    - ``"copy"`` copies the contents of the file.
+    - ``"reflink"`` clones the file with copy-on-write where the filesystem supports it, e.g.
+      Btrfs, XFS or APFS, and copies it otherwise.
+    - ``"hardlink"`` hard-links the file where both paths are on the same filesystem, and clones
+      or copies it like ``"reflink"`` otherwise. The contents of hard-linked files are shared:
+      modifying either file in place modifies the other.
+
+    :param src: Path of the file to copy.
+    :param dst: Path of the copy.
+    :param link_mode: One of :py:data:`COPY_FILE_LINK_MODES`.
+
+    :return: The way the file was copied: ``"copy"``, ``"reflink"`` or ``"hardlink"``.
+    """
+    if link_mode not in COPY_FILE_LINK_MODES:
+        raise MlflowException(
+            "Invalid link mode '{}', expected one of {}.".format(link_mode, COPY_FILE_LINK_MODES),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if link_mode != "copy" and os.path.lexists(dst):
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            return link_mode
+        os.remove(dst)
+    if link_mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass  # e.g. across filesystems
+    if link_mode != "copy":
+        try:
+            _reflink(src, dst)
+            return "reflink"
+        except OSError:
+            if os.path.lexists(dst):
+                os.remove(dst)
+    shutil.copyfile(src, dst)
+    return "copy"
+
+
+def _reflink(src, dst):
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    elif sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+    else:
+        raise OSError(errno.EOPNOTSUPP, "Cloning files is not supported on " + sys.platform)
+
+
 def write_to(filename, data):
     with codecs.open(filename, mode="w", encoding=ENCODING) as handle:
         handle.write(data)
@@ -416,18 +502,136 @@ def yield_file_in_chunks(file, chunk_size=100000000):
                 break
 
 
-def download_file_using_http_uri(http_uri, download_path, chunk_size=100000000):
+def download_file_using_http_uri(
+    http_uri, download_path, chunk_size=100000000, multipart_settings=None
+):
     """
     Downloads a file specified using the `http_uri` to a local `download_path`. This function
     uses a `chunk_size` to ensure an OOM error is not raised a large file is downloaded.
+    If `multipart_settings` are given, large files served with byte range support are downloaded
+    in parts with :py:func:`download_file_in_parts`.
 
     Note : This function is meant to download files using presigned urls from various cloud
             providers.
     """
     with requests.get(http_uri, stream=True) as response:
         response.raise_for_status()
-        with open(download_path, "wb") as output_file:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if not chunk:
-                    break
-                output_file.write(chunk)
+        size = int(response.headers.get("Content-Length", -1))
+        if (
+            multipart_settings is None
+            or response.headers.get("Accept-Ranges") != "bytes"
+            or size < multipart_settings.minimum_file_size
+        ):
+            with open(download_path, "wb") as output_file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        break
+                    output_file.write(chunk)
+            return
+
+    def read_range(start, end):
+        # HTTP byte ranges are inclusive of their last byte
+        headers = {"Range": "bytes={}-{}".format(start, end - 1)}
+        with requests.get(http_uri, stream=True, headers=headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise MlflowException(
+                    "Expected a partial response to a ranged request, got status code {}".format(
+                        response.status_code
+                    )
+                )
+            yield from response.iter_content(chunk_size=_PART_READ_CHUNK_SIZE)
+
+    # The query of presigned URLs changes with each signature, unlike the file they refer to
+    etag = response.headers.get("ETag")
+    journal_key = None
+    if etag is not None:
+        journal_key = [urllib.parse.urlsplit(http_uri)._replace(query="").geturl(), etag]
+    download_file_in_parts(
+        download_path,
+        size,
+        read_range,
+        multipart_settings.part_size,
+        multipart_settings.max_workers,
+        journal_key=journal_key,
+    )
+
+
+def download_file_in_parts(
+    download_path, size, read_range, part_size, max_workers, md5=None, journal_key=None, sha256=None
+):
+    """
+    Download a file in parts read concurrently, each written at its offset in the local file,
+    which is preallocated to the full size of the file. The size of each part is verified as it is
+    written, and the MD5 and SHA-256 digests of the file, if known, once all the parts are written.
+
+    :param download_path: Local path of the downloaded file.
+    :param size: Size of the file in bytes.
+    :param read_range: Function called with the offsets ``start`` and ``end`` of a part, returning
+                       an iterable of the ``bytes`` chunks of the range ``[start, end)``.
+    :param part_size: Size of the parts in bytes.
+    :param max_workers: Number of threads reading the parts concurrently.
+    :param md5: Hexadecimal MD5 digest of the file, or ``None`` if unknown.
+    :param journal_key: JSON-serializable list identifying the remote contents of the file, e.g.
+                        its URI and entity tag, or ``None``. If given, the written parts are
+                        recorded in a :py:class:`TransferJournal
+                        <mlflow.utils.transfer_journal.TransferJournal>`, and a download of the
+                        same contents to the same path after a failure only reads the parts
+                        that were not written yet.
+    :param sha256: Hexadecimal SHA-256 digest of the file, or ``None`` if unknown.
+    """
+    journal = None
+    written_parts = set()
+    if journal_key is not None:
+        journal = TransferJournal(
+            "download", os.path.abspath(download_path), size, part_size, md5, journal_key
+        )
+        state, records = journal.load()
+        if state is not None and os.path.isfile(download_path):
+            if os.path.getsize(download_path) == size:
+                written_parts = {record["start"] for record in records}
+    if not written_parts:
+        with open(download_path, "wb") as f:
+            f.truncate(size)
+        if journal is not None:
+            journal.start({"size": size})
+
+    def download_part(start):
+        end = min(start + part_size, size)
+        written = 0
+        with open(download_path, "r+b") as f:
+            f.seek(start)
+            for chunk in read_range(start, end):
+                f.write(chunk)
+                written += len(chunk)
+        if written != end - start:
+            raise MlflowException(
+                "Downloaded {} bytes for the range [{}, {}) of {}, expected {}".format(
+                    written, start, end, download_path, end - start
+                )
+            )
+        if journal is not None:
+            journal.record({"start": start})
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results to raise the first error of the parts
+        starts = [start for start in range(0, size, part_size) if start not in written_parts]
+        list(executor.map(download_part, starts))
+
+    if journal is not None:
+        # All the parts are written, a download failing the verifications below restarts from zero
+        journal.delete()
+    expected_digests = [("MD5", hashlib.md5, md5), ("SHA-256", hashlib.sha256, sha256)]
+    expected_digests = [digest for digest in expected_digests if digest[2] is not None]
+    if expected_digests:
+        digests = [new_digest() for _, new_digest, _ in expected_digests]
+        for chunk in yield_file_in_chunks(download_path, _PART_READ_CHUNK_SIZE):
+            for digest in digests:
+                digest.update(chunk)
+        for (name, _, expected), digest in zip(expected_digests, digests):
+            if digest.hexdigest() != expected:
+                raise MlflowException(
+                    "Downloaded file {} has an {} digest of {}, expected {}".format(
+                        download_path, name, digest.hexdigest(), expected
+                    )
+                )
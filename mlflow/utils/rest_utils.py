@@ -1,7 +1,10 @@
+import asyncio
 import base64
 import time
 import logging
 import json
+import ssl
+from collections import namedtuple
 
 import requests
 
@@ -20,6 +23,24 @@ _logger = logging.getLogger(__name__)
 _DEFAULT_HEADERS = {"User-Agent": "mlflow-python-client/%s" % __version__}
 
 
+def _get_request_headers(host_creds):
+    """
+    :return: The headers to send with every request to the server described by ``host_creds``,
+             including the ``Authorization`` header if credentials are configured.
+    """
+    auth_str = None
+    if host_creds.username and host_creds.password:
+        basic_auth_str = ("%s:%s" % (host_creds.username, host_creds.password)).encode("utf-8")
+        auth_str = "Basic " + base64.standard_b64encode(basic_auth_str).decode("utf-8")
+    elif host_creds.token:
+        auth_str = "Bearer %s" % host_creds.token
+
+    headers = dict(_DEFAULT_HEADERS)
+    if auth_str:
+        headers["Authorization"] = auth_str
+    return headers
+
+
 def http_request(
     host_creds, endpoint, retries=3, retry_interval=3, max_rate_limit_interval=60, **kwargs
 ):
@@ -27,24 +48,16 @@ def http_request(
     Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
     error code (429) will be retried with an exponential back off (1, 2, 4, ... seconds) for at most
     `max_rate_limit_interval` seconds.  Internal errors (500s) will be retried up to `retries` times
-    , waiting `retry_interval` seconds between successive retries. Parses the API response
-    (assumed to be JSON) into a Python object and returns it.
+    , waiting `retry_interval` seconds between successive retries, except for operations that the
+    server does not implement (501). Parses the API response (assumed to be JSON) into a Python
+    object and returns it.
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
     :return: Parsed API response
     """
     hostname = host_creds.host
-    auth_str = None
-    if host_creds.username and host_creds.password:
-        basic_auth_str = ("%s:%s" % (host_creds.username, host_creds.password)).encode("utf-8")
-        auth_str = "Basic " + base64.standard_b64encode(basic_auth_str).decode("utf-8")
-    elif host_creds.token:
-        auth_str = "Bearer %s" % host_creds.token
-
-    headers = dict(_DEFAULT_HEADERS)
-    if auth_str:
-        headers["Authorization"] = auth_str
+    headers = _get_request_headers(host_creds)
 
     if host_creds.server_cert_path is None:
         verify = not host_creds.ignore_tls_verification
@@ -78,7 +91,7 @@ def http_request(
         response = request_with_ratelimit_retries(
             max_rate_limit_interval, url=url, headers=headers, verify=verify, **kwargs
         )
-        if response.status_code >= 200 and response.status_code < 500:
+        if 200 <= response.status_code < 500 or response.status_code == 501:
             return response
         else:
             _logger.error(
@@ -169,6 +182,121 @@ def call_endpoint(host_creds, endpoint, method, json_body, response_proto):
     return response_proto
 
 
+# Minimal view of an HTTP response, exposing the attributes used by ``verify_rest_response``
+_AsyncResponse = namedtuple("_AsyncResponse", ["status_code", "text"])
+
+
+def _get_ssl_context(host_creds):
+    """
+    :return: The ``ssl`` argument for ``aiohttp`` requests to the server described by
+             ``host_creds``, mirroring the ``verify`` and ``cert`` arguments of ``http_request``.
+    """
+    if host_creds.ignore_tls_verification:
+        return False
+    if host_creds.server_cert_path is None and host_creds.client_cert_path is None:
+        return None
+    context = ssl.create_default_context(cafile=host_creds.server_cert_path)
+    if host_creds.client_cert_path is not None:
+        context.load_cert_chain(host_creds.client_cert_path)
+    return context
+
+
+def _to_query_params(json_body):
+    """
+    Convert a JSON request body into query parameters the way ``requests`` does, repeating the
+    key of list values.
+    """
+    params = []
+    for key, value in (json_body or {}).items():
+        for item in value if isinstance(value, list) else [value]:
+            params.append((key, str(item)))
+    return params
+
+
+async def async_http_request(
+    session, host_creds, endpoint, retries=3, retry_interval=3, max_rate_limit_interval=60, **kwargs
+):
+    """
+    Asynchronous counterpart of ``http_request``, sending the request through the specified
+    ``aiohttp.ClientSession`` so that connections are pooled across requests. Rate limited and
+    failed requests are retried the same way as in ``http_request``, without blocking the event
+    loop while waiting.
+
+    :param session: An ``aiohttp.ClientSession`` used to send the request.
+    :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
+        hostname and optional authentication.
+    :return: The API response, exposing its ``status_code`` and ``text``.
+    """
+    headers = _get_request_headers(host_creds)
+    ssl_context = _get_ssl_context(host_creds)
+    method = kwargs.pop("method")
+    if "params" in kwargs:
+        kwargs["params"] = _to_query_params(kwargs["params"])
+
+    async def request():
+        async with session.request(
+            method, url, headers=headers, ssl=ssl_context, **kwargs
+        ) as response:
+            return _AsyncResponse(response.status, await response.text())
+
+    async def request_with_ratelimit_retries(max_rate_limit_interval):
+        response = await request()
+        time_left = max_rate_limit_interval
+        sleep = 1
+        while response.status_code == 429 and time_left > 0:
+            _logger.warning(
+                "API request to {path} returned status code 429 (Rate limit exceeded). "
+                "Retrying in %d seconds. "
+                "Will continue to retry 429s for up to %d seconds.",
+                sleep,
+                time_left,
+            )
+            await asyncio.sleep(sleep)
+            time_left -= sleep
+            response = await request()
+            sleep = min(time_left, sleep * 2)  # sleep for 1, 2, 4, ... seconds;
+        return response
+
+    url = "%s%s" % (strip_suffix(host_creds.host, "/"), endpoint)
+    for i in range(retries):
+        response = await request_with_ratelimit_retries(max_rate_limit_interval)
+        if response.status_code >= 200 and response.status_code < 500:
+            return response
+        else:
+            _logger.error(
+                "API request to %s failed with code %s != 200, retrying up to %s more times. "
+                "API response body: %s",
+                url,
+                response.status_code,
+                retries - i - 1,
+                response.text,
+            )
+            await asyncio.sleep(retry_interval)
+    raise MlflowException(
+        "API request to %s failed to return code 200 after %s tries" % (url, retries)
+    )
+
+
+async def async_call_endpoint(session, host_creds, endpoint, method, json_body, response_proto):
+    """
+    Asynchronous counterpart of ``call_endpoint``, see ``async_http_request``.
+    """
+    if json_body:
+        json_body = json.loads(json_body)
+    if method == "GET":
+        response = await async_http_request(
+            session, host_creds=host_creds, endpoint=endpoint, method=method, params=json_body
+        )
+    else:
+        response = await async_http_request(
+            session, host_creds=host_creds, endpoint=endpoint, method=method, json=json_body
+        )
+    response = verify_rest_response(response, endpoint)
+    js_dict = json.loads(response.text)
+    parse_dict(js_dict=js_dict, message=response_proto)
+    return response_proto
+
+
 class MlflowHostCreds(object):
     """
     Provides a hostname and optional authentication for talking to an MLflow tracking server.
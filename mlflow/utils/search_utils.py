@@ -1,4 +1,7 @@
 import base64
+import copy
+import functools
+import heapq
 import json
 import operator
 import re
@@ -23,17 +26,37 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 
 import math
 
+# Number of filter strings whose parsed and compiled forms are cached
+FILTER_CACHE_SIZE = 256
+
 
 class SearchUtils(object):
     LIKE_OPERATOR = "LIKE"
     ILIKE_OPERATOR = "ILIKE"
+    IN_OPERATOR = "IN"
+    IS_NULL_OPERATOR = "IS NULL"
+    IS_NOT_NULL_OPERATOR = "IS NOT NULL"
     ASC_OPERATOR = "asc"
     DESC_OPERATOR = "desc"
     VALID_ORDER_BY_TAGS = [ASC_OPERATOR, DESC_OPERATOR]
-    VALID_METRIC_COMPARATORS = set([">", ">=", "!=", "=", "<", "<="])
-    VALID_PARAM_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR])
-    VALID_TAG_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR])
-    VALID_STRING_ATTRIBUTE_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR])
+    NULL_COMPARISON_OPERATORS = set([IS_NULL_OPERATOR, IS_NOT_NULL_OPERATOR])
+    VALID_METRIC_COMPARATORS = set([">", ">=", "!=", "=", "<", "<="]).union(
+        NULL_COMPARISON_OPERATORS
+    )
+    VALID_PARAM_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR, IN_OPERATOR]).union(
+        NULL_COMPARISON_OPERATORS
+    )
+    # Comparators of params with numbers, which compare the params whose values are numbers
+    VALID_NUMERIC_PARAM_COMPARATORS = set([">", ">=", "!=", "=", "<", "<="])
+    VALID_TAG_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR, IN_OPERATOR]).union(
+        NULL_COMPARISON_OPERATORS
+    )
+    VALID_STRING_ATTRIBUTE_COMPARATORS = set(
+        ["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR, IN_OPERATOR]
+    )
+    # Values of params compared to numbers, as a regular expression supported by Python and by the
+    # POSIX regular expressions of the SQL databases
+    NUMERIC_VALUE_PATTERN = "^[+-]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][+-]?[0-9]+)?$"
     CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS = set([LIKE_OPERATOR, ILIKE_OPERATOR])
     VALID_REGISTERED_MODEL_SEARCH_COMPARATORS = CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS.union(
         {"="}
@@ -49,6 +72,9 @@ class SearchUtils(object):
     _ALTERNATE_TAG_IDENTIFIERS = set(["tags"])
     _ATTRIBUTE_IDENTIFIER = "attribute"
     _ALTERNATE_ATTRIBUTE_IDENTIFIERS = set(["attr", "attributes", "run"])
+    # Types of the clauses combining other clauses
+    _AND_IDENTIFIER = "and"
+    _OR_IDENTIFIER = "or"
     _IDENTIFIERS = [_METRIC_IDENTIFIER, _PARAM_IDENTIFIER, _TAG_IDENTIFIER, _ATTRIBUTE_IDENTIFIER]
     _VALID_IDENTIFIERS = set(
         _IDENTIFIERS
@@ -179,6 +205,8 @@ class SearchUtils(object):
         elif identifier_type == cls._PARAM_IDENTIFIER or identifier_type == cls._TAG_IDENTIFIER:
             if token.ttype in cls.STRING_VALUE_TYPES or isinstance(token, Identifier):
                 return cls._strip_quotes(token.value, expect_quoted_value=True)
+            if identifier_type == cls._PARAM_IDENTIFIER and token.ttype in cls.NUMERIC_VALUE_TYPES:
+                return token.value
             raise MlflowException(
                 "Expected a quoted string value for "
                 "{identifier_type} (e.g. 'my-value'). Got value "
@@ -235,15 +263,58 @@ class SearchUtils(object):
         comp = cls._get_identifier(stripped_comparison[0].value, cls.VALID_SEARCH_ATTRIBUTE_KEYS)
         comp["comparator"] = stripped_comparison[1].value
         comp["value"] = cls._get_value(comp.get("type"), stripped_comparison[2])
+        is_number = stripped_comparison[2].ttype in cls.NUMERIC_VALUE_TYPES
+        if comp["type"] == cls._PARAM_IDENTIFIER and is_number:
+            # Params compared to numbers are compared as numbers
+            comp["numeric"] = True
+        return comp
+
+    @classmethod
+    def _get_null_comparison(cls, identifier, comparator):
+        comp = cls._get_identifier(identifier.value, cls.VALID_SEARCH_ATTRIBUTE_KEYS)
+        comp["comparator"] = comparator
+        comp["value"] = None
+        return comp
+
+    @classmethod
+    def _get_in_comparison(cls, identifier, values):
+        comp = cls._get_identifier(identifier.value, cls.VALID_SEARCH_ATTRIBUTE_KEYS)
+        tokens = [token for token in values.tokens[1:-1] if not token.is_whitespace]
+        if len(tokens) == 1 and isinstance(tokens[0], IdentifierList):
+            tokens = [token for token in tokens[0].tokens if not token.is_whitespace]
+        if (
+            len(tokens) % 2 == 0
+            or not all(
+                token.ttype in cls.STRING_VALUE_TYPES or isinstance(token, Identifier)
+                for token in tokens[::2]
+            )
+            or not all(
+                token.match(ttype=TokenType.Punctuation, values=[","]) for token in tokens[1::2]
+            )
+        ):
+            raise MlflowException(
+                "While parsing a list in the query, expected a non-empty list of string values, "
+                "but got ill-formed list: {}".format(values.value),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        comp["comparator"] = cls.IN_OPERATOR
+        comp["value"] = tuple(
+            cls._strip_quotes(token.value, expect_quoted_value=True) for token in tokens[::2]
+        )
         return comp
 
     @classmethod
     def _invalid_statement_token_search_runs(cls, token):
-        if isinstance(token, Comparison):
+        if isinstance(token, (Comparison, Identifier, Parenthesis)):
             return False
         elif token.is_whitespace:
             return False
-        elif token.match(ttype=TokenType.Keyword, values=["AND"]):
+        elif token.match(
+            ttype=TokenType.Keyword, values=["AND", "OR", "IN", "IS", "NULL", "NOT NULL"]
+        ):
+            return False
+        elif token.match(ttype=TokenType.Operator.Comparison, values=["IN"]):
+            # `IN` is a comparison token in sqlparse >= 0.4.0
             return False
         else:
             return True
@@ -269,20 +340,105 @@ class SearchUtils(object):
 
     @classmethod
     def _process_statement(cls, statement):
+        tokens = [token for token in statement.tokens if not token.is_whitespace]
+        if not tokens:
+            return []
+        clause = cls._parse_expression(tokens)
+        if clause["type"] == cls._AND_IDENTIFIER:
+            return list(clause["clauses"])
+        return [clause]
+
+    @classmethod
+    def _parse_expression(cls, tokens):
+        """
+        Parse the non-whitespace tokens of a filter expression, in which ``AND`` takes precedence
+        over ``OR``, into a comparison or into an ``"and"`` or ``"or"`` clause whose ``"clauses"``
+        are comparisons or clauses of the other type.
+        """
         # check validity
-        invalids = list(filter(cls._invalid_statement_token_search_runs, statement.tokens))
+        invalids = list(filter(cls._invalid_statement_token_search_runs, tokens))
         if len(invalids) > 0:
             invalid_clauses = ", ".join("'%s'" % token for token in invalids)
             raise MlflowException(
                 "Invalid clause(s) in filter string: %s" % invalid_clauses,
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        return [cls._get_comparison(si) for si in statement.tokens if isinstance(si, Comparison)]
+        disjuncts = []
+        for disjunct_tokens in cls._split_tokens(tokens, "OR"):
+            conjuncts = [
+                cls._parse_operand(conjunct_tokens)
+                for conjunct_tokens in cls._split_tokens(disjunct_tokens, "AND")
+            ]
+            disjuncts.append(cls._combine_clauses(cls._AND_IDENTIFIER, conjuncts))
+        return cls._combine_clauses(cls._OR_IDENTIFIER, disjuncts)
+
+    @classmethod
+    def _split_tokens(cls, tokens, keyword):
+        parts = [[]]
+        for token in tokens:
+            if token.match(ttype=TokenType.Keyword, values=[keyword]):
+                parts.append([])
+            else:
+                parts[-1].append(token)
+        if not all(parts):
+            raise MlflowException(
+                "Invalid clause(s) in filter string: expected an expression on both sides of "
+                "'%s'" % keyword,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return parts
+
+    @classmethod
+    def _combine_clauses(cls, clause_type, clauses):
+        if len(clauses) == 1:
+            return clauses[0]
+        combined = []
+        for clause in clauses:
+            if clause["type"] == clause_type:
+                combined.extend(clause["clauses"])
+            else:
+                combined.append(clause)
+        return {"type": clause_type, "clauses": tuple(combined)}
+
+    @classmethod
+    def _parse_operand(cls, tokens):
+        if len(tokens) == 1 and isinstance(tokens[0], Comparison):
+            return cls._get_comparison(tokens[0])
+        elif len(tokens) == 1 and isinstance(tokens[0], Parenthesis):
+            inner_tokens = [token for token in tokens[0].tokens[1:-1] if not token.is_whitespace]
+            if inner_tokens:
+                return cls._parse_expression(inner_tokens)
+        elif len(tokens) >= 3 and isinstance(tokens[0], Identifier):
+            if tokens[1].match(ttype=TokenType.Keyword, values=["IS"]):
+                comparator = " ".join(" ".join(token.normalized for token in tokens[1:]).split())
+                if comparator in cls.NULL_COMPARISON_OPERATORS:
+                    return cls._get_null_comparison(tokens[0], comparator)
+            elif (
+                len(tokens) == 3
+                and tokens[1].normalized == cls.IN_OPERATOR
+                and isinstance(tokens[2], Parenthesis)
+            ):
+                return cls._get_in_comparison(tokens[0], tokens[2])
+        raise MlflowException(
+            "Invalid clause(s) in filter string: %s" % " ".join("'%s'" % token for token in tokens),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
 
     @classmethod
     def parse_search_filter(cls, filter_string):
+        """
+        Parse a search filter string into a list of clauses which must all be satisfied. Clauses
+        are either comparisons, with ``"type"``, ``"key"``, ``"comparator"`` and ``"value"``
+        entries, or ``"and"`` or ``"or"`` clauses with a ``"clauses"`` entry.
+        """
+        # Copy the cached clauses so that callers may modify them
+        return copy.deepcopy(list(cls._parse_search_filter(filter_string)))
+
+    @classmethod
+    @functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+    def _parse_search_filter(cls, filter_string):
         if not filter_string:
-            return []
+            return ()
         try:
             parsed = sqlparse.parse(filter_string)
         except Exception:
@@ -300,7 +456,7 @@ class SearchUtils(object):
                 "Provide AND-ed expression list." % filter_string,
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        return SearchUtils._process_statement(parsed[0])
+        return tuple(SearchUtils._process_statement(parsed[0]))
 
     @classmethod
     def is_metric(cls, key_type, comparator):
@@ -315,12 +471,14 @@ class SearchUtils(object):
         return False
 
     @classmethod
-    def is_param(cls, key_type, comparator):
+    def is_param(cls, key_type, comparator, numeric=False):
         if key_type == cls._PARAM_IDENTIFIER:
-            if comparator not in cls.VALID_PARAM_COMPARATORS:
+            valid_comparators = (
+                cls.VALID_NUMERIC_PARAM_COMPARATORS if numeric else cls.VALID_PARAM_COMPARATORS
+            )
+            if comparator not in valid_comparators:
                 raise MlflowException(
-                    "Invalid comparator '%s' "
-                    "not one of '%s'" % (comparator, cls.VALID_PARAM_COMPARATORS),
+                    "Invalid comparator '%s' " "not one of '%s'" % (comparator, valid_comparators),
                     error_code=INVALID_PARAMETER_VALUE,
                 )
             return True
@@ -349,56 +507,58 @@ class SearchUtils(object):
         return False
 
     @classmethod
-    def _does_run_match_clause(cls, run, sed):
+    @functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+    def compile_filter(cls, filter_string):
+        """
+        Compile a search filter string into a :py:class:`SearchFilter`. The filters of the most
+        recently used filter strings are cached, so that the string is parsed and its ``LIKE``
+        patterns are translated to regular expressions once rather than for every search.
+
+        :param filter_string: Filter string, as accepted by ``search_runs``. ``None`` or an empty
+                              string compile to a filter matching all runs.
+
+        :return: A :py:class:`SearchFilter`.
+        """
+        return SearchFilter(
+            [cls._compile_clause(clause) for clause in cls._parse_search_filter(filter_string)]
+        )
+
+    @classmethod
+    def _compile_clause(cls, sed):
         key_type = sed.get("type")
-        key = sed.get("key")
-        value = sed.get("value")
+        if key_type in [cls._AND_IDENTIFIER, cls._OR_IDENTIFIER]:
+            return _BooleanClause(
+                [cls._compile_clause(clause) for clause in sed.get("clauses")],
+                any_clause=key_type == cls._OR_IDENTIFIER,
+            )
         comparator = sed.get("comparator").upper()
-
-        if cls.is_metric(key_type, comparator):
-            lhs = run.data.metrics.get(key, None)
-            value = float(value)
-        elif cls.is_param(key_type, comparator):
-            lhs = run.data.params.get(key, None)
-        elif cls.is_tag(key_type, comparator):
-            lhs = run.data.tags.get(key, None)
-        elif cls.is_attribute(key_type, comparator):
-            lhs = getattr(run.info, key)
-        else:
+        numeric = sed.get("numeric", False)
+        if not (
+            cls.is_metric(key_type, comparator)
+            or cls.is_param(key_type, comparator, numeric)
+            or cls.is_tag(key_type, comparator)
+            or cls.is_attribute(key_type, comparator)
+        ):
             raise MlflowException(
                 "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
             )
-        if lhs is None:
-            return False
+        return _FilterClause(key_type, sed.get("key"), comparator, sed.get("value"), numeric)
 
-        if comparator in cls.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-            # Change value from sql syntax to regex syntax
-            if comparator == "ILIKE":
-                value = value.lower()
-                lhs = lhs.lower()
-            if not value.startswith("%"):
-                value = "^" + value
-            if not value.endswith("%"):
-                value = value + "$"
-            value = value.replace("_", ".").replace("%", ".*")
-            return cls.filter_ops.get(comparator)(value, lhs)
-
-        elif comparator in cls.filter_ops.keys():
-            return cls.filter_ops.get(comparator)(lhs, value)
-        else:
-            return False
+    @classmethod
+    def _like_to_regex(cls, pattern):
+        """Translate the pattern of a ``LIKE`` comparison to a regular expression."""
+        if not pattern.startswith("%"):
+            pattern = "^" + pattern
+        if not pattern.endswith("%"):
+            pattern = pattern + "$"
+        return pattern.replace("_", ".").replace("%", ".*")
 
     @classmethod
     def filter(cls, runs, filter_string):
         """Filters a set of runs based on a search filter string."""
         if not filter_string:
             return runs
-        parsed = cls.parse_search_filter(filter_string)
-
-        def run_matches(run):
-            return all([cls._does_run_match_clause(run, s) for s in parsed])
-
-        return [run for run in runs if run_matches(run)]
+        return cls.compile_filter(filter_string).filter(runs)
 
     @classmethod
     def _validate_order_by_and_generate_token(cls, order_by):
@@ -494,29 +654,48 @@ class SearchUtils(object):
         is_null_or_nan = sort_value is None or (
             isinstance(sort_value, float) and math.isnan(sort_value)
         )
-        if ascending:
-            return (is_null_or_nan, sort_value)
-        return (not is_null_or_nan, sort_value)
+        if is_null_or_nan:
+            return (1,)
+        return (0, sort_value if ascending else _Descending(sort_value))
+
+    @classmethod
+    def _get_sort_key(cls, order_by_list):
+        """
+        Returns a function computing the sort key of a run, which orders runs by the clauses of
+        ``order_by_list``, then by start time descending, then by run id for tie-breaking.
+        """
+        order_by_keys = [cls.parse_order_by_for_search_runs(o) for o in order_by_list or []]
+
+        def sort_key(run):
+            return tuple(
+                cls._get_value_for_sort(run, key_type, key, ascending)
+                for key_type, key, ascending in order_by_keys
+            ) + (-run.info.start_time, run.info.run_uuid)
+
+        return sort_key
 
     @classmethod
     def sort(cls, runs, order_by_list):
         """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
         Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
         """
-        runs = sorted(runs, key=lambda run: (-run.info.start_time, run.info.run_uuid))
-        if not order_by_list:
-            return runs
-        # NB: We rely on the stability of Python's sort function, so that we can apply
-        # the ordering conditions in reverse order.
-        for order_by_clause in reversed(order_by_list):
-            (key_type, key, ascending) = cls.parse_order_by_for_search_runs(order_by_clause)
-            # pylint: disable=cell-var-from-loop
-            runs = sorted(
-                runs,
-                key=lambda run: cls._get_value_for_sort(run, key_type, key, ascending),
-                reverse=not ascending,
-            )
-        return runs
+        return sorted(runs, key=cls._get_sort_key(order_by_list))
+
+    @classmethod
+    def sort_and_paginate(cls, runs, order_by_list, page_token, max_results):
+        """Sorts a set of runs like :py:meth:`sort` and paginates them like :py:meth:`paginate`.
+        The runs of pages ending in the first quarter of the sorted runs are selected with a heap
+        rather than by sorting all runs.
+        """
+        start_offset = cls.parse_start_offset_from_page_token(page_token)
+        final_offset = start_offset + max_results
+        # Selecting the first k of n runs with a heap takes O(n log k) rather than O(n log n)
+        # comparisons, but is slower than sorting once k exceeds about n / 4.
+        if final_offset * 4 <= len(runs):
+            sort_key = cls._get_sort_key(order_by_list)
+            first_runs = heapq.nsmallest(final_offset, runs, key=sort_key)
+            return first_runs[start_offset:], cls.create_page_token(final_offset)
+        return cls.paginate(cls.sort(runs, order_by_list), page_token, max_results)
 
     @classmethod
     def parse_start_offset_from_page_token(cls, page_token):
@@ -774,3 +953,216 @@ class SearchUtils(object):
         return cls._parse_filter_for_model_registry(
             filter_string, cls.VALID_SEARCH_KEYS_FOR_REGISTERED_MODELS
         )
+
+
+class _Descending(object):
+    """
+    Sort key component ordering values in descending order.
+    """
+
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class SearchFilter(object):
+    """
+    Search filter compiled by :py:meth:`SearchUtils.compile_filter`, matching the runs which
+    satisfy all of its clauses.
+    """
+
+    def __init__(self, clauses):
+        self._clauses = clauses
+
+    def matches(self, run):
+        """
+        :param run: :py:class:`mlflow.entities.Run`.
+
+        :return: Whether the run satisfies all the clauses of the filter.
+        """
+        return all(clause.matches(run) for clause in self._clauses)
+
+    def filter(self, runs):
+        """
+        :param runs: List of :py:class:`mlflow.entities.Run`.
+
+        :return: The runs matching the filter, in their original order.
+        """
+        if not self._clauses:
+            return list(runs)
+        return [run for run in runs if self.matches(run)]
+
+    def mask(self, columns, num_rows):
+        """
+        Evaluate the filter over runs stored column by column, such as the tables returned by
+        :py:func:`mlflow.search_runs` or ``MlflowClient.export_runs``, one clause at a time.
+
+        :param columns: Mapping from column names to arrays of ``num_rows`` values, such as a
+                        ``pandas.DataFrame`` or a dictionary of numpy arrays, ``pyarrow`` arrays or
+                        lists. Metrics are read from the ``metrics.<key>`` columns, params from the
+                        ``params.<key>`` columns, tags from the ``tags.<key>`` columns and
+                        attributes from the columns named after them. Missing values are ``None``
+                        or NaN. The clauses referencing columns absent from the mapping match no
+                        rows.
+        :param num_rows: Number of rows of the columns.
+
+        :return: A boolean numpy array of length ``num_rows``, true for the rows matching the
+                 filter.
+        """
+        import numpy as np
+
+        mask = np.ones(num_rows, dtype=bool)
+        for clause in self._clauses:
+            mask &= clause.mask(columns, num_rows)
+        return mask
+
+    def exclude(self, key_types):
+        """
+        :param key_types: Identifier types of the keys to exclude, such as ``"metric"``.
+
+        :return: A :py:class:`SearchFilter` made of the clauses of this filter which do not
+                 reference keys of these types. It matches a superset of the runs matched by this
+                 filter, and can be evaluated over runs missing the values of these keys.
+        """
+        return SearchFilter([c for c in self._clauses if not c.key_types.intersection(key_types)])
+
+
+class _FilterClause(object):
+    """
+    Comparison of a search filter, with its value converted and its pattern compiled once.
+    """
+
+    _COLUMN_PREFIXES = {
+        SearchUtils._METRIC_IDENTIFIER: "metrics.",
+        SearchUtils._PARAM_IDENTIFIER: "params.",
+        SearchUtils._TAG_IDENTIFIER: "tags.",
+        SearchUtils._ATTRIBUTE_IDENTIFIER: "",
+    }
+    _NUMERIC_VALUE_REGEX = re.compile(SearchUtils.NUMERIC_VALUE_PATTERN)
+
+    def __init__(self, key_type, key, comparator, value, numeric=False):
+        self.key_type = key_type
+        self.key_types = frozenset([key_type])
+        self.key = key
+        self.column = self._COLUMN_PREFIXES[key_type] + key
+        self._comparator = comparator
+        self._numeric = numeric or key_type == SearchUtils._METRIC_IDENTIFIER
+        self._case_insensitive = comparator == SearchUtils.ILIKE_OPERATOR
+        self._pattern = None
+        self._value = None
+        if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+            if self._case_insensitive:
+                value = value.lower()
+            self._pattern = re.compile(SearchUtils._like_to_regex(value))
+        elif comparator == SearchUtils.IN_OPERATOR:
+            self._value = frozenset(value)
+        elif comparator not in SearchUtils.NULL_COMPARISON_OPERATORS:
+            self._op = SearchUtils.filter_ops[comparator]
+            self._value = float(value) if self._numeric else value
+
+    def _get_value(self, run):
+        if self.key_type == SearchUtils._METRIC_IDENTIFIER:
+            return run.data.metrics.get(self.key)
+        elif self.key_type == SearchUtils._PARAM_IDENTIFIER:
+            value = run.data.params.get(self.key)
+            return self._to_number(value) if self._numeric else value
+        elif self.key_type == SearchUtils._TAG_IDENTIFIER:
+            return run.data.tags.get(self.key)
+        return getattr(run.info, self.key)
+
+    def _to_number(self, value):
+        """Convert the value of a param to a float, or to ``None`` if it is not a number."""
+        if value is not None and self._NUMERIC_VALUE_REGEX.match(value):
+            return float(value)
+        return None
+
+    def _matches_value(self, value):
+        if self._pattern is not None:
+            if self._case_insensitive:
+                value = value.lower()
+            return self._pattern.match(value) is not None
+        elif self._comparator == SearchUtils.IN_OPERATOR:
+            return value in self._value
+        return self._op(value, self._value)
+
+    def matches(self, run):
+        value = self._get_value(run)
+        if self._comparator == SearchUtils.IS_NULL_OPERATOR:
+            return value is None
+        elif self._comparator == SearchUtils.IS_NOT_NULL_OPERATOR:
+            return value is not None
+        return value is not None and self._matches_value(value)
+
+    def _get_column(self, column, num_rows):
+        """
+        :return: The values of the column as a numpy array, and a boolean numpy array which is
+                 true for the rows with a value.
+        """
+        import numpy as np
+
+        if self.key_type == SearchUtils._METRIC_IDENTIFIER:
+            values = np.asarray(column, dtype=float)
+            return values, ~np.isnan(values)
+        values = np.asarray(column, dtype=object)
+        if self._numeric:
+            values = np.fromiter(
+                (
+                    number if number is not None else np.nan
+                    for number in map(self._to_number, values)
+                ),
+                dtype=float,
+                count=num_rows,
+            )
+            return values, ~np.isnan(values)
+        present = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=num_rows)
+        return values, present
+
+    def mask(self, columns, num_rows):
+        import numpy as np
+
+        if self.column in columns:
+            values, present = self._get_column(columns[self.column], num_rows)
+        else:
+            values, present = np.full(num_rows, None, dtype=object), np.zeros(num_rows, dtype=bool)
+        if self._comparator == SearchUtils.IS_NULL_OPERATOR:
+            return ~present
+        elif self._comparator == SearchUtils.IS_NOT_NULL_OPERATOR:
+            return present
+        elif self._pattern is not None or self._comparator == SearchUtils.IN_OPERATOR:
+            return np.fromiter(
+                (p and self._matches_value(v) for v, p in zip(values, present)),
+                dtype=bool,
+                count=num_rows,
+            )
+        return present & np.asarray(self._op(values, self._value), dtype=bool)
+
+
+class _BooleanClause(object):
+    """
+    Clause of a search filter satisfied by all or by any of its clauses.
+    """
+
+    def __init__(self, clauses, any_clause):
+        self._clauses = clauses
+        self._any = any_clause
+        self.key_types = frozenset().union(*[clause.key_types for clause in clauses])
+
+    def matches(self, run):
+        if self._any:
+            return any(clause.matches(run) for clause in self._clauses)
+        return all(clause.matches(run) for clause in self._clauses)
+
+    def mask(self, columns, num_rows):
+        import numpy as np
+
+        masks = [clause.mask(columns, num_rows) for clause in self._clauses]
+        if self._any:
+            return np.logical_or.reduce(masks)
+        return np.logical_and.reduce(masks)
@@ -0,0 +1,79 @@
+"""
+Local journals of the progress of large artifact transfers, with which a retry of an interrupted
+upload or download resumes from the parts completed by the previous attempt instead of restarting
+from zero.
+
+A journal is a file of JSON lines in :py:data:`TRANSFER_JOURNAL_DIR`, named after a digest of the
+key identifying its transfer. The first line is the state of the transfer, e.g. the identifier of
+a multipart upload, and each following line records a completed part. Lines are appended as the
+parts complete, and a line truncated by a crash is ignored.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+# Directory of the journals, shared by all the processes of the host so that a transfer can be
+# resumed by another process than the one that started it.
+TRANSFER_JOURNAL_DIR = os.path.join(tempfile.gettempdir(), "mlflow-transfer-journals")
+
+
+class TransferJournal:
+    """
+    Journal of the progress of a transfer.
+
+    :param key: JSON-serializable values identifying the transfer, e.g. its direction, source and
+                destination, and the size, modification time or entity tag of the transferred
+                file, so that the journal of a transfer is not used once the file changed.
+    """
+
+    def __init__(self, *key):
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        self.path = os.path.join(TRANSFER_JOURNAL_DIR, digest + ".jsonl")
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        :return: The state of the transfer and the list of its recorded parts, or ``None`` and an
+                 empty list if the transfer has no journal.
+        """
+        try:
+            with open(self.path) as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return None, []
+        entries = []
+        # The last line is empty, unless it was truncated
+        for line in lines[:-1]:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+        if not entries:
+            return None, []
+        return entries[0], entries[1:]
+
+    def start(self, state):
+        """
+        Start a new journal of the transfer with the given state, replacing any previous one.
+        """
+        os.makedirs(TRANSFER_JOURNAL_DIR, exist_ok=True)
+        with self._lock, open(self.path, "w") as f:
+            f.write(json.dumps(state) + "\n")
+
+    def record(self, part):
+        """
+        Record a completed part of the transfer. Can be called concurrently.
+        """
+        with self._lock, open(self.path, "a") as f:
+            f.write(json.dumps(part) + "\n")
+
+    def delete(self):
+        """
+        Delete the journal, once the transfer completed or cannot be resumed.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -25,6 +25,7 @@ _BAD_CHARACTERS_MESSAGE = (
 MAX_PARAMS_TAGS_PER_BATCH = 100
 MAX_METRICS_PER_BATCH = 1000
 MAX_ENTITIES_PER_BATCH = 1000
+MAX_RUNS_PER_BATCH = 100
 MAX_BATCH_LOG_REQUEST_SIZE = int(1e6)
 MAX_PARAM_VAL_LENGTH = 250
 MAX_TAG_VAL_LENGTH = 5000
@@ -219,6 +220,11 @@ def _validate_batch_log_limits(metrics, params, tags):
     )
 
 
+def _validate_batch_runs_limit(run_count):
+    """Validate that a multi-run request does not exceed the maximum number of runs."""
+    _validate_batch_limit(entity_name="runs", limit=MAX_RUNS_PER_BATCH, length=run_count)
+
+
 def _validate_batch_log_data(metrics, params, tags):
     for metric in metrics:
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
@@ -60,7 +60,8 @@ setup(
     extras_require={
         "extras": [
             "scikit-learn",
-            # Required to log artifacts and models to HDFS artifact locations
+            # Required to log artifacts and models to HDFS artifact locations, and to export runs
+            # as Apache Arrow tables, MlflowClient.export_runs
             "pyarrow",
             # Required to log artifacts and models to AWS S3 artifact locations
             "boto3",
@@ -73,6 +74,10 @@ setup(
             # Required by the mlflow.projects module, when running projects against
             # a remote Kubernetes cluster
             "kubernetes",
+            # Required by the asyncio-native tracking client, mlflow.tracking.AsyncMlflowClient
+            "aiohttp",
+            # Required to serve the tracking server as an ASGI application, `mlflow server --asgi`
+            "uvicorn",
         ],
         "sqlserver": ["mlflow-dbstore",],
         "aliyun-oss": ["aliyunstoreplugin",],
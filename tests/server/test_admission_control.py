@@ -0,0 +1,220 @@
+import base64
+import json
+import os
+
+import pytest
+from unittest import mock
+from flask import Flask, Response, request
+
+from mlflow.exceptions import MlflowException
+from mlflow.server.admission_control import (
+    AdmissionController,
+    InMemoryLimiterState,
+    SqliteLimiterState,
+    get_client_id,
+    get_endpoint_class,
+    get_limiter_state,
+    get_worker_limits,
+    parse_client_rate_limit,
+    parse_concurrency_limits,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def state(request, tmpdir):
+    if request.param == "memory":
+        return InMemoryLimiterState()
+    return SqliteLimiterState(tmpdir.join("state.db").strpath)
+
+
+def test_token_bucket(state):
+    with mock.patch("time.time", return_value=1000):
+        assert [state.consume_token("a", 2, 3) for _ in range(3)] == [0, 0, 0]
+        assert state.consume_token("a", 2, 3) == pytest.approx(0.5)
+        # Buckets are per client
+        assert state.consume_token("b", 2, 3) == 0
+    with mock.patch("time.time", return_value=1000.25):
+        assert state.consume_token("a", 2, 3) == pytest.approx(0.25)
+    with mock.patch("time.time", return_value=1000.5):
+        assert state.consume_token("a", 2, 3) == 0
+        assert state.consume_token("a", 2, 3) == pytest.approx(0.5)
+    with mock.patch("time.time", return_value=2000):
+        # Buckets do not refill past their burst size
+        assert [state.consume_token("a", 2, 3) for _ in range(3)] == [0, 0, 0]
+        assert state.consume_token("a", 2, 3) > 0
+
+
+def test_concurrency_slots(state):
+    slots = [state.acquire_slot("writes", 2) for _ in range(2)]
+    assert None not in slots
+    assert state.acquire_slot("writes", 2) is None
+    assert state.acquire_slot("searches", 1) is not None
+    state.release_slot("writes", slots[0])
+    assert state.acquire_slot("writes", 2) is not None
+    assert state.acquire_slot("writes", 2) is None
+
+
+def test_sqlite_state_is_shared_and_reclaims_slots_of_dead_processes(tmpdir):
+    path = tmpdir.join("state.db").strpath
+    state, other_state = SqliteLimiterState(path), SqliteLimiterState(path)
+    with mock.patch("time.time", return_value=1000):
+        assert state.consume_token("a", 1, 1) == 0
+        assert other_state.consume_token("a", 1, 1) == pytest.approx(1)
+
+    with mock.patch("os.getpid", return_value=2 ** 22 + 1):
+        assert other_state.acquire_slot("artifacts", 1) is not None
+    with mock.patch("mlflow.server.admission_control._is_process_alive", return_value=True):
+        assert state.acquire_slot("artifacts", 1) is None
+    assert state.acquire_slot("artifacts", 1) is not None
+    assert other_state.acquire_slot("artifacts", 1) is None
+
+
+def test_get_limiter_state(tmpdir):
+    assert isinstance(get_limiter_state("memory"), InMemoryLimiterState)
+    path = tmpdir.join("subdir", "state.db").strpath
+    assert isinstance(get_limiter_state("sqlite:///" + path), SqliteLimiterState)
+    assert os.path.exists(path)
+    with pytest.raises(MlflowException, match="Invalid admission control state URI"):
+        get_limiter_state("redis://localhost")
+
+
+def test_get_worker_limits():
+    limits = {"searches": 8, "writes": 10}
+    assert get_worker_limits("memory", (20, 100), limits, 4) == (
+        (5, 25),
+        {"searches": 2, "writes": 3},
+    )
+    assert get_worker_limits("memory", (2, 2), {"streams": 1}, 4) == ((0.5, 1), {"streams": 1})
+    # Shared states enforce the limits of the server
+    assert get_worker_limits("sqlite:///state.db", (20, 100), limits, 4) == ((20, 100), limits)
+    assert get_worker_limits("memory", None, limits, 1) == (None, limits)
+
+
+def test_parse_limits():
+    assert parse_client_rate_limit("20") == (20, 20)
+    assert parse_client_rate_limit("0.5") == (0.5, 1)
+    assert parse_client_rate_limit("20,100") == (20, 100)
+    for spec in ["", "x", "0", "1,2,3", "-1,2"]:
+        with pytest.raises(MlflowException, match="Invalid client rate limit"):
+            parse_client_rate_limit(spec)
+
+    assert parse_concurrency_limits("writes=32, searches=8") == {"writes": 32, "searches": 8}
+    for spec in ["reads=1", "writes", "writes=0", "writes=x"]:
+        with pytest.raises(MlflowException, match="Invalid concurrency limit"):
+            parse_concurrency_limits(spec)
+
+
+def test_get_endpoint_class():
+    assert get_endpoint_class("POST", "/api/2.0/mlflow/runs/log-metric") == "writes"
+    assert get_endpoint_class("POST", "/ajax-api/2.0/preview/mlflow/runs/search") == "searches"
+    assert get_endpoint_class("GET", "/api/2.0/mlflow/runs/get") == "searches"
+    assert get_endpoint_class("POST", "/api/2.0/mlflow/runs/export") == "searches"
+    assert get_endpoint_class("GET", "/api/2.0/mlflow/artifacts/list") == "artifacts"
+    assert get_endpoint_class("GET", "/get-artifact") == "artifacts"
+    assert get_endpoint_class("GET", "/model-versions/get-artifact") == "artifacts"
+    assert get_endpoint_class("GET", "/api/2.0/mlflow/metrics/stream") == "streams"
+    assert get_endpoint_class("GET", "/health") is None
+    assert get_endpoint_class("GET", "/static-files/main.js") is None
+
+
+def test_get_client_id():
+    app = Flask(__name__)
+    basic = "Basic " + base64.b64encode(b"alice:secret").decode()
+    with app.test_request_context(headers={"Authorization": basic}):
+        assert get_client_id(request, trust_proxy_auth=True) == "user:alice"
+    with app.test_request_context(headers={"Authorization": "Bearer my-token"}):
+        token_id = get_client_id(request, trust_proxy_auth=True)
+        assert token_id.startswith("token:") and "my-token" not in token_id
+    with app.test_request_context(environ_base={"REMOTE_ADDR": "10.0.0.1"}):
+        assert get_client_id(request, trust_proxy_auth=True) == "ip:10.0.0.1"
+
+
+def test_get_client_id_ignores_authorization_unless_verified_by_a_proxy():
+    app = Flask(__name__)
+    for authorization in ["Basic " + base64.b64encode(b"alice:secret").decode(), "Bearer token"]:
+        with app.test_request_context(
+            headers={"Authorization": authorization}, environ_base={"REMOTE_ADDR": "10.0.0.1"}
+        ):
+            assert get_client_id(request) == "ip:10.0.0.1"
+
+
+@pytest.fixture()
+def app():
+    app = Flask(__name__)
+
+    @app.route("/api/2.0/mlflow/runs/log-metric", methods=["POST"])
+    def log_metric():  # pylint: disable=unused-variable
+        return "{}"
+
+    @app.route("/api/2.0/mlflow/runs/search", methods=["POST"])
+    def search_runs():  # pylint: disable=unused-variable
+        raise ValueError("search failed")
+
+    @app.route("/get-artifact")
+    def get_artifact():  # pylint: disable=unused-variable
+        return Response(iter([b"01", b"23"]))
+
+    @app.route("/health")
+    def health():  # pylint: disable=unused-variable
+        return "OK"
+
+    return app
+
+
+def test_requests_over_client_rate_limit_are_rejected(app):
+    AdmissionController(InMemoryLimiterState(), client_rate_limit=(1, 2)).install(app)
+    with app.test_client() as c, mock.patch("time.time", return_value=1000):
+        for _ in range(2):
+            assert c.post("/api/2.0/mlflow/runs/log-metric").status_code == 200
+        response = c.post("/api/2.0/mlflow/runs/log-metric")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert json.loads(response.get_data())["error_code"] == "REQUEST_LIMIT_EXCEEDED"
+        # Other clients and endpoints outside of the API are unaffected
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-metric", environ_base={"REMOTE_ADDR": "10.0.0.2"}
+        )
+        assert response.status_code == 200
+        assert c.get("/health").status_code == 200
+
+
+def test_clients_cannot_evade_the_rate_limit_with_new_credentials(app):
+    AdmissionController(InMemoryLimiterState(), client_rate_limit=(1, 1)).install(app)
+    with app.test_client() as c, mock.patch("time.time", return_value=1000):
+        for i, expected_status in enumerate([200, 429]):
+            response = c.post(
+                "/api/2.0/mlflow/runs/log-metric",
+                headers={"Authorization": "Bearer token-{}".format(i)},
+            )
+            assert response.status_code == expected_status
+
+
+def test_clients_behind_an_authenticating_proxy_are_rate_limited_by_credentials(app):
+    AdmissionController(
+        InMemoryLimiterState(), client_rate_limit=(1, 1), trust_proxy_auth=True
+    ).install(app)
+    with app.test_client() as c, mock.patch("time.time", return_value=1000):
+        for user, expected_status in [("alice", 200), ("bob", 200), ("alice", 429)]:
+            basic = "Basic " + base64.b64encode(user.encode() + b":secret").decode()
+            response = c.post("/api/2.0/mlflow/runs/log-metric", headers={"Authorization": basic})
+            assert response.status_code == expected_status
+
+
+def test_requests_over_concurrency_limit_are_rejected(app):
+    state = InMemoryLimiterState()
+    AdmissionController(state, concurrency_limits={"artifacts": 1, "searches": 1}).install(app)
+    with app.test_client() as c:
+        # Streamed responses hold their slot until they are closed
+        response = c.get("/get-artifact", buffered=False)
+        assert response.status_code == 200
+        rejected = c.get("/get-artifact")
+        assert rejected.status_code == 429
+        assert rejected.headers["Retry-After"] == "1"
+        assert b"".join(response.response) == b"0123"
+        response.close()
+        assert c.get("/get-artifact").status_code == 200
+
+        # Slots are released when handlers fail
+        for _ in range(2):
+            assert c.post("/api/2.0/mlflow/runs/search", buffered=True).status_code == 500
+        assert state.acquire_slot("searches", 1) is not None
@@ -0,0 +1,301 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+from unittest import mock
+from werkzeug.wrappers import Request
+
+from mlflow.entities import Experiment
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
+from mlflow.server import app as wsgi_app
+from mlflow.server import (
+    ADMISSION_CONTROL_STATE_ENV_VAR,
+    ASGI_MAX_THREADS_ENV_VAR,
+    CONCURRENCY_LIMITS_ENV_VAR,
+    WORKERS_ENV_VAR,
+)
+from mlflow.server.asgi import AsgiApp, create_app, get_max_threads, _build_wsgi_environ
+from mlflow.store.artifact.artifact_repo import ARTIFACT_STREAM_CHUNK_SIZE
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def _request(asgi_app, method, path, query_string=b"", headers=(), body=b""):
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+        "server": ("localhost", 5000),
+        "client": ("127.0.0.1", 12345),
+    }
+    received = [
+        {"type": "http.request", "body": body[:1], "more_body": True},
+        {"type": "http.request", "body": body[1:], "more_body": False},
+    ]
+    sent = []
+
+    async def receive():
+        return received.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    _run(asgi_app(scope, receive, send))
+    return sent
+
+
+def _response(messages):
+    assert messages[0]["type"] == "http.response.start"
+    assert all(message["type"] == "http.response.body" for message in messages[1:])
+    assert messages[-1]["more_body"] is False
+    headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    return messages[0]["status"], headers, b"".join(message["body"] for message in messages[1:])
+
+
+@pytest.fixture()
+def asgi_app():
+    return create_app(max_threads=4)
+
+
+def test_health(asgi_app):
+    status, _, body = _response(_request(asgi_app, "GET", "/health"))
+    assert status == 200
+    assert body == b"OK"
+
+
+def test_json_endpoints(asgi_app):
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as get_store:
+        store = get_store.return_value
+        store.create_experiment.return_value = "7"
+        store.get_experiment.return_value = Experiment("7", "exp", "/artifacts", "active")
+        status, headers, body = _response(
+            _request(
+                asgi_app,
+                "POST",
+                "/api/2.0/mlflow/experiments/create",
+                headers=[("Content-Type", "application/json")],
+                body=json.dumps({"name": "exp"}).encode(),
+            )
+        )
+        assert status == 200
+        assert headers["content-type"] == "application/json"
+        assert json.loads(body) == {"experiment_id": "7"}
+        store.create_experiment.assert_called_once_with("exp", "")
+
+        status, _, body = _response(
+            _request(
+                asgi_app, "GET", "/api/2.0/mlflow/experiments/get", query_string=b"experiment_id=7"
+            )
+        )
+        assert status == 200
+        assert json.loads(body)["experiment"]["name"] == "exp"
+        store.get_experiment.assert_called_once_with("7")
+
+
+def test_errors_are_returned_with_their_status(asgi_app):
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as get_store:
+        get_store.return_value.get_run.side_effect = MlflowException(
+            "Run 'abc' not found", RESOURCE_DOES_NOT_EXIST
+        )
+        status, _, body = _response(
+            _request(asgi_app, "GET", "/api/2.0/mlflow/runs/get", query_string=b"run_id=abc")
+        )
+    assert status == 404
+    assert json.loads(body)["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_artifacts_are_streamed_in_chunks(asgi_app, tmpdir):
+    contents = b"0123456789" * (ARTIFACT_STREAM_CHUNK_SIZE // 4)
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.join("data.bin").write(contents, mode="wb")
+    with mock.patch(
+        "mlflow.server.handlers._get_artifact_repo",
+        return_value=LocalArtifactRepository(artifact_dir.strpath),
+    ), mock.patch("mlflow.server.handlers._get_tracking_store"):
+        messages = _request(
+            asgi_app, "GET", "/get-artifact", query_string=b"run_id=123&path=data.bin"
+        )
+        status, headers, body = _response(messages)
+        assert status == 200
+        assert body == contents
+        assert headers["content-length"] == str(len(contents))
+        assert len([message for message in messages if message.get("body")]) == 3
+
+        status, headers, body = _response(
+            _request(
+                asgi_app,
+                "GET",
+                "/get-artifact",
+                query_string=b"run_id=123&path=data.bin",
+                headers=[("Range", "bytes=5-14")],
+            )
+        )
+        assert status == 206
+        assert body == contents[5:15]
+        assert headers["content-range"] == "bytes 5-14/%d" % len(contents)
+
+
+def test_requests_are_handled_in_bounded_thread_pool():
+    lock = threading.Lock()
+    active = [0]
+    max_active = [0]
+
+    def wsgi_handler(environ, start_response):
+        with lock:
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+        threading.Event().wait(0.05)
+        with lock:
+            active[0] -= 1
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [environ["PATH_INFO"].encode()]
+
+    asgi_app = AsgiApp(wsgi_handler, max_threads=2)
+
+    async def handle_concurrently():
+        bodies = []
+
+        async def handle(i):
+            received = [{"type": "http.request", "body": b"", "more_body": False}]
+            sent = []
+
+            async def receive():
+                return received.pop(0)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "method": "GET", "path": "/%d" % i, "headers": []}
+            await asgi_app(scope, receive, send)
+            bodies.append(_response(sent)[2])
+
+        await asyncio.gather(*[handle(i) for i in range(6)])
+        return bodies
+
+    bodies = _run(handle_concurrently())
+    assert sorted(bodies) == [("/%d" % i).encode() for i in range(6)]
+    assert max_active[0] == 2
+
+
+def test_request_bodies_are_streamed_to_handlers():
+    started = threading.Event()
+    chunks = [b"ab", b"cd", b"ef"]
+    received = []
+    received_before_start = []
+
+    def wsgi_handler(environ, start_response):
+        received_before_start.append(len(received))
+        started.set()
+        # Chunked requests have no content length, and their body ends with the last message
+        body = Request(environ).get_data()
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [body]
+
+    asgi_app = AsgiApp(wsgi_handler, max_threads=1)
+
+    async def receive():
+        # The body only arrives once the handler started
+        await asyncio.get_event_loop().run_in_executor(None, started.wait, 10)
+        received.append(chunks[len(received)])
+        return {
+            "type": "http.request",
+            "body": received[-1],
+            "more_body": len(received) < len(chunks),
+        }
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/upload", "headers": []}
+    _run(asgi_app(scope, receive, send))
+    assert received_before_start == [0]
+    assert _response(sent)[2] == b"abcdef"
+
+
+def test_lifespan():
+    asgi_app = AsgiApp(wsgi_app, max_threads=1)
+    received = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return received.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    _run(asgi_app({"type": "lifespan"}, receive, send))
+    assert sent == [{"type": "lifespan.startup.complete"}, {"type": "lifespan.shutdown.complete"}]
+
+
+def test_build_wsgi_environ():
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "scheme": "https",
+        "path": "/mlflow/api/2.0/mlflow/runs/create",
+        "root_path": "/mlflow",
+        "query_string": b"a=1",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", b"2"),
+            (b"x-forwarded-for", b"10.0.0.1"),
+            (b"x-forwarded-for", b"10.0.0.2"),
+        ],
+        "server": ("example.com", 443),
+        "client": ("10.0.0.3", 4321),
+    }
+    environ = _build_wsgi_environ(scope, None)
+    assert environ["REQUEST_METHOD"] == "POST"
+    assert environ["SCRIPT_NAME"] == "/mlflow"
+    assert environ["PATH_INFO"] == "/api/2.0/mlflow/runs/create"
+    assert environ["QUERY_STRING"] == "a=1"
+    assert environ["SERVER_NAME"] == "example.com"
+    assert environ["SERVER_PORT"] == "443"
+    assert environ["REMOTE_ADDR"] == "10.0.0.3"
+    assert environ["CONTENT_TYPE"] == "application/json"
+    assert environ["CONTENT_LENGTH"] == "2"
+    assert environ["HTTP_X_FORWARDED_FOR"] == "10.0.0.1,10.0.0.2"
+    assert environ["wsgi.url_scheme"] == "https"
+
+
+def test_thread_pool_is_sized_against_the_concurrency_limits():
+    assert get_max_threads() == 32 + 8
+    assert get_max_threads(concurrency_limits={"streams": 2}) == 32 + 2
+    limits = {"writes": 32, "searches": 8, "artifacts": 4, "streams": 16}
+    assert get_max_threads(concurrency_limits=limits) == 44 + 8
+    with mock.patch("mlflow.server.asgi._logger.warning") as warning:
+        assert get_max_threads(60, limits) == 60
+        warning.assert_not_called()
+        assert get_max_threads(20, limits) == 20
+        assert "admitted requests may wait for a thread" in warning.call_args[0][0]
+        assert get_max_threads(4) == 4
+        assert "can all be held by metric streams" in warning.call_args[0][0]
+
+
+def test_create_app_sizes_the_thread_pool_from_the_server_options():
+    with mock.patch.dict(os.environ, {CONCURRENCY_LIMITS_ENV_VAR: "searches=40"}):
+        assert create_app().max_threads == 48
+        with mock.patch.dict(os.environ, {ASGI_MAX_THREADS_ENV_VAR: "64"}):
+            assert create_app().max_threads == 64
+        # Each worker admits its share of the requests unless the workers share their limits
+        with mock.patch.dict(os.environ, {WORKERS_ENV_VAR: "4"}):
+            assert create_app().max_threads == 40
+            with mock.patch.dict(os.environ, {ADMISSION_CONTROL_STATE_ENV_VAR: "sqlite:///s.db"}):
+                assert create_app().max_threads == 48
@@ -1,3 +1,4 @@
+import collections
 import json
 import uuid
 
@@ -6,7 +7,7 @@ from unittest import mock
 
 import os
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import ViewType, Run, RunData, RunInfo, RunStatus, Metric, Param, RunTag
 from mlflow.entities.model_registry import (
     RegisteredModel,
     ModelVersion,
@@ -14,13 +15,21 @@ from mlflow.entities.model_registry import (
     ModelVersionTag,
 )
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE, ErrorCode
+from mlflow.protos.databricks_pb2 import (
+    FEATURE_DISABLED,
+    INTERNAL_ERROR,
+    INVALID_PARAMETER_VALUE,
+    ErrorCode,
+)
 from mlflow.server.handlers import (
     get_endpoints,
     _create_experiment,
     _get_request_message,
     _search_runs,
     _log_batch,
+    _create_runs,
+    _terminate_runs,
+    _delete_runs,
     catch_mlflow_exception,
     _create_registered_model,
     _update_registered_model,
@@ -42,9 +51,17 @@ from mlflow.server.handlers import (
     _set_model_version_tag,
     _delete_model_version_tag,
 )
-from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
+from mlflow.server import ARTIFACTS_DESTINATION_ENV_VAR, BACKEND_STORE_URI_ENV_VAR, app
+from mlflow.server.response_cache import InMemoryResponseCache
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
+from mlflow.protos.service_pb2 import (
+    CreateExperiment,
+    SearchRuns,
+    CreateRuns,
+    TerminateRuns,
+    DeleteRuns,
+)
 from mlflow.protos.model_registry_pb2 import (
     CreateRegisteredModel,
     UpdateRegisteredModel,
@@ -66,6 +83,7 @@ from mlflow.protos.model_registry_pb2 import (
     SetModelVersionTag,
     DeleteModelVersionTag,
 )
+from mlflow.utils.arrow_utils import deserialize_table, runs_to_arrow_table
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE
 
@@ -201,6 +219,451 @@ def test_log_batch_api_req(mock_get_request_json):
     )
 
 
+def _run_info(run_id, status=RunStatus.RUNNING):
+    return RunInfo(
+        run_uuid=run_id,
+        run_id=run_id,
+        experiment_id="0",
+        user_id="user",
+        status=RunStatus.to_string(status),
+        start_time=123,
+        end_time=None,
+        lifecycle_stage="active",
+    )
+
+
+def test_create_runs(mock_get_request_message, mock_tracking_store):
+    runs_data = [
+        RunData(
+            metrics=[Metric("m", 1.0, 123, 0)], params=[Param("p", "a")], tags=[RunTag("t", "x")]
+        ),
+        RunData(),
+    ]
+    mock_get_request_message.return_value = CreateRuns(
+        experiment_id="0",
+        user_id="user",
+        start_time=123,
+        runs_data=[run_data.to_proto() for run_data in runs_data],
+    )
+    runs = [Run(_run_info("a"), runs_data[0]), Run(_run_info("b"), runs_data[1])]
+    mock_tracking_store.create_runs.return_value = runs
+    resp = _create_runs()
+    _, args = mock_tracking_store.create_runs.call_args
+    assert args["experiment_id"] == "0"
+    assert args["user_id"] == "user"
+    assert args["start_time"] == 123
+    assert [run_data.to_dictionary() for run_data in args["runs_data"]] == [
+        run_data.to_dictionary() for run_data in runs_data
+    ]
+    assert json.loads(resp.get_data()) == {"runs": jsonify(runs)}
+
+
+def test_terminate_runs(mock_get_request_message, mock_tracking_store):
+    mock_get_request_message.return_value = TerminateRuns(
+        run_ids=["a", "b"], status=RunStatus.FINISHED, end_time=456
+    )
+    run_infos = [_run_info("a", RunStatus.FINISHED), _run_info("b", RunStatus.FINISHED)]
+    mock_tracking_store.update_run_infos.return_value = run_infos
+    resp = _terminate_runs()
+    mock_tracking_store.update_run_infos.assert_called_once_with(
+        ["a", "b"], RunStatus.FINISHED, 456
+    )
+    assert json.loads(resp.get_data()) == {"run_infos": jsonify(run_infos)}
+
+
+def test_delete_runs(mock_get_request_message, mock_tracking_store):
+    mock_get_request_message.return_value = DeleteRuns(run_ids=["a", "b"])
+    _delete_runs()
+    mock_tracking_store.delete_runs.assert_called_once_with(["a", "b"])
+
+
+def test_get_metric_history_since(mock_tracking_store):
+    mock_tracking_store.get_metric_history_since.return_value = [Metric("m", 1.5, 20, 3)]
+    query = {"run_id": "a", "metric_key": "m", "since_step": 2, "since_timestamp": 10}
+    with app.test_client() as c:
+        response = c.get("/api/2.0/mlflow/metrics/get-history", query_string=query)
+        assert response.status_code == 200
+        assert json.loads(response.get_data())["metrics"] == [
+            {"key": "m", "value": 1.5, "timestamp": "20", "step": "3"}
+        ]
+        mock_tracking_store.get_metric_history_since.assert_called_once_with("a", "m", 2, 10)
+        mock_tracking_store.get_metric_history.assert_not_called()
+
+        del query["since_timestamp"]
+        response = c.get("/api/2.0/mlflow/metrics/get-history", query_string=query)
+        assert response.status_code == 400
+        assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+
+
+def test_get_run_omits_run_unchanged_since_version(mock_tracking_store):
+    def run_with(metric, params):
+        return Run(_run_info("a"), RunData(metrics=[metric], params=params))
+
+    params = [Param("p", "a"), Param("q", "b")]
+    mock_tracking_store.get_run.return_value = run_with(Metric("m", 1.0, 1, 0), params)
+    with app.test_client() as c:
+        first = json.loads(c.get("/api/2.0/mlflow/runs/get?run_id=a").get_data())
+        assert first["run"]["info"]["run_id"] == "a"
+        version = first["version"]
+
+        # The version does not depend on the order in which the store returns the run data
+        mock_tracking_store.get_run.return_value = run_with(Metric("m", 1.0, 1, 0), params[::-1])
+        query = {"run_id": "a", "since_version": version}
+        unchanged = json.loads(c.get("/api/2.0/mlflow/runs/get", query_string=query).get_data())
+        assert unchanged == {"version": version}
+
+        mock_tracking_store.get_run.return_value = run_with(Metric("m", 2.0, 2, 1), params)
+        changed = json.loads(c.get("/api/2.0/mlflow/runs/get", query_string=query).get_data())
+        assert changed["version"] != version
+        assert changed["run"]["data"]["metrics"] == [
+            {"key": "m", "value": 2.0, "timestamp": "2", "step": "1"}
+        ]
+
+
+def test_export_runs(mock_tracking_store):
+    runs = [Run(_run_info("a"), RunData(metrics=[Metric("m", 1.0, 123, 0)]))]
+    table = runs_to_arrow_table(runs)
+    mock_tracking_store.export_run_batches.side_effect = lambda *args: (table.schema, iter([table]))
+    body = {"experiment_ids": ["0"], "filter": "metrics.m > 0", "order_by": ["metrics.m DESC"]}
+    with app.test_client() as c:
+        response = c.post("/api/2.0/mlflow/runs/export", json=body)
+        assert response.status_code == 200
+        assert response.mimetype == "application/vnd.apache.arrow.stream"
+        assert response.is_streamed
+        assert deserialize_table(response.get_data()).column("metrics.m").to_pylist() == [1.0]
+        mock_tracking_store.export_run_batches.assert_called_once_with(
+            ["0"], "metrics.m > 0", ViewType.ACTIVE_ONLY, 100000, ["metrics.m DESC"]
+        )
+
+        response = c.post("/api/2.0/mlflow/runs/export?format=parquet", json=body)
+        assert response.mimetype == "application/vnd.apache.parquet"
+        assert deserialize_table(response.get_data(), "parquet").num_rows == 1
+
+        for query, request_body in [("?format=csv", body), ("", dict(body, max_results=100001))]:
+            response = c.post("/api/2.0/mlflow/runs/export" + query, json=request_body)
+            assert response.status_code == 400
+            assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+
+
+@pytest.fixture()
+def artifact_file(tmpdir):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.mkdir("subdir").join("data.txt").write("0123456789")
+    with mock.patch(
+        "mlflow.server.handlers._get_artifact_repo",
+        return_value=LocalArtifactRepository(artifact_dir.strpath),
+    ), mock.patch("mlflow.server.handlers._get_tracking_store"):
+        yield "/get-artifact?run_id=123&path=subdir/data.txt"
+
+
+def test_get_artifact_streams_file_contents(artifact_file):
+    with app.test_client() as c:
+        response = c.get(artifact_file)
+        assert response.status_code == 200
+        assert response.get_data() == b"0123456789"
+        assert response.mimetype == "text/plain"
+        assert response.headers["Content-Disposition"] == "attachment; filename=data.txt"
+        assert response.headers["Content-Length"] == "10"
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+
+def test_get_artifact_serves_byte_ranges(artifact_file):
+    with app.test_client() as c:
+        response = c.get(artifact_file, headers={"Range": "bytes=2-5"})
+        assert response.status_code == 206
+        assert response.get_data() == b"2345"
+        assert response.headers["Content-Range"] == "bytes 2-5/10"
+        assert response.headers["Content-Length"] == "4"
+
+        response = c.get(artifact_file, headers={"Range": "bytes=-3"})
+        assert response.status_code == 206
+        assert response.get_data() == b"789"
+
+        response = c.get(artifact_file, headers={"Range": "bytes=20-"})
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == "bytes */10"
+
+        # Multiple ranges are answered with the full contents
+        response = c.get(artifact_file, headers={"Range": "bytes=0-1,4-5"})
+        assert response.status_code == 200
+        assert response.get_data() == b"0123456789"
+
+
+def test_get_artifact_conditional_requests(artifact_file):
+    with app.test_client() as c:
+        etag = c.get(artifact_file).headers["ETag"]
+
+        response = c.get(artifact_file, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.get_data() == b""
+
+        response = c.get(artifact_file, headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+
+        response = c.get(artifact_file, headers={"Range": "bytes=0-1", "If-Range": etag})
+        assert response.status_code == 206
+        assert response.get_data() == b"01"
+
+        response = c.get(artifact_file, headers={"Range": "bytes=0-1", "If-Range": '"other"'})
+        assert response.status_code == 200
+        assert response.get_data() == b"0123456789"
+
+
+def test_get_artifact_missing_file_returns_not_found(artifact_file):
+    with app.test_client() as c:
+        response = c.get("/get-artifact?run_id=123&path=subdir/missing.txt")
+        assert response.status_code == 404
+        assert json.loads(response.get_data())["error_code"] == "RESOURCE_DOES_NOT_EXIST"
+
+
+@pytest.fixture()
+def artifacts_destination(tmpdir):
+    destination = tmpdir.mkdir("destination")
+    with mock.patch.dict(os.environ, {ARTIFACTS_DESTINATION_ENV_VAR: destination.strpath}), (
+        mock.patch("mlflow.server.handlers._artifacts_destination_repo", None)
+    ):
+        yield destination
+
+
+def test_proxied_artifact_upload_download_and_list(artifacts_destination):
+    with app.test_client() as c:
+        response = c.put("/api/2.0/mlflow-artifacts/artifacts/1/run/a.txt", data=b"0123456789")
+        assert response.status_code == 200
+        assert artifacts_destination.join("1", "run", "a.txt").read() == "0123456789"
+
+        response = c.get("/api/2.0/mlflow-artifacts/artifacts/1/run/a.txt")
+        assert response.get_data() == b"0123456789"
+        response = c.get(
+            "/api/2.0/mlflow-artifacts/artifacts/1/run/a.txt", headers={"Range": "bytes=2-3"}
+        )
+        assert response.get_data() == b"23"
+
+        response = c.get("/api/2.0/mlflow-artifacts/artifacts?path=1/run")
+        assert json.loads(response.get_data()) == {
+            "files": [{"path": "1/run/a.txt", "is_dir": False, "file_size": 10}],
+            "recursive": False,
+        }
+        response = c.get("/api/2.0/mlflow-artifacts/artifacts?path=1&recursive=true")
+        assert json.loads(response.get_data()) == {
+            "files": [{"path": "1/run/a.txt", "is_dir": False, "file_size": 10}],
+            "recursive": True,
+        }
+
+
+def test_proxied_artifact_upload_streams_body_to_destination(artifacts_destination):
+    with app.test_client() as c, mock.patch.object(
+        LocalArtifactRepository, "log_artifact_stream", autospec=True
+    ) as log_artifact_stream_mock:
+        response = c.put("/api/2.0/mlflow-artifacts/artifacts/1/run/a.txt", data=b"0123456789")
+        assert response.status_code == 200
+        artifact_path = log_artifact_stream_mock.call_args[0][2]
+        assert artifact_path == "1/run/a.txt"
+
+        log_artifact_stream_mock.side_effect = MlflowException(
+            "LocalArtifactRepository does not support streamed uploads.",
+            error_code=FEATURE_DISABLED,
+        )
+        response = c.put("/api/2.0/mlflow-artifacts/artifacts/1/run/a.txt", data=b"0")
+        assert response.status_code == 501
+        assert json.loads(response.get_data())["error_code"] == "FEATURE_DISABLED"
+
+
+def test_proxied_multipart_upload(artifacts_destination):
+    path = "/api/2.0/mlflow-artifacts/mpu/{}/1/run/model.bin"
+    with app.test_client() as c:
+        upload_id = json.loads(c.post(path.format("create")).get_data())["upload_id"]
+        etags = {}
+        # Parts can be uploaded in any order and re-uploaded
+        for part_number, data in [(2, b"xx"), (1, b"0123"), (2, b"45")]:
+            response = c.put(
+                path.format("upload"),
+                query_string={"upload_id": upload_id, "part_number": part_number},
+                data=data,
+            )
+            assert response.status_code == 200
+            etags[part_number] = json.loads(response.get_data())["etag"]
+
+        response = c.get(path.format("parts"), query_string={"upload_id": upload_id})
+        parts = json.loads(response.get_data())["parts"]
+        assert [(p["part_number"], p["size"], p["etag"]) for p in parts] == [
+            (1, 4, etags[1]),
+            (2, 2, etags[2]),
+        ]
+
+        response = c.post(
+            path.format("complete"),
+            query_string={"upload_id": upload_id},
+            json={"parts": [{"part_number": n, "etag": etag} for n, etag in etags.items()]},
+        )
+        assert response.status_code == 200
+        assert artifacts_destination.join("1", "run", "model.bin").read() == "012345"
+        response = c.get(path.format("parts"), query_string={"upload_id": upload_id})
+        assert response.status_code == 404
+
+        upload_id = json.loads(c.post(path.format("create")).get_data())["upload_id"]
+        response = c.put(
+            path.format("upload"), query_string={"upload_id": upload_id, "part_number": 0}
+        )
+        assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+        c.post(path.format("abort"), query_string={"upload_id": upload_id})
+        response = c.get(path.format("parts"), query_string={"upload_id": upload_id})
+        assert response.status_code == 404
+
+
+def test_proxied_artifact_paths_are_validated(artifacts_destination):
+    with app.test_client() as c:
+        for path in ["../outside.txt", "1/./a.txt", "1/a/../../../b.txt"]:
+            response = c.put("/api/2.0/mlflow-artifacts/artifacts/" + path, data=b"0")
+            assert response.status_code == 400
+            assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+        response = c.get("/api/2.0/mlflow-artifacts/artifacts?path=..")
+        assert response.status_code == 400
+
+
+def test_proxied_artifact_access_requires_destination():
+    with app.test_client() as c, mock.patch.dict(os.environ, clear=True):
+        response = c.get("/api/2.0/mlflow-artifacts/artifacts")
+        assert response.status_code == 404
+        assert json.loads(response.get_data())["error_code"] == "ENDPOINT_NOT_FOUND"
+
+
+def test_list_artifacts_recursively(mock_tracking_store, tmpdir):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.join("a.txt").write("A")
+    artifact_dir.mkdir("model").mkdir("data").join("b.txt").write("BB")
+    artifact_dir.join("model").mkdir("empty")
+    run = Run(
+        RunInfo("run1", "0", "user", "RUNNING", 1, None, "active", artifact_dir.strpath), RunData(),
+    )
+    mock_tracking_store.get_run.return_value = run
+    with app.test_client() as c:
+        for recursive, expected_files in [
+            ("false", [("a.txt", False, "1"), ("model", True, None)]),
+            (
+                "true",
+                [
+                    ("a.txt", False, "1"),
+                    ("model/data/b.txt", False, "2"),
+                    ("model/empty", True, None),
+                ],
+            ),
+        ]:
+            response = c.get(
+                "/api/2.0/mlflow/artifacts/list",
+                query_string={"run_id": "run1", "recursive": recursive},
+            )
+            files = json.loads(response.get_data())["files"]
+            assert [(f["path"], f["is_dir"], f.get("file_size")) for f in files] == expected_files
+
+
+@pytest.fixture()
+def response_cache():
+    cache = InMemoryResponseCache()
+    with mock.patch("mlflow.server.handlers._response_cache", cache), mock.patch(
+        "mlflow.server.handlers._response_cache_ttls", {None: 60}
+    ), mock.patch("mlflow.server.handlers._run_experiment_ids", collections.OrderedDict()):
+        yield cache
+
+
+def test_read_handlers_are_served_from_response_cache(mock_tracking_store, response_cache):
+    run = Run(
+        RunInfo("run1", "0", "user", "RUNNING", 1, None, "active", "artifact_uri"), RunData(),
+    )
+    mock_tracking_store.get_run.return_value = run
+    with app.test_client() as c:
+        first = c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+        second = c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+        assert first.status_code == second.status_code == 200
+        assert first.get_data() == second.get_data()
+        assert mock_tracking_store.get_run.call_count == 1
+        assert response_cache.get_stats() == {"GetRun": (1, 1)}
+
+        # Writes to the run invalidate its cached responses, with the experiment of the run read
+        for _ in range(2):
+            c.post(
+                "/api/2.0/mlflow/runs/set-tag", json={"run_id": "run1", "key": "k", "value": "v"}
+            )
+        assert mock_tracking_store.set_tag.call_count == 2
+        assert mock_tracking_store.get_run.call_count == 1
+        c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+        assert mock_tracking_store.get_run.call_count == 2
+
+
+def test_reads_concurrent_with_writes_are_not_cached(mock_tracking_store, response_cache):
+    run = Run(
+        RunInfo("run1", "0", "user", "RUNNING", 1, None, "active", "artifact_uri"), RunData(),
+    )
+
+    def get_run(run_id):
+        if mock_tracking_store.get_run.call_count == 1:
+            # A write to the run commits and invalidates its responses while the run is read
+            response_cache.invalidate(["run:run1"])
+        return run
+
+    mock_tracking_store.get_run.side_effect = get_run
+    with app.test_client() as c:
+        for _ in range(3):
+            assert c.get("/api/2.0/mlflow/runs/get?run_id=run1").status_code == 200
+    assert mock_tracking_store.get_run.call_count == 2
+    assert response_cache.get_stats() == {"GetRun": (1, 2)}
+
+
+def test_run_writes_invalidate_search_results_of_their_experiment(
+    mock_tracking_store, response_cache
+):
+    mock_tracking_store.search_runs.return_value = PagedList([], None)
+    mock_tracking_store.get_run.return_value.info.experiment_id = "0"
+    search_0 = {"experiment_ids": ["0"]}
+    search_1 = {"experiment_ids": ["1"]}
+    with app.test_client() as c:
+        c.post("/api/2.0/mlflow/runs/search", json=search_0)
+        c.post("/api/2.0/mlflow/runs/search", json=search_1)
+        c.post("/api/2.0/mlflow/runs/search", json=search_0)
+        assert mock_tracking_store.search_runs.call_count == 2
+
+        c.post("/api/2.0/mlflow/runs/log-metric", json={"run_id": "run1", "key": "m", "value": 1})
+        c.post("/api/2.0/mlflow/runs/search", json=search_1)
+        assert mock_tracking_store.search_runs.call_count == 2
+        c.post("/api/2.0/mlflow/runs/search", json=search_0)
+        assert mock_tracking_store.search_runs.call_count == 3
+
+
+def test_run_writes_look_up_the_experiments_of_runs_once(mock_tracking_store, response_cache):
+    def make_run(run_id, experiment_id):
+        info = RunInfo(run_id, experiment_id, "user", "RUNNING", 1, None, "active", "")
+        return Run(info, RunData())
+
+    mock_tracking_store.create_run.side_effect = lambda experiment_id, **kwargs: make_run(
+        "run{}".format(mock_tracking_store.create_run.call_count), experiment_id
+    )
+    mock_tracking_store.get_run.side_effect = lambda run_id: make_run(run_id, "1")
+    log_metric = {"key": "m", "value": 1, "timestamp": 0}
+    with mock.patch(
+        "mlflow.server.handlers._RUN_EXPERIMENT_IDS_MAX_SIZE", 2
+    ), app.test_client() as c:
+        # The experiments of runs created by this server are taken from the created runs
+        for _ in range(3):
+            c.post("/api/2.0/mlflow/runs/create", json={"experiment_id": "0"})
+        for run_id in ["run2", "run3"]:
+            c.post("/api/2.0/mlflow/runs/log-metric", json=dict(log_metric, run_id=run_id))
+        assert mock_tracking_store.get_run.call_count == 0
+        # Other runs are fetched once, evicting the least recently used ones
+        for run_id in ["run1", "run1", "run3"]:
+            c.post("/api/2.0/mlflow/runs/log-metric", json=dict(log_metric, run_id=run_id))
+        assert mock_tracking_store.get_run.call_count == 1
+        assert list(mlflow.server.handlers._run_experiment_ids) == ["run1", "run3"]
+
+
+def test_failed_responses_are_not_cached(mock_tracking_store, response_cache):
+    mock_tracking_store.get_experiment.side_effect = MlflowException("not found")
+    with app.test_client() as c:
+        for _ in range(2):
+            assert c.get("/api/2.0/mlflow/experiments/get?experiment_id=0").status_code == 500
+        assert mock_tracking_store.get_experiment.call_count == 2
+
+
 def test_catch_mlflow_exception():
     @catch_mlflow_exception
     def test_handler():
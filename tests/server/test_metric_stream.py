@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+
+import pytest
+from unittest import mock
+
+from mlflow.entities import Metric, RunStatus
+from mlflow.server import app, metric_stream
+from mlflow.store.tracking.file_store import FileStore
+
+
+@pytest.fixture()
+def store(tmpdir):
+    store = FileStore(tmpdir.join("mlruns").strpath)
+    with mock.patch("mlflow.server.handlers._get_tracking_store", return_value=store):
+        yield store
+
+
+def _create_run(store):
+    return store.create_run(
+        experiment_id=FileStore.DEFAULT_EXPERIMENT_ID, user_id="user", start_time=0, tags=[]
+    ).info.run_id
+
+
+def _parse_events(events):
+    return [
+        (data["run_id"], data["metric"]["key"], data["metric"]["value"])
+        for data in [json.loads(event.split("data: ")[1]) for event in events]
+    ]
+
+
+def test_stream_sends_values_logged_after_it_is_opened(store):
+    run_id = _create_run(store)
+    other_run_id = _create_run(store)
+    store.log_metric(run_id, Metric("loss", 1.0, 1, 0))
+    stream = metric_stream.MetricStream(store, [run_id, other_run_id], [])
+
+    store.log_metric(run_id, Metric("loss", 0.5, 2, 1))
+    store.log_metric(run_id, Metric("loss", 0.4, 3, 2))
+    store.log_metric(other_run_id, Metric("acc", 0.9, 2, 0))
+    for run in [run_id, other_run_id]:
+        store.update_run_info(run, RunStatus.FINISHED, 10)
+
+    assert _parse_events(stream) == [
+        (run_id, "loss", 0.5),
+        (run_id, "loss", 0.4),
+        (other_run_id, "acc", 0.9),
+    ]
+
+
+def test_stream_filters_metrics_and_wakes_up_on_notifications(store):
+    run_id = _create_run(store)
+    stream = iter(metric_stream.MetricStream(store, [run_id], ["loss"]))
+
+    def log_metrics():
+        time.sleep(0.5)
+        store.log_metric(run_id, Metric("acc", 0.9, 1, 0))
+        store.log_metric(run_id, Metric("loss", 0.5, 1, 0))
+        store.update_run_info(run_id, RunStatus.FINISHED, 10)
+        metric_stream.notify(run_id)
+
+    thread = threading.Thread(target=log_metrics)
+    start = time.time()
+    with mock.patch.object(metric_stream, "POLL_INTERVAL", 60):
+        thread.start()
+        assert _parse_events(stream) == [(run_id, "loss", 0.5)]
+    thread.join()
+    assert time.time() - start < 30
+    assert metric_stream._notifier._runs == {}
+
+
+def test_stream_ends_after_maximum_duration(store):
+    run_id = _create_run(store)
+    with mock.patch.object(metric_stream, "MAX_STREAM_DURATION", 0.5), mock.patch.object(
+        metric_stream, "POLL_INTERVAL", 0.1
+    ), mock.patch.object(metric_stream, "HEARTBEAT_INTERVAL", 0.2):
+        events = list(metric_stream.MetricStream(store, [run_id], []))
+    assert events
+    assert all(event == ": keep-alive\n\n" for event in events)
+
+
+def _get_stream(client, query_string=None, multithread=True):
+    return client.get(
+        "/api/2.0/mlflow/metrics/stream",
+        query_string=query_string,
+        environ_overrides={"wsgi.multithread": multithread},
+    )
+
+
+def test_stream_endpoint(store):
+    run_id = _create_run(store)
+    store.update_run_info(run_id, RunStatus.FINISHED, 10)
+    with app.test_client() as c:
+        response = _get_stream(c, {"run_id": run_id})
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert response.get_data() == b""
+
+        response = _get_stream(c)
+        assert response.status_code == 400
+        assert json.loads(response.get_data())["error_code"] == "INVALID_PARAMETER_VALUE"
+
+        response = _get_stream(c, {"run_id": "missing"})
+        assert response.status_code == 404
+
+
+def test_stream_endpoint_is_refused_by_servers_without_threads(store):
+    run_id = _create_run(store)
+    with app.test_client() as c:
+        response = _get_stream(c, {"run_id": run_id}, multithread=False)
+        assert response.status_code == 501
+        assert json.loads(response.get_data())["error_code"] == "FEATURE_DISABLED"
+
+
+def test_stream_endpoint_limits_concurrent_streams(store):
+    run_id = _create_run(store)
+    slots = threading.BoundedSemaphore(1)
+    with app.test_client() as c, mock.patch.object(
+        metric_stream, "_stream_slots", slots
+    ), mock.patch.object(metric_stream, "HEARTBEAT_INTERVAL", 0):
+        stream = _get_stream(c, {"run_id": run_id})
+        response = _get_stream(c, {"run_id": run_id})
+        assert response.status_code == 429
+        assert json.loads(response.get_data())["error_code"] == "REQUEST_LIMIT_EXCEEDED"
+
+        # Closing a stream releases its slot, as do streams failing to open
+        stream.close()
+        response = _get_stream(c, {"run_id": "missing"})
+        assert response.status_code == 404
+        store.update_run_info(run_id, RunStatus.FINISHED, 10)
+        response = _get_stream(c, {"run_id": run_id})
+        assert response.status_code == 200
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+from unittest import mock
+from flask import Flask
+from prometheus_client import CollectorRegistry
+
+from mlflow.server import (
+    handlers,
+    ARTIFACT_ROOT_ENV_VAR,
+    ARTIFACTS_DESTINATION_ENV_VAR,
+    BACKEND_STORE_URI_ENV_VAR,
+)
+from mlflow.server.handlers import (
+    get_artifact_proxy_endpoints,
+    get_endpoints,
+    get_metric_stream_endpoints,
+    get_run_export_endpoints,
+)
+from mlflow.server.prometheus_exporter import (
+    ServerMetrics,
+    change_path_for_metric,
+    get_instrumented_view_names,
+    instrument_server,
+)
+
+
+@pytest.fixture()
+def instrumented_app(tmpdir):
+    app = Flask(__name__)
+    for http_path, handler, methods in (
+        get_endpoints()
+        + get_artifact_proxy_endpoints()
+        + get_metric_stream_endpoints()
+        + get_run_export_endpoints()
+    ):
+        app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
+    registry = CollectorRegistry()
+    env = {
+        BACKEND_STORE_URI_ENV_VAR: "sqlite:///" + tmpdir.join("mlflow.db").strpath,
+        ARTIFACT_ROOT_ENV_VAR: tmpdir.join("artifacts").strpath,
+        ARTIFACTS_DESTINATION_ENV_VAR: tmpdir.join("proxied").strpath,
+    }
+    with mock.patch.dict("os.environ", env), mock.patch.object(
+        handlers, "_store_wrappers", []
+    ), mock.patch.object(handlers, "_serialization_listeners", []), mock.patch.object(
+        handlers, "_tracking_store", None
+    ), mock.patch.object(
+        handlers, "_model_registry_store", None
+    ), mock.patch.object(
+        handlers, "_artifacts_destination_repo", None
+    ):
+        instrument_server(app, ServerMetrics(registry), get_instrumented_view_names())
+        yield app, registry
+
+
+def _sample(registry, name, **labels):
+    return registry.get_sample_value(name, labels) or 0
+
+
+def test_handlers_and_stores_are_instrumented(instrumented_app):
+    app, registry = instrumented_app
+    with app.test_client() as c:
+        request_body = json.dumps({"name": "exp"})
+        response = c.post("/api/2.0/mlflow/experiments/create", data=request_body)
+        assert response.status_code == 200
+        experiment_id = json.loads(response.get_data())["experiment_id"]
+        response = c.post(
+            "/api/2.0/mlflow/runs/search", data=json.dumps({"experiment_ids": [experiment_id]})
+        )
+        assert response.status_code == 200
+        response = c.get("/api/2.0/preview/mlflow/registered-models/list")
+        assert response.status_code == 200
+
+    path = "experiments_create"
+    assert _sample(registry, "mlflow_request_body_bytes_count", path=path) == 1
+    assert _sample(registry, "mlflow_request_body_bytes_sum", path=path) == len(request_body)
+    assert _sample(registry, "mlflow_response_body_bytes_sum", path=path) == len(
+        json.dumps({"experiment_id": experiment_id}, indent=2)
+    )
+    assert _sample(registry, "mlflow_response_serialization_seconds_count", path=path) == 1
+    assert (
+        _sample(
+            registry,
+            "mlflow_store_call_seconds_count",
+            path=path,
+            store="tracking",
+            method="create_experiment",
+        )
+        == 1
+    )
+    assert (
+        _sample(
+            registry,
+            "mlflow_store_call_seconds_count",
+            path="runs_search",
+            store="tracking",
+            method="search_runs",
+        )
+        == 1
+    )
+    assert (
+        _sample(
+            registry,
+            "mlflow_store_call_seconds_count",
+            path="registered-models_list",
+            store="model_registry",
+            method="list_registered_models",
+        )
+        == 1
+    )
+    for path in ["experiments_create", "runs_search", "registered-models_list"]:
+        queries = _sample(registry, "mlflow_db_query_seconds_count", path=path)
+        assert queries > 0
+        assert _sample(registry, "mlflow_db_queries_per_request_sum", path=path) == queries
+        assert _sample(registry, "mlflow_db_queries_per_request_count", path=path) == 1
+        assert _sample(registry, "mlflow_db_pool_connections_in_use_count", path=path) > 0
+        assert _sample(registry, "mlflow_db_pool_connections_in_use_sum", path=path) > 0
+    assert _sample(registry, "mlflow_db_connect_seconds_count", path="experiments_create") > 0
+
+
+def test_all_server_endpoints_are_instrumented(instrumented_app):
+    app, registry = instrumented_app
+    assert {"_export_runs", "_stream_metrics", "_upload_proxied_artifact", "serve_artifacts"} <= (
+        get_instrumented_view_names()
+    )
+    with app.test_client() as c:
+        response = c.put("/api/2.0/mlflow-artifacts/artifacts/a/b.txt", data=b"abc")
+        assert response.status_code == 200
+        response = c.put("/api/2.0/mlflow-artifacts/artifacts/c.txt", data=b"defg")
+        assert response.status_code == 200
+
+    # Requests are labeled by their URL rule rather than by their artifact path
+    path = change_path_for_metric("/api/2.0/mlflow-artifacts/artifacts/<path:artifact_path>")
+    assert _sample(registry, "mlflow_request_body_bytes_count", path=path) == 2
+    assert _sample(registry, "mlflow_request_body_bytes_sum", path=path) == 7
+
+
+def test_stores_created_before_instrumentation_are_wrapped():
+    store = mock.Mock()
+    with mock.patch.object(handlers, "_store_wrappers", []), mock.patch.object(
+        handlers, "_tracking_store", store
+    ):
+        handlers.add_store_wrapper(lambda s: ("wrapped", s))
+        assert handlers._tracking_store == ("wrapped", store)
+
+
+def test_change_path_for_metric():
+    assert change_path_for_metric("/api/2.0/mlflow/runs/search") == "runs_search"
+    assert change_path_for_metric("/health") == "_health"
@@ -0,0 +1,128 @@
+import time
+from unittest import mock
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.server.response_cache import (
+    DEFAULT_RESPONSE_CACHE_TTL,
+    InMemoryResponseCache,
+    SqliteResponseCache,
+    get_response_cache,
+    parse_response_cache_ttls,
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmpdir):
+    if request.param == "memory":
+        return InMemoryResponseCache(max_entries=3)
+    return SqliteResponseCache(tmpdir.join("cache.db").strpath, max_entries=3)
+
+
+def test_get_set_and_invalidate(cache):
+    assert cache.get("a") is None
+    cache.set("a", b"value-a", None, ["run:1", "experiment:0"])
+    cache.set("b", b"value-b", None, ["run:2", "experiment:0"])
+    cache.set("c", b"value-c", None, ["run:3", "experiment:1"])
+    assert cache.get("a") == b"value-a"
+
+    cache.invalidate(["run:2"])
+    assert cache.get("b") is None
+    assert cache.get("a") == b"value-a"
+
+    cache.invalidate(["experiment:0", "unknown"])
+    assert cache.get("a") is None
+    assert cache.get("c") == b"value-c"
+
+
+def test_entries_expire(cache):
+    cache.set("a", b"value-a", 10, [])
+    cache.set("b", b"value-b", None, [])
+    with mock.patch("time.time", return_value=time.time() + 11):
+        assert cache.get("a") is None
+        assert cache.get("b") == b"value-b"
+
+
+def test_replacing_an_entry_replaces_its_tags(cache):
+    cache.set("a", b"value-a", None, ["run:1"])
+    cache.set("a", b"new-value-a", None, ["run:2"])
+    cache.invalidate(["run:1"])
+    assert cache.get("a") == b"new-value-a"
+    cache.invalidate(["run:2"])
+    assert cache.get("a") is None
+
+
+def test_responses_predating_an_invalidation_of_their_tags_are_not_cached(cache):
+    started_at = time.time()
+    cache.invalidate(["run:1"])
+    cache.set("a", b"stale-a", None, ["run:1", "experiment:0"], since=started_at)
+    assert cache.get("a") is None
+    cache.set("b", b"value-b", None, ["run:2", "experiment:0"], since=started_at)
+    assert cache.get("b") == b"value-b"
+    cache.set("a", b"value-a", None, ["run:1", "experiment:0"], since=time.time())
+    assert cache.get("a") == b"value-a"
+
+    # Invalidation times are only remembered for a while, after which nothing older is cached
+    with mock.patch("time.time", return_value=started_at + 3601):
+        cache.invalidate(["run:3"])
+        cache.set("b", b"old-b", None, ["run:2"], since=started_at)
+        cache.set("c", b"value-c", None, ["run:1"], since=started_at + 3600)
+        assert cache.get("b") == b"value-b"
+        assert cache.get("c") == b"value-c"
+
+
+def test_in_memory_cache_evicts_least_recently_used_entries():
+    cache = InMemoryResponseCache(max_entries=2)
+    cache.set("a", b"value-a", None, ["tag"])
+    cache.set("b", b"value-b", None, ["tag"])
+    cache.get("a")
+    cache.set("c", b"value-c", None, ["tag"])
+    assert cache.get("b") is None
+    assert cache.get("a") == b"value-a"
+    assert cache.get("c") == b"value-c"
+
+
+def test_sqlite_cache_is_shared_across_instances(tmpdir):
+    path = tmpdir.join("cache.db").strpath
+    SqliteResponseCache(path).set("a", b"value-a", None, ["run:1"])
+    other = SqliteResponseCache(path)
+    assert other.get("a") == b"value-a"
+    other.invalidate(["run:1"])
+    assert SqliteResponseCache(path).get("a") is None
+
+
+def test_hit_ratio_and_listeners():
+    cache = InMemoryResponseCache()
+    listener = mock.Mock()
+    cache.add_lookup_listener(listener)
+    assert cache.hit_ratio() is None
+    cache.record_lookup("GetRun", True)
+    cache.record_lookup("GetRun", False)
+    cache.record_lookup("SearchRuns", True)
+    assert cache.get_stats() == {"GetRun": (1, 1), "SearchRuns": (1, 0)}
+    assert cache.hit_ratio("GetRun") == 0.5
+    assert cache.hit_ratio("ListExperiments") is None
+    assert cache.hit_ratio() == 2 / 3
+    listener.assert_called_with("SearchRuns", True)
+    assert listener.call_count == 3
+
+
+def test_get_response_cache(tmpdir):
+    assert isinstance(get_response_cache("memory"), InMemoryResponseCache)
+    assert get_response_cache("memory:?max_entries=5")._max_entries == 5
+    sqlite_cache = get_response_cache("sqlite:///" + tmpdir.join("cache.db").strpath)
+    assert isinstance(sqlite_cache, SqliteResponseCache)
+    with pytest.raises(MlflowException, match="Invalid response cache URI"):
+        get_response_cache("redis://localhost")
+
+
+def test_parse_response_cache_ttls():
+    assert parse_response_cache_ttls(None) == {None: DEFAULT_RESPONSE_CACHE_TTL}
+    assert parse_response_cache_ttls("30, GetRun=5,SearchRuns=2.5") == {
+        None: 30,
+        "GetRun": 5,
+        "SearchRuns": 2.5,
+    }
+    with pytest.raises(MlflowException, match="Invalid response cache time-to-live"):
+        parse_response_cache_ttls("GetRun=soon")
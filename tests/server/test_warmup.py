@@ -0,0 +1,102 @@
+import os
+
+import pytest
+import sqlalchemy
+from sqlalchemy.pool import QueuePool
+from unittest import mock
+
+from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR, app, handlers, warmup
+from mlflow.server import _build_gunicorn_command
+
+
+@pytest.fixture()
+def sqlite_backend(tmpdir):
+    env = {
+        BACKEND_STORE_URI_ENV_VAR: "sqlite:///" + tmpdir.join("mlflow.db").strpath,
+        ARTIFACT_ROOT_ENV_VAR: tmpdir.join("artifacts").strpath,
+    }
+    with mock.patch.dict(os.environ, env), mock.patch.object(
+        handlers, "_tracking_store", None
+    ), mock.patch.object(handlers, "_model_registry_store", None), mock.patch.object(
+        warmup, "_ready_pid", None
+    ):
+        yield
+
+
+def test_warm_up_initializes_stores_and_marks_process_ready(sqlite_backend):
+    assert not warmup.is_ready()
+    warmup.warm_up()
+    assert warmup.is_ready()
+    assert handlers._tracking_store is not None
+    assert handlers._model_registry_store is not None
+    # Forked processes do not inherit the readiness of their parent
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        assert not warmup.is_ready()
+
+
+def test_ready_endpoint_only_passes_once_warm(sqlite_backend):
+    with app.test_client() as c:
+        with mock.patch.object(warmup, "start_warmup") as start_warmup_mock:
+            assert c.get("/ready").status_code == 503
+            start_warmup_mock.assert_called_once_with()
+        warmup.start_warmup()
+        warmup._warmup_thread.join()
+        assert c.get("/ready").status_code == 200
+        assert c.get("/health").status_code == 200
+
+
+def test_failed_warm_up_is_retried(sqlite_backend):
+    with mock.patch.object(warmup, "warm_up", side_effect=[Exception("unreachable"), None]) as m:
+        warmup.start_warmup()
+        warmup._warmup_thread.join()
+        warmup.start_warmup()
+        warmup._warmup_thread.join()
+    assert m.call_count == 2
+
+
+def test_preload_warms_workers_after_fork(sqlite_backend):
+    with mock.patch("os.register_at_fork") as register_at_fork_mock:
+        warmup.preload()
+    assert warmup.is_ready()
+    hooks = register_at_fork_mock.call_args[1]
+    with mock.patch.object(warmup, "_fill_pool") as fill_pool_mock:
+        hooks["before"]()
+        with mock.patch("os.getpid", return_value=os.getpid() + 1):
+            hooks["after_in_child"]()
+            warmup._warmup_thread.join()
+            assert warmup.is_ready()
+    assert fill_pool_mock.call_count == len(warmup._get_store_engines())
+
+
+def test_connections_are_not_shared_across_forks(tmpdir):
+    engine = sqlalchemy.create_engine(
+        "sqlite:///" + tmpdir.join("db.sqlite").strpath, poolclass=QueuePool, pool_size=2
+    )
+    warmup._discard_connections_across_forks(engine)
+    warmup._fill_pool(engine)
+    assert engine.pool.checkedin() == 2
+    parent_connection = engine.raw_connection()
+    dbapi_connection = parent_connection.connection
+    parent_connection.close()
+
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        child_connection = engine.raw_connection()
+        # The connection of the parent is dropped without being closed
+        assert child_connection.connection is not dbapi_connection
+        dbapi_connection.execute("SELECT 1")
+        child_connection.close()
+
+
+def test_build_gunicorn_command_with_preload():
+    command = _build_gunicorn_command("--timeout 60", "127.0.0.1", 5000, 2, preload=True)
+    assert command == [
+        "gunicorn",
+        "--timeout",
+        "60",
+        "--preload",
+        "-b",
+        "127.0.0.1:5000",
+        "-w",
+        "2",
+        "mlflow.server:app",
+    ]
@@ -798,6 +798,51 @@ def test_parameter_search_estimators_produce_expected_outputs(cv_class, search_s
         assert len([metric for metric in child_metrics.keys() if metric.startswith("split")]) == 0
 
 
+def test_parameter_search_creates_child_runs_in_bulk():
+    mlflow.sklearn.autolog()
+
+    client_class = mlflow.tracking.MlflowClient
+    with mock.patch("mlflow.sklearn.utils.MAX_RUNS_PER_BATCH", 2), mock.patch.object(
+        client_class, "create_runs", autospec=True, side_effect=client_class.create_runs
+    ) as create_runs_mock, mock.patch.object(
+        client_class,
+        "set_terminated_runs",
+        autospec=True,
+        side_effect=client_class.set_terminated_runs,
+    ) as set_terminated_runs_mock, mock.patch.object(
+        client_class, "create_run", autospec=True, side_effect=client_class.create_run
+    ) as create_run_mock:
+        with mlflow.start_run() as run:
+            svc = sklearn.svm.SVC()
+            cv_model = sklearn.model_selection.GridSearchCV(svc, {"C": [1, 2, 3, 4, 5]}, n_jobs=1)
+            cv_model.fit(*get_iris())
+
+    # Five child runs are created and terminated in batches of at most two runs; only the parent
+    # run is created individually
+    assert [len(call[1]["runs_data"]) for call in create_runs_mock.call_args_list] == [2, 2, 1]
+    assert [len(call[1]["run_ids"]) for call in set_terminated_runs_mock.call_args_list] == [
+        2,
+        2,
+        1,
+    ]
+    assert create_run_mock.call_count == 1
+
+    client = mlflow.tracking.MlflowClient()
+    child_runs = client.search_runs(
+        run.info.experiment_id, "tags.`mlflow.parentRunId` = '{}'".format(run.info.run_id)
+    )
+    assert sorted(child_run.data.params["C"] for child_run in child_runs) == [
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+    for child_run in child_runs:
+        assert child_run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+        assert "mean_test_score" in child_run.data.metrics
+
+
 def test_parameter_search_handles_large_volume_of_metric_outputs():
     mlflow.sklearn.autolog()
 
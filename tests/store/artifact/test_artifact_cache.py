@@ -0,0 +1,216 @@
+import hashlib
+import os
+import posixpath
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from mlflow.entities import FileInfo
+from mlflow.store.artifact import artifact_cache
+from mlflow.store.artifact.artifact_cache import ArtifactCache, get_artifact_cache
+from mlflow.store.artifact.artifact_repo import ArtifactRepository, ArtifactStat
+from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+
+
+class MemoryArtifactRepository(ArtifactRepository):
+    def __init__(self, artifact_uri, files):
+        super().__init__(artifact_uri)
+        self.files = files
+        self.downloads = []
+
+    def log_artifact(self, local_file, artifact_path=None):
+        raise NotImplementedError()
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        raise NotImplementedError()
+
+    def list_artifacts(self, path):
+        prefix = path + "/" if path else ""
+        children = {p[len(prefix) :].split("/")[0] for p in self.files if p.startswith(prefix)}
+        return [
+            FileInfo(prefix + child, prefix + child not in self.files, None)
+            for child in sorted(children)
+        ]
+
+    def _download_file(self, remote_file_path, local_path):
+        self.downloads.append(remote_file_path)
+        with open(local_path, "wb") as f:
+            f.write(self.files[remote_file_path])
+
+    def get_artifact_stat(self, artifact_path):
+        data = self.files[artifact_path]
+        return ArtifactStat(len(data), None, hashlib.md5(data).hexdigest())
+
+
+@pytest.fixture()
+def repo():
+    return MemoryArtifactRepository(
+        "s3://bucket/1/abc/artifacts",
+        {"model/MLmodel": b"flavors", "model/data/weights.bin": b"0123456789"},
+    )
+
+
+def test_download_artifacts_reuses_cached_files(tmpdir, repo):
+    cache = ArtifactCache(tmpdir.join("cache").strpath)
+    local_path = cache.download_artifacts(repo, "model", tmpdir.mkdir("dst1").strpath)
+    assert local_path == tmpdir.join("dst1", "model").strpath
+    assert sorted(repo.downloads) == ["model/MLmodel", "model/data/weights.bin"]
+
+    local_path = cache.download_artifacts(repo, "model")
+    assert repo.downloads == ["model/MLmodel", "model/data/weights.bin"]
+    weights = os.path.join(local_path, "data", "weights.bin")
+    with open(weights, "rb") as f:
+        assert f.read() == b"0123456789"
+    assert os.stat(weights).st_ino == tmpdir.join("dst1", "model", "data", "weights.bin").stat().ino
+    assert not os.access(weights, os.W_OK) or os.geteuid() == 0
+
+    with mock.patch("os.link", side_effect=OSError("Cross-device link")):
+        local_path = cache.download_artifacts(repo, "model/MLmodel", tmpdir.mkdir("dst2").strpath)
+    assert local_path == tmpdir.join("dst2", "model", "MLmodel").strpath
+    assert tmpdir.join("dst2", "model", "MLmodel").read() == "flavors"
+
+    repo.files["model/data/weights.bin"] = b"9876543210"
+    local_path = cache.download_artifacts(repo, "model", tmpdir.mkdir("dst3").strpath)
+    assert repo.downloads.count("model/data/weights.bin") == 2
+    assert tmpdir.join("dst3", "model", "data", "weights.bin").read() == "9876543210"
+    assert tmpdir.join("dst1", "model", "data", "weights.bin").read() == "0123456789"
+
+
+def test_download_artifacts_evicts_least_recently_used_entries(tmpdir, repo):
+    cache = ArtifactCache(tmpdir.join("cache").strpath, max_size=20)
+    entries_dir = tmpdir.join("cache", "entries")
+    cache.download_artifacts(repo, "model/MLmodel")
+    time.sleep(0.01)
+    cache.download_artifacts(repo, "model/data")
+    assert len(entries_dir.listdir()) == 2
+    time.sleep(0.01)
+    cache.download_artifacts(repo, "model/MLmodel")
+
+    repo.files["model/data/weights.bin"] = b"9876543210"
+    cache.download_artifacts(repo, "model/data")
+    assert len(entries_dir.listdir()) == 2
+    downloads = len(repo.downloads)
+    cache.download_artifacts(repo, "model/MLmodel")
+    assert len(repo.downloads) == downloads
+
+    cache.max_size = 5
+    repo.files["model/data/weights.bin"] = b"0000000000"
+    cache.download_artifacts(repo, "model/data")
+    assert len(entries_dir.listdir()) == 1
+
+
+def test_manifest_stats_files_with_the_download_workers_of_the_repository(repo, monkeypatch):
+    threads = set()
+    get_artifact_stat = repo.get_artifact_stat
+
+    def tracking_get_artifact_stat(artifact_path):
+        threads.add(threading.get_ident())
+        time.sleep(0.05)
+        return get_artifact_stat(artifact_path)
+
+    repo.get_artifact_stat = tracking_get_artifact_stat
+    repo.files.update({"model/data/%d.bin" % i: b"0" for i in range(4)})
+    monkeypatch.setenv("MLFLOW_ARTIFACT_DOWNLOAD_WORKERS", "4")
+    artifact_cache._get_manifest(repo, "model")
+    assert len(threads) > 1
+
+    # e.g. repositories whose connection cannot be shared across threads
+    threads.clear()
+    with mock.patch.object(MemoryArtifactRepository, "_get_download_workers", return_value=1):
+        manifest = artifact_cache._get_manifest(repo, "model")
+    assert len(threads) == 1
+    assert [path for path, _, _, _ in manifest] == sorted(repo.files)
+
+
+def test_manifest_uses_the_stats_of_listings_that_report_them(repo):
+    repo.list_file_stats = mock.Mock(
+        return_value=[
+            ("model/MLmodel", ArtifactStat(7, 1.0, "a")),
+            ("model/w", ArtifactStat(1, 2.0, "b")),
+        ]
+    )
+    repo.get_artifact_stat = mock.Mock()
+    assert artifact_cache._get_manifest(repo, "model") == [
+        ["model/MLmodel", 7, "a", 1.0],
+        ["model/w", 1, "b", 2.0],
+    ]
+    repo.get_artifact_stat.assert_not_called()
+
+
+def test_cache_lock_waits_for_other_threads(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    locked = threading.Event()
+
+    def hold_lock():
+        with cache._lock():
+            locked.set()
+            time.sleep(0.3)
+
+    thread = threading.Thread(target=hold_lock)
+    thread.start()
+    locked.wait()
+    start = time.time()
+    with cache._lock():
+        assert time.time() - start >= 0.2
+    thread.join()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Kills the process with SIGKILL")
+def test_cache_lock_is_released_when_its_process_crashes(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath)
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys, time\n"
+            "from mlflow.store.artifact.artifact_cache import ArtifactCache\n"
+            "with ArtifactCache(sys.argv[1])._lock():\n"
+            "    print('locked', flush=True)\n"
+            "    time.sleep(60)\n",
+            tmpdir.strpath,
+        ],
+        stdout=subprocess.PIPE,
+    )
+    assert holder.stdout.readline() == b"locked\n"
+    holder.kill()
+    holder.wait()
+    start = time.time()
+    with cache._lock():
+        assert time.time() - start < 10
+
+
+def test_download_artifacts_falls_back_to_the_repository_if_entry_is_evicted_while_in_use(
+    tmpdir, repo
+):
+    cache = ArtifactCache(tmpdir.join("cache").strpath)
+    cache.download_artifacts(repo, "model")
+    use_entry = artifact_cache._use_entry
+
+    def evict_and_use_entry(entry_dir, dst_path):
+        shutil.rmtree(entry_dir)
+        return use_entry(entry_dir, dst_path)
+
+    with mock.patch.object(artifact_cache, "_use_entry", side_effect=evict_and_use_entry):
+        local_path = cache.download_artifacts(repo, "model", tmpdir.mkdir("dst").strpath)
+    assert local_path == tmpdir.join("dst", "model").strpath
+    assert tmpdir.join("dst", "model", "data", "weights.bin").read() == "0123456789"
+    assert repo.downloads.count("model/data/weights.bin") == 2
+
+
+def test_download_artifact_from_uri_uses_cache_when_enabled(tmpdir, repo, monkeypatch):
+    assert get_artifact_cache() is None
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    with mock.patch(
+        "mlflow.tracking.artifact_utils.get_artifact_repository", return_value=repo
+    ) as get_repo_mock:
+        for _ in range(2):
+            local_path = _download_artifact_from_uri(posixpath.join(repo.artifact_uri, "model"))
+            assert tmpdir.join("cache").strpath not in local_path
+            assert os.path.isfile(os.path.join(local_path, "MLmodel"))
+    get_repo_mock.assert_called_with(artifact_uri=repo.artifact_uri)
+    assert len(repo.downloads) == 2
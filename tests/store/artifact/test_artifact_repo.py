@@ -1,9 +1,28 @@
+import io
+import os
 import posixpath
+import threading
+import time
 from unittest import mock
 import pytest
+import requests
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import (
+    ErrorCode,
+    FEATURE_DISABLED,
+    RESOURCE_DOES_NOT_EXIST,
+    TEMPORARILY_UNAVAILABLE,
+)
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    ArtifactStat,
+    MultipartUploadSettings,
+    _is_transient_error,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository, MULTIPART_UPLOAD_DIR
+from mlflow.utils import transfer_journal
 from mlflow.utils.file_utils import TempDir
 
 
@@ -67,3 +86,349 @@ def test_download_artifacts_handles_empty_dir(base_uri, download_arg, list_retur
         repo = ArtifactRepositoryImpl(base_uri)
         with TempDir() as tmp:
             repo.download_artifacts(download_arg, dst_path=tmp.path())
+
+
+def test_open_artifact_default_implementation_streams_range_and_cleans_up(tmpdir):
+    class RangeArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            if path == "dir":
+                return [FileInfo("dir/file.txt", False, 10)]
+            return []
+
+        def _download_file(self, remote_file_path, local_path):
+            with open(local_path, "w") as f:
+                f.write("0123456789")
+
+    repo = RangeArtifactRepositoryImpl("")
+    assert repo.get_artifact_stat("dir/file.txt") == ArtifactStat(10, None, None)
+    with pytest.raises(MlflowException, match="No such artifact file") as e:
+        repo.get_artifact_stat("dir/missing.txt")
+    assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    with mock.patch("tempfile.mkdtemp", return_value=tmpdir.mkdir("tmp").strpath) as mkdtemp_mock:
+        assert b"".join(repo.open_artifact("dir/file.txt", 2, 7)) == b"23456"
+        assert not os.path.exists(mkdtemp_mock.return_value)
+
+
+def test_streamed_and_multipart_uploads_are_unsupported_by_default():
+    repo = ArtifactRepositoryImpl("")
+    for upload in [
+        lambda: repo.log_artifact_stream(io.BytesIO(b"0"), "model.bin"),
+        lambda: repo.create_multipart_upload("model.bin"),
+        lambda: repo.upload_part("model.bin", "id", 1, io.BytesIO(b"0")),
+        lambda: repo.complete_multipart_upload("model.bin", "id", []),
+    ]:
+        with pytest.raises(MlflowException, match="ArtifactRepositoryImpl does not support") as e:
+            upload()
+        assert e.value.error_code == ErrorCode.Name(FEATURE_DISABLED)
+        assert e.value.get_http_status_code() == 501
+
+
+def test_upload_file_in_parts_resumes_interrupted_uploads(tmpdir, monkeypatch):
+    class UploadArtifactRepositoryImpl(LocalArtifactRepository):
+        def upload_part(self, artifact_path, upload_id, part_number, fileobj):
+            uploaded_part_numbers.append(part_number)
+            if part_number in failing_part_numbers:
+                raise IOError("Connection reset")
+            return super().upload_part(artifact_path, upload_id, part_number, fileobj)
+
+    monkeypatch.setattr(transfer_journal, "TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath)
+    uploaded_part_numbers = []
+    failing_part_numbers = {2}
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(b"0123456789" * 3)
+    root = tmpdir.mkdir("root")
+    staging_dir = root.join(MULTIPART_UPLOAD_DIR)
+    repo = UploadArtifactRepositoryImpl(root.strpath)
+    settings = MultipartUploadSettings(0, 8, 2)
+
+    with pytest.raises(IOError, match="Connection reset"):
+        repo._upload_file_in_parts(local_file.strpath, "dir/model.bin", settings)
+    # The parts that were not started yet when the upload failed are cancelled
+    uploaded_parts = set(uploaded_part_numbers) - failing_part_numbers
+    assert 1 in uploaded_parts
+    failing_part_numbers.clear()
+    del uploaded_part_numbers[:]
+    repo._upload_file_in_parts(local_file.strpath, "dir/model.bin", settings)
+    assert sorted(uploaded_part_numbers) == sorted({1, 2, 3, 4} - uploaded_parts)
+    assert root.join("dir", "model.bin").read_binary() == b"0123456789" * 3
+    assert staging_dir.listdir() == []
+    assert tmpdir.join("journals").listdir() == []
+
+    # Uploads that no longer exist restart from zero
+    failing_part_numbers.add(2)
+    with pytest.raises(IOError, match="Connection reset"):
+        repo._upload_file_in_parts(local_file.strpath, "dir/model.bin", settings)
+    for upload_dir in staging_dir.listdir():
+        upload_dir.remove()
+    failing_part_numbers.clear()
+    del uploaded_part_numbers[:]
+    repo._upload_file_in_parts(local_file.strpath, "dir/model.bin", settings)
+    assert sorted(uploaded_part_numbers) == [1, 2, 3, 4]
+
+
+def test_download_artifacts_downloads_directories_concurrently_with_retries(tmpdir, monkeypatch):
+    class TreeArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            if path == "model":
+                return [FileInfo("model/MLmodel", False, 2), FileInfo("model/data", True, None)]
+            elif path == "model/data":
+                files = [FileInfo("model/data/%d.bin" % i, False, 1) for i in range(8)]
+                return files + [FileInfo("model/data/empty", True, None)]
+            return []
+
+        def _download_file(self, remote_file_path, local_path):
+            with lock:
+                attempts[remote_file_path] = attempts.get(remote_file_path, 0) + 1
+                threads.add(threading.get_ident())
+                if remote_file_path == "model/data/3.bin" and attempts[remote_file_path] < 3:
+                    raise ConnectionResetError("Connection reset")
+            time.sleep(0.05)
+            with open(local_path, "w") as f:
+                f.write(remote_file_path)
+
+    lock = threading.Lock()
+    attempts = {}
+    threads = set()
+    progress = []
+    repo = TreeArtifactRepositoryImpl("")
+    monkeypatch.setenv("MLFLOW_ARTIFACT_DOWNLOAD_WORKERS", "4")
+    with mock.patch("time.sleep", wraps=time.sleep) as sleep_mock:
+        local_dir = repo.download_artifacts(
+            "model", tmpdir.strpath, lambda *args: progress.append(args)
+        )
+    assert local_dir == tmpdir.join("model").strpath
+    assert [call[0][0] for call in sleep_mock.call_args_list].count(0.5) == 1
+    assert attempts["model/data/3.bin"] == 3
+    assert len(threads) > 1
+    assert os.path.isdir(tmpdir.join("model", "data", "empty").strpath)
+    expected_paths = ["model/MLmodel"] + ["model/data/%d.bin" % i for i in range(8)]
+    assert sorted(progress) == [(p, tmpdir.join(p).strpath) for p in expected_paths]
+    for path in expected_paths:
+        assert tmpdir.join(path).read() == path
+
+    with mock.patch("time.sleep"), mock.patch.object(
+        TreeArtifactRepositoryImpl,
+        "_download_file",
+        side_effect=ConnectionResetError("Connection reset"),
+    ) as download_mock:
+        with pytest.raises(ConnectionResetError, match="Connection reset"):
+            repo.download_artifacts("model", tmpdir.strpath)
+    assert download_mock.call_count >= 3
+
+    monkeypatch.setenv("MLFLOW_ARTIFACT_DOWNLOAD_WORKERS", "0")
+    with pytest.raises(MlflowException, match="MLFLOW_ARTIFACT_DOWNLOAD_WORKERS"):
+        repo.download_artifacts("model", tmpdir.strpath)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        FileNotFoundError("No such file"),
+        PermissionError("Permission denied"),
+        MlflowException("Not found", RESOURCE_DOES_NOT_EXIST),
+    ],
+)
+def test_download_artifacts_does_not_retry_non_transient_errors(tmpdir, error):
+    class FailingArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            return []
+
+        def _download_file(self, remote_file_path, local_path):
+            attempts.append(remote_file_path)
+            raise error
+
+    attempts = []
+    repo = FailingArtifactRepositoryImpl("")
+    with mock.patch("time.sleep") as sleep_mock, pytest.raises(type(error)):
+        repo.download_artifacts("model.pkl", tmpdir.strpath)
+    assert attempts == ["model.pkl"]
+    sleep_mock.assert_not_called()
+
+
+def _http_error(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def _client_error(code, status_code):
+    error = Exception(code)
+    error.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status_code}}
+    return error
+
+
+@pytest.mark.parametrize(
+    ("error", "transient"),
+    [
+        (ConnectionResetError("Connection reset"), True),
+        (TimeoutError("Timed out"), True),
+        (requests.ConnectionError("Failed to connect"), True),
+        (requests.exceptions.ReadTimeout("Timed out"), True),
+        (requests.exceptions.ChunkedEncodingError("Connection broken"), True),
+        (_http_error(503), True),
+        (_http_error(429), True),
+        (_http_error(404), False),
+        (_http_error(403), False),
+        (_client_error("SlowDown", 503), True),
+        (_client_error("RequestTimeout", 400), True),
+        (_client_error("NoSuchKey", 404), False),
+        (_client_error("AccessDenied", 403), False),
+        (MlflowException("Downloaded 10 bytes instead of 20"), True),
+        (MlflowException("Unavailable", TEMPORARILY_UNAVAILABLE), True),
+        (MlflowException("Not found", RESOURCE_DOES_NOT_EXIST), False),
+        (FileNotFoundError("No such file"), False),
+        (PermissionError("Permission denied"), False),
+        (IsADirectoryError("Is a directory"), False),
+        (ValueError("Invalid"), False),
+    ],
+)
+def test_is_transient_error(error, transient):
+    assert _is_transient_error(error) == transient
+
+
+def test_list_artifacts_recursive_walks_directories_concurrently(monkeypatch):
+    class TreeArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path, recursive=False):
+            if recursive:
+                return self._list_artifacts_recursive(path)
+            with lock:
+                threads.add(threading.get_ident())
+            time.sleep(0.05)
+            if path == "model":
+                return [FileInfo("model", True, None)] + [
+                    FileInfo("model/%d" % i, True, None) for i in range(4)
+                ]
+            elif path == "model/0":
+                return [
+                    FileInfo("model/0/MLmodel", False, 2),
+                    FileInfo("model/0/empty", True, None),
+                ]
+            elif path in ["model/1", "model/2", "model/3"]:
+                return [FileInfo(path + "/data.bin", False, 1)]
+            return []
+
+    lock = threading.Lock()
+    threads = set()
+    repo = TreeArtifactRepositoryImpl("")
+    monkeypatch.setenv("MLFLOW_ARTIFACT_DOWNLOAD_WORKERS", "4")
+    assert [(f.path, f.is_dir) for f in repo.list_artifacts("model", recursive=True)] == [
+        ("model/0/MLmodel", False),
+        ("model/0/empty", True),
+        ("model/1/data.bin", False),
+        ("model/2/data.bin", False),
+        ("model/3/data.bin", False),
+    ]
+    assert len(threads) > 1
+    assert repo.list_artifacts("model/1/data.bin", recursive=True) == []
+
+
+def test_list_files_walks_directories_of_repositories_without_recursive_listings():
+    class PluginArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            return listings.get(path, [])
+
+    listings = {
+        "model": [FileInfo("model/MLmodel", False, 2), FileInfo("model/data", True, None)],
+        "model/data": [FileInfo("model/data/a.bin", False, 1)],
+    }
+    repo = PluginArtifactRepositoryImpl("")
+    assert [(f.path, f.file_size) for f in repo.list_files("model")] == [
+        ("model/MLmodel", 2),
+        ("model/data/a.bin", 1),
+    ]
+
+
+def test_list_file_stats_stats_listed_files_if_the_repository_provides_stats():
+    class PluginArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path):
+            return listings.get(path, [])
+
+    class StatArtifactRepositoryImpl(PluginArtifactRepositoryImpl):
+        def get_artifact_stat(self, artifact_path):
+            return ArtifactStat(len(artifact_path), 1.0, artifact_path)
+
+    listings = {
+        "model": [FileInfo("model/MLmodel", False, 2), FileInfo("model/data", True, None)],
+        "model/data": [FileInfo("model/data/a.bin", False, 1)],
+    }
+    assert PluginArtifactRepositoryImpl("").list_file_stats("model") == [
+        ("model/MLmodel", ArtifactStat(2, None, None)),
+        ("model/data/a.bin", ArtifactStat(1, None, None)),
+    ]
+    assert StatArtifactRepositoryImpl("").list_file_stats("model") == [
+        ("model/MLmodel", ArtifactStat(13, 1.0, "model/MLmodel")),
+        ("model/data/a.bin", ArtifactStat(16, 1.0, "model/data/a.bin")),
+    ]
+
+
+def test_download_artifacts_plans_transfers_with_a_recursive_listing(tmpdir):
+    class FlatArtifactRepositoryImpl(ArtifactRepositoryImpl):
+        def list_artifacts(self, path, recursive=False):
+            listings.append((path, recursive))
+            if not recursive:
+                return [FileInfo("model/MLmodel", False, 2), FileInfo("model/data", True, None)]
+            return [
+                FileInfo("model/MLmodel", False, 2),
+                FileInfo("model/data/weights.bin", False, 7),
+                FileInfo("model/empty", True, None),
+            ]
+
+        def _download_file(self, remote_file_path, local_path):
+            with open(local_path, "w") as f:
+                f.write(remote_file_path)
+
+    listings = []
+    progress = []
+    repo = FlatArtifactRepositoryImpl("")
+    local_dir = repo.download_artifacts(
+        "model", tmpdir.strpath, lambda *args: progress.append(args)
+    )
+    assert local_dir == tmpdir.join("model").strpath
+    # One listing to find that the path is a directory, and one to list all its files
+    assert listings == [("model", False), ("model", True)]
+    assert tmpdir.join("model", "data", "weights.bin").read() == "model/data/weights.bin"
+    assert os.path.isdir(tmpdir.join("model", "empty").strpath)
+    assert sorted(p for p, _ in progress) == ["model/MLmodel", "model/data/weights.bin"]
+
+
+def test_upload_dir_uploads_files_concurrently_and_reports_failures_together(tmpdir):
+    local_dir = tmpdir.mkdir("local")
+    local_dir.join("b.txt").write("b")
+    local_dir.mkdir("sub").join("c.txt").write("c")
+    local_dir.join("a.txt").write("a")
+    local_dir.mkdir("empty")
+
+    def upload_file(local_file, artifact_dir):
+        with lock:
+            threads.add(threading.get_ident())
+        time.sleep(0.05)
+        if os.path.basename(local_file) in failing:
+            raise IOError("Access denied")
+        uploads[posixpath.join(artifact_dir, os.path.basename(local_file))] = local_file
+
+    lock = threading.Lock()
+    threads = set()
+    uploads = {}
+    failing = []
+    repo = ArtifactRepositoryImpl("")
+    with mock.patch("mlflow.store.artifact.artifact_repo._logger") as logger_mock:
+        repo._upload_dir(local_dir.strpath, "model", upload_file)
+    assert uploads == {
+        "model/a.txt": local_dir.join("a.txt").strpath,
+        "model/b.txt": local_dir.join("b.txt").strpath,
+        "model/sub/c.txt": local_dir.join("sub", "c.txt").strpath,
+    }
+    assert len(threads) > 1
+    reported = [call[0][1] for call in logger_mock.debug.call_args_list]
+    assert reported == [local_dir.join(p).strpath for p in ["a.txt", "b.txt", "sub/c.txt"]]
+
+    uploads.clear()
+    failing = ["a.txt", "c.txt"]
+    with pytest.raises(MlflowException, match="Failed to upload 2 of 3 artifact files") as e:
+        repo._upload_dir(local_dir.strpath, None, upload_file)
+    assert e.value.message.splitlines()[1:] == [
+        "  {}: Access denied".format(local_dir.join("a.txt").strpath),
+        "  {}: Access denied".format(local_dir.join("sub", "c.txt").strpath),
+    ]
+    assert uploads == {"b.txt": local_dir.join("b.txt").strpath}
@@ -1,13 +1,18 @@
+import datetime
+import hashlib
+import io
 import os
 import posixpath
 import pytest
 from unittest import mock
 
-from azure.storage.blob import BlobServiceClient, BlobPrefix, BlobProperties
+from azure.storage.blob import BlobBlock, BlobServiceClient, BlobPrefix, BlobProperties
 
 from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactStat, MultipartUploadPart
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.azure_blob_artifact_repo import AzureBlobArtifactRepository
+from mlflow.utils import transfer_journal
 
 
 TEST_ROOT_PATH = "some/path"
@@ -34,7 +39,10 @@ def mock_client():
     if old_conn_string is not None:
         del os.environ["AZURE_STORAGE_CONNECTION_STRING"]
 
-    yield mock.MagicMock(autospec=BlobServiceClient)
+    client = mock.MagicMock(autospec=BlobServiceClient)
+    blob_client = client.get_container_client.return_value.get_blob_client.return_value
+    blob_client.get_blob_properties.return_value.size = 12
+    yield client
 
     if old_access_key is not None:
         os.environ["AZURE_STORAGE_ACCESS_KEY"] = old_access_key
@@ -123,6 +131,52 @@ def test_list_artifacts(mock_client, root_path):
     assert artifacts[1].file_size == 42
 
 
+def test_list_artifacts_recursive(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+
+    blobs = []
+    for name, size in [("dir/subdir/b.txt", 2), ("dir/a.txt", 1)]:
+        blob_props = BlobProperties()
+        blob_props.size = size
+        blob_props.name = posixpath.join(TEST_ROOT_PATH, name)
+        blobs.append(blob_props)
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList(blobs)
+
+    artifacts = repo.list_artifacts("dir", recursive=True)
+    mock_client.get_container_client().list_blobs.assert_called_with(
+        name_starts_with=posixpath.join(TEST_ROOT_PATH, "dir/")
+    )
+    mock_client.get_container_client().walk_blobs.assert_not_called()
+    assert [(f.path, f.is_dir, f.file_size) for f in artifacts] == [
+        ("dir/a.txt", False, 1),
+        ("dir/subdir/b.txt", False, 2),
+    ]
+
+
+def test_list_file_stats(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    last_modified = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+    blobs = []
+    for name, size in [("dir/subdir/b.txt", 2), ("dir/a.txt", 1)]:
+        blob_props = BlobProperties()
+        blob_props.size = size
+        blob_props.name = posixpath.join(TEST_ROOT_PATH, name)
+        blob_props.last_modified = last_modified
+        blob_props.etag = '"0x%d"' % size
+        blobs.append(blob_props)
+    mock_client.get_container_client().list_blobs.return_value = MockBlobList(blobs)
+
+    assert repo.list_file_stats("dir") == [
+        ("dir/a.txt", ArtifactStat(1, last_modified.timestamp(), "0x1")),
+        ("dir/subdir/b.txt", ArtifactStat(2, last_modified.timestamp(), "0x2")),
+    ]
+    mock_client.get_container_client().list_blobs.assert_called_with(
+        name_starts_with=posixpath.join(TEST_ROOT_PATH, "dir/")
+    )
+    mock_client.get_container_client().get_blob_client.assert_not_called()
+
+
 def test_log_artifact(mock_client, tmpdir):
     repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
 
@@ -228,6 +282,7 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_not_blob_con
         f.write("hello world!")
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    mock_client.get_container_client().list_blobs.side_effect = get_mock_listing
     mock_client.get_container_client().download_blob().readinto.side_effect = create_file
 
     # Ensure that the root directory can be downloaded successfully
@@ -273,12 +328,19 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
         else:
             return MockBlobList([])
 
+    def get_mock_recursive_listing(*args, **kwargs):
+        # pylint: disable=unused-argument
+        if posixpath.abspath(kwargs["name_starts_with"]) == "/":
+            return MockBlobList([blob_props_1, blob_props_2])
+        return get_mock_listing(*args, **kwargs)
+
     def create_file(buffer):
         fname = os.path.basename(buffer.name)
         f = tmpdir.join(fname)
         f.write("hello world!")
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    mock_client.get_container_client().list_blobs.side_effect = get_mock_recursive_listing
     mock_client.get_container_client().download_blob().readinto.side_effect = create_file
 
     # Ensure that the root directory can be downloaded successfully
@@ -316,8 +378,135 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
             return MockBlobList([])
 
     mock_client.get_container_client().walk_blobs.side_effect = get_mock_listing
+    mock_client.get_container_client().list_blobs.side_effect = get_mock_listing
 
     with pytest.raises(MlflowException) as exc:
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_open_artifact_streams_byte_ranges(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blob_client = mock_client.get_container_client.return_value.get_blob_client.return_value
+    blob_client.download_blob.return_value.chunks.return_value = iter([b"34"])
+
+    assert b"".join(repo.open_artifact("subdir/test.txt", 3, 5)) == b"34"
+    mock_client.get_container_client.return_value.get_blob_client.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "subdir/test.txt")
+    )
+    blob_client.download_blob.assert_called_with(offset=3, length=2)
+
+    repo.open_artifact("subdir/test.txt")
+    blob_client.download_blob.assert_called_with()
+
+
+def test_log_artifact_stream_uploads_file_object(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    fileobj = io.BytesIO(b"0123")
+    repo.log_artifact_stream(fileobj, "subdir/model.bin")
+    mock_client.get_container_client.return_value.get_blob_client.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "subdir/model.bin")
+    )
+    blob_client = mock_client.get_container_client.return_value.get_blob_client.return_value
+    blob_client.upload_blob.assert_called_once_with(fileobj)
+
+
+def test_multipart_upload_stages_and_commits_blocks(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blob_client = mock_client.get_container_client.return_value.get_blob_client.return_value
+
+    upload_id = repo.create_multipart_upload("subdir/model.bin")
+    part = repo.upload_part("subdir/model.bin", upload_id, 2, io.BytesIO(b"0123"))
+    block_id = "{}-00002".format(upload_id)
+    assert part == MultipartUploadPart(2, 4, block_id)
+    blob_client.stage_block.assert_called_once_with(block_id, mock.ANY, length=4)
+    mock_client.get_container_client.return_value.get_blob_client.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "subdir/model.bin")
+    )
+
+    # Blocks staged by other uploads of the same blob are ignored
+    blob_client.get_block_list.return_value = (
+        [],
+        [BlobBlock("other-00001"), BlobBlock(block_id)],
+    )
+    blob_client.get_block_list.return_value[1][1].size = 4
+    assert repo.list_multipart_upload_parts("subdir/model.bin", upload_id) == [part]
+    blob_client.get_block_list.assert_called_once_with("uncommitted")
+
+    with pytest.raises(MlflowException, match="different entity tag"):
+        repo.complete_multipart_upload("subdir/model.bin", upload_id, [(2, "other-00002")])
+    repo.complete_multipart_upload("subdir/model.bin", upload_id, [part])
+    (block_list,), _ = blob_client.commit_block_list.call_args
+    assert [block.id for block in block_list] == [block_id]
+
+
+def test_log_artifact_stages_blocks_of_large_files(mock_client, tmpdir, monkeypatch):
+    monkeypatch.setattr(transfer_journal, "TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath)
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", "20")
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", "8")
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blob_client = mock_client.get_container_client.return_value.get_blob_client.return_value
+    staged = {}
+    failing_block_numbers = {"00002"}
+
+    def stage_block(block_id, data, length):
+        if block_id[-5:] in failing_block_numbers:
+            raise IOError("Connection reset")
+        staged[block_id] = data.read(length)
+
+    def get_block_list(block_list_type):
+        blocks = [BlobBlock(block_id) for block_id in staged]
+        for block in blocks:
+            block.size = len(staged[block.id])
+        return [], blocks
+
+    blob_client.stage_block.side_effect = stage_block
+    blob_client.get_block_list.side_effect = get_block_list
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(b"0123456789" * 3)
+
+    with mock.patch("time.sleep"), pytest.raises(IOError, match="Connection reset"):
+        repo.log_artifact(local_file.strpath, "subdir")
+    failing_block_numbers.clear()
+    num_staged_blocks = len(staged)
+    blob_client.stage_block.reset_mock()
+    repo.log_artifact(local_file.strpath, "subdir")
+    # Only the blocks that were not staged by the failed upload are staged
+    assert blob_client.stage_block.call_count == 4 - num_staged_blocks
+    mock_client.get_container_client.return_value.upload_blob.assert_not_called()
+    mock_client.get_container_client.return_value.get_blob_client.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "subdir/model.bin")
+    )
+    (block_list,), _ = blob_client.commit_block_list.call_args
+    assert b"".join(staged[block.id] for block in block_list) == b"0123456789" * 3
+    assert len(block_list) == 4
+    assert tmpdir.join("journals").listdir() == []
+
+
+def test_download_file_downloads_large_blobs_in_parts(mock_client, tmpdir, monkeypatch):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    data = b"0123456789" * 3
+    blob_client = mock_client.get_container_client.return_value.get_blob_client.return_value
+    properties = blob_client.get_blob_properties.return_value
+    properties.size = len(data)
+    properties.content_settings.content_md5 = bytearray(hashlib.md5(data).digest())
+    properties.etag = '"0x8D9"'
+
+    def download_blob(offset, length):
+        downloader = mock.MagicMock()
+        downloader.chunks.return_value = iter([data[offset : offset + length]])
+        return downloader
+
+    blob_client.download_blob.side_effect = download_blob
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE", "20")
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE", "8")
+
+    local_path = repo.download_artifacts("model.bin", tmpdir.strpath)
+    with open(local_path, "rb") as f:
+        assert f.read() == data
+    mock_client.get_container_client.return_value.get_blob_client.assert_called_with(
+        posixpath.join(TEST_ROOT_PATH, "model.bin")
+    )
+    ranges = [(c[1]["offset"], c[1]["length"]) for c in blob_client.download_blob.call_args_list]
+    assert sorted(ranges) == [(0, 8), (8, 8), (16, 8), (24, 6)]
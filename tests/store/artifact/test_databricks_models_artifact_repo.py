@@ -195,7 +195,9 @@ class TestDatabricksModelArtifactRepository(object):
             download_mock.return_value = None
             databricks_model_artifact_repo.download_artifacts(remote_file_path, local_path)
             call_endpoint_mock.assert_called_with(ANY, REGISTRY_ARTIFACT_PRESIGNED_URI_ENDPOINT)
-            download_mock.assert_called_with(signed_uri_mock["signed_uri"], ANY, ANY)
+            download_mock.assert_called_with(
+                signed_uri_mock["signed_uri"], ANY, ANY, multipart_settings=ANY
+            )
 
     def test_download_file_get_request_fail(self, databricks_model_artifact_repo):
         with mock.patch(
@@ -1,13 +1,21 @@
 # pylint: disable=redefined-outer-name
+import base64
+import datetime
+import io
+import hashlib
 import os
 import posixpath
 import pytest
+import requests
 from unittest import mock
 
 from google.cloud.storage import client as gcs_client
 
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact.artifact_repo import ArtifactStat
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.gcs_artifact_repo import GCSArtifactRepository
+from mlflow.utils import transfer_journal
 from google.auth.exceptions import DefaultCredentialsError
 
 
@@ -17,7 +25,9 @@ def gcs_mock():
     old_G_APP_CREDS = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/dev/null"
 
-    yield mock.MagicMock(autospec=gcs_client)
+    client = mock.MagicMock(autospec=gcs_client)
+    client.Client.return_value.bucket.return_value.blob.return_value.size = 12
+    yield client
 
     if old_G_APP_CREDS:
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = old_G_APP_CREDS
@@ -112,6 +122,52 @@ def test_list_artifacts_with_subdir(gcs_mock, dir_name):
     assert artifacts[1].file_size is None
 
 
+def test_list_artifacts_recursive(gcs_mock):
+    artifact_root_path = "/experiment_id/run_id/"
+    repo = GCSArtifactRepository("gs://test_bucket" + artifact_root_path, gcs_mock)
+
+    blob_mocks = []
+    for name, size in [("model/", 0), ("model/variables/data.bin", 2), ("model/model.pb", 1)]:
+        blob_mock = mock.Mock(size=size)
+        blob_mock.name = artifact_root_path[1:] + name
+        blob_mocks.append(blob_mock)
+    gcs_mock.Client.return_value.bucket.return_value.list_blobs.return_value = blob_mocks
+
+    artifacts = repo.list_artifacts(path="model", recursive=True)
+    gcs_mock.Client().bucket().list_blobs.assert_called_once_with(
+        prefix=posixpath.join(artifact_root_path[1:], "model/")
+    )
+    assert [(f.path, f.is_dir, f.file_size) for f in artifacts] == [
+        ("model/model.pb", False, 1),
+        ("model/variables/data.bin", False, 2),
+    ]
+
+
+def test_list_file_stats(gcs_mock):
+    artifact_root_path = "/experiment_id/run_id/"
+    repo = GCSArtifactRepository("gs://test_bucket" + artifact_root_path, gcs_mock)
+    updated = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+
+    blob_mocks = []
+    for name, size in [("model/", 0), ("model/variables/data.bin", 2), ("model/model.pb", 1)]:
+        blob_mock = mock.Mock(size=size, updated=updated, etag="etag-" + name)
+        blob_mock.name = artifact_root_path[1:] + name
+        blob_mocks.append(blob_mock)
+    gcs_mock.Client.return_value.bucket.return_value.list_blobs.return_value = blob_mocks
+
+    assert repo.list_file_stats("model") == [
+        ("model/model.pb", ArtifactStat(1, updated.timestamp(), "etag-model/model.pb")),
+        (
+            "model/variables/data.bin",
+            ArtifactStat(2, updated.timestamp(), "etag-model/variables/data.bin"),
+        ),
+    ]
+    gcs_mock.Client().bucket().list_blobs.assert_called_once_with(
+        prefix=posixpath.join(artifact_root_path[1:], "model/")
+    )
+    gcs_mock.Client().bucket().get_blob.assert_not_called()
+
+
 def test_log_artifact(gcs_mock, tmpdir):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
 
@@ -157,6 +213,123 @@ def test_log_artifacts(gcs_mock, tmpdir):
     )
 
 
+def _mock_resumable_upload_session(content, failures, persist_failed_chunks=False):
+    """
+    Mock of ``requests.put`` to a resumable upload session of ``content``, raising the exceptions
+    of ``failures``, keyed by the offsets of the chunks, after persisting the first half of them if
+    ``persist_failed_chunks``.
+    """
+    uploaded = bytearray()
+
+    def put(url, data=None, headers=None, timeout=None):
+        assert url == "https://session"
+        assert timeout is not None
+        if data is not None:
+            offset = int(headers["Content-Range"][len("bytes ") :].split("-")[0])
+            assert offset <= len(uploaded)
+            data = data[len(uploaded) - offset :]
+            if failures.get(offset):
+                if persist_failed_chunks:
+                    uploaded.extend(data[: len(data) // 2])
+                raise failures[offset].pop(0)
+            uploaded.extend(data)
+        response = mock.MagicMock()
+        response.status_code = 308 if len(uploaded) < len(content) else 200
+        response.headers = {"Range": "bytes=0-{}".format(len(uploaded) - 1)}
+        return response
+
+    return put, uploaded
+
+
+def test_log_artifact_resumes_interrupted_uploads_of_large_files(gcs_mock, tmpdir, monkeypatch):
+    monkeypatch.setattr(transfer_journal, "TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath)
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", str(256 * 1024))
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", str(256 * 1024))
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.blob.return_value
+    blob_mock.create_resumable_upload_session.return_value = "https://session"
+    content = os.urandom(600 * 1024)
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(content)
+    failures = {256 * 1024: [requests.ConnectionError("Connection reset")] * 5}
+    put, uploaded = _mock_resumable_upload_session(content, failures)
+
+    with mock.patch("requests.put", side_effect=put) as put_mock, mock.patch(
+        "mlflow.store.artifact.gcs_artifact_repo.time.sleep"
+    ):
+        with pytest.raises(requests.ConnectionError, match="Connection reset"):
+            repo.log_artifact(local_file.strpath, "subdir")
+        put_mock.reset_mock()
+        repo.log_artifact(local_file.strpath, "subdir")
+    assert bytes(uploaded) == content
+    # The second upload queries the persisted offset of the session, then sends two chunks
+    assert put_mock.call_count == 1 + 2
+    gcs_mock.Client().bucket().blob.assert_called_with("some/path/subdir/model.bin")
+    blob_mock.create_resumable_upload_session.assert_called_once_with(
+        content_type=mock.ANY, size=len(content)
+    )
+    blob_mock.upload_from_filename.assert_not_called()
+    assert tmpdir.join("journals").listdir() == []
+
+
+def test_log_artifact_retries_failed_chunks_from_the_persisted_offset(
+    gcs_mock, tmpdir, monkeypatch
+):
+    monkeypatch.setattr(transfer_journal, "TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath)
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", str(256 * 1024))
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE", str(256 * 1024))
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.blob.return_value
+    blob_mock.create_resumable_upload_session.return_value = "https://session"
+    content = os.urandom(600 * 1024)
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(content)
+    server_error = requests.HTTPError(
+        "503 Service Unavailable", response=mock.Mock(status_code=503)
+    )
+    failures = {0: [requests.Timeout("Read timed out")], 384 * 1024: [server_error]}
+    put, uploaded = _mock_resumable_upload_session(content, failures, persist_failed_chunks=True)
+
+    with mock.patch("requests.put", side_effect=put) as put_mock, mock.patch(
+        "mlflow.store.artifact.gcs_artifact_repo.time.sleep"
+    ) as sleep_mock:
+        repo.log_artifact(local_file.strpath, "subdir")
+    assert bytes(uploaded) == content
+    # Each failed chunk is followed by a query of the persisted offset, from which the upload
+    # resumes with the rest of the chunk
+    content_ranges = [c[1]["headers"]["Content-Range"] for c in put_mock.call_args_list]
+    assert content_ranges[:3] == [
+        "bytes 0-262143/614400",
+        "bytes */614400",
+        "bytes 131072-393215/614400",
+    ]
+    assert content_ranges[3:] == [
+        "bytes 393216-614399/614400",
+        "bytes */614400",
+        "bytes 503808-614399/614400",
+    ]
+    assert sleep_mock.call_count == 2
+    assert tmpdir.join("journals").listdir() == []
+
+
+def test_log_artifact_does_not_retry_client_errors_of_resumable_uploads(
+    gcs_mock, tmpdir, monkeypatch
+):
+    monkeypatch.setattr(transfer_journal, "TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath)
+    monkeypatch.setenv("MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE", str(256 * 1024))
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.blob.return_value
+    blob_mock.create_resumable_upload_session.return_value = "https://session"
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(os.urandom(300 * 1024))
+    client_error = requests.HTTPError("403 Forbidden", response=mock.Mock(status_code=403))
+
+    with mock.patch("requests.put", side_effect=client_error) as put_mock:
+        with pytest.raises(requests.HTTPError, match="403 Forbidden"):
+            repo.log_artifact(local_file.strpath, "subdir")
+    assert put_mock.call_count == 1
+
+
 def test_download_artifacts_calls_expected_gcs_client_methods(gcs_mock, tmpdir):
     repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
 
@@ -242,3 +415,136 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+def test_open_artifact_streams_byte_ranges(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value
+    blob_mock.size = 10
+    blob_mock.etag = "abc"
+    blob_mock.download_as_string.side_effect = lambda start, end: b"0123456789"[start : end + 1]
+
+    stat = repo.get_artifact_stat("subdir/test.txt")
+    assert (stat.size, stat.etag) == (10, "abc")
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.assert_called_with(
+        "some/path/subdir/test.txt"
+    )
+    with mock.patch("mlflow.store.artifact.gcs_artifact_repo.ARTIFACT_STREAM_CHUNK_SIZE", 3):
+        assert list(repo.open_artifact("subdir/test.txt")) == [b"012", b"345", b"678", b"9"]
+        assert list(repo.open_artifact("subdir/test.txt", 2, 7)) == [b"234", b"56"]
+
+
+def test_get_artifact_stat_of_missing_blob_raises(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    gcs_mock.Client.return_value.bucket.return_value.get_blob.return_value = None
+    with pytest.raises(MlflowException, match="No such artifact file"):
+        repo.get_artifact_stat("missing.txt")
+
+
+def test_download_file_downloads_large_blobs_in_parts(gcs_mock, tmpdir, monkeypatch):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    data = b"0123456789" * 3
+    blob_mock = gcs_mock.Client.return_value.bucket.return_value.blob.return_value
+    blob_mock.size = len(data)
+    blob_mock.md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode()
+    blob_mock.etag = "CJ2Bq9z7"
+    blob_mock.download_as_string.side_effect = lambda start, end: data[start : end + 1]
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_MINIMUM_FILE_SIZE", "20")
+    monkeypatch.setenv("MLFLOW_MULTIPART_DOWNLOAD_CHUNK_SIZE", "8")
+
+    local_path = repo.download_artifacts("model.bin", tmpdir.strpath)
+    with open(local_path, "rb") as f:
+        assert f.read() == data
+    blob_mock.download_to_filename.assert_not_called()
+    ranges = [(c[1]["start"], c[1]["end"]) for c in blob_mock.download_as_string.call_args_list]
+    assert sorted(ranges) == [(0, 7), (8, 15), (16, 23), (24, 29)]
+
+    blob_mock.md5_hash = base64.b64encode(hashlib.md5(b"other").digest()).decode()
+    with mock.patch("time.sleep"), pytest.raises(MlflowException, match="MD5 digest"):
+        repo.download_artifacts("model.bin", tmpdir.strpath)
+
+
+def test_log_artifact_stream_uploads_file_object(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    fileobj = mock.Mock()
+    repo.log_artifact_stream(fileobj, "model/data.json")
+    gcs_mock.Client().bucket().blob.assert_called_with("some/path/model/data.json")
+    gcs_mock.Client().bucket().blob().upload_from_file.assert_called_once_with(
+        fileobj, content_type="application/json"
+    )
+
+
+class _FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.content_type = None
+
+    @property
+    def size(self):
+        return len(self.bucket.blobs[self.name])
+
+    @property
+    def md5_hash(self):
+        return base64.b64encode(hashlib.md5(self.bucket.blobs[self.name]).digest()).decode()
+
+    def upload_from_string(self, data):
+        self.bucket.blobs[self.name] = data
+
+    def upload_from_file(self, fileobj, size):
+        self.bucket.blobs[self.name] = fileobj.read(size)
+
+    def compose(self, sources):
+        assert len(sources) <= 32
+        self.bucket.compositions.append(len(sources))
+        self.bucket.blobs[self.name] = b"".join(self.bucket.blobs[s.name] for s in sources)
+
+    def delete(self):
+        del self.bucket.blobs[self.name]
+
+
+class _FakeBucket:
+    def __init__(self):
+        self.blobs = {}
+        self.compositions = []
+
+    def blob(self, name):
+        return _FakeBlob(self, name)
+
+    def get_blob(self, name):
+        return _FakeBlob(self, name) if name in self.blobs else None
+
+    def list_blobs(self, prefix):
+        return [_FakeBlob(self, name) for name in sorted(self.blobs) if name.startswith(prefix)]
+
+
+def test_multipart_uploads_compose_parts(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    bucket = _FakeBucket()
+    gcs_mock.Client.return_value.bucket.return_value = bucket
+
+    upload_id = repo.create_multipart_upload("model.bin")
+    data = [str(i).encode() * 3 for i in range(1, 71)]
+    parts = [
+        repo.upload_part("model.bin", upload_id, part_number, io.BytesIO(part_data))
+        for part_number, part_data in reversed(list(enumerate(data, start=1)))
+    ]
+    assert repo.list_multipart_upload_parts("model.bin", upload_id) == sorted(parts)
+    assert parts[-1].etag == hashlib.md5(data[0]).hexdigest()
+
+    with pytest.raises(MlflowException, match="different entity tag"):
+        repo.complete_multipart_upload("model.bin", upload_id, [(1, parts[0].etag)])
+
+    repo.complete_multipart_upload("model.bin", upload_id, parts)
+    assert bucket.blobs == {"some/path/model.bin": b"".join(data)}
+    # 70 parts are composed into 3 intermediate blobs first
+    assert bucket.compositions == [32, 32, 6, 3]
+    with pytest.raises(MlflowException, match="No such multipart upload"):
+        repo.list_multipart_upload_parts("model.bin", upload_id)
+
+    upload_id = repo.create_multipart_upload("model.bin")
+    repo.upload_part("model.bin", upload_id, 1, io.BytesIO(b"0"))
+    repo.abort_multipart_upload("model.bin", upload_id)
+    assert list(bucket.blobs) == ["some/path/model.bin"]
+    with pytest.raises(MlflowException, match="No such multipart upload"):
+        repo.upload_part("model.bin", "../" + upload_id, 1, io.BytesIO(b"0"))
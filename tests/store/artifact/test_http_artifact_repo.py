@@ -0,0 +1,184 @@
+import json
+import os
+import threading
+
+import pytest
+import requests
+from unittest import mock
+from werkzeug.serving import make_server
+
+from mlflow.exceptions import MlflowException
+from mlflow.server import ARTIFACTS_DESTINATION_ENV_VAR, app
+from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.http_artifact_repo import (
+    HttpArtifactRepository,
+    MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR,
+    MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR,
+)
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
+
+
+@pytest.fixture()
+def artifacts_destination(tmpdir):
+    destination = tmpdir.mkdir("destination")
+    env = {ARTIFACTS_DESTINATION_ENV_VAR: destination.strpath}
+    with mock.patch.dict(os.environ, env), mock.patch(
+        "mlflow.server.handlers._artifacts_destination_repo", None
+    ), mock.patch(
+        "mlflow.utils.transfer_journal.TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath
+    ):
+        yield destination
+
+
+@pytest.fixture()
+def server_url(artifacts_destination):  # pylint: disable=unused-argument
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_port)
+    server.shutdown()
+    thread.join()
+
+
+@pytest.fixture()
+def repo(server_url):
+    return get_artifact_repository(server_url + "/api/2.0/mlflow-artifacts/artifacts/1/run")
+
+
+def test_artifact_uri_parsing():
+    repo = HttpArtifactRepository("https://host/prefix/api/2.0/mlflow-artifacts/artifacts/1/run/")
+    assert (repo._host, repo._root_path) == ("https://host/prefix", "1/run")
+    repo = HttpArtifactRepository("http://host:5000/api/2.0/mlflow-artifacts/artifacts")
+    assert (repo._host, repo._root_path) == ("http://host:5000", "")
+    with pytest.raises(MlflowException, match="HTTP artifact URI must be of the form"):
+        HttpArtifactRepository("http://host:5000/api/2.0/mlflow/artifacts/1")
+
+
+def test_artifacts_are_logged_listed_and_downloaded(repo, artifacts_destination, tmpdir):
+    local_dir = tmpdir.mkdir("local")
+    local_dir.join("a.txt").write("A")
+    local_dir.mkdir("subdir").join("b.txt").write("BB")
+    local_dir.join("empty.txt").write("")
+    repo.log_artifacts(local_dir.strpath, "dir")
+    repo.log_artifact(local_dir.join("a.txt").strpath)
+
+    assert artifacts_destination.join("1", "run", "dir", "subdir", "b.txt").read() == "BB"
+    assert [(f.path, f.is_dir, f.file_size) for f in repo.list_artifacts()] == [
+        ("a.txt", False, 1),
+        ("dir", True, None),
+    ]
+    assert [f.path for f in repo.list_artifacts("dir")] == [
+        "dir/a.txt",
+        "dir/empty.txt",
+        "dir/subdir",
+    ]
+
+    assert [(f.path, f.file_size) for f in repo.list_artifacts("dir", recursive=True)] == [
+        ("dir/a.txt", 1),
+        ("dir/empty.txt", 0),
+        ("dir/subdir/b.txt", 2),
+    ]
+
+    downloaded = repo.download_artifacts("dir", tmpdir.mkdir("download").strpath)
+    assert open(os.path.join(downloaded, "subdir", "b.txt")).read() == "BB"
+    assert open(os.path.join(downloaded, "empty.txt")).read() == ""
+    with pytest.raises(MlflowException, match="RESOURCE_DOES_NOT_EXIST"):
+        repo._download_file("missing.txt", tmpdir.join("missing.txt").strpath)
+
+
+def test_list_artifacts_recursive_walks_directories_of_servers_without_recursive_listings():
+    repo = HttpArtifactRepository("http://host/api/2.0/mlflow-artifacts/artifacts/1/run")
+    listings = {
+        "1/run/dir": [
+            {"path": "1/run/dir/a.txt", "is_dir": False, "file_size": 1},
+            {"path": "1/run/dir/subdir", "is_dir": True},
+        ],
+        "1/run/dir/subdir": [{"path": "1/run/dir/subdir/b.txt", "is_dir": False, "file_size": 2}],
+    }
+
+    def http_request_safe(host_creds, endpoint, method, params):
+        return mock.Mock(text=json.dumps({"files": listings[params["path"]]}))
+
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo.http_request_safe", side_effect=http_request_safe
+    ) as request_mock:
+        artifacts = repo.list_artifacts("dir", recursive=True)
+    assert [(f.path, f.file_size) for f in artifacts] == [("dir/a.txt", 1), ("dir/subdir/b.txt", 2)]
+    assert request_mock.call_args_list[0][1]["params"] == {"path": "1/run/dir", "recursive": "true"}
+
+
+def test_large_files_are_uploaded_in_resumable_multipart_uploads(
+    repo, artifacts_destination, tmpdir
+):
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(b"0123456789")
+    env = {
+        MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR: "5",
+        MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR: "4",
+    }
+    upload = HttpArtifactRepository._upload
+    failing_parts = [2]
+    uploaded_parts = []
+
+    def flaky_upload(self, endpoint, local_file, offset, length, params=None):
+        if params["part_number"] in failing_parts:
+            failing_parts.remove(params["part_number"])
+            raise MlflowException("Upload failed")
+        uploaded_parts.append(params["part_number"])
+        return upload(self, endpoint, local_file, offset, length, params)
+
+    with mock.patch.dict(os.environ, env), mock.patch.object(
+        HttpArtifactRepository, "_upload", autospec=True, side_effect=flaky_upload
+    ):
+        with pytest.raises(MlflowException, match="Upload failed"):
+            repo.log_artifact(local_file.strpath, "model")
+        assert not artifacts_destination.join("1", "run", "model", "model.bin").exists()
+        # The next attempt resumes the upload from the failed part
+        repo.log_artifact(local_file.strpath, "model")
+
+    assert uploaded_parts == [1, 2, 3]
+    assert artifacts_destination.join("1", "run", "model", "model.bin").read() == "0123456789"
+    assert os.listdir(tmpdir.join("journals").strpath) == []
+
+
+def test_large_files_are_uploaded_in_single_requests_without_multipart_api(
+    repo, artifacts_destination, tmpdir
+):
+    local_file = tmpdir.join("model.bin")
+    local_file.write_binary(b"0123456789")
+    env = {
+        MULTIPART_UPLOAD_MINIMUM_FILE_SIZE_ENV_VAR: "5",
+        MULTIPART_UPLOAD_CHUNK_SIZE_ENV_VAR: "4",
+    }
+    with mock.patch.dict(os.environ, env), mock.patch.object(
+        LocalArtifactRepository,
+        "create_multipart_upload",
+        ArtifactRepository.create_multipart_upload,
+    ), mock.patch("time.sleep") as sleep_mock:
+        repo.log_artifact(local_file.strpath, "model")
+
+    assert artifacts_destination.join("1", "run", "model", "model.bin").read() == "0123456789"
+    # Unsupported operations are not retried
+    sleep_mock.assert_not_called()
+
+
+def test_upload_requests_are_retried_with_their_whole_body(repo, artifacts_destination, tmpdir):
+    local_file = tmpdir.join("a.txt")
+    local_file.write("0123456789")
+    real_request = requests.request
+    calls = []
+
+    def flaky_request(**kwargs):
+        calls.append(kwargs["method"])
+        if len(calls) == 1:
+            kwargs["data"].read(3)
+            raise requests.exceptions.ConnectionError("Connection reset")
+        if len(calls) == 2:
+            return mock.Mock(status_code=429)
+        return real_request(**kwargs)
+
+    with mock.patch("requests.request", side_effect=flaky_request), mock.patch("time.sleep"):
+        repo.log_artifact(local_file.strpath)
+    assert calls == ["PUT"] * 3
+    assert artifacts_destination.join("1", "run", "a.txt").read() == "0123456789"
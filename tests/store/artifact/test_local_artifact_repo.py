@@ -1,10 +1,14 @@
+import io
 import os
 import pytest
 import posixpath
+from unittest import mock
 
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
-from mlflow.utils.file_utils import TempDir
+from mlflow.protos.databricks_pb2 import ErrorCode, INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.store.artifact.artifact_repo import MultipartUploadPart
+from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository, MULTIPART_UPLOAD_DIR
+from mlflow.utils.file_utils import TempDir, copy_file
 
 
 @pytest.fixture
@@ -31,6 +35,25 @@ def test_list_artifacts(local_artifact_repo, local_artifact_root):
     assert artifacts_list[0].path == artifact_rel_path
 
 
+def test_list_artifacts_recursive(local_artifact_repo, local_artifact_root):
+    os.makedirs(os.path.join(local_artifact_root, "model", "data"))
+    os.makedirs(os.path.join(local_artifact_root, "model", "empty"))
+    for path in [["a.txt"], ["model", "MLmodel"], ["model", "data", "b.txt"]]:
+        with open(os.path.join(local_artifact_root, *path), "w") as f:
+            f.write("artifact")
+
+    listing = [(f.path, f.is_dir) for f in local_artifact_repo.list_artifacts(recursive=True)]
+    assert listing == [
+        ("a.txt", False),
+        ("model/MLmodel", False),
+        ("model/data/b.txt", False),
+        ("model/empty", True),
+    ]
+    listing = local_artifact_repo.list_artifacts("model/data", recursive=True)
+    assert [(f.path, f.file_size) for f in listing] == [("model/data/b.txt", 8)]
+    assert local_artifact_repo.list_artifacts("a.txt", recursive=True) == []
+
+
 def test_log_artifacts(local_artifact_repo, local_artifact_root):
     artifact_rel_path = "test.txt"
     artifact_text = "hello world!"
@@ -50,6 +73,43 @@ def test_log_artifacts(local_artifact_repo, local_artifact_root):
     assert open(artifact_dst_path).read() == artifact_text
 
 
+@pytest.mark.parametrize("link_mode", ["copy", "reflink", "hardlink"])
+def test_log_and_download_artifacts_with_link_mode(
+    local_artifact_repo, local_artifact_root, tmpdir, monkeypatch, link_mode
+):
+    src_dir = tmpdir.mkdir("src")
+    src_dir.join("MLmodel").write("flavors")
+    src_dir.mkdir("data").join("weights.bin").write("0123456789")
+    src_dir.mkdir("empty")
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_LINK_MODE", link_mode)
+    with mock.patch(
+        "mlflow.store.artifact.local_artifact_repo.copy_file", wraps=copy_file
+    ) as copy_file_mock:
+        local_artifact_repo.log_artifacts(src_dir.strpath, "model")
+        local_artifact_repo.log_artifact(src_dir.join("MLmodel").strpath)
+        dst_dir = local_artifact_repo.download_artifacts("model", tmpdir.mkdir("dst").strpath)
+    assert {c[0][2] for c in copy_file_mock.call_args_list} == {link_mode}
+
+    artifact_dir = os.path.join(local_artifact_root, "model")
+    assert os.path.isdir(os.path.join(artifact_dir, "empty"))
+    assert os.path.isdir(os.path.join(dst_dir, "empty"))
+    for path in [["MLmodel"], ["data", "weights.bin"]]:
+        src_stat = os.stat(os.path.join(src_dir.strpath, *path))
+        artifact_stat = os.stat(os.path.join(artifact_dir, *path))
+        dst_stat = os.stat(os.path.join(dst_dir, *path))
+        assert open(os.path.join(dst_dir, *path)).read() == src_dir.join(*path).read()
+        if link_mode == "hardlink":
+            assert src_stat.st_ino == artifact_stat.st_ino == dst_stat.st_ino
+        else:
+            assert len({src_stat.st_ino, artifact_stat.st_ino, dst_stat.st_ino}) == 3
+
+    monkeypatch.setenv("MLFLOW_LOCAL_ARTIFACT_LINK_MODE", "symlink")
+    with pytest.raises(MlflowException, match="Invalid link mode"):
+        local_artifact_repo.log_artifacts(src_dir.strpath, "model")
+    with pytest.raises(MlflowException, match="not a directory"):
+        local_artifact_repo.log_artifacts(src_dir.join("MLmodel").strpath)
+
+
 @pytest.mark.parametrize("dst_path", [None, "dest"])
 def test_download_artifacts(local_artifact_repo, dst_path):
     artifact_rel_path = "test.txt"
@@ -187,3 +247,65 @@ def test_delete_artifacts(local_artifact_repo):
         assert os.path.exists(os.path.join(local_artifact_repo._artifact_dir, "b.txt"))
         local_artifact_repo.delete_artifacts()
         assert not os.path.exists(os.path.join(local_artifact_repo._artifact_dir))
+
+
+def test_open_artifact_streams_byte_ranges(local_artifact_repo, local_artifact_root):
+    os.makedirs(os.path.join(local_artifact_root, "subdir"))
+    with open(os.path.join(local_artifact_root, "subdir", "data.txt"), "w") as f:
+        f.write("0123456789")
+
+    stat = local_artifact_repo.get_artifact_stat("subdir/data.txt")
+    assert stat.size == 10
+    assert stat.last_modified is not None
+    assert stat.etag is not None
+    assert b"".join(local_artifact_repo.open_artifact("subdir/data.txt")) == b"0123456789"
+    assert b"".join(local_artifact_repo.open_artifact("subdir/data.txt", 3)) == b"3456789"
+    assert b"".join(local_artifact_repo.open_artifact("subdir/data.txt", 3, 5)) == b"34"
+    assert b"".join(local_artifact_repo.open_artifact("subdir/data.txt", end=2)) == b"01"
+
+    for path in ["subdir", "subdir/missing.txt"]:
+        with pytest.raises(MlflowException, match="No such artifact file"):
+            local_artifact_repo.get_artifact_stat(path)
+        with pytest.raises(MlflowException, match="No such artifact file"):
+            local_artifact_repo.open_artifact(path)
+
+
+def test_log_artifact_stream_replaces_files(local_artifact_repo, local_artifact_root):
+    local_artifact_repo.log_artifact_stream(io.BytesIO(b"0123"), "dir/model.bin")
+    local_artifact_repo.log_artifact_stream(io.BytesIO(b"456"), "dir/model.bin")
+    assert os.listdir(os.path.join(local_artifact_root, "dir")) == ["model.bin"]
+    with open(os.path.join(local_artifact_root, "dir", "model.bin"), "rb") as f:
+        assert f.read() == b"456"
+
+
+def test_multipart_uploads_stage_parts_in_the_artifact_root(
+    local_artifact_repo, local_artifact_root
+):
+    upload_id = local_artifact_repo.create_multipart_upload("dir/model.bin")
+    part2 = local_artifact_repo.upload_part("dir/model.bin", upload_id, 2, io.BytesIO(b"6789"))
+    local_artifact_repo.upload_part("dir/model.bin", upload_id, 1, io.BytesIO(b"xxxx"))
+    part1 = local_artifact_repo.upload_part("dir/model.bin", upload_id, 1, io.BytesIO(b"012345"))
+    assert part1 == MultipartUploadPart(1, 6, part1.etag)
+    parts = local_artifact_repo.list_multipart_upload_parts("dir/model.bin", upload_id)
+    assert parts == [part1, part2]
+    # The staged parts are hidden from the listings
+    assert local_artifact_repo.list_artifacts() == []
+    assert local_artifact_repo.list_artifacts(recursive=True) == []
+
+    with pytest.raises(MlflowException, match="different entity tag") as e:
+        local_artifact_repo.complete_multipart_upload("dir/model.bin", upload_id, [(1, part2.etag)])
+    assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    local_artifact_repo.complete_multipart_upload("dir/model.bin", upload_id, [part2, part1])
+    with open(os.path.join(local_artifact_root, "dir", "model.bin"), "rb") as f:
+        assert f.read() == b"0123456789"
+    assert os.listdir(os.path.join(local_artifact_root, MULTIPART_UPLOAD_DIR)) == []
+
+    for invalid_upload_id in [upload_id, "../" + upload_id]:
+        with pytest.raises(MlflowException, match="No such multipart upload") as e:
+            local_artifact_repo.upload_part("dir/model.bin", invalid_upload_id, 1, io.BytesIO())
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    upload_id = local_artifact_repo.create_multipart_upload("model.bin")
+    local_artifact_repo.abort_multipart_upload("model.bin", upload_id)
+    assert os.listdir(os.path.join(local_artifact_root, MULTIPART_UPLOAD_DIR)) == []
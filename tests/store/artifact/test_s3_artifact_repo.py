@@ -1,11 +1,17 @@
+import base64
+import hashlib
+import io
 import os
 import posixpath
 import tarfile
+from unittest import mock
 
 import pytest
 
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
-from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
+from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository, _get_digests
 
 from tests.helper_functions import set_boto_credentials  # pylint: disable=unused-import
 from tests.helper_functions import mock_s3_bucket  # pylint: disable=unused-import
@@ -35,6 +41,16 @@ def test_file_artifact_is_logged_and_downloaded_successfully(s3_artifact_root, t
     assert downloaded_text == file_text
 
 
+def test_artifact_stream_is_logged_with_content_type(s3_artifact_root):
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact_stream(io.BytesIO(b'{"a": 1}'), "model/data.json")
+
+    bucket, _ = repo.parse_s3_uri(s3_artifact_root)
+    response = repo._get_s3_client().get_object(Bucket=bucket, Key="some/path/model/data.json")
+    assert response["ContentType"] == "application/json"
+    assert b"".join(repo.open_artifact("model/data.json")) == b'{"a": 1}'
+
+
 def test_file_artifact_is_logged_with_content_metadata(s3_artifact_root, tmpdir):
     file_name = "test.txt"
     file_path = os.path.join(str(tmpdir), file_name)
@@ -156,6 +172,23 @@ def test_file_and_directories_artifacts_are_logged_and_listed_successfully_in_ba
     )
     assert nested_artifacts_listing == [("nested/c.txt", False, 1)]
 
+    recursive_listing = [
+        (f.path, f.is_dir, f.file_size) for f in repo.list_artifacts(recursive=True)
+    ]
+    assert recursive_listing == [
+        ("a.txt", False, 1),
+        ("b.txt", False, 1),
+        ("nested/c.txt", False, 1),
+    ]
+    assert [f.path for f in repo.list_artifacts("nested", recursive=True)] == ["nested/c.txt"]
+    assert repo.list_artifacts("a.txt", recursive=True) == []
+
+    # The recursive listing reports the same stats as HEAD requests
+    with mock.patch.object(repo, "get_artifact_stat", wraps=repo.get_artifact_stat) as stat:
+        file_stats = repo.list_file_stats("nested")
+        assert file_stats == [("nested/c.txt", repo.get_artifact_stat("nested/c.txt"))]
+        assert stat.call_count == 1
+
 
 def test_download_directory_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
     s3_artifact_root, tmpdir
@@ -194,6 +227,29 @@ def test_download_file_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
         assert f.read() == file_a_text
 
 
+def test_download_directory_artifact_takes_the_sizes_of_small_files_from_the_listing(
+    s3_artifact_root, tmpdir, monkeypatch
+):
+    src = tmpdir.mkdir("model")
+    src.join("small.txt").write("Hello world!")
+    src.mkdir("nested").join("data.bin").write_binary(os.urandom(1024))
+    src.join("large.bin").write_binary(os.urandom(1024 * 1024))
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifacts(src.strpath, "model")
+    monkeypatch.setenv("MLFLOW_S3_MULTIPART_THRESHOLD", str(1024 * 1024))
+    client = repo._get_s3_client()
+
+    with mock.patch.object(client, "head_object", wraps=client.head_object) as head_mock:
+        local_path = repo.download_artifacts("model", tmpdir.mkdir("dst").strpath)
+    # Only the file at the multipart threshold is looked up before its download
+    head_mock.assert_called_once_with(
+        Bucket=mock.ANY, Key="some/path/model/large.bin", ChecksumMode="ENABLED"
+    )
+    for path in ["small.txt", "nested/data.bin", "large.bin"]:
+        with open(os.path.join(local_path, path), "rb") as f:
+            assert f.read() == src.join(path).read_binary()
+
+
 def test_get_s3_file_upload_extra_args():
     os.environ.setdefault(
         "MLFLOW_S3_UPLOAD_EXTRA_ARGS",
@@ -218,3 +274,120 @@ def test_get_s3_file_upload_extra_args_invalid_json():
 
     with pytest.raises(ValueError):
         S3ArtifactRepository.get_s3_file_upload_extra_args()
+
+
+def test_open_artifact_streams_byte_ranges(s3_artifact_root, tmpdir):
+    file_path = os.path.join(str(tmpdir), "test.txt")
+    with open(file_path, "w") as f:
+        f.write("0123456789")
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(file_path, "subdir")
+
+    stat = repo.get_artifact_stat("subdir/test.txt")
+    assert stat.size == 10
+    assert stat.last_modified is not None
+    assert stat.etag and not stat.etag.startswith('"')
+    assert b"".join(repo.open_artifact("subdir/test.txt")) == b"0123456789"
+    assert b"".join(repo.open_artifact("subdir/test.txt", 3)) == b"3456789"
+    assert b"".join(repo.open_artifact("subdir/test.txt", 3, 5)) == b"34"
+
+
+def test_multipart_upload(s3_artifact_root, tmpdir):
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    # All the parts of S3 multipart uploads but the last one must be at least 5 MB large
+    first_part = b"0" * 5 * 1024 * 1024
+    upload_id = repo.create_multipart_upload("subdir/model.txt")
+    part2 = repo.upload_part("subdir/model.txt", upload_id, 2, io.BytesIO(b"123"))
+    part1 = repo.upload_part("subdir/model.txt", upload_id, 1, io.BytesIO(first_part))
+    assert part1.size == len(first_part) and part2.size == 3
+    assert repo.list_multipart_upload_parts("subdir/model.txt", upload_id) == [part1, part2]
+
+    repo.complete_multipart_upload("subdir/model.txt", upload_id, [part2, part1])
+    with open(repo.download_artifacts("subdir/model.txt"), "rb") as f:
+        assert f.read() == first_part + b"123"
+    bucket, _ = repo.parse_s3_uri(s3_artifact_root)
+    head = repo._get_s3_client().head_object(Bucket=bucket, Key="some/path/subdir/model.txt")
+    assert head["ContentType"] == "text/plain"
+
+    upload_id = repo.create_multipart_upload("aborted.txt")
+    repo.abort_multipart_upload("aborted.txt", upload_id)
+    with pytest.raises(MlflowException, match="No such multipart upload") as e:
+        repo.list_multipart_upload_parts("aborted.txt", upload_id)
+    assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+
+def test_get_s3_client_reuses_clients_per_configuration(monkeypatch):
+    repo = S3ArtifactRepository("s3://bucket/some/path")
+    client = repo._get_s3_client()
+    assert S3ArtifactRepository("s3://other-bucket")._get_s3_client() is client
+    assert client.meta.config.max_pool_connections == 64
+
+    monkeypatch.setenv("MLFLOW_S3_ENDPOINT_URL", "http://localhost:9000")
+    monkeypatch.setenv("MLFLOW_S3_MAX_POOL_CONNECTIONS", "16")
+    endpoint_client = repo._get_s3_client()
+    assert endpoint_client is not client
+    assert endpoint_client.meta.endpoint_url == "http://localhost:9000"
+    assert endpoint_client.meta.config.max_pool_connections == 16
+    assert repo._get_s3_client() is endpoint_client
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "other-key")
+    assert repo._get_s3_client() is not endpoint_client
+
+    # Forked processes create their own clients
+    client = repo._get_s3_client()
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        assert repo._get_s3_client() is not client
+
+
+def test_transfer_config_is_configurable_by_environment_variables(
+    s3_artifact_root, tmpdir, monkeypatch
+):
+    config = S3ArtifactRepository._get_transfer_config()
+    assert config.multipart_threshold == 8 * 1024 * 1024
+    assert config.multipart_chunksize == 8 * 1024 * 1024
+    assert config.max_concurrency == 8
+
+    monkeypatch.setenv("MLFLOW_S3_MULTIPART_THRESHOLD", str(5 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_S3_MULTIPART_CHUNKSIZE", str(5 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_S3_MAX_CONCURRENCY", "2")
+    config = S3ArtifactRepository._get_transfer_config()
+    assert config.multipart_threshold == 5 * 1024 * 1024
+    assert config.multipart_chunksize == 5 * 1024 * 1024
+    assert config.max_concurrency == 2
+
+    content = os.urandom(11 * 1024 * 1024)
+    tmpdir.join("model.bin").write_binary(content)
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(tmpdir.join("model.bin").strpath)
+    bucket, _ = repo.parse_s3_uri(s3_artifact_root)
+    head = repo._get_s3_client().head_object(Bucket=bucket, Key="some/path/model.bin")
+    # The ETags of objects uploaded in parts end with their number of parts
+    assert head["ETag"].strip('"').endswith("-3")
+    with mock.patch.object(S3ArtifactRepository, "_download_file_in_parts") as download_mock:
+        repo.download_artifacts("model.bin", tmpdir.mkdir("dst").strpath)
+    settings = download_mock.call_args[1]["settings"]
+    assert (settings.part_size, settings.max_workers) == (5 * 1024 * 1024, 2)
+    assert download_mock.call_args[1]["md5"] is None
+
+    # The ETags of objects uploaded at once are the MD5 digests verified by the download
+    monkeypatch.setenv("MLFLOW_S3_MULTIPART_THRESHOLD", "1024")
+    content = os.urandom(1024)
+    repo._get_s3_client().put_object(Bucket=bucket, Key="some/path/single.bin", Body=content)
+    with mock.patch.object(S3ArtifactRepository, "_download_file_in_parts") as download_mock:
+        repo.download_artifacts("single.bin", tmpdir.join("dst").strpath)
+    assert download_mock.call_args[1]["md5"] == hashlib.md5(content).hexdigest()
+
+
+def test_get_digests():
+    md5 = hashlib.md5(b"abc").hexdigest()
+    sha256 = hashlib.sha256(b"abc")
+    checksum = base64.b64encode(sha256.digest()).decode()
+    assert _get_digests({"ETag": '"{}"'.format(md5)}) == (md5, None)
+    assert _get_digests({"ETag": '"{}-3"'.format(md5)}) == (None, None)
+    assert _get_digests({"ETag": md5, "ServerSideEncryption": "aws:kms"}) == (None, None)
+    assert _get_digests({"ETag": md5, "SSECustomerAlgorithm": "AES256"}) == (None, None)
+    assert _get_digests({"ETag": md5, "ServerSideEncryption": "AES256"}) == (md5, None)
+    assert _get_digests({"ETag": md5, "ChecksumSHA256": checksum}) == (md5, sha256.hexdigest())
+    # Checksums of objects uploaded in parts are checksums of the checksums of their parts
+    assert _get_digests({"ETag": md5 + "-2", "ChecksumSHA256": checksum + "-2"}) == (None, None)
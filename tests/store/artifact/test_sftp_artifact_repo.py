@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 import pytest
 from tempfile import NamedTemporaryFile
@@ -170,3 +171,31 @@ def test_log_artifacts():
 
             with open(posixpath.join(remote_dir, directory, file2), "rb") as remote_content:
                 assert remote_content.read() == file_content_2
+
+
+@pytest.mark.large
+def test_open_artifact_streams_byte_ranges(sftp_mock, tmpdir):
+    repo = SFTPArtifactRepository("sftp://test_sftp/some/path", sftp_mock)
+    tmpdir.join("test.txt").write("0123456789")
+    sftp_mock.open = MagicMock(side_effect=lambda path, mode: open(tmpdir.join("test.txt"), mode))
+
+    assert b"".join(repo.open_artifact("subdir/test.txt", 3, 5)) == b"34"
+    sftp_mock.open.assert_called_once_with("/some/path/subdir/test.txt", "rb")
+
+
+@pytest.mark.large
+def test_stat_and_open_artifact_use_the_connection_of_the_calling_thread(sftp_mock, tmpdir):
+    repo = SFTPArtifactRepository("sftp://test_sftp/some/path", sftp_mock)
+    thread_sftp_mock = MagicMock(autospec=pysftp.Connection)
+    repo._connect = MagicMock(return_value=thread_sftp_mock)
+    tmpdir.join("test.txt").write("0123456789")
+    thread_sftp_mock.open = MagicMock(side_effect=lambda path, mode: open(tmpdir.join("test.txt")))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(repo.get_artifact_stat, "test.txt").result()
+        executor.submit(lambda: list(repo.open_artifact("test.txt"))).result()
+    thread_sftp_mock.stat.assert_called_once_with("/some/path/test.txt")
+    thread_sftp_mock.open.assert_called_once_with("/some/path/test.txt", "rb")
+    sftp_mock.stat.assert_not_called()
+    sftp_mock.open.assert_not_called()
+    repo._connect.assert_called_once_with()
@@ -78,3 +78,17 @@ class TestCreateSqlAlchemyEngineWithRetry(TestCase):
                             mock_create_sqlalchemy_engine.mock_calls
                             == [mock.call("mydb://host:port/")] * utils.MAX_RETRY_COUNT
                         )
+
+
+def test_read_replica_router_forgets_writes_older_than_the_write_window():
+    router = utils._ReadReplicaRouter(None, None, [], lambda obj: [], write_window=10)
+    with mock.patch("time.time", return_value=100):
+        router.record_writes([("run", "a"), ("run", "b")])
+    with mock.patch("time.time", return_value=105):
+        router.record_writes([("run", "b"), ("run", "c")])
+        assert router._was_written_recently([("run", "a")])
+    with mock.patch("time.time", return_value=112):
+        router.record_writes([("run", "d")])
+        assert list(router._write_times) == [("run", "b"), ("run", "c"), ("run", "d")]
+        assert not router._was_written_recently([("run", "a"), ("run", "e")])
+        assert router._was_written_recently([("run", "e"), ("run", "c")])
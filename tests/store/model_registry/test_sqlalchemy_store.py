@@ -1,10 +1,13 @@
 import os
+import shutil
 import unittest
 
 import tempfile
 from unittest import mock
 import uuid
 
+import pytest
+
 import mlflow
 import mlflow.db
 import mlflow.store.db.base_sql_model
@@ -1266,3 +1269,48 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         with self.assertRaises(MlflowException) as exception_context:
             self.store.delete_model_version_tag(name1, "I am not a version", "key")
         assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_searches_are_routed_to_read_replicas(tmpdir):
+    primary_path = tmpdir.join("primary.db").strpath
+    replica_path = tmpdir.join("replica.db").strpath
+    store = SqlAlchemyStore(DB_URI + primary_path)
+    store.create_registered_model("replicated")
+    store.engine.dispose()
+    shutil.copyfile(primary_path, replica_path)
+
+    store = SqlAlchemyStore(DB_URI + primary_path, [DB_URI + replica_path])
+    # Writes, and reads made as part of writes, go to the primary
+    store.create_registered_model("not replicated")
+    store.create_model_version("not replicated", "path/to/source", "run_id")
+    store.create_model_version("replicated", "path/to/source", "run_id")
+    # Searches go to the (lagging) replica
+    assert store.search_model_versions("name='replicated'") == []
+    assert [rm.name for rm in store.search_registered_models()] == ["replicated"]
+    # Lookups by name read the writes of the primary
+    assert [mv.version for mv in store.get_registered_model("replicated").latest_versions] == [1]
+    assert [mv.version for mv in store.get_latest_versions("replicated", ["None"])] == [1]
+    assert store.get_registered_model("not replicated").name == "not replicated"
+    assert store.get_model_version("not replicated", 1).source == "path/to/source"
+    assert store.get_model_version_download_uri("replicated", 1) == "path/to/source"
+
+
+def test_lookups_read_from_replicas_after_the_write_window(tmpdir):
+    primary_path = tmpdir.join("primary.db").strpath
+    replica_path = tmpdir.join("replica.db").strpath
+    store = SqlAlchemyStore(DB_URI + primary_path)
+    store.create_registered_model("replicated")
+    store.engine.dispose()
+    shutil.copyfile(primary_path, replica_path)
+
+    with mock.patch.dict(os.environ, {"MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW": "0"}):
+        store = SqlAlchemyStore(DB_URI + primary_path, [DB_URI + replica_path])
+    store.create_model_version("replicated", "path/to/source", "run_id")
+    store.update_registered_model("replicated", "description")
+    store.create_registered_model("not replicated")
+    # Lookups of replicated models read the (lagging) replica
+    assert store.get_registered_model("replicated").description is None
+    # Lookups of models missing from the replica fall back to the primary
+    assert store.get_registered_model("not replicated").name == "not replicated"
+    assert store.get_model_version("replicated", 1).source == "path/to/source"
+    assert [mv.version for mv in store.get_latest_versions("replicated", ["None"])] == [1]
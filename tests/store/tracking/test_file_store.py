@@ -445,6 +445,32 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         assert isinstance(tags_run.data, RunData)
         assert tags_run.data.tags == tags_dict
 
+    def test_create_runs(self):
+        fs = FileStore(self.test_root)
+        runs_data = [
+            RunData(
+                metrics=[Metric("m", 1.0, 123, 0)],
+                params=[Param("p", "a")],
+                tags=[RunTag("t", "x")],
+            ),
+            RunData(),
+        ]
+        runs = fs.create_runs(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, runs_data)
+        assert [fs.get_run(run.info.run_id).data.to_dictionary() for run in runs] == [
+            {"metrics": {"m": 1.0}, "params": {"p": "a"}, "tags": {"t": "x"}},
+            {"metrics": {}, "params": {}, "tags": {}},
+        ]
+
+        fs.update_run_infos([run.info.run_id for run in runs], RunStatus.FAILED, 456)
+        for run in runs:
+            run_info = fs.get_run(run.info.run_id).info
+            assert run_info.status == RunStatus.to_string(RunStatus.FAILED)
+            assert run_info.end_time == 456
+
+        fs.delete_runs([run.info.run_id for run in runs])
+        for run in runs:
+            assert fs.get_run(run.info.run_id).info.lifecycle_stage == LifecycleStage.DELETED
+
     def _experiment_id_edit_func(self, old_dict):
         old_dict["experiment_id"] = int(old_dict["experiment_id"])
         return old_dict
@@ -550,6 +576,43 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
                         self.assertEqual(metric.key, metric_name)
                         self.assertEqual(metric.value, metric_value)
 
+    def test_get_metric_history_since(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        for value, timestamp, step in [
+            (0.5, 3, 0),
+            (0.6, 1, 1),
+            (0.7, 2, 1),
+            (0.8, 1, 2),
+            (0.9, 4, 0),
+        ]:
+            fs.log_metric(run_id, Metric("test", value, timestamp, step))
+
+        actual = fs.get_metric_history_since(run_id, "test", 1, 1)
+        assert [(m.value, m.timestamp, m.step) for m in actual] == [(0.7, 2, 1), (0.8, 1, 2)]
+        assert fs.get_metric_history_since(run_id, "test", 2, 1) == []
+        actual = fs.get_metric_history_since(run_id, "test", -1, 0)
+        assert [m.value for m in actual] == [0.5, 0.9, 0.6, 0.7, 0.8]
+
+    def test_export_runs(self):
+        fs = FileStore(self.test_root)
+        exp_id = fs.create_experiment("test_export_runs")
+        run_ids = []
+        for i in range(5):
+            run_id = fs.create_run(exp_id, user_id="user", start_time=i, tags=[]).info.run_id
+            fs.log_metric(run_id, Metric("m", i, 0, 0))
+            run_ids.append(run_id)
+        fs.log_param(run_ids[2], Param("p", "a"))
+        with mock.patch("mlflow.store.tracking.abstract_store.EXPORT_BATCH_SIZE", 2):
+            table = fs.export_runs([exp_id], "metrics.m >= 1", ViewType.ALL, 3, ["metrics.m DESC"])
+            schema, tables = fs.export_run_batches([exp_id], "metrics.m >= 1", ViewType.ALL)
+            assert [t.num_rows for t in tables] == [2, 2]
+        assert table.column("run_id").to_pylist() == run_ids[:1:-1]
+        assert table.column("metrics.m").to_pylist() == [4.0, 3.0, 2.0]
+        # Columns of the runs of later pages are collected before the first page is converted
+        assert table.column("params.p").to_pylist() == [None, None, "a"]
+        assert schema.names == table.schema.names
+
     def _search(
         self,
         fs,
@@ -625,6 +688,67 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
             [r2], self._search(fs, experiment_id, filter_str="tags.generic_2 ILIKE '%OTHER%'")
         )
 
+    def test_search_or_in_null_and_numeric_params(self):
+        fs = FileStore(self.test_root)
+        experiment_id = self.experiments[0]
+        r1 = fs.create_run(experiment_id, "user", 0, []).info.run_id
+        r2 = fs.create_run(experiment_id, "user", 0, []).info.run_id
+
+        fs.log_param(r1, Param("lr", "0.1"))
+        fs.log_param(r2, Param("lr", "auto"))
+        fs.set_tag(r2, RunTag("team", "a"))
+
+        def search(filter_str):
+            return self._search(fs, experiment_id, filter_str=filter_str)
+
+        self.assertCountEqual([r1, r2], search("params.lr > 0.01 OR tags.team = 'a'"))
+        self.assertCountEqual([r1], search("params.lr > 0.01 AND (tags.team IS NULL)"))
+        self.assertCountEqual([r2], search("params.lr IN ('auto', '1') AND tags.team IS NOT NULL"))
+        self.assertCountEqual([], search("params.lr < 0.01"))
+
+    def test_search_with_search_index(self):
+        fs = FileStore(self.test_root)
+        experiment_id = fs.create_experiment("search_index")
+        r1 = fs.create_run(experiment_id, "user", 0, [RunTag("mlflow.runName", "bert-base")])
+        r2 = fs.create_run(experiment_id, "user", 0, [RunTag("mlflow.runName", "resnet-50")])
+        r1, r2 = r1.info.run_id, r2.info.run_id
+        fs.log_param(r1, Param("model", "BERT"))
+        fs.log_param(r2, Param("model", "resnet"))
+        fs.log_metric(r2, Metric("acc", 0.9, 1, 0))
+
+        def search(filter_str):
+            return self._search(fs, experiment_id, filter_str=filter_str)
+
+        index_path = os.path.join(self.test_root, experiment_id, ".search_index.json")
+        with mock.patch.dict(os.environ, {"MLFLOW_FILESTORE_SEARCH_INDEX": "true"}), mock.patch(
+            "mlflow.store.tracking.search_index.FileSearchIndex.RACY_INTERVAL", 0.1
+        ):
+            # Runs modified within the racy interval before a search are not indexed
+            time.sleep(0.2)
+            self.assertCountEqual([r1], search("tags.mlflow.runName LIKE '%bert%'"))
+            assert os.path.exists(index_path)
+            with mock.patch.object(fs, "_get_all_params") as get_all_params, mock.patch.object(
+                fs, "_get_all_metrics", return_value=[]
+            ) as get_all_metrics:
+                self.assertCountEqual([r2], search("params.model ILIKE 'res%'"))
+                get_all_params.assert_not_called()
+                get_all_metrics.assert_called_once()
+            self.assertCountEqual([r2], search("params.model = 'resnet' AND metrics.acc > 0.5"))
+
+            fs.set_tag(r1, RunTag("mlflow.runName", "roberta"))
+            fs.set_tag(r2, RunTag("a/b", "bert"))
+            self.assertCountEqual([r1], search("tags.mlflow.runName LIKE '%bert%'"))
+            self.assertCountEqual([r2], search("tags.`a/b` = 'bert'"))
+            fs.delete_tag(r2, "a/b")
+            self.assertCountEqual([], search("tags.`a/b` = 'bert'"))
+            fs.log_param(r2, Param("lr", "0.1"))
+            self.assertCountEqual([r2], search("params.lr = 0.1"))
+
+            fs.delete_run(r2)
+            fs._hard_delete_run(r2)
+            self.assertCountEqual([r1], search(None))
+        self.assertCountEqual([r1], search("tags.mlflow.runName LIKE '%bert%'"))
+
     def test_search_with_max_results(self):
         fs = FileStore(self.test_root)
         exp = fs.create_experiment("search_with_max_results")
@@ -14,13 +14,19 @@ from mlflow.entities import (
     ExperimentTag,
     Experiment,
     LifecycleStage,
+    RunData,
+    RunStatus,
+    Run,
+    RunInfo,
 )
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
 from mlflow.protos.service_pb2 import (
     CreateRun,
+    CreateRuns,
     DeleteExperiment,
     DeleteRun,
+    DeleteRuns,
     LogBatch,
     LogMetric,
     LogParam,
@@ -32,8 +38,10 @@ from mlflow.protos.service_pb2 import (
     DeleteTag,
     SetExperimentTag,
     GetExperimentByName,
+    GetMetricHistory,
     ListExperiments,
     LogModel,
+    TerminateRuns,
 )
 from mlflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
@@ -43,6 +51,7 @@ from mlflow.protos.databricks_pb2 import (
     ErrorCode,
 )
 from mlflow.store.tracking.rest_store import RestStore, DatabricksRestStore
+from mlflow.utils.arrow_utils import runs_to_arrow_table, serialize_table
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import MlflowHostCreds, _DEFAULT_HEADERS
 
@@ -310,6 +319,106 @@ class TestRestStore(object):
                 mock_http, creds, "runs/log-model", "POST", message_to_json(expected_message)
             )
 
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            store.get_metric_history_since("run_id", "m1", 3, 12345)
+            expected_message = GetMetricHistory(
+                run_id="run_id",
+                run_uuid="run_id",
+                metric_key="m1",
+                since_step=3,
+                since_timestamp=12345,
+            )
+            self._verify_requests(
+                mock_http, creds, "metrics/get-history", "GET", message_to_json(expected_message)
+            )
+
+    def test_export_runs(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        run = Run(
+            RunInfo("a", "0", "user", "FINISHED", 1, 2, "active"),
+            RunData(metrics=[Metric("m", 1.0, 1, 0)]),
+        )
+        table = runs_to_arrow_table([run])
+        response = mock.MagicMock(status_code=200, content=serialize_table(table))
+        with mock.patch(
+            "mlflow.store.tracking.rest_store.http_request", return_value=response
+        ) as mock_http:
+            assert store.export_runs(["0"], "metrics.m > 0", ViewType.ALL, 10, ["m"]).equals(table)
+        expected_message = SearchRuns(
+            experiment_ids=["0"],
+            filter="metrics.m > 0",
+            run_view_type=ViewType.to_proto(ViewType.ALL),
+            max_results=10,
+            order_by=["m"],
+        )
+        mock_http.assert_called_once_with(
+            host_creds=creds,
+            endpoint="/api/2.0/mlflow/runs/export",
+            method="POST",
+            json=json.loads(message_to_json(expected_message)),
+        )
+
+        # Servers without the export endpoint are searched page by page
+        response = mock.MagicMock(status_code=404, text="<html>Not Found</html>")
+        with mock.patch(
+            "mlflow.store.tracking.rest_store.http_request", return_value=response
+        ), mock.patch.object(store, "_search_runs", return_value=([run], None)) as search_mock:
+            assert store.export_runs(["0"], "metrics.m > 0", ViewType.ALL, 10, ["m"]).equals(table)
+        search_mock.assert_called_once_with(["0"], "metrics.m > 0", ViewType.ALL, 10, ["m"], None)
+
+    @mock.patch("requests.request")
+    def test_bulk_run_requests(self, request):
+        response = mock.MagicMock
+        response.status_code = 200
+        response.text = "{}"
+        request.return_value = response
+
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            store.delete_runs(["u25", "u26"])
+            self._verify_requests(
+                mock_http,
+                creds,
+                "runs/delete-batch",
+                "POST",
+                message_to_json(DeleteRuns(run_ids=["u25", "u26"])),
+            )
+
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            store.update_run_infos(["u25", "u26"], RunStatus.KILLED, 12345)
+            self._verify_requests(
+                mock_http,
+                creds,
+                "runs/terminate-batch",
+                "POST",
+                message_to_json(
+                    TerminateRuns(run_ids=["u25", "u26"], status=RunStatus.KILLED, end_time=12345)
+                ),
+            )
+
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            runs_data = [
+                RunData(
+                    metrics=[Metric("m1", 0.87, 12345, 0)],
+                    params=[Param("p1", "p1val")],
+                    tags=[RunTag("t1", "t1val")],
+                ),
+                RunData(),
+            ]
+            store.create_runs("43", "user", 12345, runs_data)
+            body = message_to_json(
+                CreateRuns(
+                    experiment_id="43",
+                    user_id="user",
+                    start_time=12345,
+                    runs_data=[run_data.to_proto() for run_data in runs_data],
+                )
+            )
+            self._verify_requests(mock_http, creds, "runs/create-batch", "POST", body)
+
     @pytest.mark.parametrize("store_class", [RestStore, DatabricksRestStore])
     def test_get_experiment_by_name(self, store_class):
         creds = MlflowHostCreds("https://hello")
@@ -1,6 +1,7 @@
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 import warnings
 
@@ -15,8 +16,18 @@ import pandas as pd
 from unittest import mock
 
 import mlflow.db
+import mlflow.runs
 import mlflow.store.db.base_sql_model
-from mlflow.entities import ViewType, RunTag, SourceType, RunStatus, Experiment, Metric, Param
+from mlflow.entities import (
+    ViewType,
+    RunTag,
+    SourceType,
+    RunStatus,
+    Experiment,
+    Metric,
+    Param,
+    RunData,
+)
 from mlflow.protos.databricks_pb2 import (
     ErrorCode,
     RESOURCE_DOES_NOT_EXIST,
@@ -29,14 +40,24 @@ from mlflow.store.db.utils import (
     _get_latest_schema_revision,
     MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW,
     MLFLOW_SQLALCHEMYSTORE_POOL_SIZE,
+    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS,
+    MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW,
 )
+from mlflow.store.tracking import search_index
 from mlflow.store.tracking.dbmodels import models
 from mlflow.store.db.db_types import MYSQL, MSSQL
 from mlflow import entities
 from mlflow.exceptions import MlflowException
-from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
+from mlflow.store.tracking.sqlalchemy_store import (
+    SEARCH_STATISTICS_TTL,
+    SqlAlchemyStore,
+    _SearchStatistics,
+    _get_orderby_clauses,
+    _get_sqlalchemy_filter_clauses,
+)
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
 from tests.resources.db.initial_models import Base as InitialBase
 from tests.integration.utils import invoke_cli_runner
@@ -507,6 +528,70 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         expected_tags = {tag.key: tag.value for tag in tags}
         self.assertEqual(actual.data.tags, expected_tags)
 
+    def test_create_runs(self):
+        experiment_id = self._experiment_factory("test_create_runs")
+        runs_data = [
+            RunData(
+                metrics=[
+                    Metric("m", 1.0, 100, 0),
+                    Metric("m", 3.0, 100, 1),
+                    Metric("m", 2.0, 200, 0),
+                    Metric("nan", float("nan"), 100, 0),
+                    Metric("inf", float("inf"), 100, 0),
+                ],
+                params=[Param("p", "a")],
+                tags=[RunTag("t", "x")],
+            ),
+            RunData(params=[Param("p", "b")]),
+            RunData(),
+        ]
+
+        runs = self.store.create_runs(experiment_id, "Anderson", 12345, runs_data)
+
+        assert len(runs) == 3
+        assert len({run.info.run_id for run in runs}) == 3
+        for run, expected in zip(runs, [self.store.get_run(run.info.run_id) for run in runs]):
+            assert run.info.experiment_id == experiment_id
+            assert run.info.user_id == "Anderson"
+            assert run.info.start_time == 12345
+            assert run.info.status == RunStatus.to_string(RunStatus.RUNNING)
+            assert run.info == expected.info
+            assert run.data.params == expected.data.params
+            assert run.data.tags == expected.data.tags
+            assert run.data.metrics.keys() == expected.data.metrics.keys()
+        first_run_data = self.store.get_run(runs[0].info.run_id).data
+        assert first_run_data.metrics["m"] == 3.0
+        assert math.isnan(first_run_data.metrics["nan"])
+        assert first_run_data.metrics["inf"] == 1.7976931348623157e308
+        assert first_run_data.params == {"p": "a"}
+        assert first_run_data.tags == {"t": "x"}
+        history = self.store.get_metric_history(runs[0].info.run_id, "m")
+        assert sorted((m.value, m.timestamp, m.step) for m in history) == [
+            (1.0, 100, 0),
+            (2.0, 200, 0),
+            (3.0, 100, 1),
+        ]
+        assert self.store.get_run(runs[1].info.run_id).data.params == {"p": "b"}
+        assert self.store.get_run(runs[2].info.run_id).data.to_dictionary() == {
+            "metrics": {},
+            "params": {},
+            "tags": {},
+        }
+
+    def test_create_runs_is_atomic(self):
+        experiment_id = self._experiment_factory("test_create_runs_is_atomic")
+        runs_data = [RunData(params=[Param("p", "a")]), RunData(params=[Param("p/../q", "b")])]
+        with pytest.raises(MlflowException, match="Invalid parameter name"):
+            self.store.create_runs(experiment_id, "Anderson", 12345, runs_data)
+        assert len(self.store.search_runs([experiment_id], None, ViewType.ALL)) == 0
+
+        with pytest.raises(MlflowException, match="at most 100 runs"):
+            self.store.create_runs(experiment_id, "Anderson", 12345, [RunData()] * 101)
+
+        self.store.delete_experiment(experiment_id)
+        with pytest.raises(MlflowException, match="must be in the 'active' state"):
+            self.store.create_runs(experiment_id, "Anderson", 12345, [RunData()])
+
     def test_to_mlflow_entity_and_proto(self):
         # Create a run and log metrics, params, tags to the run
         created_run = self._run_factory()
@@ -546,6 +631,21 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             deleted_run = self.store.get_run(run.info.run_id)
             self.assertEqual(actual.run_uuid, deleted_run.info.run_id)
 
+    def test_delete_runs(self):
+        experiment_id = self._experiment_factory("test_delete_runs")
+        run_ids = [
+            self._run_factory(config=self._get_run_configs(experiment_id=experiment_id)).info.run_id
+            for _ in range(3)
+        ]
+        self.store.delete_runs(run_ids[:2])
+        active_runs = self.store.search_runs([experiment_id], None, ViewType.ACTIVE_ONLY)
+        assert [run.info.run_id for run in active_runs] == [run_ids[2]]
+
+        # Deleting an already deleted run fails without deleting any other run
+        with pytest.raises(MlflowException, match="must be in the 'active' state"):
+            self.store.delete_runs([run_ids[2], run_ids[0]])
+        assert self.store.get_run(run_ids[2]).info.lifecycle_stage == "active"
+
     def test_hard_delete_run(self):
         run = self._run_factory()
         metric = entities.Metric("blahmetric", 100.0, int(1000 * time.time()), 0)
@@ -819,6 +919,24 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             [(m.key, m.value, m.timestamp) for m in actual],
         )
 
+    def test_get_metric_history_since(self):
+        run = self._run_factory()
+        run_id = run.info.run_id
+        for value, timestamp, step in [
+            (0.5, 3, 0),
+            (0.6, 1, 1),
+            (0.7, 2, 1),
+            (0.8, 1, 2),
+            (0.9, 4, 0),
+        ]:
+            self.store.log_metric(run_id, entities.Metric("test", value, timestamp, step))
+
+        actual = self.store.get_metric_history_since(run_id, "test", 1, 1)
+        assert [(m.value, m.timestamp, m.step) for m in actual] == [(0.7, 2, 1), (0.8, 1, 2)]
+        assert self.store.get_metric_history_since(run_id, "test", 2, 1) == []
+        actual = self.store.get_metric_history_since(run_id, "test", -1, 0)
+        assert [m.value for m in actual] == [0.5, 0.9, 0.6, 0.7, 0.8]
+
     def test_list_run_infos(self):
         experiment_id = self._experiment_factory("test_exp")
         r1 = self._run_factory(config=self._get_run_configs(experiment_id)).info.run_id
@@ -856,6 +974,25 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             self.assertEqual(actual.status, new_status_string)
             self.assertEqual(actual.end_time, endtime)
 
+    def test_update_run_infos(self):
+        experiment_id = self._experiment_factory("test_update_run_infos")
+        run_ids = [
+            self._run_factory(config=self._get_run_configs(experiment_id=experiment_id)).info.run_id
+            for _ in range(3)
+        ]
+        actual = self.store.update_run_infos(run_ids[:2], RunStatus.KILLED, 123)
+        assert [run_info.run_id for run_info in actual] == run_ids[:2]
+        for run_id in run_ids[:2]:
+            run_info = self.store.get_run(run_id).info
+            assert run_info.status == "KILLED"
+            assert run_info.end_time == 123
+        assert self.store.get_run(run_ids[2]).info.status == "RUNNING"
+
+        with pytest.raises(MlflowException, match="not found") as e:
+            self.store.update_run_infos([run_ids[2], "fake_run_id"], RunStatus.FINISHED, 456)
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+        assert self.store.get_run(run_ids[2]).info.status == "RUNNING"
+
     def test_restore_experiment(self):
         experiment_id = self._experiment_factory("helloexp")
         exp = self.store.get_experiment(experiment_id)
@@ -1428,6 +1565,195 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         )
         self.assertCountEqual([], self._search(experiment_id, filter_string))
 
+    def test_search_or_in_null_and_numeric_params(self):
+        experiment_id = self._experiment_factory("search_grammar")
+        r1 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        r2 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        r3 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+
+        self.store.log_param(r1, entities.Param("model", "tf"))
+        self.store.log_param(r2, entities.Param("model", "sklearn"))
+        self.store.log_param(r1, entities.Param("lr", "0.1"))
+        self.store.log_param(r2, entities.Param("lr", "1e-3"))
+        self.store.log_param(r3, entities.Param("lr", "auto"))
+        self.store.set_tag(r3, entities.RunTag("team", "a"))
+        self.store.log_metric(r1, entities.Metric("acc", 0.9, 1, 0))
+        self.store.log_metric(r2, entities.Metric("acc", 0.5, 1, 0))
+
+        def search(filter_string):
+            return self._search(experiment_id, filter_string)
+
+        self.assertCountEqual([r1, r3], search("params.model = 'tf' OR tags.team = 'a'"))
+        self.assertCountEqual(
+            [r1], search("(params.model = 'sklearn' OR metrics.acc > 0.8) AND params.lr = '0.1'")
+        )
+        self.assertCountEqual([r1, r2], search("params.model IN ('tf', 'sklearn', 'xgboost')"))
+        self.assertCountEqual([r3], search("tags.team IN ('a')"))
+        self.assertCountEqual([r1, r2, r3], search("attributes.status IN ('RUNNING')"))
+        self.assertCountEqual([r3], search("params.model IS NULL"))
+        self.assertCountEqual([r1, r2], search("metrics.acc IS NOT NULL"))
+        self.assertCountEqual([r1, r2], search("tags.team IS NULL AND params.lr IS NOT NULL"))
+        self.assertCountEqual([r1], search("params.lr > 0.01"))
+        self.assertCountEqual([r1, r2], search("params.lr < 1"))
+        self.assertCountEqual([r2], search("params.lr = 0.001"))
+        self.assertCountEqual([r1], search("params.lr != 0.001"))
+        self.assertCountEqual([r3], search("params.lr = 'auto' OR params.lr < 0.0001"))
+
+        with self.assertRaisesRegex(MlflowException, "Invalid comparator"):
+            search("params.lr LIKE 1")
+        with self.assertRaisesRegex(MlflowException, "Invalid comparator"):
+            search("metrics.acc IN ('1')")
+
+    def test_search_with_search_index(self):
+        experiment_id = self._experiment_factory("search_index")
+        r1 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        r2 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        self.store.set_tag(r1, entities.RunTag("mlflow.runName", "bert-base"))
+        self.store.set_tag(r2, entities.RunTag("mlflow.runName", "resnet-50"))
+        self.store.log_param(r1, entities.Param("model", "BERT"))
+
+        invoke_cli_runner(mlflow.db.commands, ["create-search-index", self.db_url])
+        self.store = self._get_store(self.db_url)
+        assert self.store.search_index == "sqlite"
+
+        def search(filter_string):
+            return self._search(experiment_id, filter_string)
+
+        with mock.patch(
+            "mlflow.store.tracking.search_index.select_sqlite_candidates",
+            wraps=search_index.select_sqlite_candidates,
+        ) as select_candidates:
+            self.assertCountEqual([r1], search("tags.mlflow.runName LIKE '%bert%'"))
+            select_candidates.assert_called_once_with("tags", "mlflow.runName", ["bert"])
+        # The index is case-insensitive, while LIKE comparisons are case-sensitive
+        self.assertCountEqual([], search("params.model LIKE 'bert%'"))
+        self.assertCountEqual([r1], search("params.model ILIKE 'bert%'"))
+        self.assertCountEqual([r1, r2], search("tags.mlflow.runName LIKE '%e%'"))
+        self.assertCountEqual(
+            [r2], search("tags.mlflow.runName LIKE 'res%' OR params.model LIKE '%\"x\"%'")
+        )
+
+        # The index is maintained as params and tags are logged, updated and deleted
+        self.store.set_tag(r1, entities.RunTag("mlflow.runName", "gpt"))
+        self.store.set_tag(r2, entities.RunTag("note", "distilbert"))
+        self.store.log_param(r2, entities.Param("model", "bert-tiny"))
+        self.assertCountEqual([], search("tags.mlflow.runName LIKE '%bert%' OR tags.note = 'x'"))
+        self.assertCountEqual([r2], search("tags.note LIKE '%bert%'"))
+        self.assertCountEqual([r1, r2], search("params.model ILIKE 'BERT%'"))
+        self.store.delete_tag(r2, "note")
+        self.assertCountEqual([], search("tags.note LIKE '%bert%'"))
+
+        # Incomplete indexes, for instance after migrations recreating tables, are not used
+        with self.store.engine.begin() as connection:
+            connection.execute("DROP TRIGGER tags_search_index_au")
+        assert search_index.get_search_index(self.store.engine) is None
+
+        invoke_cli_runner(mlflow.db.commands, ["drop-search-index", self.db_url])
+        self.store = self._get_store(self.db_url)
+        assert self.store.search_index is None
+        self.assertCountEqual([r1, r2], search("params.model ILIKE 'BERT%'"))
+
+    def test_search_filter_clauses_are_merged_and_ordered_by_selectivity(self):
+        experiment_id = self._experiment_factory("search_planner")
+        runs = [self._run_factory(self._get_run_configs(experiment_id)) for _ in range(4)]
+        r1, r2 = runs[0].info.run_id, runs[1].info.run_id
+        for run in runs:
+            self.store.log_param(run.info.run_id, entities.Param("common", "x"))
+        self.store.log_param(r1, entities.Param("rare", "a"))
+        self.store.log_param(r2, entities.Param("rare", "b"))
+
+        filter_string = (
+            "params.common != 'y' AND params.rare LIKE '%a%' AND params.rare != 'b' "
+            "AND params.missing IS NULL"
+        )
+        with self.store.ManagedSessionMaker() as session:
+            # Databases never analyzed have no statistics, with which clauses keep their order
+            assert _SearchStatistics.collect(session) is None
+        with self.store.engine.begin() as connection:
+            connection.execute("ANALYZE")
+        with self.store.ManagedSessionMaker() as session:
+            statistics = self.store._get_search_statistics(session)
+            assert statistics.num_runs == 4
+            # 6 params of 2 keys
+            assert statistics.rows_per_key == {"params": 3}
+            clauses = _get_sqlalchemy_filter_clauses(
+                SearchUtils.parse_search_filter(filter_string), statistics=statistics
+            )
+        clauses_sql = [
+            str(
+                c.compile(dialect=self.store.engine.dialect, compile_kwargs={"literal_binds": True})
+            )
+            for c in clauses
+        ]
+        # The comparisons of params.rare are merged into one subquery, estimated to match fewer
+        # runs than the other clauses
+        assert len(clauses_sql) == 3
+        assert "params.value LIKE '%a%' AND params.value != 'b'" in clauses_sql[0]
+        assert clauses_sql[1].startswith("NOT")
+        assert "'common'" in clauses_sql[2]
+        self.assertCountEqual([r1], self._search(experiment_id, filter_string))
+
+        with mock.patch.object(
+            _SearchStatistics, "collect", wraps=_SearchStatistics.collect
+        ) as collect:
+            self._search(experiment_id, filter_string)
+            collect.assert_not_called()
+
+    def test_expired_search_statistics_are_read_by_a_single_search(self):
+        reading = threading.Event()
+        read = threading.Event()
+
+        def collect(session):  # pylint: disable=unused-argument
+            reading.set()
+            read.wait(10)
+            return _SearchStatistics(4)
+
+        with mock.patch.object(_SearchStatistics, "collect", side_effect=collect) as collect_mock:
+            thread = threading.Thread(target=self.store._get_search_statistics, args=(None,))
+            thread.start()
+            assert reading.wait(10)
+            # Concurrent searches use the previous statistics instead of reading them again
+            assert self.store._get_search_statistics(None) is None
+            read.set()
+            thread.join()
+            assert self.store._get_search_statistics(None).num_runs == 4
+            assert collect_mock.call_count == 1
+            with mock.patch("time.time", return_value=time.time() + SEARCH_STATISTICS_TTL + 1):
+                self.store._get_search_statistics(None)
+            assert collect_mock.call_count == 2
+
+    def test_explain_search_runs(self):
+        experiment_id = self._experiment_factory("explain")
+        run_id = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        self.store.log_param(run_id, entities.Param("model", "bert"))
+
+        explanation = self.store.explain_search_runs(
+            [experiment_id],
+            "params.model LIKE '%er%' AND metrics.acc > 0.5",
+            ViewType.ACTIVE_ONLY,
+            order_by=["metrics.acc DESC"],
+        )
+        assert explanation["sql"].startswith("SELECT")
+        assert "params.value LIKE '%er%'" in explanation["sql"]
+        assert any("params" in line for line in explanation["plan"])
+
+        client = mlflow.tracking.MlflowClient(tracking_uri=self.db_url)
+        assert client.search_runs([experiment_id], explain=True)["plan"]
+        with mock.patch.dict(os.environ, {"MLFLOW_TRACKING_URI": self.db_url}):
+            result = invoke_cli_runner(
+                mlflow.runs.commands,
+                ["explain", "--experiment-id", experiment_id, "--filter", "params.model = 'bert'"],
+            )
+        assert "params.value = 'bert'" in result.output
+        assert "Query plan:" in result.output
+
+    def test_search_index_requires_sqlite_or_postgres(self):
+        engine = mock.Mock()
+        engine.dialect.name = MYSQL
+        with pytest.raises(MlflowException, match="only supported by SQLite and PostgreSQL"):
+            search_index.create_search_index(engine)
+        assert search_index.get_search_index(engine) is None
+
     def test_search_with_max_results(self):
         exp = self._experiment_factory("search_with_max_results")
         runs = [
@@ -1992,3 +2318,102 @@ def test_get_orderby_clauses():
 
         # test that an exception is NOT raised when key types are different
         _get_orderby_clauses(["param.a", "metric.a", "tag.a"], session)
+
+
+def _create_store_with_lagging_replicas(tmpdir, num_replicas=2):
+    """
+    Create a store with an experiment and a run, then a store of the same database with stand-in
+    replicas, which are copies of the database that do not receive any of the further writes.
+    """
+    primary_path = tmpdir.join("primary.db").strpath
+    artifact_root = tmpdir.join("artifacts").strpath
+    store = SqlAlchemyStore(DB_URI + primary_path, artifact_root)
+    experiment_id = store.create_experiment("replicated")
+    replicated_run = store.create_run(experiment_id, "user", 0, [])
+    store.engine.dispose()
+    replica_paths = [tmpdir.join("replica%d.db" % i).strpath for i in range(num_replicas)]
+    for replica_path in replica_paths:
+        shutil.copyfile(primary_path, replica_path)
+    store = SqlAlchemyStore(
+        DB_URI + primary_path, artifact_root, [DB_URI + path for path in replica_paths]
+    )
+    return store, replica_paths, experiment_id, replicated_run
+
+
+def test_searches_are_routed_to_read_replicas(tmpdir):
+    store, replica_paths, experiment_id, replicated_run = _create_store_with_lagging_replicas(
+        tmpdir
+    )
+    # Writes, and reads made as part of writes, go to the primary
+    new_experiment_id = store.create_experiment("not replicated")
+    store.create_run(new_experiment_id, "user", 0, [])
+    store.log_metric(replicated_run.info.run_id, entities.Metric("m", 1.0, 0, 0))
+    # Listings and searches go to the (lagging) replicas, in a round-robin fashion
+    for _ in replica_paths:
+        assert [e.experiment_id for e in store.list_experiments()] == ["0", experiment_id]
+        assert store.search_runs([new_experiment_id], None, ViewType.ALL) == []
+        runs = store.search_runs([experiment_id], None, ViewType.ALL)
+        assert [run.data.metrics for run in runs] == [{}]
+        assert store.get_metric_history_since(replicated_run.info.run_id, "m", -1, -1) == []
+
+    # Diverge the replicas to observe the round-robin
+    other_store = SqlAlchemyStore(DB_URI + replica_paths[1], tmpdir.join("artifacts").strpath)
+    other_store.create_experiment("only in replica 1")
+    other_store.engine.dispose()
+    found = ["only in replica 1" in [e.name for e in store.list_experiments()] for _ in range(4)]
+    assert sorted(found) == [False, False, True, True]
+    assert found[0] != found[1]
+
+
+def test_lookups_by_id_read_their_writes_despite_lagging_replicas(tmpdir):
+    store, _, experiment_id, replicated_run = _create_store_with_lagging_replicas(tmpdir)
+    run_id = replicated_run.info.run_id
+    new_experiment_id = store.create_experiment("not replicated")
+    new_run = store.create_run(new_experiment_id, "user", 0, [])
+    store.log_metric(run_id, entities.Metric("m", 1.0, 0, 0))
+    store.set_tag(run_id, entities.RunTag("t", "v"))
+    store.update_run_info(run_id, RunStatus.FINISHED, 1)
+    store.set_experiment_tag(experiment_id, entities.ExperimentTag("t", "v"))
+    for _ in range(2):
+        assert store.get_experiment(new_experiment_id).name == "not replicated"
+        assert store.get_experiment(experiment_id).tags == {"t": "v"}
+        assert store.get_experiment_by_name("not replicated").experiment_id == new_experiment_id
+        assert store.get_run(new_run.info.run_id).info.experiment_id == new_experiment_id
+        run = store.get_run(run_id)
+        assert run.data.metrics == {"m": 1.0}
+        assert run.data.tags["t"] == "v"
+        assert run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+        assert [m.value for m in store.get_metric_history(run_id, "m")] == [1.0]
+
+
+def test_lookups_read_from_replicas_after_the_write_window(tmpdir):
+    with mock.patch.dict(os.environ, {MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_WRITE_WINDOW: "0"}):
+        store, _, experiment_id, replicated_run = _create_store_with_lagging_replicas(tmpdir)
+    run_id = replicated_run.info.run_id
+    new_experiment_id = store.create_experiment("not replicated")
+    new_run = store.create_run(new_experiment_id, "user", 0, [])
+    store.log_metric(run_id, entities.Metric("m", 1.0, 0, 0))
+    store.set_experiment_tag(experiment_id, entities.ExperimentTag("t", "v"))
+    # Lookups of replicated entities read the (lagging) replicas
+    assert store.get_run(run_id).data.metrics == {}
+    assert store.get_experiment(experiment_id).tags == {}
+    # Lookups of entities missing from the replicas fall back to the primary
+    assert store.get_experiment(new_experiment_id).name == "not replicated"
+    assert store.get_experiment_by_name("not replicated").experiment_id == new_experiment_id
+    assert store.get_run(new_run.info.run_id).info.experiment_id == new_experiment_id
+    assert [m.value for m in store.get_metric_history(run_id, "m")] == [1.0]
+    with pytest.raises(MlflowException, match="not found"):
+        store.get_run(uuid.uuid4().hex)
+
+
+def test_read_replica_uris_default_to_environment_variable(tmpdir):
+    primary_uri = DB_URI + tmpdir.join("primary.db").strpath
+    replica_uri = DB_URI + tmpdir.join("replica.db").strpath
+    SqlAlchemyStore(replica_uri, ARTIFACT_URI)
+    with mock.patch.dict(os.environ, {MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS: replica_uri}):
+        store = SqlAlchemyStore(primary_uri, ARTIFACT_URI)
+    assert store.read_replica_uris == [replica_uri]
+    assert store.ReadOnlySessionMaker is not store.ManagedSessionMaker
+    store = SqlAlchemyStore(primary_uri, ARTIFACT_URI)
+    assert store.read_replica_uris == []
+    assert store.ReadOnlySessionMaker is store.ManagedSessionMaker
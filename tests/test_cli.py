@@ -16,6 +16,7 @@ from urllib.parse import urlparse, unquote
 from mlflow.cli import run, server, ui
 from mlflow.server import handlers
 from mlflow import experiments
+from mlflow.store.db.utils import MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 from mlflow.store.tracking.file_store import FileStore
 from mlflow.exceptions import MlflowException
@@ -46,6 +47,89 @@ def test_server_default_artifact_root_validation():
         run_server_mock.assert_not_called()
 
 
+def test_server_read_replica_uris(tmpdir):
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(
+            server, ["--backend-store-read-replica-uri", "sqlite:///replica.db"]
+        )
+        assert "requires a database backend store" in result.output
+        run_server_mock.assert_not_called()
+
+    primary_uri = "sqlite:///" + tmpdir.join("primary.db").strpath
+    replica_uris = ["sqlite:///" + tmpdir.join("replica%d.db" % i).strpath for i in range(2)]
+    for replica_uri in replica_uris:
+        SqlAlchemyStore(replica_uri, tmpdir.strpath)
+    handlers._tracking_store = None
+    with mock.patch("mlflow.cli._run_server") as run_server_mock, mock.patch.dict(os.environ):
+        CliRunner().invoke(
+            server,
+            ["--backend-store-uri", primary_uri, "--default-artifact-root", tmpdir.strpath]
+            + ["--backend-store-read-replica-uri=" + uri for uri in replica_uris],
+        )
+        run_server_mock.assert_called_once()
+        assert os.environ[MLFLOW_SQLALCHEMYSTORE_READ_REPLICA_URIS] == ",".join(replica_uris)
+        assert handlers._tracking_store.read_replica_uris == replica_uris
+    handlers._tracking_store = None
+    handlers._model_registry_store = None
+
+
+def test_server_asgi_mode():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(
+            server, ["--asgi", "--asgi-max-threads", "8", "--uvicorn-opts", "--log-level debug"]
+        )
+        run_server_mock.assert_called_once()
+        assert run_server_mock.call_args[0][-9:-6] == (True, 8, "--log-level debug")
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--uvicorn-opts", "--log-level debug"])
+        assert "--uvicorn-opts can only be specified together with --asgi" in str(result.exception)
+        run_server_mock.assert_not_called()
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--asgi", "--gunicorn-opts", "--timeout 60"])
+        assert "cannot specify --gunicorn-opts" in str(result.exception)
+        run_server_mock.assert_not_called()
+
+
+def test_server_admission_control(tmpdir):
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(
+            server, ["--client-rate-limit", "20,100", "--max-concurrent-requests", "searches=8"]
+        )
+        run_server_mock.assert_called_once()
+        client_rate_limit, concurrency_limits, state_uri = run_server_mock.call_args[0][-6:-3]
+        assert (client_rate_limit, concurrency_limits) == ("20,100", "searches=8")
+        # Each worker enforces its share of the limits by default
+        assert state_uri is None
+        # Clients are identified by IP address unless authenticated by a trusted proxy
+        assert run_server_mock.call_args[0][-3] is False
+    state_uri = "sqlite:///" + tmpdir.join("state.db").strpath
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(
+            server,
+            [
+                "--client-rate-limit",
+                "20",
+                "--admission-control-state",
+                state_uri,
+                "--trust-proxy-auth",
+            ],
+        )
+        assert run_server_mock.call_args[0][-6:-2] == ("20", None, state_uri, True)
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--max-concurrent-requests", "reads=8"])
+        assert "Invalid concurrency limit" in result.output
+        run_server_mock.assert_not_called()
+
+
+def test_server_preload():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(server)
+        assert run_server_mock.call_args[0][-1] is False
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(server, ["--preload"])
+        assert run_server_mock.call_args[0][-1] is True
+
+
 @pytest.mark.parametrize("command", [server, ui])
 def test_tracking_uri_validation_failure(command):
     handlers._tracking_store = None
@@ -0,0 +1,218 @@
+"""
+Integration tests which start a local Tracking Server on an ephemeral port, and ensure we can use
+the asyncio-native client to communicate with it.
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+
+import pytest
+from unittest import mock
+
+from mlflow.entities import Metric, Param, RunData, RunStatus, RunTag, ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import AsyncMlflowClient, MlflowClient
+from mlflow.utils.file_utils import path_to_local_file_uri
+from mlflow.utils.rest_utils import MlflowHostCreds, async_http_request
+
+from tests.tracking.integration_test_utils import _await_server_down_or_die, _init_server
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="module")
+def tracking_server_uri():
+    root_dir = tempfile.mkdtemp("test_async_client")
+    backend_uri = "sqlite:///" + os.path.join(root_dir, "test-database.db")
+    url, process = _init_server(backend_uri, root_artifact_uri=path_to_local_file_uri(root_dir))
+    yield url
+    process.terminate()
+    _await_server_down_or_die(process)
+    shutil.rmtree(root_dir)
+
+
+@pytest.fixture()
+def experiment_id(tracking_server_uri):
+    return MlflowClient(tracking_server_uri).create_experiment("exp-%s" % time.time())
+
+
+def test_client_rejects_non_rest_tracking_uri(tmpdir):
+    with pytest.raises(MlflowException, match="only supports tracking and registry servers"):
+        AsyncMlflowClient(path_to_local_file_uri(tmpdir.strpath))
+
+
+def test_run_lifecycle(tracking_server_uri, experiment_id):
+    async def lifecycle():
+        async with AsyncMlflowClient(tracking_server_uri) as client:
+            run = await client.create_run(experiment_id, tags={"t": "x"})
+            run_id = run.info.run_id
+            await client.log_metric(run_id, "m", 1.5, timestamp=100, step=1)
+            await client.log_param(run_id, "p", 3)
+            await client.set_tag(run_id, "u", "y")
+            await client.delete_tag(run_id, "t")
+            await client.log_batch(
+                run_id,
+                metrics=[Metric("m", 2.5, 200, 2)],
+                params=[Param("q", "b")],
+                tags=[RunTag("v", "z")],
+            )
+            run_info = await client.set_terminated(run_id, status="KILLED", end_time=300)
+            history = await client.get_metric_history(run_id, "m")
+            new_values = await client.get_metric_history(run_id, "m", since=(1, 100))
+            return await client.get_run(run_id), run_info, history, new_values
+
+    run, run_info, history, new_values = _run(lifecycle())
+    assert run.data.metrics == {"m": 2.5}
+    assert run.data.params == {"p": "3", "q": "b"}
+    assert run.data.tags["u"] == "y"
+    assert run.data.tags["v"] == "z"
+    assert "t" not in run.data.tags
+    assert run.info.status == "KILLED"
+    assert run.info.end_time == 300
+    assert run_info == run.info
+    assert sorted((m.value, m.timestamp, m.step) for m in history) == [(1.5, 100, 1), (2.5, 200, 2)]
+    assert [(m.value, m.timestamp, m.step) for m in new_values] == [(2.5, 200, 2)]
+
+
+def test_bulk_operations_and_concurrent_fan_out(tracking_server_uri, experiment_id):
+    async def fan_out():
+        async with AsyncMlflowClient(tracking_server_uri, max_concurrency=4) as client:
+            runs = await client.create_runs(
+                experiment_id,
+                [RunData(params=[Param("i", str(i))]) for i in range(20)],
+                tags={"common": "tag"},
+            )
+            run_ids = [run.info.run_id for run in runs]
+            await asyncio.gather(
+                *[client.log_metric(run_id, "m", i) for i, run_id in enumerate(run_ids)]
+            )
+            await client.set_terminated_runs(run_ids[:10])
+            await client.delete_runs(run_ids[10:15])
+            fetched_runs = await client.get_runs(run_ids)
+            active_runs = await client.search_runs(
+                experiment_id, "tags.common = 'tag'", ViewType.ACTIVE_ONLY, max_results=100
+            )
+            return run_ids, fetched_runs, active_runs
+
+    run_ids, fetched_runs, active_runs = _run(fan_out())
+    assert [run.info.run_id for run in fetched_runs] == run_ids
+    for i, run in enumerate(fetched_runs):
+        assert run.data.params == {"i": str(i)}
+        assert run.data.metrics == {"m": i}
+        assert run.data.tags["common"] == "tag"
+        expected_status = RunStatus.FINISHED if i < 10 else RunStatus.RUNNING
+        assert run.info.status == RunStatus.to_string(expected_status)
+    assert set(run.info.run_id for run in active_runs) == set(run_ids[:10] + run_ids[15:])
+
+
+def test_experiments(tracking_server_uri):
+    async def experiments():
+        async with AsyncMlflowClient(tracking_server_uri) as client:
+            experiment_id = await client.create_experiment("async experiment")
+            await client.set_experiment_tag(experiment_id, "k", "v")
+            await client.rename_experiment(experiment_id, "renamed async experiment")
+            experiment = await client.get_experiment(experiment_id)
+            by_name = await client.get_experiment_by_name("renamed async experiment")
+            missing = await client.get_experiment_by_name("does not exist")
+            await client.delete_experiment(experiment_id)
+            deleted = await client.list_experiments(ViewType.DELETED_ONLY)
+            await client.restore_experiment(experiment_id)
+            active = await client.list_experiments()
+            return experiment_id, experiment, by_name, missing, deleted, active
+
+    experiment_id, experiment, by_name, missing, deleted, active = _run(experiments())
+    assert experiment.name == "renamed async experiment"
+    assert experiment.tags == {"k": "v"}
+    assert by_name.experiment_id == experiment_id
+    assert missing is None
+    assert experiment_id in [e.experiment_id for e in deleted]
+    assert experiment_id in [e.experiment_id for e in active]
+
+
+def test_errors_are_raised_as_mlflow_exceptions(tracking_server_uri):
+    async def get_missing_run():
+        async with AsyncMlflowClient(tracking_server_uri) as client:
+            await client.get_run("0123456789abcdef")
+
+    with pytest.raises(MlflowException, match="not found") as e:
+        _run(get_missing_run())
+    assert e.value.error_code == "RESOURCE_DOES_NOT_EXIST"
+
+
+def test_model_registry(tracking_server_uri):
+    async def registry():
+        async with AsyncMlflowClient(tracking_server_uri) as client:
+            await client.create_registered_model("async model", tags={"a": "b"})
+            await client.update_registered_model("async model", description="desc")
+            await client.set_registered_model_tag("async model", "c", "d")
+            await client.delete_registered_model_tag("async model", "a")
+            version = await client.create_model_version("async model", "runs:/abc/model")
+            await client.set_model_version_tag("async model", version.version, "e", "f")
+            await client.transition_model_version_stage(
+                "async model", version.version, "Production"
+            )
+            latest = await client.get_latest_versions("async model", stages=["Production"])
+            found = await client.search_model_versions("name = 'async model'")
+            model = await client.get_registered_model("async model")
+            await client.rename_registered_model("async model", "renamed async model")
+            listed = await client.search_registered_models("name = 'renamed async model'")
+            await client.delete_registered_model("renamed async model")
+            return version, latest, found, model, listed
+
+    version, latest, found, model, listed = _run(registry())
+    assert version.version == "1"
+    assert [mv.version for mv in latest] == ["1"]
+    assert latest[0].tags == {"e": "f"}
+    assert [mv.version for mv in found] == ["1"]
+    assert model.description == "desc"
+    assert model.tags == {"c": "d"}
+    assert [rm.name for rm in listed] == ["renamed async model"]
+
+
+def test_async_http_request_retries_rate_limited_and_failed_requests():
+    class MockResponse:
+        def __init__(self, status, text):
+            self.status = status
+            self._text = text
+
+        async def text(self):
+            return self._text
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+    session = mock.Mock()
+    session.request.side_effect = [
+        MockResponse(429, "rate limited"),
+        MockResponse(500, "internal error"),
+        MockResponse(200, "{}"),
+    ]
+    host_creds = MlflowHostCreds("http://my-host/", token="my-token")
+
+    async def no_sleep(_):
+        pass
+
+    with mock.patch("asyncio.sleep", side_effect=no_sleep):
+        response = _run(
+            async_http_request(
+                session, host_creds, "/api/2.0/mlflow/runs/get", method="GET", params={"a": [1, 2]}
+            )
+        )
+    assert response.status_code == 200
+    assert response.text == "{}"
+    assert session.request.call_count == 3
+    args, kwargs = session.request.call_args
+    assert args == ("GET", "http://my-host/api/2.0/mlflow/runs/get")
+    assert kwargs["headers"]["Authorization"] == "Bearer my-token"
+    assert kwargs["params"] == [("a", "1"), ("a", "2")]
@@ -1,7 +1,17 @@
 import pytest
 from unittest import mock
 
-from mlflow.entities import SourceType, ViewType, RunTag, Run, RunInfo
+from mlflow.entities import (
+    SourceType,
+    ViewType,
+    RunTag,
+    Run,
+    RunInfo,
+    RunData,
+    RunStatus,
+    Metric,
+    Param,
+)
 from mlflow.entities.model_registry import ModelVersion, ModelVersionTag
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import ErrorCode, FEATURE_DISABLED
@@ -80,6 +90,55 @@ def test_client_create_run_overrides(mock_store):
     )
 
 
+def test_client_create_runs(mock_store, mock_time):
+    runs_data = [
+        RunData(
+            metrics=[Metric("m", 1.0, 123, 0)],
+            params=[Param("p", "a")],
+            tags=[RunTag("t", "run"), RunTag("u", "run")],
+        ),
+        RunData(),
+    ]
+
+    MlflowClient().create_runs("0", runs_data, tags={MLFLOW_USER: "user", "t": "common"})
+
+    _, kwargs = mock_store.create_runs.call_args
+    assert kwargs["experiment_id"] == "0"
+    assert kwargs["user_id"] == "user"
+    assert kwargs["start_time"] == int(mock_time * 1000)
+    assert [run_data.to_dictionary() for run_data in kwargs["runs_data"]] == [
+        {
+            "metrics": {"m": 1.0},
+            "params": {"p": "a"},
+            "tags": {MLFLOW_USER: "user", "t": "run", "u": "run"},
+        },
+        {"metrics": {}, "params": {}, "tags": {MLFLOW_USER: "user", "t": "common"}},
+    ]
+
+
+def test_client_create_runs_validates_names(mock_store):
+    with pytest.raises(MlflowException, match="Invalid parameter name"):
+        MlflowClient().create_runs("0", [RunData(), RunData(params=[Param("a/../b", "v")])])
+    mock_store.create_runs.assert_not_called()
+
+
+def test_client_set_terminated_runs(mock_store, mock_time):
+    MlflowClient().set_terminated_runs(["a", "b"])
+    mock_store.update_run_infos.assert_called_once_with(
+        ["a", "b"], run_status=RunStatus.FINISHED, end_time=int(mock_time * 1000)
+    )
+    mock_store.reset_mock()
+    MlflowClient().set_terminated_runs(["a"], status="KILLED", end_time=123)
+    mock_store.update_run_infos.assert_called_once_with(
+        ["a"], run_status=RunStatus.KILLED, end_time=123
+    )
+
+
+def test_client_delete_runs(mock_store):
+    MlflowClient().delete_runs(["a", "b"])
+    mock_store.delete_runs.assert_called_once_with(["a", "b"])
+
+
 def test_client_search_runs_defaults(mock_store):
     MlflowClient().search_runs([1, 2, 3])
     mock_store.search_runs.assert_called_once_with(
@@ -176,6 +235,23 @@ def test_client_search_runs_page_token(mock_store):
     )
 
 
+def test_client_search_runs_explain(mock_store):
+    mock_store.explain_search_runs.return_value = {"sql": "SELECT", "plan": []}
+    assert MlflowClient().search_runs([5], "my filter", explain=True) == {
+        "sql": "SELECT",
+        "plan": [],
+    }
+    mock_store.explain_search_runs.assert_called_once_with(
+        experiment_ids=[5],
+        filter_string="my filter",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    )
+    mock_store.search_runs.assert_not_called()
+
+
 def test_client_registry_operations_raise_exception_with_unsupported_registry_store():
     """
     This test case ensures that Model Registry operations invoked on the `MlflowClient`
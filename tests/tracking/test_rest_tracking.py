@@ -445,6 +445,29 @@ def test_search_pagination(mlflow_client, backend_store_uri):
     assert result.token is None
 
 
+def test_export_runs(mlflow_client, backend_store_uri):
+    experiment_id = mlflow_client.create_experiment("export_runs")
+    run_ids = []
+    for i in range(3):
+        run_id = mlflow_client.create_run(experiment_id, start_time=i).info.run_id
+        mlflow_client.log_metric(run_id, "m", i)
+        mlflow_client.log_param(run_id, "p", "p%d" % i)
+        run_ids.append(run_id)
+    mlflow_client.set_tag(run_ids[2], "t", "x")
+
+    table = mlflow_client.export_runs(
+        experiment_id, filter_string="metrics.m >= 1", order_by=["metrics.m DESC"]
+    )
+    df = table.to_pandas()
+    assert list(df["run_id"]) == run_ids[:0:-1]
+    assert list(df["metrics.m"]) == [2.0, 1.0]
+    assert list(df["params.p"]) == ["p2", "p1"]
+    assert list(df["tags.t"]) == ["x", None]
+    expected = mlflow.search_runs([experiment_id], "metrics.m >= 1", order_by=["metrics.m DESC"])
+    assert list(df["start_time"]) == list(expected["start_time"])
+    assert mlflow_client.export_runs(experiment_id, max_results=1).num_rows == 1
+
+
 def test_get_experiment_by_name(mlflow_client, backend_store_uri):
     name = "test_get_experiment_by_name"
     experiment_id = mlflow_client.create_experiment(name)
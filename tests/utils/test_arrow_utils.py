@@ -0,0 +1,107 @@
+import math
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.utils.arrow_utils import (
+    deserialize_table,
+    get_data_keys,
+    get_runs_schema,
+    runs_to_arrow_table,
+    serialize_table,
+    serialize_tables,
+)
+
+
+def _run(run_id, metrics=(), params=(), tags=(), end_time=None):
+    info = RunInfo(run_id, "0", "user", "FINISHED", 1000, end_time, "active", "uri/" + run_id)
+    return Run(info, RunData(metrics=list(metrics), params=list(params), tags=list(tags)))
+
+
+@pytest.fixture()
+def runs():
+    return [
+        _run("r1", metrics=[Metric("m", 1.5, 1, 0)], params=[Param("p", "a")], end_time=2000),
+        _run("r2", metrics=[Metric("a", float("nan"), 1, 0)], tags=[RunTag("t", "x")]),
+    ]
+
+
+def test_runs_to_arrow_table(runs):
+    table = runs_to_arrow_table(runs)
+    assert table.column_names == [
+        "run_id",
+        "experiment_id",
+        "status",
+        "artifact_uri",
+        "start_time",
+        "end_time",
+        "metrics.a",
+        "metrics.m",
+        "params.p",
+        "tags.t",
+    ]
+    assert table.schema.field("start_time").type == pa.timestamp("ms", tz="UTC")
+    assert table.schema.field("metrics.m").type == pa.float64()
+    assert table.column("run_id").to_pylist() == ["r1", "r2"]
+    assert table.column("metrics.m").to_pylist() == [1.5, None]
+    assert math.isnan(table.column("metrics.a").to_pylist()[1])
+    assert table.column("params.p").to_pylist() == ["a", None]
+    assert table.column("tags.t").to_pylist() == [None, "x"]
+
+    df = table.to_pandas()
+    assert df["start_time"][0] == pd.to_datetime(1000, unit="ms", utc=True)
+    assert pd.isnull(df["end_time"][1])
+    assert pd.isnull(df["metrics.m"][1])
+
+
+def test_runs_to_arrow_table_without_runs():
+    table = runs_to_arrow_table([])
+    assert table.num_rows == 0
+    assert table.column_names[0] == "run_id"
+
+
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+def test_serialize_table_round_trip(runs, export_format):
+    table = runs_to_arrow_table(runs)
+    deserialized = deserialize_table(serialize_table(table, export_format), export_format)
+    assert deserialized.schema.equals(table.schema)
+    # NaN metric values are not equal to themselves, unlike in DataFrame comparisons
+    assert deserialized.to_pandas().equals(table.to_pandas())
+
+
+def test_runs_to_arrow_table_with_schema(runs):
+    data_keys = get_data_keys(runs[:1])
+    assert data_keys == ({"m"}, {"p"}, set())
+    table = runs_to_arrow_table(runs, get_runs_schema(data_keys))
+    assert table.column_names[6:] == ["metrics.m", "params.p"]
+    assert table.column("metrics.m").to_pylist() == [1.5, None]
+
+
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+def test_serialize_tables_streams_each_table(runs, export_format):
+    schema = runs_to_arrow_table(runs).schema
+    consumed = []
+
+    def tables():
+        for run in runs:
+            consumed.append(run)
+            yield runs_to_arrow_table([run], schema)
+
+    chunks = []
+    num_consumed = []
+    for chunk in serialize_tables(schema, tables(), export_format):
+        chunks.append(chunk)
+        num_consumed.append(len(consumed))
+    # A chunk per table, then the end of the stream or the footer of the file
+    assert num_consumed == [1, 2, 2]
+    table = deserialize_table(b"".join(chunks), export_format)
+    assert table.schema.equals(schema)
+    assert table.column("run_id").to_pylist() == ["r1", "r2"]
+
+
+def test_serialize_table_rejects_unknown_formats(runs):
+    with pytest.raises(MlflowException, match="Invalid export format 'csv'"):
+        serialize_table(runs_to_arrow_table(runs), "csv")
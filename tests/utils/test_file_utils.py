@@ -6,8 +6,10 @@ import os
 import shutil
 import pytest
 import tarfile
+from unittest import mock
 
-from mlflow.utils import file_utils
+from mlflow.exceptions import MlflowException
+from mlflow.utils import file_utils, transfer_journal
 from mlflow.utils.file_utils import get_parent_dir, _copy_file_or_tree, TempDir
 from tests.projects.utils import TEST_PROJECT_DIR
 
@@ -137,3 +139,142 @@ def test_dir_copy():
             f.write("testing")
         _copy_file_or_tree(dir_path, copy_path, "")
         assert filecmp.dircmp(dir_path, copy_path)
+
+
+def test_copy_file_links_clones_or_copies_files(tmpdir):
+    src = tmpdir.join("src.bin")
+    src.write_binary(b"0123456789")
+
+    dst = tmpdir.join("copy.bin")
+    assert file_utils.copy_file(src.strpath, dst.strpath) == "copy"
+    assert dst.read_binary() == b"0123456789"
+    assert dst.stat().ino != src.stat().ino
+
+    # Existing files are replaced by links, and linking a file to itself keeps it
+    for _ in range(2):
+        assert file_utils.copy_file(src.strpath, dst.strpath, "hardlink") == "hardlink"
+        assert dst.stat().ino == src.stat().ino
+
+    dst = tmpdir.join("clone.bin")
+    with mock.patch("os.link", side_effect=OSError("Cross-device link")), mock.patch.object(
+        file_utils, "_reflink"
+    ) as reflink_mock:
+        assert file_utils.copy_file(src.strpath, dst.strpath, "hardlink") == "reflink"
+    reflink_mock.assert_called_once_with(src.strpath, dst.strpath)
+
+    for link_mode in ["reflink", "hardlink"]:
+        dst = tmpdir.join(link_mode + ".bin")
+        with mock.patch("os.link", side_effect=OSError("Cross-device link")), mock.patch.object(
+            file_utils, "_reflink", side_effect=OSError("Operation not supported")
+        ):
+            assert file_utils.copy_file(src.strpath, dst.strpath, link_mode) == "copy"
+        assert dst.read_binary() == b"0123456789"
+
+    with pytest.raises(MlflowException, match="Invalid link mode 'symlink'"):
+        file_utils.copy_file(src.strpath, dst.strpath, "symlink")
+
+
+def test_download_file_in_parts_writes_parts_at_their_offsets(tmpdir):
+    data = bytes(range(256)) * 4
+    download_path = tmpdir.join("file.bin").strpath
+    ranges = []
+
+    def read_range(start, end):
+        ranges.append((start, end))
+        # Return the parts in several chunks
+        return [data[start : start + 10], data[start + 10 : end]]
+
+    file_utils.download_file_in_parts(
+        download_path, len(data), read_range, 100, 4, hashlib.md5(data).hexdigest()
+    )
+    with open(download_path, "rb") as f:
+        assert f.read() == data
+    assert sorted(ranges) == [(start, min(start + 100, len(data))) for start in range(0, 1024, 100)]
+
+    with pytest.raises(MlflowException, match=r"Downloaded 10 bytes for the range \[0, 100\)"):
+        file_utils.download_file_in_parts(
+            download_path, len(data), lambda start, end: [data[start : start + 10]], 100, 4
+        )
+    with pytest.raises(MlflowException, match="has an MD5 digest of"):
+        file_utils.download_file_in_parts(download_path, len(data), read_range, 100, 4, "0" * 32)
+    with pytest.raises(MlflowException, match="has an SHA-256 digest of"):
+        file_utils.download_file_in_parts(
+            download_path, len(data), read_range, 100, 4, sha256="0" * 64
+        )
+    file_utils.download_file_in_parts(
+        download_path, len(data), read_range, 100, 4, sha256=hashlib.sha256(data).hexdigest()
+    )
+
+
+def test_download_file_in_parts_resumes_interrupted_downloads(tmpdir, monkeypatch):
+    monkeypatch.setattr(transfer_journal, "TRANSFER_JOURNAL_DIR", tmpdir.join("journals").strpath)
+    data = bytes(range(256)) * 4
+    md5 = hashlib.md5(data).hexdigest()
+    download_path = tmpdir.join("file.bin").strpath
+    failing_starts = {500}
+    starts = []
+
+    def read_range(start, end):
+        starts.append(start)
+        if start in failing_starts:
+            raise IOError("Connection reset")
+        return [data[start:end]]
+
+    def download(journal_key):
+        file_utils.download_file_in_parts(
+            download_path, len(data), read_range, 100, 2, md5, journal_key
+        )
+
+    with pytest.raises(IOError, match="Connection reset"):
+        download(["https://uri", "etag"])
+    failing_starts.clear()
+    del starts[:]
+    download(["https://uri", "etag"])
+    assert starts == [500]
+    with open(download_path, "rb") as f:
+        assert f.read() == data
+    assert tmpdir.join("journals").listdir() == []
+
+    # Downloads of other contents of the file restart from zero
+    failing_starts.add(500)
+    with pytest.raises(IOError, match="Connection reset"):
+        download(["https://uri", "etag"])
+    failing_starts.clear()
+    del starts[:]
+    download(["https://uri", "other-etag"])
+    assert sorted(starts) == list(range(0, 1024, 100))
+
+
+def test_download_file_using_http_uri_downloads_large_files_in_ranged_parts(tmpdir):
+    data = b"0123456789" * 10
+
+    def get(uri, stream, headers=None):
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.headers = {"Content-Length": str(len(data)), "Accept-Ranges": "bytes"}
+        response.status_code = 200
+        content = data
+        if headers is not None:
+            start, end = map(int, headers["Range"][len("bytes=") :].split("-"))
+            response.status_code = 206
+            content = data[start : end + 1]
+        response.iter_content.side_effect = lambda chunk_size: [content]
+        return response
+
+    download_path = tmpdir.join("file.bin").strpath
+    settings = file_utils.MultipartDownloadSettings(50, 30, 2)
+    with mock.patch("requests.get", side_effect=get) as get_mock:
+        file_utils.download_file_using_http_uri("https://uri", download_path, 1000, settings)
+    with open(download_path, "rb") as f:
+        assert f.read() == data
+    ranges = sorted(
+        c[1]["headers"]["Range"] for c in get_mock.call_args_list if c[1].get("headers")
+    )
+    assert ranges == ["bytes=0-29", "bytes=30-59", "bytes=60-89", "bytes=90-99"]
+
+    settings = file_utils.MultipartDownloadSettings(101, 30, 2)
+    with mock.patch("requests.get", side_effect=get) as get_mock:
+        file_utils.download_file_using_http_uri("https://uri", download_path, 1000, settings)
+    assert get_mock.call_count == 1
+    with open(download_path, "rb") as f:
+        assert f.read() == data
@@ -1,5 +1,6 @@
 import base64
 import json
+import numpy as np
 import pytest
 
 from mlflow.entities import RunInfo, RunData, Run, LifecycleStage, RunStatus, Metric, Param, RunTag
@@ -115,9 +116,12 @@ def test_correct_quote_trimming(filter_string, parsed_filter):
         ("attri.x != 1", "Invalid entity type"),
         ("a.x != 1", "Invalid entity type"),
         ("model >= 'LR'", "Invalid identifier"),
-        ("metrics.A > 0.1 OR params.B = 'LR'", "Invalid clause(s) in filter string"),
+        ("metrics.A > 0.1 OR", "expected an expression on both sides of 'OR'"),
         ("metrics.A > 0.1 NAND params.B = 'LR'", "Invalid clause(s) in filter string"),
-        ("metrics.A > 0.1 AND (params.B = 'LR')", "Invalid clause(s) in filter string"),
+        ("metrics.A > 0.1 AND ()", "Invalid clause(s) in filter string"),
+        ("params.B IN 'LR'", "Invalid clause(s) in filter string"),
+        ("params.B IN ('LR', 5)", "expected a non-empty list of string values"),
+        ("params.B IS NOT 'LR'", "Invalid clause(s) in filter string"),
         ("`metrics.A > 0.1", "Invalid clause(s) in filter string"),
         ("param`.A > 0.1", "Invalid clause(s) in filter string"),
         ("`dummy.A > 0.1", "Invalid clause(s) in filter string"),
@@ -146,7 +150,7 @@ def test_error_filter(filter_string, error_message):
     [
         ("metric.model = 'LR'", "Expected numeric value type for metric"),
         ("metric.model = '5'", "Expected numeric value type for metric"),
-        ("params.acc = 5", "Expected a quoted string value for param"),
+        ("params.acc = true", "Invalid clause(s) in filter string"),
         ("tags.acc = 5", "Expected a quoted string value for tag"),
         ("metrics.acc != metrics.acc", "Expected numeric value type for metric"),
         ("1.0 > metrics.acc", "Expected 'Identifier' found"),
@@ -187,7 +191,7 @@ def test_bad_quotes(filter_string, error_message):
         ("params.acc LR", "Invalid clause(s) in filter string"),
         ("metric.acc !=", "Invalid clause(s) in filter string"),
         ("acc != 1.0", "Invalid identifier"),
-        ("foo is null", "Invalid clause(s) in filter string"),
+        ("foo is null", "Invalid identifier"),
         ("1=1", "Expected 'Identifier' found"),
         ("1==2", "Expected 'Identifier' found"),
     ],
@@ -301,6 +305,70 @@ def test_correct_filtering(filter_string, matching_runs):
     assert set(filtered_runs) == set([runs[i] for i in matching_runs])
 
 
+def test_compile_filter_is_cached_and_validates_comparators():
+    filter_string = "metrics.acc > 0.5 AND params.model LIKE 'tf%'"
+    assert SearchUtils.compile_filter(filter_string) is SearchUtils.compile_filter(filter_string)
+    # Callers may modify the parsed clauses without affecting the cached ones
+    SearchUtils.parse_search_filter(filter_string)[0]["key"] = "loss"
+    assert SearchUtils.parse_search_filter(filter_string)[0]["key"] == "acc"
+
+    with pytest.raises(MlflowException, match="Invalid comparator"):
+        SearchUtils.compile_filter("params.model > 'tf'")
+
+
+@pytest.mark.parametrize(
+    "filter_string, matching_rows",
+    [
+        (None, [0, 1, 2, 3]),
+        ("metrics.acc > 0.5", [1, 2]),
+        ("metrics.acc != 0.9", [0, 2]),
+        ("params.model = 'tf'", [0, 1]),
+        ("params.model != 'tf'", [2]),
+        ("params.model LIKE 't%'", [0, 1]),
+        ("params.model ILIKE 'SK%'", [2]),
+        ("tags.team = 'a'", []),
+        ("attributes.status = 'FAILED' AND metrics.acc >= 0.6", [2]),
+        ("params.model IN ('tf', 'xgboost') AND metrics.acc > 0.5 OR metrics.acc < 0.2", [0, 1]),
+        ("params.model IS NULL OR (params.model = 'sklearn' AND tags.team IS NULL)", [2, 3]),
+        ("metrics.acc IS NOT NULL AND attributes.status IN ('FAILED')", [2]),
+    ],
+)
+def test_compiled_filter_matches_runs_and_columns(filter_string, matching_rows):
+    acc = [0.1, 0.9, 0.6, None]
+    model = ["tf", "tf", "sklearn", None]
+    status = ["FINISHED", "FINISHED", "FAILED", "FAILED"]
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_uuid=str(i),
+                run_id=str(i),
+                experiment_id=0,
+                user_id="user-id",
+                status=status[i],
+                start_time=0,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[Metric("acc", acc[i], 1, 0)] if acc[i] is not None else [],
+                params=[Param("model", model[i])] if model[i] is not None else [],
+                tags=[],
+            ),
+        )
+        for i in range(4)
+    ]
+    search_filter = SearchUtils.compile_filter(filter_string)
+    assert search_filter.filter(runs) == [runs[i] for i in matching_rows]
+
+    columns = {
+        "metrics.acc": np.array(acc, dtype=float),
+        "params.model": model,
+        "status": np.array(status, dtype=object),
+    }
+    mask = search_filter.mask(columns, num_rows=4)
+    assert mask.tolist() == [i in matching_rows for i in range(4)]
+
+
 @pytest.mark.parametrize(
     "order_bys, matching_runs",
     [
@@ -408,6 +476,37 @@ def test_order_by_metric_with_nans_and_infs():
     assert ["inf", "1000", "0", "-1000", "-inf", "nan"] == sorted_runs_desc
 
 
+@pytest.mark.parametrize(
+    "order_bys", [[], ["metrics.x desc"], ["params.p", "metrics.x"], ["attributes.start_time asc"]],
+)
+def test_sort_and_paginate_selects_the_same_runs_as_sort(order_bys):
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_id=str(i),
+                run_uuid=str(i),
+                experiment_id=0,
+                user_id="user",
+                status=RunStatus.to_string(RunStatus.FINISHED),
+                start_time=i % 7,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[Metric("x", float("nan") if i % 5 == 0 else i % 4, 1, 0)],
+                params=[Param("p", str(i % 3))] if i % 2 else [],
+            ),
+        )
+        for i in range(40)
+    ]
+    sorted_runs = SearchUtils.sort(runs, order_bys)
+    page_token = None
+    for offset in range(0, 40, 3):
+        page, page_token = SearchUtils.sort_and_paginate(runs, order_bys, page_token, 3)
+        assert page == sorted_runs[offset : offset + 3]
+    assert page_token is None
+
+
 @pytest.mark.parametrize(
     "order_by, error_message",
     [